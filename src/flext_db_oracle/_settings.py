@@ -73,6 +73,52 @@ class FlextDbOracleSettings(FlextCliSettings):
                 default=None, description="Distinguished name of server SSL certificate"
             ),
         ]
+        instrumentation: Annotated[
+            bool,
+            m.Field(
+                default=True,
+                description="Record phase timings of every query and DML call",
+            ),
+        ]
+        tracing: Annotated[
+            bool,
+            m.Field(default=False, description="Record trace spans of Oracle calls"),
+        ]
+        trace_file: Annotated[
+            str | None,
+            m.Field(
+                default=None,
+                description="JSON-lines file receiving spans (default: in memory)",
+            ),
+        ]
+        session_stats: Annotated[
+            bool,
+            m.Field(
+                default=False,
+                description="Attach v$mystat counter deltas to instrumented calls",
+            ),
+        ]
+        bind_literals: Annotated[
+            bool,
+            m.Field(
+                default=False,
+                description="Rewrite predicate literals of ad-hoc SQL into binds",
+            ),
+        ]
+        slow_query_seconds: Annotated[
+            float,
+            m.Field(
+                default=5.0,
+                description="Call duration logged as a slow query (0 disables)",
+            ),
+        ]
+        explain_slow_queries: Annotated[
+            bool,
+            m.Field(
+                default=False,
+                description="Capture the EXPLAIN PLAN of slow queries in background",
+            ),
+        ]
         enable_dispatcher: Annotated[
             bool,
             m.Field(
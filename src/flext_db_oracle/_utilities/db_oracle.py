@@ -2,8 +2,16 @@
 
 from __future__ import annotations
 
+import base64
+import functools
 import hashlib
+import io
+import itertools
+import json
+import mmap
 from collections.abc import Mapping
+from datetime import UTC, date, datetime
+from decimal import Decimal, InvalidOperation
 from enum import StrEnum
 from typing import TYPE_CHECKING
 
@@ -13,6 +21,7 @@ from sqlalchemy import (
     TextClause,
     create_engine,
 )
+from sqlalchemy.sql import quoted_name
 
 # mro-6int (claude-ulw): import aliases from upstream (flext_core/flext_cli) and
 # the settings singleton from the concrete _settings leaf, not the own package
@@ -22,10 +31,15 @@ from flext_db_oracle._settings import settings
 from flext_db_oracle.constants import FlextDbOracleConstants as c
 
 if TYPE_CHECKING:
+    import _csv
     import contextlib
+    from collections.abc import Iterable, Iterator
+    from pathlib import Path
 
     from sqlalchemy.engine import CursorResult
 
+    from flext_db_oracle.typings import FlextDbOracleTypes
+
 
 class FlextDbOracleUtilitiesDbOracle:
     """Oracle-specific utility mixin.
@@ -89,6 +103,258 @@ class FlextDbOracleUtilitiesDbOracle:
         max_len = c.DbOracle.MAX_IDENTIFIER_LENGTH
         return r[str].ok(identifier[:max_len])
 
+    @staticmethod
+    def _quote_identifier(identifier: str) -> str:
+        """Render an identifier for raw SQL the way the SQL builders normalize it."""
+        if c.DbOracle.IDENTIFIER_RE.fullmatch(identifier):
+            return identifier.upper()
+        escaped = identifier.replace('"', '""')
+        return f'"{escaped}"'
+
+    @staticmethod
+    def _normalize_identifier(name: str) -> str | quoted_name:
+        """Wrap an identifier for SQLAlchemy as ``_quote_identifier`` renders it."""
+        if c.DbOracle.IDENTIFIER_RE.fullmatch(name):
+            return quoted_name(name.upper(), quote=False)
+        return quoted_name(name, quote=True)
+
+    @staticmethod
+    def _dictionary_name(identifier: str) -> str:
+        """Render an identifier as stored in the Oracle data dictionary."""
+        if c.DbOracle.IDENTIFIER_RE.fullmatch(identifier):
+            return identifier.upper()
+        return identifier
+
+    @classmethod
+    def _qualified_name(cls, name: str, schema: str | None = None) -> str:
+        """Render an optionally schema-qualified object name for raw SQL."""
+        quoted = cls._quote_identifier(name)
+        return f"{cls._quote_identifier(schema)}.{quoted}" if schema else quoted
+
+    @classmethod
+    def _bind_converter(
+        cls, data_type: str
+    ) -> FlextDbOracleTypes.DbOracle.BindConverter:
+        """Select the bind-value converter for an Oracle column type."""
+        upper_type = data_type.upper()
+        if upper_type.startswith(tuple(c.DbOracle.NUMERIC_TYPE_PREFIXES)):
+            return cls._to_number
+        if upper_type.startswith(tuple(c.DbOracle.TEMPORAL_TYPE_PREFIXES)):
+            return cls._to_datetime
+        return cls._to_text
+
+    @classmethod
+    def _singer_converter(
+        cls, singer_type: str, format_hint: str | None = None
+    ) -> FlextDbOracleTypes.DbOracle.BindConverter:
+        """Select the bind-value converter for a Singer property type."""
+        if format_hint == "date-time":
+            return cls._to_datetime
+        if singer_type == "integer":
+            return cls._to_integer
+        if singer_type == "boolean":
+            return cls._to_flag
+        if singer_type == "number":
+            return cls._to_number
+        return cls._to_text
+
+    @staticmethod
+    def _to_number(value: t.JsonValue) -> FlextDbOracleTypes.DbOracle.BindValue:
+        """Convert a raw field into an Oracle NUMBER bind value."""
+        if value is None or (isinstance(value, str) and not value):
+            return None
+        if isinstance(value, bool):
+            return int(value)
+        if isinstance(value, (int, float)):
+            return value
+        try:
+            return Decimal(str(value).strip())
+        except InvalidOperation as exc:
+            msg = f"invalid number: {value!r}"
+            raise ValueError(msg) from exc
+
+    @staticmethod
+    def _to_integer(value: t.JsonValue) -> FlextDbOracleTypes.DbOracle.BindValue:
+        """Convert a raw field into an integral Oracle NUMBER bind value."""
+        if value is None or (isinstance(value, str) and not value):
+            return None
+        if isinstance(value, (bool, int)):
+            return int(value)
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        try:
+            return int(str(value).strip())
+        except ValueError as exc:
+            msg = f"invalid integer: {value!r}"
+            raise ValueError(msg) from exc
+
+    @staticmethod
+    def _to_flag(value: t.JsonValue) -> FlextDbOracleTypes.DbOracle.BindValue:
+        """Convert a raw boolean into a NUMBER(1) bind value (1 or 0)."""
+        if value is None or (isinstance(value, str) and not value):
+            return None
+        if isinstance(value, (bool, int, float)):
+            return int(bool(value))
+        flag = str(value).strip().lower()
+        if flag in {"true", "t", "yes", "y", "1"}:
+            return 1
+        if flag in {"false", "f", "no", "n", "0"}:
+            return 0
+        msg = f"invalid boolean: {value!r}"
+        raise ValueError(msg)
+
+    @staticmethod
+    def _to_datetime(value: t.JsonValue) -> FlextDbOracleTypes.DbOracle.BindValue:
+        """Convert a raw ISO-8601 field into an Oracle DATE/TIMESTAMP bind."""
+        if value is None or (isinstance(value, str) and not value):
+            return None
+        if not isinstance(value, str):
+            msg = f"invalid timestamp: {value!r}"
+            raise TypeError(msg)
+        return datetime.fromisoformat(value.strip())
+
+    @staticmethod
+    def _to_text(value: t.JsonValue) -> FlextDbOracleTypes.DbOracle.BindValue:
+        """Convert a raw field into a character bind value."""
+        if value is None or isinstance(value, str):
+            return value
+        if isinstance(value, (dict, list)):
+            return json.dumps(value, separators=(",", ":"))
+        return str(value)
+
+    @staticmethod
+    def iter_file_lines(
+        path: Path,
+        chunk_bytes: int = c.DbOracle.DEFAULT_FILE_CHUNK_BYTES,
+        encoding: str = c.DbOracle.DEFAULT_FILE_ENCODING,
+    ) -> Iterator[str]:
+        """Yield text lines from a memory-mapped file in newline-aligned chunks."""
+        with path.open("rb") as handle:
+            if path.stat().st_size == 0:
+                return
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                size = len(mapped)
+                start = 0
+                while start < size:
+                    end = min(start + chunk_bytes, size)
+                    if end < size:
+                        newline = mapped.rfind(b"\n", start, end)
+                        if newline < 0:
+                            newline = mapped.find(b"\n", end)
+                        end = size if newline < 0 else newline + 1
+                    yield from io.StringIO(
+                        mapped[start:end].decode(encoding), newline=""
+                    )
+                    start = end
+
+    @staticmethod
+    def iter_csv_records(
+        reader: _csv.Reader, column_names: t.StrSequence
+    ) -> Iterator[FlextDbOracleTypes.DbOracle.LoadRecord]:
+        """Yield CSV rows as column mappings, flagging malformed rows.
+
+        Each row carries the file line it starts on, taken from the reader's
+        ``line_num``, so a header read earlier and quoted fields spanning
+        several lines are both accounted for.
+        """
+        while True:
+            line_number = reader.line_num + 1
+            values = next(reader, None)
+            if values is None:
+                return
+            if not values:
+                continue
+            if len(values) != len(column_names):
+                yield (
+                    line_number,
+                    None,
+                    f"expected {len(column_names)} fields, got {len(values)}",
+                )
+                continue
+            yield line_number, dict(zip(column_names, values, strict=True)), ""
+
+    @staticmethod
+    def iter_jsonl_records(
+        lines: Iterator[str], column_names: t.StrSequence
+    ) -> Iterator[FlextDbOracleTypes.DbOracle.LoadRecord]:
+        """Yield JSONL objects as column mappings, flagging malformed lines."""
+        for line_number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                payload = json.loads(line)
+            except json.JSONDecodeError as exc:
+                yield line_number, None, f"invalid JSON: {exc.msg}"
+                continue
+            if not isinstance(payload, dict):
+                yield line_number, None, "JSON line is not an object"
+                continue
+            by_upper = {str(key).upper(): value for key, value in payload.items()}
+            yield (
+                line_number,
+                {
+                    name: payload.get(name, by_upper.get(name.upper()))
+                    for name in column_names
+                },
+                "",
+            )
+
+    @classmethod
+    def _dictionary_qualified_name(cls, name: str, schema: str | None = None) -> str:
+        """Render an optionally schema-qualified name in data dictionary case."""
+        return cls._qualified_name(
+            cls._dictionary_name(name), cls._dictionary_name(schema) if schema else None
+        )
+
+    @classmethod
+    def _stream_name(cls, table_name: str, schema: str | None) -> str:
+        """Derive the Singer stream id (``SCHEMA-TABLE``) of a table."""
+        table = cls._dictionary_name(table_name)
+        return f"{cls._dictionary_name(schema)}-{table}" if schema else table
+
+    @staticmethod
+    def insert_all_binds(
+        rows: FlextDbOracleTypes.DbOracle.BindBatch, columns: t.StrSequence
+    ) -> FlextDbOracleTypes.DbOracle.BindRow:
+        """Flatten rows into the numbered ``:r{i}c{j}`` binds of an INSERT ALL."""
+        return {
+            f"r{row_index}c{column_index}": row.get(name)
+            for row_index, row in enumerate(rows)
+            for column_index, name in enumerate(columns)
+        }
+
+    @staticmethod
+    def merge_binds(
+        row: FlextDbOracleTypes.DbOracle.BindRow, columns: t.StrSequence
+    ) -> FlextDbOracleTypes.DbOracle.BindRow:
+        """Map a row onto the positional ``:c{j}`` binds of a bind-row MERGE."""
+        return {f"c{index}": row.get(name) for index, name in enumerate(columns)}
+
+    @staticmethod
+    def in_list_size(value_count: int) -> int:
+        """Bucketed bind count for an IN list of ``value_count`` values.
+
+        Padding IN lists to a few fixed sizes keeps the SQL text, and therefore
+        the cursor and plan, shared across calls with different list lengths.
+        """
+        return next(
+            (size for size in c.DbOracle.IN_LIST_BIND_BUCKETS if size >= value_count),
+            value_count,
+        )
+
+    @classmethod
+    def in_list_binds(
+        cls,
+        column_name: str,
+        values: t.SequenceOf[FlextDbOracleTypes.DbOracle.BindValue],
+    ) -> FlextDbOracleTypes.DbOracle.BindRow:
+        """Bind ``values`` as ``:{column}_{i}``, padded with the last value."""
+        if not values:
+            return {}
+        padded = [*values]
+        padded.extend([padded[-1]] * (cls.in_list_size(len(padded)) - len(padded)))
+        return {f"{column_name}_{index}": value for index, value in enumerate(padded)}
+
     @classmethod
     def format_query_result(
         cls, result: t.JsonPayload, format_type: str = "table"
@@ -99,6 +365,120 @@ class FlextDbOracleUtilitiesDbOracle:
             return r[str].ok(t.json_value_adapter().dump_json(json_payload).decode())
         return r[str].ok(str(result))
 
+    @classmethod
+    def json_encoder(
+        cls, backend: c.DbOracle.JsonBackend = c.DbOracle.JsonBackend.AUTO
+    ) -> p.Result[FlextDbOracleTypes.DbOracle.JsonEncoder]:
+        """Resolve the compact JSON-to-bytes encoder of a backend.
+
+        ``AUTO`` prefers msgspec (the optional ``json`` extra), then the
+        standard library. Every backend produces the same JSON, except that
+        float exponents are spelled ``1e+20`` by the standard library and
+        ``1e20`` by msgspec. Integral decimals encode as JSON integers and
+        others as JSON floats, so fractional NUMBERs beyond 15-17 significant
+        digits are rounded; datetimes encode as RFC 3339 with naive values
+        taken as UTC and UTC written ``Z``, and bytes as base64.
+        """
+        candidates = (
+            (c.DbOracle.JsonBackend.MSGSPEC, c.DbOracle.JsonBackend.STDLIB)
+            if backend == c.DbOracle.JsonBackend.AUTO
+            else (backend,)
+        )
+        for candidate in candidates:
+            encoder = cls._load_json_encoder(candidate)
+            if encoder is not None:
+                found: p.Result[FlextDbOracleTypes.DbOracle.JsonEncoder] = r.ok(encoder)
+                return found
+        missing: p.Result[FlextDbOracleTypes.DbOracle.JsonEncoder] = r.fail(
+            f"JSON backend {backend} is not installed"
+        )
+        return missing
+
+    @classmethod
+    def encode_json(
+        cls,
+        value: FlextDbOracleTypes.DbOracle.JsonEncodable,
+        *,
+        backend: c.DbOracle.JsonBackend = c.DbOracle.JsonBackend.AUTO,
+    ) -> p.Result[bytes]:
+        """Encode a value as compact UTF-8 JSON bytes."""
+        encoder_result = cls.json_encoder(backend)
+        if encoder_result.failure:
+            return r[bytes].fail(encoder_result.error or "No JSON backend available")
+        try:
+            return r[bytes].ok(encoder_result.value(value))
+        except (TypeError, ValueError) as e:
+            return r[bytes].fail_op("JSON encoding", e)
+
+    @classmethod
+    def encode_json_rows(
+        cls,
+        column_names: t.StrSequence,
+        rows: Iterable[t.SequenceOf[FlextDbOracleTypes.DbOracle.BindValue]],
+        *,
+        backend: c.DbOracle.JsonBackend = c.DbOracle.JsonBackend.AUTO,
+    ) -> p.Result[bytes]:
+        """Encode raw row tuples as a JSON array of column-keyed objects.
+
+        Driver values go to the encoder as-is: no string normalization and
+        no intermediate row models.
+        """
+        names = tuple(column_names)
+        return cls.encode_json(
+            [dict(zip(names, row, strict=True)) for row in rows], backend=backend
+        )
+
+    @classmethod
+    @functools.cache
+    def _load_json_encoder(
+        cls, backend: c.DbOracle.JsonBackend
+    ) -> FlextDbOracleTypes.DbOracle.JsonEncoder | None:
+        """Build a backend's encoder once; None when it is not installed."""
+        if backend == c.DbOracle.JsonBackend.STDLIB:
+            stdlib_encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+            return lambda value: stdlib_encoder.encode(cls._json_ready(value)).encode()
+        try:
+            import msgspec.json
+        except ModuleNotFoundError:
+            return None
+        msgspec_encoder: msgspec.json.Encoder = msgspec.json.Encoder()
+
+        def encode_msgspec(value: FlextDbOracleTypes.DbOracle.JsonEncodable) -> bytes:
+            try:
+                return msgspec_encoder.encode(cls._json_ready(value))
+            except msgspec.EncodeError as exc:
+                raise ValueError(str(exc)) from exc
+
+        return encode_msgspec
+
+    @classmethod
+    def _json_ready(
+        cls, value: FlextDbOracleTypes.DbOracle.JsonEncodable
+    ) -> t.JsonValue:
+        """Convert the driver values inside a value to their JSON forms.
+
+        Both backends encode the converted value, since msgspec would
+        otherwise encode decimals and naive datetimes natively.
+        """
+        if value is None or isinstance(value, (str, int, float)):
+            return value
+        if isinstance(value, Mapping):
+            return {key: cls._json_ready(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [cls._json_ready(item) for item in value]
+        if isinstance(value, Decimal):
+            return int(value) if value == value.to_integral_value() else float(value)
+        if isinstance(value, datetime):
+            aware = value if value.tzinfo is not None else value.replace(tzinfo=UTC)
+            iso = aware.isoformat()
+            return iso.removesuffix("+00:00") + "Z" if iso.endswith("+00:00") else iso
+        if isinstance(value, date):
+            return value.isoformat()
+        if isinstance(value, bytes):
+            return base64.b64encode(value).decode("ascii")
+        msg = f"Value of type {type(value).__name__} is not JSON serializable"
+        raise TypeError(msg)
+
     @staticmethod
     def format_sql_for_oracle(sql: str) -> p.Result[str]:
         """Normalize SQL string formatting for Oracle execution."""
@@ -115,6 +495,122 @@ class FlextDbOracleUtilitiesDbOracle:
         payload = f"{query}|{serialized}".encode()
         return r[str].ok(hashlib.sha256(payload).hexdigest()[:16])
 
+    @staticmethod
+    def normalize_sql(sql: str) -> str:
+        """Reduce SQL to its shape: literals become ``?``, IN lists collapse.
+
+        Comments are dropped, unquoted words are lowercased and tokens are
+        re-joined with single spaces; quoted identifiers and bind variable
+        names are kept. Statements that differ only in literal values, IN
+        list length, letter case or layout normalize to the same text.
+        """
+        tokens: list[str] = []
+        for match in c.DbOracle.SQL_TOKEN_RE.finditer(sql):
+            kind = match.lastgroup
+            if kind in {"string", "number"}:
+                tokens.append("?")
+            elif kind == "word":
+                tokens.append(match.group().lower())
+            elif kind != "comment":
+                tokens.append(match.group())
+        return c.DbOracle.SQL_IN_LIST_RE.sub("in (...)", " ".join(tokens))
+
+    @classmethod
+    @functools.lru_cache(maxsize=c.DbOracle.STATEMENT_CACHE_SIZE)
+    def statement_fingerprint(cls, sql: str) -> str:
+        """Hash the normalized SQL shape into a 16-hex-digit fingerprint.
+
+        Unlike ``generate_query_hash``, which keys exact text and binds,
+        every literal variant of a statement shares one fingerprint.
+        """
+        return hashlib.sha256(cls.normalize_sql(sql).encode()).hexdigest()[:16]
+
+    @classmethod
+    @functools.lru_cache(maxsize=c.DbOracle.STATEMENT_CACHE_SIZE)
+    def parameterize_sql(
+        cls, sql: str
+    ) -> tuple[str, tuple[tuple[str, int | str], ...]]:
+        """Rewrite the safe literals of a query or DML statement into binds.
+
+        Integer and string literals compared with ``=``, ``<``, ``>``,
+        ``LIKE`` or ``BETWEEN``, or listed directly in ``IN (...)`` or
+        ``VALUES (...)``, become ``:flext_lit_<n>`` binds. Typed literals
+        (``DATE '...'``), national strings, decimals and every literal of a
+        select list, GROUP BY or ORDER BY clause stay as written, so an
+        expression repeated in GROUP BY still matches its select-list twin;
+        other statement types are left alone. Returns the template and its
+        bind values. Note that a bound string compared with a CHAR column
+        loses blank-padded comparison.
+        """
+        keyword, _, _ = sql.lstrip().partition(" ")
+        if keyword.upper() not in c.DbOracle.EXPLAINABLE_KEYWORDS:
+            return sql, ()
+        parts: list[str] = []
+        binds: list[tuple[str, int | str]] = []
+        value_lists: list[bool] = []
+        kept_clauses: list[bool] = [False]
+        previous = ""
+        between = False
+        end = 0
+        for match in c.DbOracle.SQL_TOKEN_RE.finditer(sql):
+            kind = match.lastgroup
+            lexeme = match.group()
+            if kind == "comment":
+                continue
+            if kind in {"string", "number"}:
+                bindable = not kept_clauses[-1] and (
+                    previous in {"=", "<", ">", "like", "between", "between-and"}
+                    or (previous in {"(", ","} and value_lists[-1:] == [True])
+                )
+                if kind == "number" and bindable and lexeme.isdigit():
+                    value: int | str | None = int(lexeme)
+                elif kind == "string" and bindable and lexeme.startswith("'"):
+                    value = lexeme[1:-1].replace("''", "'")
+                else:
+                    value = None
+                if value is not None:
+                    name = f"{c.DbOracle.LITERAL_BIND_PREFIX}{len(binds)}"
+                    parts.extend((sql[end : match.start()], f":{name}"))
+                    binds.append((name, value))
+                    end = match.end()
+            lowered = lexeme.lower() if kind == "word" else lexeme
+            if lexeme == "(":
+                value_lists.append(previous in {"in", "values"})
+                kept_clauses.append(kept_clauses[-1])
+            elif lexeme == ")" and value_lists:
+                _ = value_lists.pop()
+                _ = kept_clauses.pop()
+            elif lowered == "select" or (
+                lowered == "by" and previous in {"group", "order"}
+            ):
+                kept_clauses[-1] = True
+            elif lowered in c.DbOracle.LITERAL_CLAUSE_KEYWORDS:
+                kept_clauses[-1] = False
+            if lowered == "between":
+                between = True
+            elif lowered == "and" and between:
+                between = False
+                lowered = "between-and"
+            previous = lowered
+        if not binds:
+            return sql, ()
+        parts.append(sql[end:])
+        return "".join(parts), tuple(binds)
+
+    @staticmethod
+    def statement_bind_names(sql: str) -> t.StrSequence:
+        """Distinct bind variable names of a statement, in order of appearance.
+
+        Names compare case-insensitively, as in Oracle; placeholders inside
+        comments, string literals and quoted identifiers are ignored.
+        """
+        names: dict[str, str] = {}
+        for match in c.DbOracle.SQL_TOKEN_RE.finditer(sql):
+            if match.lastgroup == "bind":
+                name = match.group()[1:]
+                _ = names.setdefault(name.upper(), name)
+        return list(names.values())
+
     @staticmethod
     def validate_config_map(value: t.JsonValue | t.JsonMapping) -> m.ConfigMap | None:
         """Validate arbitrary mapping input as ConfigMap."""
@@ -171,7 +667,7 @@ class FlextDbOracleUtilitiesDbOracle:
             values = t.str_sequence_adapter().validate_python(value)
         except c.ValidationError:
             return str(value)
-        return values[0] if values else "string"
+        return next((name for name in values if name != "null"), "string")
 
     @staticmethod
     def _sqlalchemy_create_engine(
@@ -223,3 +719,40 @@ class FlextDbOracleUtilitiesDbOracle:
         """Execute statement on SQL connection."""
         normalized_params = cls.normalize_params(parameters)
         return connection.execute(statement, normalized_params.root)
+
+    @staticmethod
+    def _connection_execute_many(
+        connection: SAConnection,
+        statement: TextClause,
+        rows: FlextDbOracleTypes.DbOracle.BindBatch,
+    ) -> CursorResult[tuple[t.JsonValue, ...]]:
+        """Execute one array-bound statement (``executemany``) on a connection."""
+        return connection.execute(statement, [dict(row) for row in rows])
+
+    @classmethod
+    def _direct_path_load(
+        cls,
+        connection: SAConnection,
+        statement: TextClause,
+        rows: Iterable[FlextDbOracleTypes.DbOracle.BindRow],
+        columns: t.StrSequence,
+        batch_size: int,
+    ) -> tuple[int, int]:
+        """Array-load rows with a direct-path insert, committing every batch.
+
+        Oracle refuses any further access to a table within the transaction
+        that direct-path loaded it (ORA-12838), so each batch commits before
+        the next one is written. Returns the loaded row and batch counts.
+        """
+        row_iter = iter(rows)
+        loaded = 0
+        batches = 0
+        while batch := [
+            {name: row.get(name) for name in columns}
+            for row in itertools.islice(row_iter, batch_size)
+        ]:
+            _ = cls._connection_execute_many(connection, statement, batch)
+            connection.commit()
+            loaded += len(batch)
+            batches += 1
+        return loaded, batches
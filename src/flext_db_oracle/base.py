@@ -9,17 +9,29 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
+import contextlib
+import inspect
+import secrets
 import time
+from collections import deque
+from contextvars import ContextVar
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Engine as SAEngine
+from sqlalchemy import Engine as SAEngine, bindparam, text
 
 from flext_core import s
-from flext_db_oracle import FlextDbOracleSettings, m, p, r, t, u
+from flext_db_oracle import FlextDbOracleSettings, c, m, p, r, t, u
 from flext_db_oracle._utilities.db_oracle import FlextDbOracleUtilitiesDbOracle
 
 if TYPE_CHECKING:
-    from collections.abc import MutableMapping, MutableSequence, Sequence
+    from collections.abc import Generator, Iterator, MutableMapping, Sequence
+    from concurrent.futures import Future, ThreadPoolExecutor
+
+    from sqlalchemy import Connection as SAConnection
+
+_CURRENT_SPAN: ContextVar[m.DbOracle.Span | None] = ContextVar(
+    "flext_db_oracle_current_span", default=None
+)
 
 
 class FlextDbOracleServiceBase(s, FlextDbOracleUtilitiesDbOracle):
@@ -35,18 +47,65 @@ class FlextDbOracleServiceBase(s, FlextDbOracleUtilitiesDbOracle):
 
     _db_config: FlextDbOracleSettings | None = u.PrivateAttr()
     _engine: SAEngine | None = u.PrivateAttr(default_factory=lambda: None)
-    _operations: MutableSequence[m.DbOracle.OperationRecord] = u.PrivateAttr(
-        default_factory=list[m.DbOracle.OperationRecord]
+    _operations: deque[t.DbOracle.OperationEntry] = u.PrivateAttr(
+        default_factory=lambda: deque(maxlen=c.DbOracle.OPERATION_LOG_CAPACITY)
+    )
+    _operation_stats: MutableMapping[str, m.DbOracle.OperationStats] = u.PrivateAttr(
+        default_factory=dict[str, m.DbOracle.OperationStats]
+    )
+    _statement_stats: MutableMapping[str, m.DbOracle.StatementStats] = u.PrivateAttr(
+        default_factory=dict[str, m.DbOracle.StatementStats]
+    )
+    _checkout_stats: m.DbOracle.OperationStats = u.PrivateAttr(
+        default_factory=m.DbOracle.OperationStats
     )
     _plugins: MutableMapping[str, t.JsonPayload] = u.PrivateAttr(
         default_factory=dict[str, t.JsonPayload]
     )
     _metrics: t.MutableJsonMapping = u.PrivateAttr(default_factory=dict)
+    _stats_row_changes: MutableMapping[str, int] = u.PrivateAttr(
+        default_factory=dict[str, int]
+    )
+    _singer_coercers: MutableMapping[str, m.DbOracle.SingerCoercer] = u.PrivateAttr(
+        default_factory=dict[str, m.DbOracle.SingerCoercer]
+    )
+    _span_exporter: p.DbOracle.SpanExporter | None = u.PrivateAttr(
+        default_factory=lambda: None
+    )
+    _slow_queries: deque[m.DbOracle.SlowQuery] = u.PrivateAttr(
+        default_factory=lambda: deque(maxlen=c.DbOracle.SLOW_QUERY_LOG_CAPACITY)
+    )
+    _plan_cache: MutableMapping[str, str] = u.PrivateAttr(
+        default_factory=dict[str, str]
+    )
+    _plan_captures: deque[Future[None]] = u.PrivateAttr(
+        default_factory=lambda: deque(maxlen=c.DbOracle.SLOW_QUERY_LOG_CAPACITY)
+    )
+    _plan_executor: ThreadPoolExecutor | None = u.PrivateAttr(
+        default_factory=lambda: None
+    )
+    _plan_baselines: MutableMapping[str, m.DbOracle.PlanBaseline] = u.PrivateAttr(
+        default_factory=dict[str, m.DbOracle.PlanBaseline]
+    )
+    _plan_regressions: deque[m.DbOracle.PlanRegression] = u.PrivateAttr(
+        default_factory=lambda: deque(maxlen=c.DbOracle.SLOW_QUERY_LOG_CAPACITY)
+    )
+    _session_stats_overhead: t.MappingKV[str, int] | None = u.PrivateAttr(
+        default_factory=lambda: None
+    )
+    _session_stats_error: str | None = u.PrivateAttr(default_factory=lambda: None)
 
     def __init__(self, settings: FlextDbOracleSettings) -> None:
         """Initialize shared Oracle service state."""
         super().__init__()
         self._db_config = settings
+        if settings.DbOracle.tracing:
+            trace_file = settings.DbOracle.trace_file
+            self._span_exporter = (
+                m.DbOracle.FileSpanExporter(path=trace_file)
+                if trace_file
+                else m.DbOracle.InMemorySpanExporter()
+            )
 
     @property
     def db_config(self) -> FlextDbOracleSettings:
@@ -81,6 +140,540 @@ class FlextDbOracleServiceBase(s, FlextDbOracleUtilitiesDbOracle):
             return r[SAEngine].fail("Not connected to database")
         return r[SAEngine].ok(engine)
 
+    def trace(
+        self,
+        name: str,
+        attributes: t.MappingKV[str, t.Scalar] | None = None,
+        *,
+        traceparent: str | None = None,
+    ) -> contextlib.AbstractContextManager[m.DbOracle.Span | None]:
+        """Open a span around a block of Oracle calls.
+
+        Statements run inside the block become child spans. The parent is
+        the W3C ``traceparent`` when given, else the enclosing span. With
+        tracing off this is a no-op context yielding None.
+        """
+        exporter = self._span_exporter
+        if exporter is None:
+            return contextlib.nullcontext()
+        return self._open_span(exporter, name, attributes or {}, traceparent)
+
+    @contextlib.contextmanager
+    def _open_span(
+        self,
+        exporter: p.DbOracle.SpanExporter,
+        name: str,
+        attributes: t.MappingKV[str, t.Scalar],
+        traceparent: str | None,
+    ) -> Generator[m.DbOracle.Span]:
+        """Make a span current for the block, then end and export it."""
+        trace_id, parent_span_id = self._span_parent(traceparent)
+        span = m.DbOracle.Span(
+            name=name,
+            trace_id=trace_id,
+            parent_span_id=parent_span_id,
+            attributes={"db.system": "oracle", **attributes},
+        )
+        token = _CURRENT_SPAN.set(span)
+        try:
+            yield span
+        except Exception as e:
+            span.record_error(e)
+            raise
+        finally:
+            _CURRENT_SPAN.reset(token)
+            span.end_time_unix_nano = time.time_ns()
+            self._export_spans(exporter, [span])
+
+    def _export_spans(
+        self, exporter: p.DbOracle.SpanExporter, spans: Sequence[m.DbOracle.Span]
+    ) -> None:
+        """Hand finished spans to the exporter, logging a failed write.
+
+        Tracing never fails the traced call: an unwritable trace file is
+        logged and its spans are dropped.
+        """
+        try:
+            exporter.export(spans)
+        except OSError:
+            self.logger.exception("Span export failed", spans=len(spans))
+
+    @staticmethod
+    def _span_parent(traceparent: str | None = None) -> tuple[str, str | None]:
+        """Trace and parent span ids from a traceparent or the current span."""
+        remote = (
+            c.DbOracle.TRACEPARENT_RE.fullmatch(traceparent) if traceparent else None
+        )
+        if remote is not None:
+            return remote.group("trace_id"), remote.group("span_id")
+        current = _CURRENT_SPAN.get()
+        if current is not None:
+            return current.trace_id, current.span_id
+        return secrets.token_hex(16), None
+
+    def _begin_statement(self, sql: str) -> m.DbOracle.StatementTiming | None:
+        """Start timing a DB call; None (and no overhead) when disabled.
+
+        Calls are timed when instrumentation or tracing is enabled. The
+        bulk loaders that drive a connection directly (``upsert_via_staging``,
+        ``load_file``, ``copy_table`` and the refresh and DDL helpers) are not
+        timed per statement; they show up as ``trace`` spans only.
+        """
+        if not self.db_config.DbOracle.instrumentation and self._span_exporter is None:
+            return None
+        keyword, _, _ = sql.lstrip().partition(" ")
+        return m.DbOracle.StatementTiming(
+            operation_type=keyword.upper() or "UNKNOWN",
+            fingerprint=self.statement_fingerprint(sql),
+            statement=sql,
+        )
+
+    def _finish_statement(
+        self,
+        timing: m.DbOracle.StatementTiming,
+        *,
+        rows: int = 0,
+        payload_bytes: int = 0,
+        success: bool = True,
+        error: BaseException | None = None,
+    ) -> None:
+        """Record a timed DB call in the metrics and export its spans.
+
+        Calls reaching ``slow_query_seconds`` also go to the slow-query log.
+        """
+        timing.rows = rows
+        timing.payload_bytes = payload_bytes
+        timing.success = success and error is None
+        if self.db_config.DbOracle.instrumentation:
+            self._record_statement_metrics(timing)
+        if self._span_exporter is not None:
+            self._export_statement_spans(self._span_exporter, timing, error)
+        threshold = self.db_config.DbOracle.slow_query_seconds
+        if threshold > 0 and timing.total_seconds >= threshold:
+            self._log_slow_query(timing)
+
+    @contextlib.contextmanager
+    def _timed_connection(
+        self,
+        engine: SAEngine,
+        timing: m.DbOracle.StatementTiming | None,
+        *,
+        begin: bool = False,
+    ) -> Generator[SAConnection]:
+        """Check out a connection and end the checkout phase of ``timing``.
+
+        With ``begin`` the block runs in a transaction committed on exit.
+        """
+        with (
+            self._engine_begin(engine) if begin else self._engine_connect(engine)
+        ) as conn:
+            self._lap_statement(timing, c.DbOracle.StatementPhase.CHECKOUT, conn)
+            yield conn
+
+    def _lap_statement(
+        self,
+        timing: m.DbOracle.StatementTiming | None,
+        phase: c.DbOracle.StatementPhase,
+        conn: SAConnection | None = None,
+    ) -> None:
+        """End a phase of a timed call, then sample session stats on ``conn``."""
+        if timing is None:
+            return
+        setattr(timing, c.DbOracle.StatementPhase(phase).value, timing.lap())
+        if conn is not None:
+            self._sample_session_stats(timing, conn)
+
+    def _log_slow_query(self, timing: m.DbOracle.StatementTiming) -> None:
+        """Log a slow call in composed service facades."""
+        del timing
+        msg = "_log_slow_query requires the composed DB Oracle service facade"
+        raise NotImplementedError(msg)
+
+    def _record_plan(
+        self, plan: m.DbOracle.ExplainPlan, observed_seconds: float
+    ) -> None:
+        """Compare a captured plan with its baseline in composed service facades."""
+        del plan, observed_seconds
+        msg = "_record_plan requires the composed DB Oracle service facade"
+        raise NotImplementedError(msg)
+
+    def _bind_literals(
+        self, sql: str, params: m.ConfigMap | None
+    ) -> tuple[str, m.ConfigMap | None]:
+        """Swap the safe literals of ``sql`` for binds when ``bind_literals`` is on.
+
+        Rewritten templates are cached by ``parameterize_sql``, and every
+        literal variant of a statement then shares one cursor.
+        """
+        if not self.db_config.DbOracle.bind_literals:
+            return sql, params
+        template, literals = self.parameterize_sql(sql)
+        if not literals:
+            return sql, params
+        return template, m.ConfigMap(
+            root={**self.normalize_params(params).root, **dict(literals)}
+        )
+
+    def _track_literal_variants(
+        self, stats: m.DbOracle.StatementStats, sql: str
+    ) -> None:
+        """Count the distinct texts of a fingerprint and note its callers.
+
+        Each distinct text costs a hard parse. Once ``LITERAL_VARIANT_THRESHOLD``
+        texts share the fingerprint it is reported as literal-heavy, and up
+        to ``LITERAL_CALL_SITES`` calling lines outside the library are kept.
+        """
+        flagged = False
+        if not stats.literal_heavy:
+            digest = hash(sql)
+            if digest in stats.variant_hashes:
+                return
+            stats.variant_hashes.add(digest)
+            stats.literal_variants += 1
+            if not stats.literal_heavy:
+                return
+            stats.variant_hashes.clear()
+            flagged = True
+        if len(stats.call_sites) >= c.DbOracle.LITERAL_CALL_SITES:
+            return
+        site = self._call_site()
+        if site not in stats.call_sites:
+            stats.call_sites.append(site)
+        if flagged:
+            self.logger.warning(
+                "Literal-heavy statement",
+                fingerprint=stats.fingerprint,
+                normalized_sql=stats.normalized_sql,
+                call_site=site,
+            )
+
+    def _track_row_changes(
+        self, table_name: str, schema: str | None, rows_changed: int
+    ) -> None:
+        """Add rows written through this library to the table's change count.
+
+        ``gather_stats_if_stale`` weighs the accumulated count against the
+        row count of the table's current statistics.
+        """
+        if rows_changed <= 0:
+            return
+        key = self._dictionary_qualified_name(table_name, schema)
+        pending = self._stats_row_changes.get(key, 0) + rows_changed
+        self._stats_row_changes[key] = pending
+
+    def _track_statement_changes(self, sql: str, rows_changed: int) -> None:
+        """Attribute the rows of a DML statement to the table it writes."""
+        target = c.DbOracle.DML_TARGET_RE.match(sql)
+        if target is None:
+            return
+        schema = target.group("schema")
+        self._track_row_changes(
+            target.group("table").strip('"'),
+            schema.strip('"') if schema else None,
+            rows_changed,
+        )
+
+    @staticmethod
+    def _call_site() -> str:
+        """The innermost calling line outside this library and its stack."""
+        frame = inspect.currentframe()
+        while frame is not None:
+            module = str(frame.f_globals.get("__name__", ""))
+            if not module.startswith(c.DbOracle.CALL_SITE_SKIP_MODULES):
+                code = frame.f_code
+                return f"{code.co_filename}:{frame.f_lineno} in {code.co_name}"
+            frame = frame.f_back
+        return "unknown"
+
+    def _sample_session_stats(
+        self, timing: m.DbOracle.StatementTiming, conn: SAConnection
+    ) -> None:
+        """Snapshot ``v$mystat`` around a call, on the call's own connection.
+
+        The first sample is the baseline; the second stores the deltas less
+        the cost of one snapshot query, calibrated once per service. Time
+        spent sampling is kept out of the phase timings. A failed snapshot,
+        such as a missing grant on ``V_$MYSTAT``, is logged once and turns
+        sampling off until the next ``connect``.
+        """
+        if (
+            not self.db_config.DbOracle.session_stats
+            or self._session_stats_error is not None
+        ):
+            return
+        started = time.perf_counter()
+        try:
+            overhead = self._session_stats_calibration(conn)
+            snapshot = self._session_stats_snapshot(conn)
+        except c.DbOracle.EXC_DB_BROAD as e:
+            self._session_stats_error = str(e)
+            self.logger.warning("Session statistics unavailable", error=str(e))
+            return
+        finally:
+            timing.mark += time.perf_counter() - started
+        baseline = timing.session_baseline
+        if baseline is None:
+            timing.session_baseline = snapshot
+            return
+        timing.session_stats = {
+            name: max(value - baseline.get(name, value) - overhead.get(name, 0), 0)
+            for name, value in snapshot.items()
+        }
+
+    def _session_stats_calibration(self, conn: SAConnection) -> t.MappingKV[str, int]:
+        """Counter cost of one ``v$mystat`` snapshot, measured once per service."""
+        overhead = self._session_stats_overhead
+        if overhead is None:
+            first = self._session_stats_snapshot(conn)
+            second = self._session_stats_snapshot(conn)
+            overhead = {
+                name: value - first.get(name, value) for name, value in second.items()
+            }
+            self._session_stats_overhead = overhead
+        return overhead
+
+    def _session_stats_snapshot(self, conn: SAConnection) -> dict[str, int]:
+        """Read the tracked ``v$mystat`` counters of the connection's session."""
+        names = c.DbOracle.SESSION_STATISTICS
+        rows = self._connection_execute(
+            conn,
+            text(c.DbOracle.SESSION_STATISTICS_QUERY).bindparams(
+                bindparam("names", expanding=True)
+            ),
+            m.ConfigMap(root={"names": list(names)}),
+        )
+        return {
+            names[str(name)]: self._parse_count_value(value) for name, value in rows
+        }
+
+    def _record_statement_metrics(self, timing: m.DbOracle.StatementTiming) -> None:
+        """Record a timed DB call in the operation log and metrics registry.
+
+        The logged metadata is flat: the fingerprint, the phase seconds and
+        any ``v$mystat`` deltas.
+
+        Latency is also aggregated per statement fingerprint; the least
+        recently seen fingerprint is evicted past ``STATEMENT_STATS_CAPACITY``.
+        """
+        success = timing.success
+        _ = self.track_operation(
+            timing.operation_type,
+            timing.total_seconds,
+            success=success,
+            metadata={
+                "fingerprint": timing.fingerprint,
+                "checkout_seconds": timing.checkout_seconds,
+                "execute_seconds": timing.execute_seconds,
+                "fetch_seconds": timing.fetch_seconds,
+                "normalize_seconds": timing.normalize_seconds,
+                "commit_seconds": timing.commit_seconds,
+                **(timing.session_stats or {}),
+            },
+        )
+        self._checkout_stats.observe(timing.checkout_seconds, success=True)
+        statement_stats = self._statement_stats.pop(timing.fingerprint, None)
+        if statement_stats is None:
+            statement_stats = m.DbOracle.StatementStats(
+                fingerprint=timing.fingerprint,
+                normalized_sql=self.normalize_sql(timing.statement),
+            )
+        statement_stats.observe(timing.total_seconds, success=success)
+        statement_stats.rows += timing.rows
+        self._track_literal_variants(statement_stats, timing.statement)
+        self._statement_stats[timing.fingerprint] = statement_stats
+        if len(self._statement_stats) > c.DbOracle.STATEMENT_STATS_CAPACITY:
+            del self._statement_stats[next(iter(self._statement_stats))]
+        for name, value in (
+            ("statements_total", 1),
+            ("statement_errors_total", 0 if success else 1),
+            ("checkout_seconds_total", timing.checkout_seconds),
+            ("execute_seconds_total", timing.execute_seconds),
+            ("fetch_seconds_total", timing.fetch_seconds),
+            ("normalize_seconds_total", timing.normalize_seconds),
+            ("commit_seconds_total", timing.commit_seconds),
+            ("rows_total", timing.rows),
+            ("bytes_total", timing.payload_bytes),
+            *(
+                (f"session_{name}_total", value)
+                for name, value in (timing.session_stats or {}).items()
+            ),
+        ):
+            key = f"{c.DbOracle.METRIC_PREFIX}_{name}"
+            current = self._metrics.get(key, 0)
+            self._metrics[key] = (
+                current if isinstance(current, (int, float)) else 0
+            ) + value
+
+    def _export_statement_spans(
+        self,
+        exporter: p.DbOracle.SpanExporter,
+        timing: m.DbOracle.StatementTiming,
+        error: BaseException | None,
+    ) -> None:
+        """Export a timed DB call as a span with one child span per phase."""
+        trace_id, parent_span_id = self._span_parent()
+        start = timing.started_unix_nano
+        statement = m.DbOracle.Span(
+            name=timing.operation_type,
+            trace_id=trace_id,
+            parent_span_id=parent_span_id,
+            start_time_unix_nano=start,
+            end_time_unix_nano=start + int(timing.total_seconds * 1e9),
+            attributes={
+                "db.system": "oracle",
+                "db.operation.name": timing.operation_type,
+                "db.query.fingerprint": timing.fingerprint,
+                "db.response.returned_rows": timing.rows,
+                **{
+                    f"db.oracle.session.{name}": value
+                    for name, value in (timing.session_stats or {}).items()
+                },
+            },
+        )
+        if error is not None:
+            statement.record_error(error)
+        spans: list[m.DbOracle.Span] = []
+        for phase, seconds in (
+            ("checkout", timing.checkout_seconds),
+            ("execute", timing.execute_seconds),
+            ("fetch", timing.fetch_seconds),
+            ("normalize", timing.normalize_seconds),
+            ("commit", timing.commit_seconds),
+        ):
+            if not seconds:
+                continue
+            end = start + int(seconds * 1e9)
+            spans.append(
+                m.DbOracle.Span(
+                    name=phase,
+                    trace_id=trace_id,
+                    parent_span_id=statement.span_id,
+                    start_time_unix_nano=start,
+                    end_time_unix_nano=end,
+                    attributes={"db.system": "oracle"},
+                )
+            )
+            start = end
+        spans.append(statement)
+        self._export_spans(exporter, spans)
+
+    def _stream_row_batches(
+        self,
+        sql: str,
+        params: t.DbOracle.BindRow | None = None,
+        batch_size: int = c.DbOracle.DEFAULT_ARRAY_SIZE,
+        column_names: t.StrSequence | None = None,
+    ) -> Iterator[t.DbOracle.BindBatch]:
+        """Stream raw, driver-typed rows in batches through a server-side cursor.
+
+        Rows keep their native Python types (no string normalization) and are
+        keyed by ``column_names`` when given, else by the cursor description.
+        Driver errors propagate to the caller.
+        """
+        engine_result = self._get_engine()
+        if engine_result.failure:
+            raise ConnectionError(engine_result.error or "Not connected to database")
+        with self._engine_connect(engine_result.value) as conn:
+            result = conn.execution_options(
+                stream_results=True, yield_per=batch_size
+            ).execute(text(sql), dict(params or {}))
+            keys = list(column_names or result.keys())
+            for partition in result.partitions(batch_size):
+                yield [dict(zip(keys, row, strict=True)) for row in partition]
+
+    def _explain_statement(
+        self, sql: str, params: m.ConfigMap | None = None
+    ) -> p.Result[m.DbOracle.ExplainPlan]:
+        """EXPLAIN ``sql`` on its own pooled connection into a plan tree.
+
+        Binds missing from ``params`` are bound to NULL; EXPLAIN PLAN does
+        not peek at bind values. Plan texts are shared through a cache keyed
+        by plan hash, so repeated captures of one plan keep a single copy.
+        """
+        engine_result = self._get_engine()
+        if engine_result.failure:
+            return r[m.DbOracle.ExplainPlan].fail(
+                engine_result.error or "Not connected to database"
+            )
+        statement_id = (
+            f"{c.DbOracle.PLAN_STATEMENT_ID_PREFIX}{secrets.token_hex(8).upper()}"
+        )
+        values = self.normalize_params(params).root
+        binds = m.ConfigMap(root={"statement_id": statement_id})
+        try:
+            with self._engine_begin(engine_result.value) as conn:
+                _ = conn.exec_driver_sql(
+                    f"EXPLAIN PLAN SET STATEMENT_ID = '{statement_id}' FOR {sql}",
+                    {name: values.get(name) for name in self.statement_bind_names(sql)},
+                )
+                steps = (
+                    self
+                    ._connection_execute(
+                        conn,
+                        text(
+                            "SELECT id AS step_id, parent_id, operation, options, "
+                            "object_owner, object_name, cost, cardinality, "
+                            "bytes AS bytes_estimate, access_predicates, "
+                            "filter_predicates FROM plan_table "
+                            "WHERE statement_id = :statement_id ORDER BY id"
+                        ),
+                        binds,
+                    )
+                    .mappings()
+                    .all()
+                )
+                lines = [
+                    str(row[0])
+                    for row in self._connection_execute(
+                        conn,
+                        text(
+                            "SELECT plan_table_output FROM TABLE("
+                            "DBMS_XPLAN.DISPLAY('PLAN_TABLE', :statement_id, "
+                            "'TYPICAL'))"
+                        ),
+                        binds,
+                    )
+                ]
+                _ = self._connection_execute(
+                    conn,
+                    text("DELETE FROM plan_table WHERE statement_id = :statement_id"),
+                    binds,
+                )
+        except c.DbOracle.EXC_DB_BROAD as e:
+            return r[m.DbOracle.ExplainPlan].fail_op("Explain plan", e)
+        plan_text = "\n".join(lines)
+        match = c.DbOracle.PLAN_HASH_RE.search(plan_text)
+        plan_hash = match.group("plan_hash") if match is not None else None
+        if plan_hash is not None:
+            plan_text = self._plan_cache.pop(plan_hash, plan_text)
+            self._plan_cache[plan_hash] = plan_text
+            if len(self._plan_cache) > c.DbOracle.PLAN_CACHE_CAPACITY:
+                del self._plan_cache[next(iter(self._plan_cache))]
+        by_id: dict[int, m.DbOracle.PlanStep] = {}
+        root: m.DbOracle.PlanStep | None = None
+        for row in steps:
+            fields = {key: value for key, value in row.items() if value is not None}
+            parent_id = fields.pop("parent_id", None)
+            step = m.DbOracle.PlanStep.model_validate(fields)
+            parent = (
+                by_id.get(int(parent_id))
+                if isinstance(parent_id, (int, float))
+                else None
+            )
+            if parent is not None:
+                parent.children.append(step)
+            elif root is None:
+                root = step
+            by_id[step.step_id] = step
+        return r[m.DbOracle.ExplainPlan].ok(
+            m.DbOracle.ExplainPlan(
+                fingerprint=self.statement_fingerprint(sql),
+                plan_hash=plan_hash,
+                root=root,
+                text=plan_text,
+            )
+        )
+
     def execute_query(
         self, sql: str, params: m.ConfigMap | None = None
     ) -> p.Result[Sequence[m.Dict]]:
@@ -89,6 +682,211 @@ class FlextDbOracleServiceBase(s, FlextDbOracleUtilitiesDbOracle):
         msg = "execute_query requires the composed DB Oracle service facade"
         raise NotImplementedError(msg)
 
+    def track_operation(
+        self,
+        operation_type: str = "",
+        duration: float = 0.0,
+        *,
+        success: bool = True,
+        metadata: m.ConfigMap | t.JsonMapping | None = None,
+    ) -> p.Result[bool]:
+        """Track a database operation in composed service facades."""
+        del operation_type, duration, success, metadata
+        msg = "track_operation requires the composed DB Oracle service facade"
+        raise NotImplementedError(msg)
+
+    def statement_cache_info(self) -> t.MappingKV[str, tuple[int, int]]:
+        """Report statement cache hits and misses in composed service facades."""
+        msg = "statement_cache_info requires the composed DB Oracle service facade"
+        raise NotImplementedError(msg)
+
+    def execute_batch(self, sql: str, rows: t.DbOracle.BindBatch) -> p.Result[int]:
+        """Execute an array-bound statement in composed service facades."""
+        del sql, rows
+        msg = "execute_batch requires the composed DB Oracle service facade"
+        raise NotImplementedError(msg)
+
+    def fetch_columns(
+        self, table_name: str, schema_name: str | None = None
+    ) -> p.Result[Sequence[m.DbOracle.Column]]:
+        """Fetch table columns in composed service facades."""
+        del table_name, schema_name
+        msg = "fetch_columns requires the composed DB Oracle service facade"
+        raise NotImplementedError(msg)
+
+    def gather_stats_if_stale(
+        self,
+        table_name: str,
+        rows_changed: int,
+        *,
+        schema: str | None = None,
+        options: m.DbOracle.StatsOptions | None = None,
+    ) -> p.Result[m.DbOracle.StatsResult]:
+        """Gather table statistics when stale in composed service facades."""
+        del table_name, rows_changed, schema, options
+        msg = "gather_stats_if_stale requires the composed DB Oracle service facade"
+        raise NotImplementedError(msg)
+
+    def gather_table_stats(
+        self,
+        table_name: str,
+        *,
+        schema: str | None = None,
+        options: m.DbOracle.StatsOptions | None = None,
+    ) -> p.Result[m.DbOracle.StatsResult]:
+        """Gather table statistics in composed service facades."""
+        del table_name, schema, options
+        msg = "gather_table_stats requires the composed DB Oracle service facade"
+        raise NotImplementedError(msg)
+
+    def run_ddl_jobs(
+        self,
+        jobs: t.SequenceOf[m.DbOracle.DdlJob],
+        *,
+        max_workers: int = c.DbOracle.DEFAULT_DDL_WORKERS,
+        runner: t.DbOracle.StatementRunner | None = None,
+    ) -> p.Result[m.DbOracle.DdlRunResult]:
+        """Run DDL jobs concurrently in composed service facades."""
+        del jobs, max_workers, runner
+        msg = "run_ddl_jobs requires the composed DB Oracle service facade"
+        raise NotImplementedError(msg)
+
+    def build_create_index_statement(self, config: t.JsonMapping) -> p.Result[str]:
+        """Build CREATE INDEX DDL in composed service facades."""
+        del config
+        msg = (
+            "build_create_index_statement requires the composed DB Oracle service "
+            "facade"
+        )
+        raise NotImplementedError(msg)
+
+    def extract_incremental(
+        self,
+        table_name: str,
+        *,
+        replication_key: str | None = None,
+        bookmark: m.DbOracle.Bookmark | None = None,
+        schema: str | None = None,
+        columns: t.StrSequence | None = None,
+        batch_size: int = c.DbOracle.DEFAULT_ARRAY_SIZE,
+    ) -> p.Result[Iterator[tuple[t.DbOracle.BindBatch, m.DbOracle.Bookmark]]]:
+        """Stream rows changed since a bookmark in composed service facades."""
+        del table_name, replication_key, bookmark, schema, columns, batch_size
+        msg = "extract_incremental requires the composed DB Oracle service facade"
+        raise NotImplementedError(msg)
+
+    def bookmark_from_state(
+        self, state: t.JsonMapping, table_name: str, *, schema: str | None = None
+    ) -> p.Result[m.DbOracle.Bookmark | None]:
+        """Read a Singer bookmark in composed service facades."""
+        del state, table_name, schema
+        msg = "bookmark_from_state requires the composed DB Oracle service facade"
+        raise NotImplementedError(msg)
+
+    def upsert_rows(
+        self,
+        table_name: str,
+        rows: t.DbOracle.BindBatch,
+        key_columns: t.StrSequence,
+        *,
+        update_columns: t.StrSequence | None = None,
+        schema: str | None = None,
+        batch_size: int = c.DbOracle.DEFAULT_LOAD_BATCH_SIZE,
+    ) -> p.Result[int]:
+        """Upsert rows with array-bound MERGE in composed service facades."""
+        del table_name, rows, key_columns, update_columns, schema, batch_size
+        msg = "upsert_rows requires the composed DB Oracle service facade"
+        raise NotImplementedError(msg)
+
+    def fetch_tables(self, schema: str | None = None) -> p.Result[t.StrSequence]:
+        """List tables in composed service facades."""
+        del schema
+        msg = "fetch_tables requires the composed DB Oracle service facade"
+        raise NotImplementedError(msg)
+
+    def fetch_table_metadata(
+        self, table_name: str, schema: str | None = None
+    ) -> p.Result[m.DbOracle.TableMetadata]:
+        """Fetch table metadata in composed service facades."""
+        del table_name, schema
+        msg = "fetch_table_metadata requires the composed DB Oracle service facade"
+        raise NotImplementedError(msg)
+
+    def create_table_ddl(
+        self,
+        table_name: str,
+        columns: t.SequenceOf[m.DbOracle.Column | t.JsonMapping],
+        schema: str | None = None,
+        *,
+        options: m.DbOracle.TableStorageOptions | None = None,
+    ) -> p.Result[str]:
+        """Build CREATE TABLE DDL in composed service facades."""
+        del table_name, columns, schema, options
+        msg = "create_table_ddl requires the composed DB Oracle service facade"
+        raise NotImplementedError(msg)
+
+    def build_insert_all_statement(
+        self,
+        table_name: str,
+        columns: t.StrSequence,
+        row_count: int,
+        schema: str | None = None,
+    ) -> p.Result[str]:
+        """Build a multi-row INSERT ALL in composed service facades."""
+        del table_name, columns, row_count, schema
+        msg = (
+            "build_insert_all_statement requires the composed DB Oracle service facade"
+        )
+        raise NotImplementedError(msg)
+
+    def build_merge_statement(
+        self,
+        table_name: str,
+        key_columns: t.StrSequence,
+        update_columns: t.StrSequence,
+        schema: str | None = None,
+        source_table: str | None = None,
+        source_schema: str | None = None,
+    ) -> p.Result[str]:
+        """Build a MERGE upsert in composed service facades."""
+        del table_name, key_columns, update_columns, schema
+        del source_table, source_schema
+        msg = "build_merge_statement requires the composed DB Oracle service facade"
+        raise NotImplementedError(msg)
+
+    def build_select(
+        self,
+        table_name: str,
+        columns: t.StrSequence | None = None,
+        conditions: m.ConfigMap | t.JsonMapping | None = None,
+        schema_name: str | None = None,
+        *,
+        hints: m.DbOracle.QueryHints | None = None,
+        in_conditions: t.MappingKV[str, int] | None = None,
+        range_columns: t.StrSequence | None = None,
+        lower_bounds: t.MappingKV[str, bool] | None = None,
+        order_by: t.StrSequence | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> p.Result[str]:
+        """Build a SELECT statement in composed service facades."""
+        del table_name, columns, conditions, schema_name, hints, in_conditions
+        del range_columns, lower_bounds, order_by, limit, offset
+        msg = "build_select requires the composed DB Oracle service facade"
+        raise NotImplementedError(msg)
+
+    def build_insert_statement(
+        self,
+        table_name: str,
+        columns: t.StrSequence,
+        schema: str | None = None,
+        returning_columns: t.StrSequence | None = None,
+    ) -> p.Result[str]:
+        """Build an INSERT statement in composed service facades."""
+        del table_name, columns, schema, returning_columns
+        msg = "build_insert_statement requires the composed DB Oracle service facade"
+        raise NotImplementedError(msg)
+
 
 s = FlextDbOracleServiceBase
 
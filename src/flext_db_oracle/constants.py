@@ -86,6 +86,86 @@ class FlextDbOracleConstants(c):
         DEFAULT_POOL_RECYCLE: Final[int] = 3600
         DEFAULT_LISTENER_PORT: Final[int] = DEFAULT_PORT
         DEFAULT_SSL_PORT: Final[int] = 2484
+        DEFAULT_LOAD_BATCH_SIZE: Final[int] = DEFAULT_COMMIT_SIZE
+        DEFAULT_PIPELINE_QUEUE_DEPTH: Final[int] = 4
+        DEFAULT_FILE_CHUNK_BYTES: Final[int] = 1024 * 1024
+        DEFAULT_FILE_ENCODING: Final[str] = "utf-8"
+        DEFAULT_COPY_PARALLELISM: Final[int] = 4
+        DEFAULT_COPY_CHUNKS: Final[int] = 16
+        STATEMENT_CACHE_SIZE: Final[int] = 256
+        SINGER_COERCER_CACHE_SIZE: Final[int] = 64
+        DEFAULT_INSERT_ALL_ROWS: Final[int] = 100
+        DEFAULT_DDL_WORKERS: Final[int] = 4
+        STATS_STALE_FRACTION: Final[float] = 0.1
+        STAGING_TABLE_PREFIX: Final[str] = "STG_"
+        DIRECT_PATH_INSERT_HINT: Final[str] = "/*+ APPEND_VALUES */"
+        DIRECT_PATH_SELECT_HINT: Final[str] = "/*+ APPEND */"
+        SHADOW_TABLE_PREFIX: Final[str] = "SHD_"
+        RETIRED_TABLE_PREFIX: Final[str] = "OLD_"
+        ROWSCN_REPLICATION_KEY: Final[str] = "ORA_ROWSCN"
+        DEFAULT_TARGET_BATCH_SECONDS: Final[float] = 30.0
+        OPERATION_LOG_CAPACITY: Final[int] = 1024
+        LATENCY_HISTOGRAM_GAMMA: Final[float] = 1.02
+        LATENCY_HISTOGRAM_MIN_SECONDS: Final[float] = 1e-6
+        LATENCY_PERCENTILES: Final[tuple[float, ...]] = (0.5, 0.95, 0.99)
+        METRICS_LATENCY_BUCKETS: Final[tuple[float, ...]] = (
+            0.001,
+            0.0025,
+            0.005,
+            0.01,
+            0.025,
+            0.05,
+            0.1,
+            0.25,
+            0.5,
+            1.0,
+            2.5,
+            5.0,
+            10.0,
+        )
+        STATEMENT_STATS_CAPACITY: Final[int] = 500
+        SPAN_BUFFER_CAPACITY: Final[int] = 4096
+        DEFAULT_METRICS_HOST: Final[str] = "127.0.0.1"
+        DEFAULT_METRICS_PORT: Final[int] = 9464
+        OPENMETRICS_CONTENT_TYPE: Final[str] = (
+            "application/openmetrics-text; version=1.0.0; charset=utf-8"
+        )
+        SLOW_QUERY_LOG_CAPACITY: Final[int] = 256
+        PLAN_CACHE_CAPACITY: Final[int] = 128
+        PLAN_BASELINE_CAPACITY: Final[int] = 500
+        PLAN_REGRESSION_FACTOR: Final[float] = 1.5
+        LITERAL_VARIANT_THRESHOLD: Final[int] = 20
+        LITERAL_CALL_SITES: Final[int] = 5
+        LITERAL_BIND_PREFIX: Final[str] = "flext_lit_"
+        LITERAL_CLAUSE_KEYWORDS: Final[frozenset[str]] = frozenset({
+            "from",
+            "where",
+            "having",
+            "union",
+            "intersect",
+            "minus",
+            "except",
+            "fetch",
+            "offset",
+            "connect",
+            "start",
+            "for",
+        })
+        CALL_SITE_SKIP_MODULES: Final[tuple[str, ...]] = (
+            "flext_db_oracle",
+            "flext_core",
+            "flext_cli",
+            "sqlalchemy",
+        )
+        PLAN_STATEMENT_ID_PREFIX: Final[str] = "FLEXT_"
+        EXPLAINABLE_KEYWORDS: Final[frozenset[str]] = frozenset({
+            "SELECT",
+            "WITH",
+            "INSERT",
+            "UPDATE",
+            "DELETE",
+            "MERGE",
+        })
 
         MIN_PORT: Final[int] = 1
         MAX_PORT: Final[int] = 65535
@@ -103,11 +183,29 @@ class FlextDbOracleConstants(c):
         MAX_SERVICE_NAME_LENGTH: Final[int] = MAX_IDENTIFIER_LENGTH
         MAX_HOSTNAME_LENGTH: Final[int] = 253
         MAX_VARCHAR_LENGTH: Final[int] = 4000
+        MAX_REJECTED_SAMPLES: Final[int] = 100
+        MAX_BIND_VARIABLES: Final[int] = 65535
+        MAX_INSERT_ALL_COLUMNS: Final[int] = 999
+        MAX_IN_LIST_SIZE: Final[int] = 1000
+        IN_LIST_BIND_BUCKETS: Final[tuple[int, ...]] = (
+            1,
+            2,
+            4,
+            8,
+            16,
+            32,
+            64,
+            128,
+            256,
+            512,
+            MAX_IN_LIST_SIZE,
+        )
 
         MIN_COLUMN_FIELDS: Final[int] = 4
         COLUMN_METADATA_FIELD_COUNT: Final[int] = 7
         MILLISECONDS_TO_SECONDS_THRESHOLD: Final[int] = 1000
         PERFORMANCE_WARNING_THRESHOLD_SECONDS: Final[float] = 5.0
+        METRIC_PREFIX: Final[str] = "db_oracle"
         CONNECTION_IDLE_TIMEOUT_SECONDS: Final[int] = 3600
         DATA_SIZE_ESTIMATION_FACTOR: Final[int] = 50
         CONNECTION_EXCELLENT_THRESHOLD_SECONDS: Final[float] = 0.1
@@ -146,6 +244,41 @@ class FlextDbOracleConstants(c):
         SCHEMA_PATTERN: Final[str] = IDENTIFIER_PATTERN
         SCHEMA_RE: ClassVar[t.RegexPattern] = IDENTIFIER_RE
         WHITESPACE_RE: ClassVar[t.RegexPattern] = re.compile(r"\s+")
+        VARCHAR2_TYPE_RE: ClassVar[t.RegexPattern] = re.compile(
+            r"^VARCHAR2\((\d+)\)$", re.IGNORECASE
+        )
+        SQL_TOKEN_RE: ClassVar[t.RegexPattern] = re.compile(
+            r"""
+            (?P<comment>--[^\n]*|/\*.*?\*/)
+            |(?P<string>[nN]?'(?:[^']|'')*')
+            |(?P<quoted>"[^"]*")
+            |(?P<bind>:\w+)
+            |(?P<number>(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?(?![\w$#]))
+            |(?P<word>[^\W\d][\w$#]*)
+            |(?P<symbol>\S)
+            """,
+            re.VERBOSE | re.DOTALL,
+        )
+        SQL_IN_LIST_RE: ClassVar[t.RegexPattern] = re.compile(
+            r"\bin \( (?:\?|:\w+)(?: , (?:\?|:\w+))* \)"
+        )
+        ORA_ERROR_RE: ClassVar[t.RegexPattern] = re.compile(r"\bORA-\d{5}\b")
+        PLAN_HASH_RE: ClassVar[t.RegexPattern] = re.compile(
+            r"^Plan hash value: (?P<plan_hash>\d+)", re.MULTILINE
+        )
+        TRACEPARENT_RE: ClassVar[t.RegexPattern] = re.compile(
+            r"^00-(?P<trace_id>[0-9a-f]{32})-(?P<span_id>[0-9a-f]{16})-[0-9a-f]{2}$"
+        )
+        DML_TARGET_RE: ClassVar[t.RegexPattern] = re.compile(
+            r"""
+            ^\s*(?:INSERT|UPDATE|DELETE|MERGE)(?:\s*/\*.*?\*/)?\s+
+            (?:(?:ALL|FIRST)\b.*?\bINTO\s+|(?:INTO|FROM)\s+)?
+            (?!(?:ALL|FIRST)\b)
+            (?:(?P<schema>"[^"]+"|[A-Za-z][\w$#]*)\s*\.\s*)?
+            (?P<table>"[^"]+"|[A-Za-z][\w$#]*)
+            """,
+            re.IGNORECASE | re.VERBOSE | re.DOTALL,
+        )
 
         @staticmethod
         def collapse_whitespace(value: str) -> str:
@@ -293,6 +426,116 @@ class FlextDbOracleConstants(c):
             CHAR = "CHAR"
             RAW = "RAW"
 
+        @unique
+        class LoadFileFormat(StrEnum):
+            """Flat file formats accepted by the bulk file loader."""
+
+            CSV = "csv"
+            JSONL = "jsonl"
+
+        @unique
+        class CopyChunkStrategy(StrEnum):
+            """How a table copy splits the source into resumable chunks."""
+
+            PK_RANGE = "pk_range"
+            HASH = "hash"
+
+        @unique
+        class PartitionType(StrEnum):
+            """Table partitioning methods supported by CREATE TABLE DDL."""
+
+            RANGE = "range"
+            INTERVAL = "interval"
+            HASH = "hash"
+
+        @unique
+        class TableCompression(StrEnum):
+            """Table compression levels supported by CREATE TABLE DDL."""
+
+            BASIC = "basic"
+            ADVANCED = "advanced"
+
+        @unique
+        class DdlJobStatus(StrEnum):
+            """Final state of one job run by the parallel DDL executor."""
+
+            SUCCEEDED = "succeeded"
+            FAILED = "failed"
+            SKIPPED = "skipped"
+
+        @unique
+        class RefreshSwap(StrEnum):
+            """How a full refresh swaps the loaded shadow table into place."""
+
+            EXCHANGE = "exchange"
+            RENAME = "rename"
+
+        @unique
+        class JsonBackend(StrEnum):
+            """JSON serialization backends; AUTO picks the fastest installed."""
+
+            AUTO = "auto"
+            MSGSPEC = "msgspec"
+            STDLIB = "stdlib"
+
+        @unique
+        class SingerMessageType(StrEnum):
+            """Singer message types exchanged between taps and targets."""
+
+            SCHEMA = "SCHEMA"
+            RECORD = "RECORD"
+            STATE = "STATE"
+
+        @unique
+        class StatementStatsOrder(StrEnum):
+            """Sort keys of the per-fingerprint statement statistics."""
+
+            TOTAL_SECONDS = "total_seconds"
+            MEAN_SECONDS = "mean_seconds"
+            MAX_SECONDS = "max_seconds"
+            CALLS = "count"
+            ROWS = "rows"
+            ERRORS = "errors"
+            LITERAL_VARIANTS = "literal_variants"
+
+        @unique
+        class StatementPhase(StrEnum):
+            """Timed phases of a DB call, named after their timing fields."""
+
+            CHECKOUT = "checkout_seconds"
+            EXECUTE = "execute_seconds"
+            FETCH = "fetch_seconds"
+            NORMALIZE = "normalize_seconds"
+            COMMIT = "commit_seconds"
+
+        @unique
+        class PlanCaptureStatus(StrEnum):
+            """Progress of the background EXPLAIN PLAN of a slow query."""
+
+            PENDING = "pending"
+            CAPTURED = "captured"
+            SKIPPED = "skipped"
+            FAILED = "failed"
+
+        @unique
+        class SpanStatus(StrEnum):
+            """OpenTelemetry span status codes."""
+
+            UNSET = "UNSET"
+            OK = "OK"
+            ERROR = "ERROR"
+
+        @unique
+        class StatsGranularity(StrEnum):
+            """DBMS_STATS granularity for partitioned table statistics."""
+
+            AUTO = "AUTO"
+            GLOBAL = "GLOBAL"
+            PARTITION = "PARTITION"
+            GLOBAL_AND_PARTITION = "GLOBAL AND PARTITION"
+            SUBPARTITION = "SUBPARTITION"
+            ALL = "ALL"
+
         @unique
         class IsolationLevel(StrEnum):
             """Oracle transaction isolation levels."""
@@ -341,6 +584,71 @@ class FlextDbOracleConstants(c):
         VALID_ISOLATION_LEVELS: Final[frozenset[str]] = frozenset(
             ISOLATION_LEVEL_LITERAL
         )
+        LOAD_FILE_SUFFIXES: Final[t.StrMapping] = MappingProxyType({
+            ".csv": LoadFileFormat.CSV.value,
+            ".jsonl": LoadFileFormat.JSONL.value,
+            ".ndjson": LoadFileFormat.JSONL.value,
+        })
+        TABLE_COMPRESSION_CLAUSES: Final[t.StrMapping] = MappingProxyType({
+            TableCompression.BASIC.value: "ROW STORE COMPRESS BASIC",
+            TableCompression.ADVANCED.value: "ROW STORE COMPRESS ADVANCED",
+        })
+        SESSION_STATISTICS: Final[t.StrMapping] = MappingProxyType({
+            "consistent gets": "consistent_gets",
+            "physical reads": "physical_reads",
+            "parse count (hard)": "hard_parses",
+            "parse count (total)": "parses",
+            "bytes sent via SQL*Net to client": "bytes_sent",
+            "bytes received via SQL*Net from client": "bytes_received",
+            "SQL*Net roundtrips to/from client": "round_trips",
+        })
+        SESSION_STATISTICS_QUERY: Final[str] = (
+            "SELECT n.name, s.value FROM v$mystat s "
+            "JOIN v$statname n ON n.statistic# = s.statistic# "
+            "WHERE n.name IN :names"
+        )
+        NUMERIC_TYPE_PREFIXES: Final[t.StrSequence] = (
+            "NUMBER",
+            "INTEGER",
+            "FLOAT",
+            "BINARY_FLOAT",
+            "BINARY_DOUBLE",
+        )
+        TEMPORAL_TYPE_PREFIXES: Final[t.StrSequence] = ("DATE", "TIMESTAMP")
+        LENGTH_QUALIFIED_TYPES: Final[frozenset[str]] = frozenset({
+            "VARCHAR2",
+            "NVARCHAR2",
+            "CHAR",
+            "NCHAR",
+            "RAW",
+        })
+
+        @staticmethod
+        def format_type_spec(
+            data_type: str,
+            data_length: int | None = None,
+            data_precision: int | None = None,
+            data_scale: int | None = None,
+        ) -> str:
+            """Render a dictionary-view column type as a DDL type specification.
+
+            ``ALL_TAB_COLUMNS`` reports ``VARCHAR2`` and ``100`` separately; DDL
+            needs ``VARCHAR2(100)``. Types that already carry a size are kept.
+            """
+            base_type = data_type.upper()
+            if "(" in base_type:
+                return data_type
+            if (
+                base_type in FlextDbOracleConstants.DbOracle.LENGTH_QUALIFIED_TYPES
+                and data_length
+            ):
+                return f"{data_type}({data_length})"
+            if base_type == "NUMBER" and data_precision is not None:
+                if data_scale:
+                    return f"{data_type}({data_precision},{data_scale})"
+                return f"{data_type}({data_precision})"
+            return data_type
+
         SYSTEM_USERS: Final[t.StrSequence] = ("SYS", "SYSTEM", "XDB", "DBSNMP", "OUTLN")
         DEFAULT_SCHEMAS: Final[t.StrSequence] = ("SYSTEM", "SYS", "PUBLIC")
 
@@ -70,7 +70,15 @@ class FlextDbOracleDispatcher(FlextService[None]):
                 fn: Callable[[p.Routable], t.JsonPayload],
             ) -> Callable[[p.Routable], p.Result[t.JsonPayload]]:
                 def wrapped(message: p.Routable) -> p.Result[t.JsonPayload]:
-                    return r[t.JsonPayload].ok(fn(message))
+                    traceparent = (
+                        message.traceparent
+                        if isinstance(message, m.DbOracle.TracedCommand)
+                        else None
+                    )
+                    with services.trace(
+                        f"dispatch {type(message).__name__}", traceparent=traceparent
+                    ):
+                        return r[t.JsonPayload].ok(fn(message))
 
                 return wrapped
 
@@ -10,14 +10,24 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
+import bisect
+import itertools
+import math
+import secrets
+import time
+from collections import deque
 from datetime import datetime
+from pathlib import Path
 from types import MappingProxyType
-from typing import ClassVar
+from typing import TYPE_CHECKING, ClassVar
 
 from flext_cli import m, u
 from flext_db_oracle import c, t
 from flext_db_oracle._models.password import FlextDbOraclePassword
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 
 class FlextDbOracleModels(m):
     """Oracle database models using flext-core exclusively.
@@ -56,6 +66,19 @@ class FlextDbOracleModels(m):
             name: str
             data_type: str
             nullable: bool = True
+            data_length: int | None = None
+            data_precision: int | None = None
+            data_scale: int | None = None
+
+            @property
+            def type_spec(self) -> str:
+                """DDL-ready Oracle type including length or precision."""
+                return c.DbOracle.format_type_spec(
+                    self.data_type,
+                    self.data_length,
+                    self.data_precision,
+                    self.data_scale,
+                )
 
         class ConnectionStatus(m.Entity, m.FlexibleModel):
             """Connection status using flext-core Entity."""
@@ -341,6 +364,834 @@ class FlextDbOracleModels(m):
             )
             timestamp: str = u.Field(description="ISO timestamp of operation")
 
+        class OperationStats(DbOracleDomainModel):
+            """Cumulative count, errors and streaming latency histogram of one type.
+
+            Latencies fall into logarithmic buckets of ratio
+            ``LATENCY_HISTOGRAM_GAMMA``, so percentiles carry a bounded relative
+            error (about 1%) in constant memory per order of magnitude.
+            """
+
+            count: t.NonNegativeInt = u.Field(0, description="Operations observed")
+            errors: t.NonNegativeInt = u.Field(0, description="Failed operations")
+            total_seconds: t.NonNegativeFloat = u.Field(
+                0.0, description="Summed operation duration in seconds"
+            )
+            max_seconds: t.NonNegativeFloat = u.Field(
+                0.0, description="Slowest observed operation in seconds"
+            )
+            buckets: t.MutableMappingKV[int, int] = u.Field(
+                default_factory=dict,
+                description="Operation counts per logarithmic latency bucket",
+            )
+
+            @u.computed_field(return_type=float)
+            @property
+            def error_rate(self) -> float:
+                """Fraction of observed operations that failed."""
+                return self.errors / self.count if self.count else 0.0
+
+            @u.computed_field(return_type=float)
+            @property
+            def mean_seconds(self) -> float:
+                """Average operation duration in seconds."""
+                return self.total_seconds / self.count if self.count else 0.0
+
+            def observe(self, seconds: float, *, success: bool) -> None:
+                """Add one operation to the aggregates in place."""
+                duration = max(seconds, 0.0)
+                self.count += 1
+                self.errors += 0 if success else 1
+                self.total_seconds += duration
+                self.max_seconds = max(self.max_seconds, duration)
+                bucket = math.ceil(
+                    math.log(max(duration, c.DbOracle.LATENCY_HISTOGRAM_MIN_SECONDS))
+                    / math.log(c.DbOracle.LATENCY_HISTOGRAM_GAMMA)
+                )
+                self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+            def percentile(self, fraction: float) -> float:
+                """Estimate the latency below which ``fraction`` of operations fall."""
+                if not self.count:
+                    return 0.0
+                rank = fraction * self.count
+                seen = 0
+                bucket = 0
+                for bucket in sorted(self.buckets):
+                    seen += self.buckets[bucket]
+                    if seen >= rank:
+                        break
+                return min(self._bucket_value(bucket), self.max_seconds)
+
+            def bucket_counts(self, bounds: t.SequenceOf[float]) -> list[int]:
+                """Count operations at or below each ascending bound (``le``)."""
+                per_bound = [0] * (len(bounds) + 1)
+                for bucket, count in list(self.buckets.items()):
+                    value = self._bucket_value(bucket)
+                    per_bound[bisect.bisect_left(bounds, value)] += count
+                return list(itertools.accumulate(per_bound[:-1]))
+
+            @staticmethod
+            def _bucket_value(bucket: int) -> float:
+                """Representative latency of a logarithmic bucket."""
+                gamma = c.DbOracle.LATENCY_HISTOGRAM_GAMMA
+                return 2 * gamma**bucket / (gamma + 1)
+
+            def summary(self) -> t.JsonDict:
+                """Render count, error rate and p50/p95/p99 latency as JSON."""
+                summary: t.JsonDict = {
+                    "count": self.count,
+                    "error_rate": self.error_rate,
+                    "mean_seconds": self.mean_seconds,
+                    "max_seconds": self.max_seconds,
+                }
+                for fraction in c.DbOracle.LATENCY_PERCENTILES:
+                    key = f"p{round(fraction * 100)}_seconds"
+                    summary[key] = self.percentile(fraction)
+                return summary
+
+        class StatementStats(OperationStats):
+            """Client-side ``pg_stat_statements`` entry of one SQL fingerprint."""
+
+            fingerprint: str = u.Field(description="Statement fingerprint")
+            normalized_sql: str = u.Field(description="Literal-free statement text")
+            rows: t.NonNegativeInt = u.Field(0, description="Rows fetched or affected")
+            literal_variants: t.NonNegativeInt = u.Field(
+                0, description="Distinct statement texts seen, up to the threshold"
+            )
+            variant_hashes: set[int] = u.Field(
+                default_factory=set,
+                exclude=True,
+                description="Hashes of the distinct statement texts seen",
+            )
+            call_sites: list[str] = u.Field(
+                default_factory=list,
+                description="Callers of the statement once it is literal-heavy",
+            )
+
+            @u.computed_field(return_type=bool)
+            @property
+            def literal_heavy(self) -> bool:
+                """Whether literal variants likely cause one hard parse each."""
+                return self.literal_variants >= c.DbOracle.LITERAL_VARIANT_THRESHOLD
+
+        class StatementTiming(DbOracleDomainModel):
+            """Phase timings, volume and outcome of one instrumented DB call."""
+
+            operation_type: str = u.Field(description="Leading SQL keyword")
+            fingerprint: str = u.Field(description="Statement fingerprint")
+            statement: str = u.Field(
+                "", exclude=True, description="SQL text of the call"
+            )
+            checkout_seconds: t.NonNegativeFloat = u.Field(
+                0.0, description="Connection checkout wait in seconds"
+            )
+            execute_seconds: t.NonNegativeFloat = u.Field(
+                0.0, description="Statement execute time in seconds"
+            )
+            fetch_seconds: t.NonNegativeFloat = u.Field(
+                0.0, description="Result fetch time in seconds"
+            )
+            normalize_seconds: t.NonNegativeFloat = u.Field(
+                0.0, description="Row normalization time in seconds"
+            )
+            commit_seconds: t.NonNegativeFloat = u.Field(
+                0.0, description="Transaction commit time in seconds"
+            )
+            rows: t.NonNegativeInt = u.Field(0, description="Rows fetched or affected")
+            payload_bytes: t.NonNegativeInt = u.Field(
+                0, description="Fetched result payload size in bytes"
+            )
+            success: bool = u.Field(True, description="Whether the call succeeded")
+            session_stats: t.MutableMappingKV[str, int] | None = u.Field(
+                None, description="v$mystat counter deltas of the call"
+            )
+            session_baseline: t.MappingKV[str, int] | None = u.Field(
+                None,
+                exclude=True,
+                description="v$mystat counters sampled before the call",
+            )
+            mark: float = u.Field(
+                default_factory=time.perf_counter,
+                exclude=True,
+                description="perf_counter value at the end of the last phase",
+            )
+            started_unix_nano: int = u.Field(
+                default_factory=time.time_ns,
+                exclude=True,
+                description="Wall-clock start of the call in nanoseconds",
+            )
+
+            @u.computed_field(return_type=float)
+            @property
+            def total_seconds(self) -> float:
+                """Summed time of all phases."""
+                return (
+                    self.checkout_seconds
+                    + self.execute_seconds
+                    + self.fetch_seconds
+                    + self.normalize_seconds
+                    + self.commit_seconds
+                )
+
+            def lap(self) -> float:
+                """Return the seconds since the previous lap and restart the clock."""
+                now = time.perf_counter()
+                elapsed = now - self.mark
+                self.mark = now
+                return elapsed
+
+        class SlowQuery(DbOracleDomainModel):
+            """Slow-query log entry: literal-free SQL, timings and plan."""
+
+            fingerprint: str = u.Field(description="Statement fingerprint")
+            normalized_sql: str = u.Field(description="Literal-free statement text")
+            operation_type: str = u.Field(description="Leading SQL keyword")
+            elapsed_seconds: t.NonNegativeFloat = u.Field(
+                description="Total call duration in seconds"
+            )
+            phases: t.MappingKV[str, float] = u.Field(
+                default_factory=dict, description="Seconds spent per call phase"
+            )
+            rows: t.NonNegativeInt = u.Field(0, description="Rows fetched or affected")
+            success: bool = u.Field(True, description="Whether the call succeeded")
+            timestamp: str = u.Field(description="Unix time the call finished")
+            plan_status: c.DbOracle.PlanCaptureStatus = u.Field(
+                c.DbOracle.PlanCaptureStatus.PENDING,
+                description="Progress of the background EXPLAIN PLAN",
+            )
+            plan_hash: str | None = u.Field(
+                None, description="Oracle plan hash value of the captured plan"
+            )
+            plan: str = u.Field("", description="DBMS_XPLAN rendering of the plan")
+            plan_error: str | None = u.Field(
+                None, description="Why the plan could not be captured"
+            )
+
+        class PlanStep(DbOracleDomainModel):
+            """One row source of an execution plan, with its child steps."""
+
+            step_id: t.NonNegativeInt = u.Field(description="Step id within the plan")
+            operation: str = u.Field(description="Row source operation")
+            options: str = u.Field("", description="Operation variant")
+            object_owner: str = u.Field("", description="Owner of the accessed object")
+            object_name: str = u.Field("", description="Name of the accessed object")
+            cost: int | None = u.Field(None, description="Optimizer cost estimate")
+            cardinality: int | None = u.Field(
+                None, description="Estimated rows produced"
+            )
+            bytes_estimate: int | None = u.Field(
+                None, description="Estimated bytes produced"
+            )
+            access_predicates: str = u.Field(
+                "", description="Predicates used to locate rows"
+            )
+            filter_predicates: str = u.Field(
+                "", description="Predicates applied to located rows"
+            )
+            children: list[FlextDbOracleModels.DbOracle.PlanStep] = u.Field(
+                default_factory=list, description="Child row sources in id order"
+            )
+
+            def walk(self) -> Iterator[FlextDbOracleModels.DbOracle.PlanStep]:
+                """Yield this step and its descendants depth-first."""
+                yield self
+                for child in self.children:
+                    yield from child.walk()
+
+        class ExplainPlan(DbOracleDomainModel):
+            """Structured EXPLAIN PLAN of one statement."""
+
+            fingerprint: str = u.Field(description="Statement fingerprint")
+            plan_hash: str | None = u.Field(None, description="Oracle plan hash value")
+            root: FlextDbOracleModels.DbOracle.PlanStep | None = u.Field(
+                None, description="Top row source of the plan tree"
+            )
+            text: str = u.Field("", description="DBMS_XPLAN rendering of the plan")
+
+            @u.computed_field(return_type=int)
+            @property
+            def cost(self) -> int:
+                """Optimizer cost of the whole statement."""
+                return (self.root.cost or 0) if self.root is not None else 0
+
+        class PlanBaseline(DbOracleDomainModel):
+            """First plan seen for a fingerprint and its latency at that time."""
+
+            fingerprint: str = u.Field(description="Statement fingerprint")
+            plan_hash: str = u.Field(description="Baseline plan hash value")
+            mean_seconds: t.NonNegativeFloat = u.Field(
+                0.0, description="Statement latency under the baseline plan"
+            )
+            plan: str = u.Field("", description="DBMS_XPLAN rendering of the plan")
+            timestamp: str = u.Field(description="Unix time the baseline was set")
+
+        class PlanRegression(DbOracleDomainModel):
+            """A plan change of a fingerprint that came with slower execution."""
+
+            fingerprint: str = u.Field(description="Statement fingerprint")
+            baseline_plan_hash: str = u.Field(description="Plan hash of the baseline")
+            plan_hash: str = u.Field(description="Plan hash now in use")
+            baseline_seconds: t.NonNegativeFloat = u.Field(
+                description="Statement latency under the baseline plan"
+            )
+            observed_seconds: t.NonNegativeFloat = u.Field(
+                description="Statement latency under the new plan"
+            )
+            timestamp: str = u.Field(description="Unix time the change was seen")
+
+            @u.computed_field(return_type=float)
+            @property
+            def slowdown(self) -> float:
+                """Observed latency as a multiple of the baseline latency."""
+                if not self.baseline_seconds:
+                    return 0.0
+                return self.observed_seconds / self.baseline_seconds
+
+        class Span(DbOracleDomainModel):
+            """OpenTelemetry-compatible trace span of one Oracle call or phase."""
+
+            name: str = u.Field(description="Span name")
+            trace_id: str = u.Field(
+                default_factory=lambda: secrets.token_hex(16),
+                description="32-hex-digit trace identifier",
+            )
+            span_id: str = u.Field(
+                default_factory=lambda: secrets.token_hex(8),
+                description="16-hex-digit span identifier",
+            )
+            parent_span_id: str | None = u.Field(
+                None, description="Identifier of the parent span"
+            )
+            start_time_unix_nano: int = u.Field(
+                default_factory=time.time_ns, description="Start time in nanoseconds"
+            )
+            end_time_unix_nano: int = u.Field(0, description="End time in nanoseconds")
+            attributes: t.MutableMappingKV[str, t.Scalar] = u.Field(
+                default_factory=dict, description="Span attributes"
+            )
+            status: c.DbOracle.SpanStatus = u.Field(
+                c.DbOracle.SpanStatus.UNSET, description="Span status code"
+            )
+            status_message: str = u.Field("", description="Error description")
+
+            @u.computed_field(return_type=float)
+            @property
+            def duration_seconds(self) -> float:
+                """Span duration in seconds (0 while the span is open)."""
+                if not self.end_time_unix_nano:
+                    return 0.0
+                return (self.end_time_unix_nano - self.start_time_unix_nano) / 1e9
+
+            @property
+            def traceparent(self) -> str:
+                """W3C ``traceparent`` header value for propagating this span."""
+                return f"00-{self.trace_id}-{self.span_id}-01"
+
+            def record_error(self, error: BaseException) -> None:
+                """Mark the span failed, keeping the ORA error code when present."""
+                message = str(error)
+                code = c.DbOracle.ORA_ERROR_RE.search(message)
+                self.status = c.DbOracle.SpanStatus.ERROR
+                self.status_message = message
+                self.attributes["error.type"] = type(error).__name__
+                if code is not None:
+                    self.attributes["error.type"] = code.group(0)
+                    self.attributes["db.response.status_code"] = code.group(0)
+
+        class InMemorySpanExporter(DbOracleDomainModel):
+            """Span exporter keeping the latest finished spans in memory.
+
+            Only the last ``SPAN_BUFFER_CAPACITY`` spans are kept, so a traced
+            service left running does not grow without bound.
+            """
+
+            spans: deque[FlextDbOracleModels.DbOracle.Span] = u.Field(
+                default_factory=lambda: deque(maxlen=c.DbOracle.SPAN_BUFFER_CAPACITY),
+                description="Latest exported spans, in end order",
+            )
+
+            def export(
+                self, spans: t.SequenceOf[FlextDbOracleModels.DbOracle.Span]
+            ) -> None:
+                """Keep the finished spans."""
+                self.spans.extend(spans)
+
+        class FileSpanExporter(DbOracleDomainModel):
+            """Span exporter appending finished spans to a JSON-lines file."""
+
+            path: str = u.Field(description="JSON-lines file receiving spans")
+
+            def export(
+                self, spans: t.SequenceOf[FlextDbOracleModels.DbOracle.Span]
+            ) -> None:
+                """Append one JSON line per finished span."""
+                with Path(self.path).open("a", encoding="utf-8") as handle:
+                    handle.writelines(f"{span.model_dump_json()}\n" for span in spans)
+
+        class StatsOptions(DbOracleDomainModel):
+            """DBMS_STATS.GATHER_TABLE_STATS settings and the staleness threshold."""
+
+            degree: t.PositiveInt | None = u.Field(
+                None, description="Parallel degree (table default when unset)"
+            )
+            estimate_percent: float | None = u.Field(
+                None,
+                gt=0,
+                le=100,
+                description="Sample percent (AUTO_SAMPLE_SIZE when unset)",
+            )
+            granularity: c.DbOracle.StatsGranularity = u.Field(
+                c.DbOracle.StatsGranularity.AUTO,
+                description="Partition granularity of the gathered statistics",
+            )
+            incremental: bool | None = u.Field(
+                None,
+                description="Set the INCREMENTAL table preference before gathering",
+            )
+            partition_name: str | None = u.Field(
+                None, description="Restrict gathering to one partition"
+            )
+            cascade: bool = u.Field(True, description="Also gather index statistics")
+            stale_fraction: float = u.Field(
+                c.DbOracle.STATS_STALE_FRACTION,
+                ge=0,
+                description="Changed-row fraction of the analyzed row count that "
+                "makes statistics stale",
+            )
+
+        class StatsResult(DbOracleDomainModel):
+            """Outcome of a (possibly skipped) statistics gathering."""
+
+            table_name: str = u.Field(description="Analyzed table")
+            gathered: bool = u.Field(
+                False, description="Whether DBMS_STATS ran for the table"
+            )
+            rows_changed: t.NonNegativeInt = u.Field(
+                0, description="Rows changed since statistics were last gathered"
+            )
+            analyzed_rows: t.NonNegativeInt | None = u.Field(
+                None, description="NUM_ROWS of the previous statistics, if any"
+            )
+            elapsed_seconds: t.NonNegativeFloat = u.Field(
+                0.0, description="Duration of the gathering in seconds"
+            )
+
+        class DdlJob(DbOracleDomainModel):
+            """One DDL statement scheduled by the parallel DDL executor."""
+
+            name: str = u.Field(description="Unique job name used for dependencies")
+            sql: str = u.Field(description="DDL statement to execute")
+            depends_on: t.StrSequence = u.Field(
+                default_factory=tuple,
+                description="Names of jobs that must succeed before this one",
+            )
+
+        class DdlJobResult(DbOracleDomainModel):
+            """Outcome and timing of one DDL job."""
+
+            name: str = u.Field(description="Job name")
+            status: c.DbOracle.DdlJobStatus = u.Field(description="Final job state")
+            elapsed_seconds: t.NonNegativeFloat = u.Field(
+                0.0, description="Execution time of the statement in seconds"
+            )
+            error: str = u.Field("", description="Failure or skip reason")
+
+        class DdlRunResult(DbOracleDomainModel):
+            """Outcome of a parallel DDL run, one result per job."""
+
+            jobs: t.SequenceOf[FlextDbOracleModels.DbOracle.DdlJobResult] = u.Field(
+                default_factory=tuple, description="Per-job results in completion order"
+            )
+            elapsed_seconds: t.NonNegativeFloat = u.Field(
+                0.0, description="Wall-clock duration of the whole run in seconds"
+            )
+
+            @u.computed_field(return_type=bool)
+            @property
+            def succeeded(self) -> bool:
+                """Whether every job succeeded."""
+                return all(
+                    job.status == c.DbOracle.DdlJobStatus.SUCCEEDED for job in self.jobs
+                )
+
+        class RangePartition(DbOracleDomainModel):
+            """One range partition bound of a partitioned table."""
+
+            name: str = u.Field(description="Partition name")
+            values_less_than: str = u.Field(
+                description="Upper bound expression, e.g. DATE '2025-01-01' or MAXVALUE"
+            )
+
+        class TableStorageOptions(DbOracleDomainModel):
+            """Physical storage, compression and partitioning of a new table."""
+
+            partition_type: c.DbOracle.PartitionType | None = u.Field(
+                None, description="Partitioning method"
+            )
+            partition_columns: t.StrSequence = u.Field(
+                default_factory=tuple, description="Partitioning key columns"
+            )
+            range_partitions: t.SequenceOf[
+                FlextDbOracleModels.DbOracle.RangePartition
+            ] = u.Field(
+                default_factory=tuple,
+                description="Range partitions (the initial ones for interval)",
+            )
+            interval: str | None = u.Field(
+                None, description="Interval expression, e.g. NUMTOYMINTERVAL(1,'MONTH')"
+            )
+            hash_partitions: t.PositiveInt | None = u.Field(
+                None, description="Number of hash partitions"
+            )
+            compression: c.DbOracle.TableCompression | None = u.Field(
+                None, description="Table compression level"
+            )
+            nologging: bool = u.Field(False, description="Create the table NOLOGGING")
+            pctfree: int | None = u.Field(
+                None, ge=0, le=99, description="Percent of each block kept free"
+            )
+            tablespace: str = u.Field("", description="Tablespace name")
+            parallel: t.PositiveInt | None = u.Field(
+                None, description="Default parallel degree of the table"
+            )
+
+        class QueryHints(DbOracleDomainModel):
+            """Structured optimizer hints rendered into a SELECT."""
+
+            parallel: t.PositiveInt | None = u.Field(
+                None, description="Statement-level PARALLEL degree"
+            )
+            index: str | None = u.Field(
+                None, description="Index name for an INDEX(table index) hint"
+            )
+            full: bool = u.Field(False, description="Force a FULL table scan")
+            first_rows: t.PositiveInt | None = u.Field(
+                None, description="Optimize for the first N rows (FIRST_ROWS(n))"
+            )
+
+        class LoadResult(DbOracleDomainModel):
+            """Outcome of a streaming file-to-table bulk load."""
+
+            table_name: str = u.Field(description="Target table of the load")
+            rows_loaded: t.NonNegativeInt = u.Field(
+                0, description="Rows inserted into the target table"
+            )
+            rows_rejected: t.NonNegativeInt = u.Field(
+                0, description="Rows rejected while parsing or typing"
+            )
+            batches: t.NonNegativeInt = u.Field(
+                0, description="Array-bound batches written to Oracle"
+            )
+            elapsed_seconds: t.NonNegativeFloat = u.Field(
+                0.0, description="Wall-clock duration of the load in seconds"
+            )
+            rejected_samples: t.StrSequence = u.Field(
+                default_factory=tuple,
+                description="Bounded sample of rejection reasons by source line",
+            )
+            stats_gathered: bool = u.Field(
+                False, description="Whether table statistics were gathered afterwards"
+            )
+
+            @u.computed_field(return_type=float)
+            @property
+            def rows_per_second(self) -> float:
+                """Loaded-row throughput over the whole load."""
+                if self.elapsed_seconds <= 0:
+                    return 0.0
+                return self.rows_loaded / self.elapsed_seconds
+
+        class StagedUpsertResult(DbOracleDomainModel):
+            """Outcome and per-phase timings of a staging-table upsert."""
+
+            table_name: str = u.Field(description="Target table of the upsert")
+            staging_table: str = u.Field(description="Staging table used for the load")
+            rows_staged: t.NonNegativeInt = u.Field(
+                0, description="Rows direct-path loaded into the staging table"
+            )
+            rows_merged: t.NonNegativeInt = u.Field(
+                0, description="Rows inserted or updated by the set-based MERGE"
+            )
+            batches: t.NonNegativeInt = u.Field(
+                0, description="Array-bound batches written to the staging table"
+            )
+            prepare_seconds: t.NonNegativeFloat = u.Field(
+                0.0, description="Seconds spent creating or clearing the stage"
+            )
+            load_seconds: t.NonNegativeFloat = u.Field(
+                0.0, description="Seconds spent loading the staging table"
+            )
+            merge_seconds: t.NonNegativeFloat = u.Field(
+                0.0, description="Seconds spent merging the stage into the target"
+            )
+            cleanup_seconds: t.NonNegativeFloat = u.Field(
+                0.0, description="Seconds spent truncating the staging table"
+            )
+
+            @u.computed_field(return_type=float)
+            @property
+            def elapsed_seconds(self) -> float:
+                """Total duration across all pipeline phases."""
+                return (
+                    self.prepare_seconds
+                    + self.load_seconds
+                    + self.merge_seconds
+                    + self.cleanup_seconds
+                )
+
+            @u.computed_field(return_type=float)
+            @property
+            def rows_per_second(self) -> float:
+                """Merged-row throughput over the whole pipeline."""
+                if self.elapsed_seconds <= 0:
+                    return 0.0
+                return self.rows_merged / self.elapsed_seconds
+
+        class Bookmark(DbOracleDomainModel):
+            """Incremental extraction high-water mark of one Singer stream."""
+
+            stream: str = u.Field(description="Singer stream id of the table")
+            replication_key: str = u.Field(
+                description="Replication key column, or ORA_ROWSCN"
+            )
+            replication_key_value: int | str | None = u.Field(
+                None,
+                description="Highest replication key value extracted so far "
+                "(ISO-8601 for temporal keys)",
+            )
+
+        class TapResult(DbOracleDomainModel):
+            """Outcome of streaming one table as Singer messages."""
+
+            stream: str = u.Field(description="Singer stream id of the table")
+            rows_emitted: t.NonNegativeInt = u.Field(
+                0, description="RECORD messages written"
+            )
+            batches: t.NonNegativeInt = u.Field(
+                0, description="Cursor batches serialized and written"
+            )
+            bookmark: FlextDbOracleModels.DbOracle.Bookmark | None = u.Field(
+                None, description="Bookmark of the last STATE message, if any"
+            )
+            elapsed_seconds: t.NonNegativeFloat = u.Field(
+                0.0, description="Wall-clock duration of the extraction in seconds"
+            )
+
+            @u.computed_field(return_type=float)
+            @property
+            def rows_per_second(self) -> float:
+                """Emitted-record throughput over the whole run."""
+                if self.elapsed_seconds <= 0:
+                    return 0.0
+                return self.rows_emitted / self.elapsed_seconds
+
+        class SingerCoercer(DbOracleDomainModel):
+            """Compiled coercion plan of one Singer schema, keyed by its hash."""
+
+            schema_hash: str = u.Field(description="Hash of the canonical schema")
+            column_names: t.StrSequence = u.Field(
+                default_factory=tuple, description="Schema properties in bind order"
+            )
+            oracle_types: t.StrSequence = u.Field(
+                default_factory=tuple, description="Oracle type of every property"
+            )
+            converters: t.SequenceOf[t.DbOracle.BindConverter] = u.Field(
+                default_factory=tuple,
+                exclude=True,
+                description="Bind-value converter of every property",
+            )
+
+            @property
+            def column_types(self) -> t.StrMapping:
+                """Oracle type of every property, in bind order."""
+                return dict(zip(self.column_names, self.oracle_types, strict=True))
+
+            def coerce(
+                self, records: t.SequenceOf[t.JsonMapping]
+            ) -> t.DbOracle.BindBatch:
+                """Convert records into bind rows in one pass.
+
+                Missing properties bind NULL and unknown ones are dropped;
+                converter errors (ValueError, TypeError) propagate.
+                """
+                fields = tuple(zip(self.column_names, self.converters, strict=True))
+                return [
+                    {name: convert(record.get(name)) for name, convert in fields}
+                    for record in records
+                ]
+
+        class SingerTargetStream(DbOracleDomainModel):
+            """Load plan of one Singer stream resolved from its SCHEMA message."""
+
+            stream: str = u.Field(description="Singer stream id")
+            table_name: str = u.Field(description="Target table of the stream")
+            coercer: FlextDbOracleModels.DbOracle.SingerCoercer = u.Field(
+                description="Compiled coercion plan of the stream schema"
+            )
+            key_properties: t.StrSequence = u.Field(
+                default_factory=tuple,
+                description="Key properties; streams with keys are merged",
+            )
+            insert_sql: str | None = u.Field(
+                None, description="Array-bound INSERT of keyless streams"
+            )
+
+        class TargetResult(DbOracleDomainModel):
+            """Outcome of ingesting one Singer message stream into Oracle."""
+
+            streams: t.StrSequence = u.Field(
+                default_factory=tuple, description="Streams that received a SCHEMA"
+            )
+            tables_created: t.StrSequence = u.Field(
+                default_factory=tuple, description="Tables created from a SCHEMA"
+            )
+            tables_altered: t.StrSequence = u.Field(
+                default_factory=tuple,
+                description="Tables whose columns were added or widened",
+            )
+            records_received: t.NonNegativeInt = u.Field(
+                0, description="RECORD messages read"
+            )
+            rows_written: t.NonNegativeInt = u.Field(
+                0, description="Rows inserted or merged into Oracle"
+            )
+            batches: t.NonNegativeInt = u.Field(
+                0, description="Buffered batches flushed to Oracle"
+            )
+            states_emitted: t.NonNegativeInt = u.Field(
+                0, description="STATE values written after a committed flush"
+            )
+            elapsed_seconds: t.NonNegativeFloat = u.Field(
+                0.0, description="Wall-clock duration of the ingestion in seconds"
+            )
+
+            @u.computed_field(return_type=float)
+            @property
+            def rows_per_second(self) -> float:
+                """Written-row throughput over the whole run."""
+                if self.elapsed_seconds <= 0:
+                    return 0.0
+                return self.rows_written / self.elapsed_seconds
+
+        class IndexDefinition(DbOracleDomainModel):
+            """Definition of a plain B-tree index read from the data dictionary."""
+
+            name: str = u.Field(description="Index name")
+            columns: t.StrSequence = u.Field(
+                default_factory=tuple, description="Indexed columns in key order"
+            )
+            unique: bool = u.Field(False, description="Whether the index is unique")
+            local: bool = u.Field(
+                False, description="Whether the index is equipartitioned (LOCAL)"
+            )
+            constraint_name: str | None = u.Field(
+                None, description="Primary key constraint enforced by the index"
+            )
+
+        class TableGrant(DbOracleDomainModel):
+            """Object privilege on a table read from the data dictionary."""
+
+            grantee: str = u.Field(description="User or role holding the privilege")
+            privilege: str = u.Field(description="Granted privilege, e.g. SELECT")
+            grantable: bool = u.Field(
+                False, description="Whether it was granted WITH GRANT OPTION"
+            )
+
+        class RefreshResult(DbOracleDomainModel):
+            """Outcome and per-phase timings of a shadow-table full refresh."""
+
+            table_name: str = u.Field(description="Refreshed table")
+            shadow_table: str = u.Field(
+                description="Shadow table loaded and swapped in"
+            )
+            swap: c.DbOracle.RefreshSwap = u.Field(
+                description="Swap method used to publish the shadow table"
+            )
+            rows_loaded: t.NonNegativeInt = u.Field(
+                0, description="Rows direct-path loaded into the shadow table"
+            )
+            indexes_built: t.NonNegativeInt = u.Field(
+                0, description="Indexes rebuilt on the shadow table"
+            )
+            grants_restored: t.NonNegativeInt = u.Field(
+                0, description="Table grants re-applied after a rename swap"
+            )
+            stats_gathered: bool = u.Field(
+                False, description="Whether shadow statistics were gathered"
+            )
+            prepare_seconds: t.NonNegativeFloat = u.Field(
+                0.0, description="Seconds spent creating the shadow table"
+            )
+            load_seconds: t.NonNegativeFloat = u.Field(
+                0.0, description="Seconds spent loading the shadow table"
+            )
+            index_seconds: t.NonNegativeFloat = u.Field(
+                0.0, description="Seconds spent building indexes and statistics"
+            )
+            swap_seconds: t.NonNegativeFloat = u.Field(
+                0.0, description="Seconds spent swapping and dropping the old data"
+            )
+
+            @u.computed_field(return_type=float)
+            @property
+            def elapsed_seconds(self) -> float:
+                """Total duration across all refresh phases."""
+                return (
+                    self.prepare_seconds
+                    + self.load_seconds
+                    + self.index_seconds
+                    + self.swap_seconds
+                )
+
+        class CopyCheckpoint(DbOracleDomainModel):
+            """Resumable progress of a chunked table copy."""
+
+            table_name: str = u.Field(description="Source table being copied")
+            target_table: str = u.Field(description="Target table receiving rows")
+            strategy: str = u.Field(description="Chunking strategy of the copy")
+            chunk_count: t.PositiveInt = u.Field(description="Total number of chunks")
+            boundaries: t.StrSequence = u.Field(
+                default_factory=tuple,
+                description="Upper key bound of every chunk but the last (pk_range)",
+            )
+            completed_chunks: t.SequenceOf[int] = u.Field(
+                default_factory=tuple, description="Chunk ids committed on the target"
+            )
+            rows_copied: t.NonNegativeInt = u.Field(
+                0, description="Rows committed by the completed chunks"
+            )
+
+        class CopyResult(DbOracleDomainModel):
+            """Outcome of a parallel Oracle-to-Oracle table copy."""
+
+            table_name: str = u.Field(description="Source table that was copied")
+            target_table: str = u.Field(description="Target table receiving rows")
+            strategy: str = u.Field(description="Chunking strategy of the copy")
+            rows_copied: t.NonNegativeInt = u.Field(
+                0, description="Rows copied by this run"
+            )
+            chunks_copied: t.NonNegativeInt = u.Field(
+                0, description="Chunks copied by this run"
+            )
+            chunks_skipped: t.NonNegativeInt = u.Field(
+                0, description="Chunks skipped because a checkpoint marked them done"
+            )
+            stats_gathered: bool = u.Field(
+                False, description="Whether target statistics were gathered afterwards"
+            )
+            elapsed_seconds: t.NonNegativeFloat = u.Field(
+                0.0, description="Wall-clock duration of the copy in seconds"
+            )
+
+            @u.computed_field(return_type=float)
+            @property
+            def rows_per_second(self) -> float:
+                """Copied-row throughput over the whole run."""
+                if self.elapsed_seconds <= 0:
+                    return 0.0
+                return self.rows_copied / self.elapsed_seconds
+
         class HealthStatus(m.Entity):
             """Service health status record."""
 
@@ -360,6 +1211,11 @@ class FlextDbOracleModels(m):
                 default_factory=lambda: MappingProxyType({}),
                 description="Health check metric values",
             )
+            operations: t.JsonMapping = u.Field(
+                default_factory=lambda: MappingProxyType({}),
+                description="Cumulative count, error rate and latency percentiles "
+                "per operation type",
+            )
 
             def __getitem__(self, key: str) -> t.JsonValue:
                 """Get item from health status."""
@@ -470,6 +1326,23 @@ class FlextDbOracleModels(m):
             default_value: str = u.Field(
                 "", description="Default value for the column", validate_default=True
             )
+            data_length: int | None = u.Field(
+                None, description="Declared length in bytes for sized types"
+            )
+            data_precision: int | None = u.Field(
+                None, description="Declared NUMBER precision"
+            )
+            data_scale: int | None = u.Field(None, description="Declared NUMBER scale")
+
+            @property
+            def type_spec(self) -> str:
+                """DDL-ready Oracle type including length or precision."""
+                return c.DbOracle.format_type_spec(
+                    self.data_type,
+                    self.data_length,
+                    self.data_precision,
+                    self.data_scale,
+                )
 
             def __getitem__(self, key: str) -> t.JsonValue:
                 """Get item from column metadata."""
@@ -528,18 +1401,43 @@ class FlextDbOracleModels(m):
                 description="Parallel degree for index creation",
                 validate_default=True,
             )
+            local: bool = u.Field(
+                False,
+                description="Equipartition the index with its table (LOCAL)",
+                validate_default=True,
+            )
+            online: bool = u.Field(
+                False,
+                description="Build without blocking DML on the table (ONLINE)",
+                validate_default=True,
+            )
+            compress: t.PositiveInt | None = u.Field(
+                None, description="Number of leading key columns to compress"
+            )
+            nologging: bool = u.Field(
+                False, description="Build the index NOLOGGING", validate_default=True
+            )
 
         # Command classes for dispatcher integration
-        class ConnectCommand(m.Entity):
+        class TracedCommand(m.Entity):
+            """Dispatcher command carrying the caller's trace context."""
+
+            traceparent: str | None = u.Field(
+                None,
+                description="W3C traceparent of the dispatching span",
+                validate_default=True,
+            )
+
+        class ConnectCommand(TracedCommand):
             """Command to establish Oracle connection."""
 
-        class DisconnectCommand(m.Entity):
+        class DisconnectCommand(TracedCommand):
             """Command to close Oracle connection."""
 
-        class TestConnectionCommand(m.Entity):
+        class TestConnectionCommand(TracedCommand):
             """Command to test Oracle connection."""
 
-        class ExecuteQueryCommand(m.Entity):
+        class ExecuteQueryCommand(TracedCommand):
             """Command to execute SELECT query."""
 
             sql: str = u.Field(description="SQL SELECT query to execute")
@@ -547,7 +1445,7 @@ class FlextDbOracleModels(m):
                 None, description="Query bind parameters", validate_default=True
             )
 
-        class FetchOneCommand(m.Entity):
+        class FetchOneCommand(TracedCommand):
             """Command to fetch single row."""
 
             sql: str = u.Field(description="SQL query to fetch a single row")
@@ -555,7 +1453,7 @@ class FlextDbOracleModels(m):
                 None, description="Query bind parameters", validate_default=True
             )
 
-        class ExecuteStatementCommand(m.Entity):
+        class ExecuteStatementCommand(TracedCommand):
             """Command to execute INSERT/UPDATE/DELETE."""
 
             sql: str = u.Field(description="SQL DML statement to execute")
@@ -563,7 +1461,7 @@ class FlextDbOracleModels(m):
                 None, description="Statement bind parameters", validate_default=True
             )
 
-        class ExecuteManyCommand(m.Entity):
+        class ExecuteManyCommand(TracedCommand):
             """Command to execute batch statements."""
 
             sql: str = u.Field(description="SQL statement for batch execution")
@@ -572,17 +1470,17 @@ class FlextDbOracleModels(m):
                 description="List of parameter sets for batch execution",
             )
 
-        class GetSchemasCommand(m.Entity):
+        class GetSchemasCommand(TracedCommand):
             """Command to retrieve all schemas."""
 
-        class GetTablesCommand(m.Entity):
+        class GetTablesCommand(TracedCommand):
             """Command to retrieve tables in schema."""
 
             schema_name: str | None = u.Field(
                 None, description="Schema to list tables from", validate_default=True
             )
 
-        class GetColumnsCommand(m.Entity):
+        class GetColumnsCommand(TracedCommand):
             """Command to retrieve columns in table."""
 
             table: str = u.Field(description="Table to retrieve columns from")
@@ -277,6 +277,48 @@ class FlextDbOracleProtocols(p):
                 """
                 ...
 
+            def build_insert_all_statement(
+                self,
+                table_name: str,
+                columns: t.StrSequence,
+                row_count: int,
+                schema: str | None = None,
+            ) -> p.Result[str]:
+                """Build Oracle multi-row INSERT ALL statement.
+
+                Args:
+                table_name: Target table name
+                columns: Column names bound per row
+                row_count: Number of rows carried by the statement
+                schema: Owning schema (optional)
+
+                Returns:
+                r[str]: SQL INSERT ALL statement or error
+
+                """
+                ...
+
+            def build_merge_statement(
+                self,
+                table_name: str,
+                key_columns: t.StrSequence,
+                update_columns: t.StrSequence,
+                schema: str | None = None,
+            ) -> p.Result[str]:
+                """Build Oracle MERGE upsert statement.
+
+                Args:
+                table_name: Target table name
+                key_columns: Columns matched in the ON clause
+                update_columns: Columns updated for matched rows
+                schema: Owning schema (optional)
+
+                Returns:
+                r[str]: SQL MERGE statement or error
+
+                """
+                ...
+
             def build_select(
                 self,
                 table: str,
@@ -473,6 +515,19 @@ class FlextDbOracleProtocols(p):
                 """
                 ...
 
+        @runtime_checkable
+        class SpanExporter(Protocol):
+            """Protocol for receivers of finished trace spans."""
+
+            def export(self, spans: Sequence[m.DbOracle.Span]) -> None:
+                """Export finished Oracle trace spans.
+
+                Args:
+                spans: Spans that just ended, children before parents
+
+                """
+                ...
+
         @runtime_checkable
         class HealthCheck(Protocol):
             """Protocol for Oracle database health check operations."""
@@ -12,24 +12,62 @@ if TYPE_CHECKING:
     from .connection import (
         FlextDbOracleServiceConnection as FlextDbOracleServiceConnection,
     )
+    from .ddl_executor import (
+        FlextDbOracleServiceDdlExecutor as FlextDbOracleServiceDdlExecutor,
+    )
+    from .explain import FlextDbOracleServiceExplain as FlextDbOracleServiceExplain
+    from .exporter import FlextDbOracleServiceExporter as FlextDbOracleServiceExporter
     from .facade import FlextDbOracleServices as FlextDbOracleServices
+    from .incremental import (
+        FlextDbOracleServiceIncremental as FlextDbOracleServiceIncremental,
+    )
+    from .loader import FlextDbOracleServiceLoader as FlextDbOracleServiceLoader
     from .plugin import FlextDbOracleServicePlugin as FlextDbOracleServicePlugin
     from .query import FlextDbOracleServiceQuery as FlextDbOracleServiceQuery
+    from .refresh import FlextDbOracleServiceRefresh as FlextDbOracleServiceRefresh
     from .schema import FlextDbOracleServiceSchema as FlextDbOracleServiceSchema
     from .singer import FlextDbOracleServiceSinger as FlextDbOracleServiceSinger
+    from .singer_tap import (
+        FlextDbOracleServiceSingerTap as FlextDbOracleServiceSingerTap,
+    )
+    from .singer_target import (
+        FlextDbOracleServiceSingerTarget as FlextDbOracleServiceSingerTarget,
+    )
+    from .slow_query import (
+        FlextDbOracleServiceSlowQuery as FlextDbOracleServiceSlowQuery,
+    )
     from .sql_builder import (
         FlextDbOracleServiceSqlBuilder as FlextDbOracleServiceSqlBuilder,
     )
+    from .statistics import (
+        FlextDbOracleServiceStatistics as FlextDbOracleServiceStatistics,
+    )
+    from .table_copy import (
+        FlextDbOracleServiceTableCopy as FlextDbOracleServiceTableCopy,
+    )
+    from .upsert import FlextDbOracleServiceUpsert as FlextDbOracleServiceUpsert
 
 _LAZY_MODULES: dict[str, tuple[str, ...]] = {
     ".api_runtime": ("FlextDbOracleApiRuntime",),
     ".connection": ("FlextDbOracleServiceConnection",),
+    ".ddl_executor": ("FlextDbOracleServiceDdlExecutor",),
+    ".explain": ("FlextDbOracleServiceExplain",),
+    ".exporter": ("FlextDbOracleServiceExporter",),
     ".facade": ("FlextDbOracleServices",),
+    ".incremental": ("FlextDbOracleServiceIncremental",),
+    ".loader": ("FlextDbOracleServiceLoader",),
     ".plugin": ("FlextDbOracleServicePlugin",),
     ".query": ("FlextDbOracleServiceQuery",),
+    ".refresh": ("FlextDbOracleServiceRefresh",),
     ".schema": ("FlextDbOracleServiceSchema",),
     ".singer": ("FlextDbOracleServiceSinger",),
+    ".singer_tap": ("FlextDbOracleServiceSingerTap",),
+    ".singer_target": ("FlextDbOracleServiceSingerTarget",),
+    ".slow_query": ("FlextDbOracleServiceSlowQuery",),
     ".sql_builder": ("FlextDbOracleServiceSqlBuilder",),
+    ".statistics": ("FlextDbOracleServiceStatistics",),
+    ".table_copy": ("FlextDbOracleServiceTableCopy",),
+    ".upsert": ("FlextDbOracleServiceUpsert",),
 }
 
 
@@ -43,11 +81,23 @@ _LAZY_IMPORTS = build_lazy_import_map(
 _PUBLIC_EXPORTS: tuple[str, ...] = (
     "FlextDbOracleApiRuntime",
     "FlextDbOracleServiceConnection",
+    "FlextDbOracleServiceDdlExecutor",
+    "FlextDbOracleServiceExplain",
+    "FlextDbOracleServiceExporter",
+    "FlextDbOracleServiceIncremental",
+    "FlextDbOracleServiceLoader",
     "FlextDbOracleServicePlugin",
     "FlextDbOracleServiceQuery",
+    "FlextDbOracleServiceRefresh",
     "FlextDbOracleServiceSchema",
     "FlextDbOracleServiceSinger",
+    "FlextDbOracleServiceSingerTap",
+    "FlextDbOracleServiceSingerTarget",
+    "FlextDbOracleServiceSlowQuery",
     "FlextDbOracleServiceSqlBuilder",
+    "FlextDbOracleServiceStatistics",
+    "FlextDbOracleServiceTableCopy",
+    "FlextDbOracleServiceUpsert",
     "FlextDbOracleServices",
 )
 
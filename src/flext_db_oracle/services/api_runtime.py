@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import MutableSequence, Sequence
-from typing import TYPE_CHECKING, Self, override
+from typing import TYPE_CHECKING, BinaryIO, Self, override
 from urllib.parse import parse_qs, urlparse
 
 from pydantic_settings import SettingsConfigDict
@@ -23,6 +23,9 @@ from flext_db_oracle.services.facade import FlextDbOracleServices
 
 if TYPE_CHECKING:
     import types
+    from collections.abc import Iterable, Iterator
+    from pathlib import Path
+    from wsgiref.simple_server import WSGIServer
 
 
 class FlextDbOracleApiRuntime(FlextDbOracleServiceBase):
@@ -231,6 +234,30 @@ class FlextDbOracleApiRuntime(FlextDbOracleServiceBase):
         """Execute default domain service operation - return settings."""
         return r[p.Base].ok(self._oracle_config)
 
+    @override
+    def execute_batch(self, sql: str, rows: t.DbOracle.BindBatch) -> p.Result[int]:
+        """Execute one array-bound statement for a batch of typed bind rows."""
+        self.logger.debug("Executing array-bound batch", batch_size=len(rows))
+        return self._services.execute_batch(sql, rows)
+
+    def execute_insert_all(
+        self,
+        table_name: str,
+        rows: t.DbOracle.BindBatch,
+        *,
+        columns: t.StrSequence | None = None,
+        schema: str | None = None,
+        rows_per_statement: int = c.DbOracle.DEFAULT_INSERT_ALL_ROWS,
+    ) -> p.Result[int]:
+        """Insert rows with multi-row INSERT ALL statements."""
+        return self._services.execute_insert_all(
+            table_name,
+            rows,
+            columns=columns,
+            schema=schema,
+            rows_per_statement=rows_per_statement,
+        )
+
     def execute_many(
         self, sql: str, params_list: t.SequenceOf[t.JsonMapping]
     ) -> p.Result[int]:
@@ -260,6 +287,7 @@ class FlextDbOracleApiRuntime(FlextDbOracleServiceBase):
             )
         )
 
+    @override
     def fetch_columns(
         self, table_name: str, schema_name: str | None = None
     ) -> p.Result[Sequence[m.DbOracle.Column]]:
@@ -274,6 +302,75 @@ class FlextDbOracleApiRuntime(FlextDbOracleServiceBase):
         """Get observability metrics for the connection."""
         return self._services.fetch_metrics().map(lambda metrics: metrics.model_dump())
 
+    def fetch_statement_stats(
+        self,
+        *,
+        order_by: c.DbOracle.StatementStatsOrder = (
+            c.DbOracle.StatementStatsOrder.TOTAL_SECONDS
+        ),
+        limit: int | None = None,
+    ) -> p.Result[Sequence[m.DbOracle.StatementStats]]:
+        """Get per-fingerprint statement statistics, largest ``order_by`` first."""
+        return self._services.fetch_statement_stats(order_by=order_by, limit=limit)
+
+    def fetch_spans(self) -> p.Result[Sequence[m.DbOracle.Span]]:
+        """Get the spans kept by the in-memory span exporter."""
+        return self._services.fetch_spans()
+
+    def set_span_exporter(
+        self, exporter: p.DbOracle.SpanExporter | None
+    ) -> p.Result[bool]:
+        """Send trace spans of Oracle calls to ``exporter`` (None disables)."""
+        return self._services.set_span_exporter(exporter)
+
+    def export_openmetrics(self) -> p.Result[str]:
+        """Render pool, query latency and cache metrics as OpenMetrics text."""
+        return self._services.export_openmetrics()
+
+    def serve_metrics(
+        self,
+        host: str = c.DbOracle.DEFAULT_METRICS_HOST,
+        port: int = c.DbOracle.DEFAULT_METRICS_PORT,
+    ) -> p.Result[WSGIServer]:
+        """Serve OpenMetrics at ``/metrics`` on a local HTTP endpoint."""
+        return self._services.serve_metrics(host, port)
+
+    def fetch_slow_queries(
+        self, *, wait_for_plans: bool = False, timeout: float | None = None
+    ) -> p.Result[Sequence[m.DbOracle.SlowQuery]]:
+        """Get the slow-query log with the captured execution plans."""
+        return self._services.fetch_slow_queries(
+            wait_for_plans=wait_for_plans, timeout=timeout
+        )
+
+    def reset_slow_queries(self) -> p.Result[bool]:
+        """Clear the slow-query log and its plan cache."""
+        return self._services.reset_slow_queries()
+
+    def explain(
+        self, sql: str, parameters: t.JsonMapping | None = None
+    ) -> p.Result[m.DbOracle.ExplainPlan]:
+        """Get the structured execution plan and plan hash of a statement."""
+        return self._normalize_parameters(parameters).flat_map(
+            lambda normalized_parameters: self._services.explain(
+                sql, normalized_parameters
+            )
+        )
+
+    def fetch_plan_baselines(
+        self, sql: str | None = None
+    ) -> p.Result[Sequence[m.DbOracle.PlanBaseline]]:
+        """Get the plan baselines, optionally only the one of ``sql``."""
+        return self._services.fetch_plan_baselines(sql)
+
+    def fetch_plan_regressions(self) -> p.Result[Sequence[m.DbOracle.PlanRegression]]:
+        """Get the plan changes flagged with degraded latency."""
+        return self._services.fetch_plan_regressions()
+
+    def reset_plan_baselines(self) -> p.Result[bool]:
+        """Forget the plan baselines and flagged regressions."""
+        return self._services.reset_plan_baselines()
+
     def fetch_plugin(self, name: str) -> p.Result[t.JsonPayload]:
         """Get a registered plugin by name."""
         return self._services.fetch_plugin(name)
@@ -288,12 +385,14 @@ class FlextDbOracleApiRuntime(FlextDbOracleServiceBase):
         """Get list of available schemas."""
         return self._services.fetch_schemas()
 
+    @override
     def fetch_table_metadata(
         self, table_name: str, schema: str | None = None
     ) -> p.Result[m.DbOracle.TableMetadata]:
         """Get complete table metadata including columns and constraints."""
         return self._services.fetch_table_metadata(table_name, schema)
 
+    @override
     def fetch_tables(self, schema: str | None = None) -> p.Result[t.StrSequence]:
         """Get list of tables in specified schema."""
         return self._services.fetch_tables(schema)
@@ -304,6 +403,247 @@ class FlextDbOracleApiRuntime(FlextDbOracleServiceBase):
             self._oracle_config.DbOracle.service_name
         )
 
+    def load_file(
+        self,
+        table_name: str,
+        file_path: str | Path,
+        *,
+        schema: str | None = None,
+        file_format: str | None = None,
+        columns: t.StrSequence | None = None,
+        has_header: bool = True,
+        delimiter: str = ",",
+        batch_size: int = c.DbOracle.DEFAULT_LOAD_BATCH_SIZE,
+        queue_depth: int = c.DbOracle.DEFAULT_PIPELINE_QUEUE_DEPTH,
+        gather_stats: m.DbOracle.StatsOptions | None = None,
+    ) -> p.Result[m.DbOracle.LoadResult]:
+        """Stream a CSV or JSONL file into an Oracle table with array binds."""
+        return self._services.load_file(
+            table_name,
+            file_path,
+            schema=schema,
+            file_format=file_format,
+            columns=columns,
+            has_header=has_header,
+            delimiter=delimiter,
+            batch_size=batch_size,
+            queue_depth=queue_depth,
+            gather_stats=gather_stats,
+        )
+
+    def copy_table(
+        self,
+        target_api: FlextDbOracleApiRuntime,
+        table_name: str,
+        *,
+        source_schema: str | None = None,
+        target_table: str | None = None,
+        target_schema: str | None = None,
+        parallelism: int = c.DbOracle.DEFAULT_COPY_PARALLELISM,
+        chunk_count: int = c.DbOracle.DEFAULT_COPY_CHUNKS,
+        batch_size: int = c.DbOracle.DEFAULT_LOAD_BATCH_SIZE,
+        max_in_flight: int = c.DbOracle.DEFAULT_PIPELINE_QUEUE_DEPTH,
+        create_target: bool = True,
+        checkpoint_path: str | Path | None = None,
+        restart: bool = False,
+        gather_stats: m.DbOracle.StatsOptions | None = None,
+    ) -> p.Result[m.DbOracle.CopyResult]:
+        """Copy a table from this database into the target API's database."""
+        return self._services.copy_table(
+            target_api.oracle_services,
+            table_name,
+            source_schema=source_schema,
+            target_table=target_table,
+            target_schema=target_schema,
+            parallelism=parallelism,
+            chunk_count=chunk_count,
+            batch_size=batch_size,
+            max_in_flight=max_in_flight,
+            create_target=create_target,
+            checkpoint_path=checkpoint_path,
+            restart=restart,
+            gather_stats=gather_stats,
+        )
+
+    def full_refresh(
+        self,
+        table_name: str,
+        *,
+        rows: Iterable[t.DbOracle.BindRow] | None = None,
+        source_query: str | None = None,
+        schema: str | None = None,
+        swap: c.DbOracle.RefreshSwap = c.DbOracle.RefreshSwap.RENAME,
+        partition_name: str | None = None,
+        batch_size: int = c.DbOracle.DEFAULT_LOAD_BATCH_SIZE,
+        index_workers: int = c.DbOracle.DEFAULT_DDL_WORKERS,
+        gather_stats: m.DbOracle.StatsOptions | None = None,
+    ) -> p.Result[m.DbOracle.RefreshResult]:
+        """Reload a table into a shadow table and swap it into place."""
+        return self._services.full_refresh(
+            table_name,
+            rows=rows,
+            source_query=source_query,
+            schema=schema,
+            swap=swap,
+            partition_name=partition_name,
+            batch_size=batch_size,
+            index_workers=index_workers,
+            gather_stats=gather_stats,
+        )
+
+    @override
+    def extract_incremental(
+        self,
+        table_name: str,
+        *,
+        replication_key: str | None = None,
+        bookmark: m.DbOracle.Bookmark | None = None,
+        schema: str | None = None,
+        columns: t.StrSequence | None = None,
+        batch_size: int = c.DbOracle.DEFAULT_ARRAY_SIZE,
+    ) -> p.Result[Iterator[tuple[t.DbOracle.BindBatch, m.DbOracle.Bookmark]]]:
+        """Stream rows changed since a bookmark, batch by batch."""
+        return self._services.extract_incremental(
+            table_name,
+            replication_key=replication_key,
+            bookmark=bookmark,
+            schema=schema,
+            columns=columns,
+            batch_size=batch_size,
+        )
+
+    def singer_state(self, bookmarks: t.SequenceOf[m.DbOracle.Bookmark]) -> t.JsonDict:
+        """Render bookmarks as the value of a Singer STATE message."""
+        return self._services.singer_state(bookmarks)
+
+    @override
+    def bookmark_from_state(
+        self, state: t.JsonMapping, table_name: str, *, schema: str | None = None
+    ) -> p.Result[m.DbOracle.Bookmark | None]:
+        """Read a table's bookmark from a Singer STATE message."""
+        return self._services.bookmark_from_state(state, table_name, schema=schema)
+
+    def run_singer_tap(
+        self,
+        table_name: str,
+        *,
+        schema: str | None = None,
+        replication_key: str | None = None,
+        state: t.JsonMapping | None = None,
+        columns: t.StrSequence | None = None,
+        output: BinaryIO | None = None,
+        batch_size: int = c.DbOracle.DEFAULT_ARRAY_SIZE,
+        backend: c.DbOracle.JsonBackend = c.DbOracle.JsonBackend.AUTO,
+    ) -> p.Result[m.DbOracle.TapResult]:
+        """Stream a table as Singer SCHEMA, RECORD and STATE messages."""
+        return self._services.run_singer_tap(
+            table_name,
+            schema=schema,
+            replication_key=replication_key,
+            state=state,
+            columns=columns,
+            output=output,
+            batch_size=batch_size,
+            backend=backend,
+        )
+
+    def run_singer_target(
+        self,
+        messages: Iterable[str | bytes] | None = None,
+        *,
+        schema: str | None = None,
+        state_output: BinaryIO | None = None,
+        batch_size: int = c.DbOracle.DEFAULT_LOAD_BATCH_SIZE,
+        max_batch_seconds: float = c.DbOracle.DEFAULT_TARGET_BATCH_SECONDS,
+    ) -> p.Result[m.DbOracle.TargetResult]:
+        """Ingest Singer messages into Oracle tables in buffered batches."""
+        return self._services.run_singer_target(
+            messages,
+            schema=schema,
+            state_output=state_output,
+            batch_size=batch_size,
+            max_batch_seconds=max_batch_seconds,
+        )
+
+    @override
+    def upsert_rows(
+        self,
+        table_name: str,
+        rows: t.DbOracle.BindBatch,
+        key_columns: t.StrSequence,
+        *,
+        update_columns: t.StrSequence | None = None,
+        schema: str | None = None,
+        batch_size: int = c.DbOracle.DEFAULT_LOAD_BATCH_SIZE,
+    ) -> p.Result[int]:
+        """Upsert rows into a table with array-bound MERGE batches."""
+        return self._services.upsert_rows(
+            table_name,
+            rows,
+            key_columns,
+            update_columns=update_columns,
+            schema=schema,
+            batch_size=batch_size,
+        )
+
+    def upsert_via_staging(
+        self,
+        table_name: str,
+        rows: Iterable[t.DbOracle.BindRow],
+        key_columns: t.StrSequence,
+        *,
+        update_columns: t.StrSequence | None = None,
+        schema: str | None = None,
+        batch_size: int = c.DbOracle.DEFAULT_LOAD_BATCH_SIZE,
+    ) -> p.Result[m.DbOracle.StagedUpsertResult]:
+        """Upsert rows through a staging table and one set-based MERGE."""
+        return self._services.upsert_via_staging(
+            table_name,
+            rows,
+            key_columns,
+            update_columns=update_columns,
+            schema=schema,
+            batch_size=batch_size,
+        )
+
+    @override
+    def run_ddl_jobs(
+        self,
+        jobs: t.SequenceOf[m.DbOracle.DdlJob],
+        *,
+        max_workers: int = c.DbOracle.DEFAULT_DDL_WORKERS,
+        runner: t.DbOracle.StatementRunner | None = None,
+    ) -> p.Result[m.DbOracle.DdlRunResult]:
+        """Run dependency-ordered DDL jobs concurrently on pooled connections."""
+        return self._services.run_ddl_jobs(jobs, max_workers=max_workers, runner=runner)
+
+    @override
+    def gather_table_stats(
+        self,
+        table_name: str,
+        *,
+        schema: str | None = None,
+        options: m.DbOracle.StatsOptions | None = None,
+    ) -> p.Result[m.DbOracle.StatsResult]:
+        """Gather optimizer statistics for a table with DBMS_STATS."""
+        return self._services.gather_table_stats(
+            table_name, schema=schema, options=options
+        )
+
+    @override
+    def gather_stats_if_stale(
+        self,
+        table_name: str,
+        rows_changed: int,
+        *,
+        schema: str | None = None,
+        options: m.DbOracle.StatsOptions | None = None,
+    ) -> p.Result[m.DbOracle.StatsResult]:
+        """Record changed rows and gather table statistics once they are stale."""
+        return self._services.gather_stats_if_stale(
+            table_name, rows_changed, schema=schema, options=options
+        )
+
     def list_plugins(self) -> p.Result[t.StrSequence]:
         """List all registered plugin names."""
         return self._services.list_plugins().map(
@@ -335,6 +675,21 @@ class FlextDbOracleApiRuntime(FlextDbOracleServiceBase):
             )
         )
 
+    def query_json(
+        self,
+        sql: str,
+        parameters: t.JsonMapping | None = None,
+        *,
+        backend: c.DbOracle.JsonBackend = c.DbOracle.JsonBackend.AUTO,
+    ) -> p.Result[bytes]:
+        """Execute a SELECT query and return its rows as JSON bytes."""
+        self.logger.debug("Executing JSON query", query_length=len(sql))
+        return self._normalize_parameters(parameters).flat_map(
+            lambda normalized_parameters: self._services.execute_query_json(
+                sql, normalized_parameters, backend=backend
+            )
+        )
+
     def query_one(
         self, sql: str, parameters: t.JsonMapping | None = None
     ) -> p.Result[m.Dict | None]:
@@ -383,7 +738,13 @@ class FlextDbOracleApiRuntime(FlextDbOracleServiceBase):
     def _convert_to_query_result(
         self, sql: str, data: t.SequenceOf[m.Dict]
     ) -> m.DbOracle.QueryResult:
-        """Convert raw query data to QueryResult model."""
+        """Convert raw query data to QueryResult model.
+
+        The explain plan is the baseline plan of the query's fingerprint,
+        when one has been captured.
+        """
+        baselines = self._services.fetch_plan_baselines(sql).unwrap_or([])
+        explain_plan = baselines[0].plan if baselines else ""
         if not data:
             return m.DbOracle.QueryResult(
                 query=sql,
@@ -395,7 +756,7 @@ class FlextDbOracleApiRuntime(FlextDbOracleServiceBase):
                 domain_events=[],
                 result_data=[],
                 query_hash="",
-                explain_plan="",
+                explain_plan=explain_plan,
             )
         first_row = data[0].root
         columns = list(first_row.keys())
@@ -413,7 +774,7 @@ class FlextDbOracleApiRuntime(FlextDbOracleServiceBase):
             domain_events=[],
             result_data=[],
             query_hash="",
-            explain_plan="",
+            explain_plan=explain_plan,
         )
 
     def _execute_query_sql(self, sql: str) -> p.Result[m.DbOracle.QueryResult]:
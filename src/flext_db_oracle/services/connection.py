@@ -32,7 +32,26 @@ class FlextDbOracleServiceConnection(FlextDbOracleServiceBase):
     """
 
     def connect(self) -> p.Result[Self]:
-        """Establish Oracle database connection."""
+        """Establish Oracle database connection.
+
+        Session statistics sampling turned off by an earlier failure is
+        retried on the new connection.
+        """
+        self._session_stats_error = None
+        with self.trace(
+            "connect",
+            {
+                "server.address": self.db_config.DbOracle.host,
+                "server.port": self.db_config.DbOracle.port,
+            },
+        ) as span:
+            result = self._connect_engine()
+            if span is not None and result.failure:
+                span.record_error(ConnectionError(result.error))
+            return result
+
+    def _connect_engine(self) -> p.Result[Self]:
+        """Create the engine and verify it with a round-trip to the server."""
         url_result = self._build_connection_url()
         if url_result.failure:
             return r[Self](
@@ -83,7 +102,15 @@ class FlextDbOracleServiceConnection(FlextDbOracleServiceBase):
             return ok_result
 
     def disconnect(self) -> p.Result[bool]:
-        """Disconnect from Oracle database."""
+        """Disconnect from Oracle database.
+
+        The background plan-capture worker is stopped first: queued captures
+        are cancelled and a running one finishes before the pool goes away.
+        """
+        executor = self._plan_executor
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+            self._plan_executor = None
         engine = self._engine
         if engine is not None:
             self._engine_dispose(engine)
@@ -0,0 +1,174 @@
+"""Parallel DDL executor service mixin for flext-db-oracle.
+
+Runs dependency-ordered DDL jobs (index builds, statistics, post-load
+steps) concurrently on separate pooled connections.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, override
+
+from sqlalchemy import text
+
+from flext_db_oracle import FlextDbOracleServiceBase, c, m, p, r, t
+
+if TYPE_CHECKING:
+    from collections.abc import MutableMapping, MutableSequence
+
+
+class FlextDbOracleServiceDdlExecutor(FlextDbOracleServiceBase):
+    """Mixin providing parallel DDL execution for FlextDbOracleServices.
+
+    Handles: run_ddl_jobs, dependency validation, job scheduling.
+    """
+
+    @override
+    def run_ddl_jobs(
+        self,
+        jobs: t.SequenceOf[m.DbOracle.DdlJob],
+        *,
+        max_workers: int = c.DbOracle.DEFAULT_DDL_WORKERS,
+        runner: t.DbOracle.StatementRunner | None = None,
+    ) -> p.Result[m.DbOracle.DdlRunResult]:
+        """Run DDL jobs concurrently, honouring their dependencies.
+
+        Up to ``max_workers`` jobs run at once, each on its own pooled
+        connection. A job starts once every job it depends on succeeded; if a
+        dependency fails, its dependents are skipped while unrelated jobs keep
+        running. ``runner`` replaces the database call, e.g. with a fake
+        driver in tests. The result fails only for invalid job graphs.
+        """
+        if max_workers < 1:
+            return r[m.DbOracle.DdlRunResult].fail("Worker count must be positive")
+        graph_result = self._validate_ddl_jobs(jobs)
+        if graph_result.failure:
+            return r[m.DbOracle.DdlRunResult].fail(
+                graph_result.error or "Invalid DDL job graph"
+            )
+        if runner is None:
+            if not self.connected():
+                return r[m.DbOracle.DdlRunResult].fail("Not connected to database")
+            runner = self._run_ddl_statement
+        started = time.perf_counter()
+        results = self._schedule_ddl_jobs(jobs, max_workers, runner)
+        run_result = m.DbOracle.DdlRunResult(
+            jobs=results, elapsed_seconds=time.perf_counter() - started
+        )
+        self.logger.info(
+            "DDL jobs finished",
+            jobs=len(results),
+            succeeded=run_result.succeeded,
+            elapsed_seconds=round(run_result.elapsed_seconds, 3),
+        )
+        return r[m.DbOracle.DdlRunResult].ok(run_result)
+
+    def _schedule_ddl_jobs(
+        self,
+        jobs: t.SequenceOf[m.DbOracle.DdlJob],
+        max_workers: int,
+        runner: t.DbOracle.StatementRunner,
+    ) -> t.SequenceOf[m.DbOracle.DdlJobResult]:
+        """Submit jobs as their dependencies finish and collect the results."""
+        by_name = {job.name: job for job in jobs}
+        waiting = {job.name: set(job.depends_on) for job in jobs}
+        results: MutableSequence[m.DbOracle.DdlJobResult] = []
+        failed: set[str] = set()
+        running: MutableMapping[Future[m.DbOracle.DdlJobResult], str] = {}
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="flext-db-oracle-ddl"
+        ) as pool:
+            while waiting or running:
+                for name in [name for name, deps in waiting.items() if deps & failed]:
+                    del waiting[name]
+                    failed.add(name)
+                    results.append(
+                        m.DbOracle.DdlJobResult(
+                            name=name,
+                            status=c.DbOracle.DdlJobStatus.SKIPPED,
+                            error="A dependency did not succeed",
+                        )
+                    )
+                for name in [name for name, deps in waiting.items() if not deps]:
+                    del waiting[name]
+                    future = pool.submit(self._run_ddl_job, by_name[name], runner)
+                    running[future] = name
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    job_result = future.result()
+                    results.append(job_result)
+                    if job_result.status == c.DbOracle.DdlJobStatus.SUCCEEDED:
+                        for deps in waiting.values():
+                            deps.discard(name)
+                    else:
+                        failed.add(name)
+        return results
+
+    def _run_ddl_job(
+        self, job: m.DbOracle.DdlJob, runner: t.DbOracle.StatementRunner
+    ) -> m.DbOracle.DdlJobResult:
+        """Run one job and capture its timing and failure in isolation.
+
+        Any exception is reported on the job itself, so one failing runner
+        can neither abort the scheduler nor strand the jobs still running.
+        """
+        started = time.perf_counter()
+        try:
+            runner(job.sql)
+        except Exception as exc:
+            self.logger.exception("DDL job failed", job=job.name)
+            return m.DbOracle.DdlJobResult(
+                name=job.name,
+                status=c.DbOracle.DdlJobStatus.FAILED,
+                elapsed_seconds=time.perf_counter() - started,
+                error=str(exc),
+            )
+        return m.DbOracle.DdlJobResult(
+            name=job.name,
+            status=c.DbOracle.DdlJobStatus.SUCCEEDED,
+            elapsed_seconds=time.perf_counter() - started,
+        )
+
+    def _run_ddl_statement(self, sql: str) -> None:
+        """Execute one DDL statement on its own pooled connection."""
+        engine_result = self._get_engine()
+        if engine_result.failure:
+            msg = engine_result.error or "Failed to get database engine"
+            raise ConnectionError(msg)
+        with self._engine_begin(engine_result.value) as conn:
+            _ = self._connection_execute(conn, text(sql))
+
+    @staticmethod
+    def _validate_ddl_jobs(jobs: t.SequenceOf[m.DbOracle.DdlJob]) -> p.Result[bool]:
+        """Reject duplicate names, unknown dependencies and cycles."""
+        names = [job.name for job in jobs]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            return r[bool].fail(f"Duplicate DDL job names: {', '.join(duplicates)}")
+        unknown = sorted({
+            dep for job in jobs for dep in job.depends_on if dep not in names
+        })
+        if unknown:
+            return r[bool].fail(f"Unknown DDL job dependencies: {', '.join(unknown)}")
+        pending = {job.name: set(job.depends_on) for job in jobs}
+        while pending:
+            ready = [name for name, deps in pending.items() if not deps]
+            if not ready:
+                return r[bool].fail(
+                    f"Cyclic DDL job dependencies: {', '.join(sorted(pending))}"
+                )
+            for name in ready:
+                del pending[name]
+            for deps in pending.values():
+                deps.difference_update(ready)
+        return r[bool].ok(True)
+
+
+__all__: list[str] = ["FlextDbOracleServiceDdlExecutor"]
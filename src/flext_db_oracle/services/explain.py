@@ -0,0 +1,122 @@
+"""Explain-plan service mixin for flext-db-oracle.
+
+Returns structured execution plans and keeps a plan baseline per SQL
+fingerprint, flagging plan changes that come with slower execution.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import override
+
+from flext_db_oracle import FlextDbOracleServiceBase, c, m, p, r
+
+
+class FlextDbOracleServiceExplain(FlextDbOracleServiceBase):
+    """Mixin providing explain plans for FlextDbOracleServices.
+
+    Handles: explain, plan baselines, plan regression detection.
+    """
+
+    def explain(
+        self, sql: str, params: m.ConfigMap | None = None
+    ) -> p.Result[m.DbOracle.ExplainPlan]:
+        """EXPLAIN a statement into a plan tree with its plan hash.
+
+        Each step carries its operation, object, cost, cardinality and
+        access and filter predicates. The first plan of a fingerprint
+        becomes its baseline; a later plan with another hash is flagged as
+        a regression when the statement's mean latency has degraded.
+        """
+        keyword, _, _ = sql.lstrip().partition(" ")
+        if keyword.upper() not in c.DbOracle.EXPLAINABLE_KEYWORDS:
+            return r[m.DbOracle.ExplainPlan].fail(
+                f"{keyword.upper() or 'Empty'} statements have no execution plan"
+            )
+        if not self.connected():
+            return r[m.DbOracle.ExplainPlan].fail("Not connected to database")
+        result = self._explain_statement(sql, params)
+        if result.success:
+            stats = self._statement_stats.get(result.value.fingerprint)
+            self._record_plan(
+                result.value, stats.mean_seconds if stats is not None else 0.0
+            )
+        return result
+
+    def fetch_plan_baselines(
+        self, sql: str | None = None
+    ) -> p.Result[Sequence[m.DbOracle.PlanBaseline]]:
+        """Return the plan baselines, or only the one of ``sql``'s fingerprint."""
+        if sql is None:
+            return r[Sequence[m.DbOracle.PlanBaseline]].ok(
+                list(self._plan_baselines.values())
+            )
+        baseline = self._plan_baselines.get(self.statement_fingerprint(sql))
+        return r[Sequence[m.DbOracle.PlanBaseline]].ok(
+            [baseline] if baseline is not None else []
+        )
+
+    def fetch_plan_regressions(self) -> p.Result[Sequence[m.DbOracle.PlanRegression]]:
+        """Return the flagged plan regressions, oldest first."""
+        return r[Sequence[m.DbOracle.PlanRegression]].ok(list(self._plan_regressions))
+
+    def reset_plan_baselines(self) -> p.Result[bool]:
+        """Forget every plan baseline and flagged regression."""
+        self._plan_baselines.clear()
+        self._plan_regressions.clear()
+        return r[bool].ok(value=True)
+
+    @override
+    def _record_plan(
+        self, plan: m.DbOracle.ExplainPlan, observed_seconds: float
+    ) -> None:
+        """Set or check the baseline of the plan's fingerprint.
+
+        A regression needs both a new plan hash and a latency of at least
+        ``PLAN_REGRESSION_FACTOR`` times the baseline latency. Baselines
+        past ``PLAN_BASELINE_CAPACITY`` evict the oldest fingerprint.
+        """
+        if plan.plan_hash is None:
+            return
+        baseline = self._plan_baselines.get(plan.fingerprint)
+        if baseline is None:
+            self._plan_baselines[plan.fingerprint] = m.DbOracle.PlanBaseline(
+                fingerprint=plan.fingerprint,
+                plan_hash=plan.plan_hash,
+                mean_seconds=observed_seconds,
+                plan=plan.text,
+                timestamp=self._get_current_timestamp(),
+            )
+            if len(self._plan_baselines) > c.DbOracle.PLAN_BASELINE_CAPACITY:
+                del self._plan_baselines[next(iter(self._plan_baselines))]
+            return
+        if baseline.plan_hash == plan.plan_hash:
+            if not baseline.mean_seconds:
+                baseline.mean_seconds = observed_seconds
+            return
+        if not baseline.mean_seconds or observed_seconds < (
+            baseline.mean_seconds * c.DbOracle.PLAN_REGRESSION_FACTOR
+        ):
+            return
+        regression = m.DbOracle.PlanRegression(
+            fingerprint=plan.fingerprint,
+            baseline_plan_hash=baseline.plan_hash,
+            plan_hash=plan.plan_hash,
+            baseline_seconds=baseline.mean_seconds,
+            observed_seconds=observed_seconds,
+            timestamp=self._get_current_timestamp(),
+        )
+        self._plan_regressions.append(regression)
+        self.logger.warning(
+            "Plan regression",
+            fingerprint=plan.fingerprint,
+            baseline_plan_hash=baseline.plan_hash,
+            plan_hash=plan.plan_hash,
+            slowdown=round(regression.slowdown, 2),
+        )
+
+
+__all__: list[str] = ["FlextDbOracleServiceExplain"]
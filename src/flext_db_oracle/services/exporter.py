@@ -0,0 +1,231 @@
+"""OpenMetrics exporter service mixin for flext-db-oracle.
+
+Renders pool gauges, instrumentation counters, latency histograms and
+statement cache hit ratios in the OpenMetrics text format, on demand or
+from a local HTTP endpoint.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, override
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+from sqlalchemy.pool import QueuePool
+
+from flext_db_oracle import FlextDbOracleServiceBase, c, m, p, r, t
+
+if TYPE_CHECKING:
+    from wsgiref.types import StartResponse, WSGIEnvironment
+
+
+class _QuietRequestHandler(WSGIRequestHandler):
+    """WSGI request handler that does not log every scrape to stderr."""
+
+    @override
+    def log_request(self, code: int | str = "-", size: int | str = "-") -> None:
+        """Skip per-request access logging."""
+        del code, size
+
+
+class FlextDbOracleServiceExporter(FlextDbOracleServiceBase):
+    """Mixin providing OpenMetrics exposition for FlextDbOracleServices.
+
+    Handles: export_openmetrics, serve_metrics, pool gauges, latency histograms.
+    """
+
+    def export_openmetrics(self) -> p.Result[str]:
+        """Render the service metrics in the OpenMetrics text format.
+
+        Pool size, checked-out and overflow gauges come from the engine's
+        queue pool when connected; the ``db_oracle_*_total`` counters from
+        the statement instrumentation; latency histograms per statement
+        fingerprint, per operation type and for connection checkout wait
+        from the cumulative aggregates; and cache hits and misses from the
+        statement and fingerprint caches.
+
+        The aggregates are copied into lists before iterating, since the
+        ``serve_metrics`` thread renders while other threads keep recording.
+        """
+        prefix = c.DbOracle.METRIC_PREFIX
+        lines: list[str] = []
+        pool = self._engine.pool if self._engine is not None else None
+        if isinstance(pool, QueuePool):
+            for name, help_text, value in (
+                ("pool_size", "Configured connection pool size", pool.size()),
+                ("pool_checked_out", "Connections checked out", pool.checkedout()),
+                ("pool_overflow", "Connections over the pool size", pool.overflow()),
+            ):
+                lines.extend(
+                    self._openmetrics_family(
+                        f"{prefix}_{name}", "gauge", help_text, [("", {}, value)]
+                    )
+                )
+        for key, value in sorted(self._metrics.items()):
+            if (
+                key.startswith(f"{prefix}_")
+                and key.endswith("_total")
+                and isinstance(value, (int, float))
+                and not isinstance(value, bool)
+            ):
+                family = key.removesuffix("_total")
+                lines.extend(
+                    self._openmetrics_family(
+                        family,
+                        "counter",
+                        "Cumulative "
+                        + family.removeprefix(f"{prefix}_").replace("_", " "),
+                        [("_total", {}, value)],
+                    )
+                )
+        for name, help_text, label, stats_by_label in (
+            (
+                "query_duration_seconds",
+                "Statement latency by fingerprint",
+                "fingerprint",
+                list(self._statement_stats.items()),
+            ),
+            (
+                "operation_duration_seconds",
+                "Operation latency by type",
+                "operation",
+                list(self._operation_stats.items()),
+            ),
+            (
+                "checkout_wait_seconds",
+                "Connection checkout wait",
+                "",
+                [("", self._checkout_stats)],
+            ),
+        ):
+            samples = [
+                sample
+                for label_value, stats in stats_by_label
+                if stats.count
+                for sample in self._histogram_samples(
+                    stats, {label: label_value} if label else {}
+                )
+            ]
+            if samples:
+                lines.extend(
+                    self._openmetrics_family(
+                        f"{prefix}_{name}", "histogram", help_text, samples
+                    )
+                )
+        fingerprint = self.statement_fingerprint.cache_info()
+        parameterize = self.parameterize_sql.cache_info()
+        caches = {
+            **self.statement_cache_info(),
+            "statement_fingerprint": (fingerprint.hits, fingerprint.misses),
+            "parameterize_sql": (parameterize.hits, parameterize.misses),
+        }
+        for outcome, index in (("hits", 0), ("misses", 1)):
+            lines.extend(
+                self._openmetrics_family(
+                    f"{prefix}_cache_{outcome}",
+                    "counter",
+                    f"Cache {outcome} by cache",
+                    [
+                        ("_total", {"cache": cache}, counts[index])
+                        for cache, counts in sorted(caches.items())
+                    ],
+                )
+            )
+        lines.append("# EOF")
+        return r[str].ok("\n".join(lines) + "\n")
+
+    def serve_metrics(
+        self,
+        host: str = c.DbOracle.DEFAULT_METRICS_HOST,
+        port: int = c.DbOracle.DEFAULT_METRICS_PORT,
+    ) -> p.Result[WSGIServer]:
+        """Serve ``export_openmetrics`` at ``/metrics`` from a daemon thread.
+
+        Port 0 binds a free port, readable from ``server.server_port``.
+        Call ``shutdown()`` on the returned server to stop serving.
+        """
+
+        def metrics_app(
+            environ: WSGIEnvironment, start_response: StartResponse
+        ) -> list[bytes]:
+            """Answer ``GET /metrics`` with a fresh OpenMetrics rendering."""
+            if environ.get("PATH_INFO") != "/metrics":
+                start_response("404 Not Found", [("Content-Type", "text/plain")])
+                return [b"Not Found\n"]
+            rendered = self.export_openmetrics()
+            if rendered.failure:
+                start_response(
+                    "500 Internal Server Error", [("Content-Type", "text/plain")]
+                )
+                return [(rendered.error or "Metrics export failed").encode()]
+            body = rendered.value.encode()
+            start_response(
+                "200 OK",
+                [
+                    ("Content-Type", c.DbOracle.OPENMETRICS_CONTENT_TYPE),
+                    ("Content-Length", str(len(body))),
+                ],
+            )
+            return [body]
+
+        try:
+            server = make_server(
+                host, port, metrics_app, handler_class=_QuietRequestHandler
+            )
+        except OSError as e:
+            return r[WSGIServer].fail_op("Metrics server", e)
+        threading.Thread(
+            target=server.serve_forever, name="db-oracle-metrics", daemon=True
+        ).start()
+        self.logger.info("Serving OpenMetrics", host=host, port=server.server_port)
+        return r[WSGIServer].ok(server)
+
+    @staticmethod
+    def _histogram_samples(
+        stats: m.DbOracle.OperationStats, labels: t.StrMapping
+    ) -> list[tuple[str, t.StrMapping, float]]:
+        """Cumulative ``le`` buckets, count and sum of one latency aggregate."""
+        bounds = c.DbOracle.METRICS_LATENCY_BUCKETS
+        samples: list[tuple[str, t.StrMapping, float]] = [
+            ("_bucket", {**labels, "le": str(bound)}, count)
+            for bound, count in zip(bounds, stats.bucket_counts(bounds), strict=True)
+        ]
+        samples.extend([
+            ("_bucket", {**labels, "le": "+Inf"}, stats.count),
+            ("_count", labels, stats.count),
+            ("_sum", labels, stats.total_seconds),
+        ])
+        return samples
+
+    @classmethod
+    def _openmetrics_family(
+        cls,
+        name: str,
+        kind: str,
+        help_text: str,
+        samples: t.SequenceOf[tuple[str, t.StrMapping, float]],
+    ) -> list[str]:
+        """Render one metric family: TYPE and HELP lines, then its samples."""
+        lines = [f"# TYPE {name} {kind}", f"# HELP {name} {help_text}."]
+        for suffix, labels, value in samples:
+            label_text = ",".join(
+                f'{key}="{cls._escape_label(label)}"' for key, label in labels.items()
+            )
+            lines.append(
+                f"{name}{suffix}{{{label_text}}} {value}"
+                if label_text
+                else f"{name}{suffix} {value}"
+            )
+        return lines
+
+    @staticmethod
+    def _escape_label(value: str) -> str:
+        """Escape backslashes, quotes and newlines in an OpenMetrics label value."""
+        escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+        return escaped.replace("\n", "\\n")
+
+
+__all__: list[str] = ["FlextDbOracleServiceExporter"]
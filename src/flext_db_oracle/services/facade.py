@@ -6,14 +6,38 @@ from typing import override
 
 from flext_db_oracle import FlextDbOracleServiceBase, FlextDbOracleSettings, p, r, t
 from flext_db_oracle.services.connection import FlextDbOracleServiceConnection
+from flext_db_oracle.services.ddl_executor import FlextDbOracleServiceDdlExecutor
+from flext_db_oracle.services.explain import FlextDbOracleServiceExplain
+from flext_db_oracle.services.exporter import FlextDbOracleServiceExporter
+from flext_db_oracle.services.incremental import FlextDbOracleServiceIncremental
+from flext_db_oracle.services.loader import FlextDbOracleServiceLoader
 from flext_db_oracle.services.plugin import FlextDbOracleServicePlugin
 from flext_db_oracle.services.query import FlextDbOracleServiceQuery
+from flext_db_oracle.services.refresh import FlextDbOracleServiceRefresh
 from flext_db_oracle.services.schema import FlextDbOracleServiceSchema
 from flext_db_oracle.services.singer import FlextDbOracleServiceSinger
+from flext_db_oracle.services.singer_tap import FlextDbOracleServiceSingerTap
+from flext_db_oracle.services.singer_target import FlextDbOracleServiceSingerTarget
+from flext_db_oracle.services.slow_query import FlextDbOracleServiceSlowQuery
 from flext_db_oracle.services.sql_builder import FlextDbOracleServiceSqlBuilder
+from flext_db_oracle.services.statistics import FlextDbOracleServiceStatistics
+from flext_db_oracle.services.table_copy import FlextDbOracleServiceTableCopy
+from flext_db_oracle.services.upsert import FlextDbOracleServiceUpsert
 
 
 class FlextDbOracleServices(
+    FlextDbOracleServiceExplain,
+    FlextDbOracleServiceSlowQuery,
+    FlextDbOracleServiceExporter,
+    FlextDbOracleServiceSingerTarget,
+    FlextDbOracleServiceSingerTap,
+    FlextDbOracleServiceIncremental,
+    FlextDbOracleServiceRefresh,
+    FlextDbOracleServiceStatistics,
+    FlextDbOracleServiceDdlExecutor,
+    FlextDbOracleServiceTableCopy,
+    FlextDbOracleServiceUpsert,
+    FlextDbOracleServiceLoader,
     FlextDbOracleServicePlugin,
     FlextDbOracleServiceSchema,
     FlextDbOracleServiceSinger,
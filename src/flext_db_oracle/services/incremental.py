@@ -0,0 +1,223 @@
+"""Incremental extraction service mixin for flext-db-oracle.
+
+Streams only the rows changed since a Singer-compatible bookmark, keyed
+by a replication key column or the ORA_ROWSCN pseudo-column.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from datetime import date
+from decimal import Decimal
+from typing import override
+
+from flext_db_oracle import FlextDbOracleServiceBase, c, m, p, r, t
+
+
+class FlextDbOracleServiceIncremental(FlextDbOracleServiceBase):
+    """Mixin providing incremental extraction for FlextDbOracleServices.
+
+    Handles: extract_incremental, singer_state, bookmark_from_state.
+    """
+
+    @override
+    def extract_incremental(
+        self,
+        table_name: str,
+        *,
+        replication_key: str | None = None,
+        bookmark: m.DbOracle.Bookmark | None = None,
+        schema: str | None = None,
+        columns: t.StrSequence | None = None,
+        batch_size: int = c.DbOracle.DEFAULT_ARRAY_SIZE,
+    ) -> p.Result[Iterator[tuple[t.DbOracle.BindBatch, m.DbOracle.Bookmark]]]:
+        """Stream the rows changed since ``bookmark`` in replication-key order.
+
+        The high-water mark is ``replication_key`` (default: the bookmark's
+        key, else ``ORA_ROWSCN``). Column keys resume inclusively (``>=``),
+        so rows sharing the last key value are re-sent rather than missed;
+        ``ORA_ROWSCN`` resumes after the last SCN and is added to every row.
+        Each yielded batch comes with the bookmark to persist once the batch
+        is processed. Rows stream through a server-side cursor; driver
+        errors raised while iterating propagate to the caller.
+        """
+        if batch_size < 1:
+            return r[Iterator[tuple[t.DbOracle.BindBatch, m.DbOracle.Bookmark]]].fail(
+                "Batch size must be positive"
+            )
+        if not self.connected():
+            return r[Iterator[tuple[t.DbOracle.BindBatch, m.DbOracle.Bookmark]]].fail(
+                "Not connected to database"
+            )
+        key = self._dictionary_name(
+            replication_key
+            or (bookmark.replication_key if bookmark is not None else "")
+            or c.DbOracle.ROWSCN_REPLICATION_KEY
+        )
+        stream = self._stream_name(table_name, schema)
+        if bookmark is not None and (
+            bookmark.stream != stream
+            or self._dictionary_name(bookmark.replication_key) != key
+        ):
+            return r[Iterator[tuple[t.DbOracle.BindBatch, m.DbOracle.Bookmark]]].fail(
+                f"Bookmark tracks {bookmark.stream}.{bookmark.replication_key}, "
+                f"not {stream}.{key}"
+            )
+        return self.fetch_table_metadata(table_name, schema).flat_map(
+            lambda metadata: self._plan_incremental_extract(
+                metadata,
+                key,
+                bookmark or m.DbOracle.Bookmark(stream=stream, replication_key=key),
+                columns,
+                batch_size,
+            )
+        )
+
+    @staticmethod
+    def singer_state(bookmarks: t.SequenceOf[m.DbOracle.Bookmark]) -> t.JsonDict:
+        """Render bookmarks as the value of a Singer STATE message."""
+        return {
+            "bookmarks": {
+                bookmark.stream: {
+                    "replication_key": bookmark.replication_key,
+                    "replication_key_value": bookmark.replication_key_value,
+                }
+                for bookmark in bookmarks
+            }
+        }
+
+    @override
+    def bookmark_from_state(
+        self, state: t.JsonMapping, table_name: str, *, schema: str | None = None
+    ) -> p.Result[m.DbOracle.Bookmark | None]:
+        """Read a table's bookmark from a Singer STATE message or its value.
+
+        Returns ``None`` when the state holds no bookmark for the table.
+        """
+        value = state.get("value", state) if state.get("type") == "STATE" else state
+        bookmarks = value.get("bookmarks", {}) if isinstance(value, Mapping) else {}
+        stream = self._stream_name(table_name, schema)
+        entry = bookmarks.get(stream) if isinstance(bookmarks, Mapping) else None
+        if entry is None:
+            return r[m.DbOracle.Bookmark | None].ok(None)
+        if not isinstance(entry, Mapping):
+            return r[m.DbOracle.Bookmark | None].fail(
+                f"Invalid Singer bookmark for stream {stream}"
+            )
+        try:
+            bookmark = m.DbOracle.Bookmark.model_validate({
+                "stream": stream,
+                "replication_key": entry.get(
+                    "replication_key", c.DbOracle.ROWSCN_REPLICATION_KEY
+                ),
+                "replication_key_value": entry.get("replication_key_value"),
+            })
+        except c.ValidationError as e:
+            return r[m.DbOracle.Bookmark | None].fail(
+                f"Invalid Singer bookmark for stream {stream}: {e}"
+            )
+        return r[m.DbOracle.Bookmark | None].ok(bookmark)
+
+    def _plan_incremental_extract(
+        self,
+        metadata: m.DbOracle.TableMetadata,
+        key: str,
+        bookmark: m.DbOracle.Bookmark,
+        columns: t.StrSequence | None,
+        batch_size: int,
+    ) -> p.Result[Iterator[tuple[t.DbOracle.BindBatch, m.DbOracle.Bookmark]]]:
+        """Validate the columns and build the bookmark-filtered query."""
+        names = {column.name.upper(): column.name for column in metadata.columns}
+        types = {column.name.upper(): column.data_type for column in metadata.columns}
+        requested = list(columns or names.values())
+        by_rowscn = key == c.DbOracle.ROWSCN_REPLICATION_KEY
+        unknown = [name for name in requested if name.upper() not in names]
+        if not by_rowscn and key.upper() not in names:
+            unknown.append(key)
+        if unknown:
+            return r[Iterator[tuple[t.DbOracle.BindBatch, m.DbOracle.Bookmark]]].fail(
+                f"Unknown columns for {metadata.table_name}: {', '.join(unknown)}"
+            )
+        selected = [names[name.upper()] for name in requested]
+        select_columns = list(selected)
+        if by_rowscn:
+            # Lower case keeps the pseudo-column unquoted in the compiled SQL.
+            sql_key = key.lower()
+            selected.insert(0, key)
+            select_columns.insert(0, sql_key)
+        else:
+            key = sql_key = names[key.upper()]
+            if key not in selected:
+                selected.append(key)
+                select_columns.append(key)
+        params: t.DbOracle.BindRow = {}
+        if bookmark.replication_key_value is not None:
+            convert = (
+                self._to_number
+                if by_rowscn
+                else self._bind_converter(types[key.upper()])
+            )
+            try:
+                params = {f"{sql_key}_lower": convert(bookmark.replication_key_value)}
+            except (ValueError, TypeError) as e:
+                return r[
+                    Iterator[tuple[t.DbOracle.BindBatch, m.DbOracle.Bookmark]]
+                ].fail(f"Invalid bookmark value for {key}: {e}")
+        select_result = self.build_select(
+            metadata.table_name,
+            select_columns,
+            schema_name=metadata.schema_name or None,
+            lower_bounds={sql_key: not by_rowscn} if params else None,
+            order_by=[sql_key],
+        )
+        if select_result.failure:
+            return r[Iterator[tuple[t.DbOracle.BindBatch, m.DbOracle.Bookmark]]].fail(
+                select_result.error or "Failed to build incremental query"
+            )
+        return r[Iterator[tuple[t.DbOracle.BindBatch, m.DbOracle.Bookmark]]].ok(
+            self._iter_incremental_batches(
+                select_result.value, params, selected, key, bookmark, batch_size
+            )
+        )
+
+    def _iter_incremental_batches(
+        self,
+        sql: str,
+        params: t.DbOracle.BindRow,
+        column_names: t.StrSequence,
+        key: str,
+        bookmark: m.DbOracle.Bookmark,
+        batch_size: int,
+    ) -> Iterator[tuple[t.DbOracle.BindBatch, m.DbOracle.Bookmark]]:
+        """Yield ordered batches, advancing the bookmark past each one."""
+        current = bookmark
+        for batch in self._stream_row_batches(sql, params, batch_size, column_names):
+            last = next(
+                (row[key] for row in reversed(batch) if row[key] is not None), None
+            )
+            if last is not None:
+                current = current.model_copy(
+                    update={"replication_key_value": self._bookmark_value(last)}
+                )
+            yield batch, current
+
+    @staticmethod
+    def _bookmark_value(value: t.DbOracle.BindValue) -> int | str:
+        """Render a replication key value as a JSON-safe bookmark value."""
+        if isinstance(value, date):
+            return value.isoformat()
+        if isinstance(value, bool):
+            return int(value)
+        if isinstance(value, Decimal):
+            return int(value) if value == value.to_integral_value() else str(value)
+        if isinstance(value, bytes):
+            return value.hex()
+        if isinstance(value, int):
+            return value
+        return str(value)
+
+
+__all__: list[str] = ["FlextDbOracleServiceIncremental"]
@@ -0,0 +1,230 @@
+"""Bulk file loader service mixin for flext-db-oracle.
+
+Streams CSV and JSONL files into Oracle tables: memory-mapped chunked
+reading, typed batching, and array-bound inserts behind a bounded queue.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import csv
+import queue
+import threading
+import time
+from collections.abc import Iterator, MutableSequence
+from pathlib import Path
+
+from flext_db_oracle import FlextDbOracleServiceBase, c, m, p, r, t
+
+
+class FlextDbOracleServiceLoader(FlextDbOracleServiceBase):
+    """Mixin providing streaming file loads for FlextDbOracleServices.
+
+    Handles: load_file, file chunking, record typing, parser/writer pipeline.
+    """
+
+    def load_file(
+        self,
+        table_name: str,
+        file_path: str | Path,
+        *,
+        schema: str | None = None,
+        file_format: str | None = None,
+        columns: t.StrSequence | None = None,
+        has_header: bool = True,
+        delimiter: str = ",",
+        batch_size: int = c.DbOracle.DEFAULT_LOAD_BATCH_SIZE,
+        queue_depth: int = c.DbOracle.DEFAULT_PIPELINE_QUEUE_DEPTH,
+        gather_stats: m.DbOracle.StatsOptions | None = None,
+    ) -> p.Result[m.DbOracle.LoadResult]:
+        """Stream a CSV or JSONL file into an Oracle table.
+
+        A parser thread reads the file through ``mmap`` in newline-aligned
+        chunks, types every row against the table's Oracle column types and
+        hands fixed-size batches to the writer through a bounded queue. The
+        writer inserts each batch with one array-bound ``executemany``.
+        Rows that cannot be parsed or typed are counted as rejected instead
+        of failing the load. With ``gather_stats`` the loaded rows count
+        towards the table's staleness threshold and statistics are gathered
+        once it is reached.
+        """
+        path = Path(file_path)
+        if not path.is_file():
+            return r[m.DbOracle.LoadResult].fail(f"Load file not found: {path}")
+        resolved_format = file_format or c.DbOracle.LOAD_FILE_SUFFIXES.get(
+            path.suffix.lower(), ""
+        )
+        if resolved_format not in {fmt.value for fmt in c.DbOracle.LoadFileFormat}:
+            return r[m.DbOracle.LoadResult].fail(
+                f"Unsupported load file format: {resolved_format or path.suffix}"
+            )
+        if batch_size < 1 or queue_depth < 1:
+            return r[m.DbOracle.LoadResult].fail(
+                "Batch size and queue depth must be positive"
+            )
+        if not self.connected():
+            return r[m.DbOracle.LoadResult].fail("Not connected to database")
+        columns_result = self.fetch_columns(table_name, schema)
+        if columns_result.failure:
+            return r[m.DbOracle.LoadResult].fail(
+                columns_result.error or f"Failed to describe table {table_name}"
+            )
+        oracle_types = {
+            column.name.upper(): column.data_type for column in columns_result.value
+        }
+        lines = self.iter_file_lines(path)
+        if resolved_format == c.DbOracle.LoadFileFormat.CSV:
+            reader = csv.reader(lines, delimiter=delimiter)
+            try:
+                header = (
+                    [name.strip() for name in next(reader, [])] if has_header else []
+                )
+            except (OSError, UnicodeDecodeError, csv.Error) as exc:
+                return r[m.DbOracle.LoadResult].fail(f"Failed to read header: {exc}")
+            column_names = list(columns or header)
+            records = self.iter_csv_records(reader, column_names)
+        else:
+            column_names = list(columns or (col.name for col in columns_result.value))
+            records = self.iter_jsonl_records(lines, column_names)
+        if not column_names:
+            return r[m.DbOracle.LoadResult].fail("Load requires at least one column")
+        converters = {
+            name: self._bind_converter(oracle_types.get(name.upper(), ""))
+            for name in column_names
+        }
+        load_result = self.build_insert_statement(
+            table_name, column_names, schema
+        ).flat_map(
+            lambda sql: self._run_load_pipeline(
+                table_name, sql, records, converters, batch_size, queue_depth
+            )
+        )
+        if gather_stats is None or load_result.failure:
+            return load_result
+        stats_result = self.gather_stats_if_stale(
+            table_name,
+            load_result.value.rows_loaded,
+            schema=schema,
+            options=gather_stats,
+        )
+        if stats_result.failure:
+            self.logger.warning(
+                "Post-load statistics gathering failed",
+                table=table_name,
+                error=stats_result.error,
+            )
+            return load_result
+        return r[m.DbOracle.LoadResult].ok(
+            load_result.value.model_copy(
+                update={"stats_gathered": stats_result.value.gathered}
+            )
+        )
+
+    def _run_load_pipeline(
+        self,
+        table_name: str,
+        sql: str,
+        records: Iterator[t.DbOracle.LoadRecord],
+        converters: t.MappingKV[str, t.DbOracle.BindConverter],
+        batch_size: int,
+        queue_depth: int,
+    ) -> p.Result[m.DbOracle.LoadResult]:
+        """Run the bounded parser/writer pipeline for one file load."""
+        batches: queue.Queue[t.DbOracle.BindBatch | None] = queue.Queue(
+            maxsize=queue_depth
+        )
+        stop = threading.Event()
+        rejected: MutableSequence[str] = []
+        parse_errors: MutableSequence[str] = []
+        rejected_count = 0
+
+        def _put(item: t.DbOracle.BindBatch | None) -> bool:
+            while not stop.is_set():
+                try:
+                    batches.put(item, timeout=0.1)
+                except queue.Full:
+                    continue
+                return True
+            return False
+
+        def _reject(line_number: int, reason: str) -> None:
+            nonlocal rejected_count
+            rejected_count += 1
+            if len(rejected) < c.DbOracle.MAX_REJECTED_SAMPLES:
+                rejected.append(f"line {line_number}: {reason}")
+
+        def _batch_records() -> None:
+            batch: MutableSequence[t.DbOracle.BindRow] = []
+            for line_number, record, reason in records:
+                if record is None:
+                    _reject(line_number, reason)
+                    continue
+                try:
+                    batch.append({
+                        name: convert(record.get(name))
+                        for name, convert in converters.items()
+                    })
+                except (ValueError, TypeError, ArithmeticError) as exc:
+                    _reject(line_number, str(exc))
+                    continue
+                if len(batch) >= batch_size:
+                    if not _put(batch):
+                        return
+                    batch = []
+            if batch:
+                _put(batch)
+
+        def _produce() -> None:
+            try:
+                _batch_records()
+            except Exception as exc:
+                self.logger.exception("Load parser failed", table=table_name)
+                parse_errors.append(f"{type(exc).__name__}: {exc}")
+            finally:
+                _put(None)
+
+        started = time.perf_counter()
+        parser = threading.Thread(
+            target=_produce, name=f"flext-db-oracle-load-{table_name}", daemon=True
+        )
+        parser.start()
+        rows_loaded = 0
+        batch_count = 0
+        write_error = ""
+        try:
+            while (batch := batches.get()) is not None:
+                write_result = self.execute_batch(sql, batch)
+                if write_result.failure:
+                    write_error = write_result.error or "Batch execution failed"
+                    break
+                rows_loaded += len(batch)
+                batch_count += 1
+        finally:
+            stop.set()
+            parser.join()
+        error = write_error or "; ".join(parse_errors)
+        if error:
+            return r[m.DbOracle.LoadResult].fail(
+                f"Bulk load of {table_name} failed after {rows_loaded} rows: {error}"
+            )
+        load_result = m.DbOracle.LoadResult(
+            table_name=table_name,
+            rows_loaded=rows_loaded,
+            rows_rejected=rejected_count,
+            batches=batch_count,
+            elapsed_seconds=time.perf_counter() - started,
+            rejected_samples=tuple(rejected),
+        )
+        self.logger.info(
+            "Bulk load finished",
+            table=table_name,
+            rows_loaded=load_result.rows_loaded,
+            rows_rejected=load_result.rows_rejected,
+            rows_per_second=round(load_result.rows_per_second, 1),
+        )
+        return r[m.DbOracle.LoadResult].ok(load_result)
+
+
+__all__: list[str] = ["FlextDbOracleServiceLoader"]
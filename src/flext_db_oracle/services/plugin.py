@@ -10,21 +10,29 @@ SPDX-License-Identifier: MIT
 from __future__ import annotations
 
 from collections.abc import Sequence
+from typing import override
 
-from sqlalchemy.exc import OperationalError as SQLAlchemyOperationalError
-
-from flext_db_oracle import FlextDbOracleServiceBase, e, m, p, r, t, u
+from flext_db_oracle import FlextDbOracleServiceBase, c, e, m, p, r, t, u
 
 
 class FlextDbOracleServicePlugin(FlextDbOracleServiceBase):
     """Mixin providing plugin, metrics, and operations for FlextDbOracleServices.
 
     Handles: register_plugin, unregister_plugin, get_plugin, list_plugins,
-    record_metric, get_metrics, track_operation, get_operations.
+    record_metric, get_metrics, track_operation, get_operations,
+    set_span_exporter, fetch_spans, fetch_statement_stats,
+    reset_statement_stats, reset_operation_stats.
     """
 
     def fetch_metrics(self) -> p.Result[m.DbOracle.HealthStatus]:
-        """Get metrics status with observability integration."""
+        """Get metrics status with observability integration.
+
+        ``operations`` maps each tracked operation type to its count, error
+        rate and p50/p95/p99 latency in seconds. The aggregates are cumulative
+        since the service was created or ``reset_operation_stats`` was last
+        called, like the OpenMetrics counters built from them; callers wanting
+        a window reset them at the start of each one.
+        """
         status = "connected" if self.connected() else "disconnected"
         metrics_payload: t.StrMapping = {
             metric_name: str(metric_value)
@@ -37,12 +45,67 @@ class FlextDbOracleServicePlugin(FlextDbOracleServiceBase):
                 "service": "oracle",
                 "database": self.db_config.DbOracle.service_name,
                 "metrics": metrics_payload,
+                "operations": {
+                    operation_type: stats.summary()
+                    for operation_type, stats in self._operation_stats.items()
+                },
             })
         )
 
     def fetch_operations(self) -> p.Result[Sequence[m.DbOracle.OperationRecord]]:
-        """Get tracked operations."""
-        return r[Sequence[m.DbOracle.OperationRecord]].ok(list(self._operations))
+        """Get the most recent tracked operations, oldest first.
+
+        The log keeps the last ``OPERATION_LOG_CAPACITY`` operations as compact
+        tuples; records are only materialized here.
+        """
+        return r[Sequence[m.DbOracle.OperationRecord]].ok([
+            m.DbOracle.OperationRecord(
+                operation_type=operation_type,
+                duration=duration,
+                success=success,
+                metadata_info=str(m.ConfigMap.model_validate(metadata or {})),
+                timestamp=timestamp,
+            )
+            for operation_type, duration, success, timestamp, metadata in (
+                self._operations
+            )
+        ])
+
+    def fetch_statement_stats(
+        self,
+        *,
+        order_by: c.DbOracle.StatementStatsOrder = (
+            c.DbOracle.StatementStatsOrder.TOTAL_SECONDS
+        ),
+        limit: int | None = None,
+    ) -> p.Result[Sequence[m.DbOracle.StatementStats]]:
+        """Get per-fingerprint statement statistics, largest ``order_by`` first.
+
+        Each entry aggregates calls, errors, total/mean/max time and rows of
+        every statement sharing a normalized shape, so literal variants of
+        one query count together. Distinct texts are counted as
+        ``literal_variants``; past ``LITERAL_VARIANT_THRESHOLD`` the entry is
+        ``literal_heavy`` and lists the calling lines. The least recently
+        executed fingerprints are evicted beyond ``STATEMENT_STATS_CAPACITY``.
+        """
+        if limit is not None and limit < 1:
+            return r[Sequence[m.DbOracle.StatementStats]].fail("Limit must be positive")
+        key = c.DbOracle.StatementStatsOrder(order_by).value
+        ranked = sorted(
+            self._statement_stats.values(),
+            key=lambda stats: getattr(stats, key),
+            reverse=True,
+        )
+        return r[Sequence[m.DbOracle.StatementStats]].ok(ranked[:limit])
+
+    def fetch_spans(self) -> p.Result[Sequence[m.DbOracle.Span]]:
+        """Get the spans kept by the in-memory span exporter."""
+        exporter = self._span_exporter
+        if not isinstance(exporter, m.DbOracle.InMemorySpanExporter):
+            return r[Sequence[m.DbOracle.Span]].fail(
+                "Spans are only kept by the in-memory span exporter"
+            )
+        return r[Sequence[m.DbOracle.Span]].ok(list(exporter.spans))
 
     def fetch_plugin(self, name: str) -> p.Result[t.JsonPayload]:
         """Get plugin data from local service registry."""
@@ -80,6 +143,14 @@ class FlextDbOracleServicePlugin(FlextDbOracleServiceBase):
         self._plugins[name] = plugin
         return r[bool].ok(True)
 
+    def set_span_exporter(
+        self, exporter: p.DbOracle.SpanExporter | None
+    ) -> p.Result[bool]:
+        """Send trace spans to ``exporter``; None turns tracing off."""
+        self._span_exporter = exporter
+        return r[bool].ok(True)
+
+    @override
     def track_operation(
         self,
         operation_type: str = "",
@@ -88,34 +159,36 @@ class FlextDbOracleServicePlugin(FlextDbOracleServiceBase):
         success: bool = True,
         metadata: m.ConfigMap | t.JsonMapping | None = None,
     ) -> p.Result[bool]:
-        """Track database operation for monitoring."""
+        """Track database operation for monitoring.
 
-        def _track() -> bool:
-            metadata_value = (
-                metadata
-                if isinstance(metadata, m.ConfigMap)
-                else m.ConfigMap.model_validate(metadata or {})
-            )
-            operation = m.DbOracle.OperationRecord(
-                operation_type=operation_type,
-                duration=duration,
-                success=success,
-                metadata_info=str(metadata_value),
-                timestamp=self._get_current_timestamp(),
-            )
-            self._operations.append(operation)
-            return True
-
-        return u.try_(
-            _track,
-            catch=(
-                t.DbOracle.OracleDatabaseError,
-                t.DbOracle.OracleInterfaceError,
-                ConnectionError,
-                SQLAlchemyOperationalError,
-                OSError,
-            ),
-        ).map_error(lambda e: f"Failed to track operation: {e}")
+        The operation is appended to a bounded ring buffer (the oldest entry
+        is dropped at capacity) and folded into per-type cumulative aggregates.
+        """
+        metadata_value: t.JsonMapping | None = (
+            metadata.root if isinstance(metadata, m.ConfigMap) else metadata
+        )
+        self._operations.append((
+            operation_type,
+            duration,
+            success,
+            self._get_current_timestamp(),
+            dict(metadata_value) if metadata_value else None,
+        ))
+        stats = self._operation_stats.get(operation_type)
+        if stats is None:
+            stats = self._operation_stats[operation_type] = m.DbOracle.OperationStats()
+        stats.observe(duration, success=success)
+        return r[bool].ok(True)
+
+    def reset_operation_stats(self) -> p.Result[bool]:
+        """Discard the per-type operation aggregates, starting a new window."""
+        self._operation_stats.clear()
+        return r[bool].ok(True)
+
+    def reset_statement_stats(self) -> p.Result[bool]:
+        """Discard all per-fingerprint statement statistics."""
+        self._statement_stats.clear()
+        return r[bool].ok(True)
 
     def unregister_plugin(self, name: str) -> p.Result[bool]:
         """Unregister plugin from local service registry."""
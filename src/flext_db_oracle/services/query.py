@@ -17,45 +17,188 @@ from sqlalchemy import text
 from flext_db_oracle import FlextDbOracleServiceBase, c, m, p, r, t
 
 if TYPE_CHECKING:
-    from sqlalchemy.engine import CursorResult
+    from sqlalchemy.engine import RowMapping
 
 
 class FlextDbOracleServiceQuery(FlextDbOracleServiceBase):
     """Mixin providing query execution for FlextDbOracleServices.
 
-    Handles: execute_query, execute_statement, execute_many,
-    fetch_one, generate_query_hash, result normalization.
+    Handles: execute_query, execute_query_json, execute_statement, execute_many,
+    execute_batch, execute_insert_all, fetch_one, generate_query_hash, result
+    normalization.
     """
 
+    @override
+    def execute_batch(self, sql: str, rows: t.DbOracle.BindBatch) -> p.Result[int]:
+        """Execute one array-bound statement for a whole batch of bind rows.
+
+        The batch travels in a single ``executemany`` round-trip and commits as
+        one transaction, so callers get all-or-nothing semantics per batch.
+        """
+        if not self.connected():
+            return r[int].fail("Not connected to database")
+        if not rows:
+            return r[int].ok(0)
+        engine_result = self._get_engine()
+        if engine_result.failure:
+            return r[int].fail(engine_result.error or "Failed to get database engine")
+        timing = self._begin_statement(sql)
+        try:
+            with self._timed_connection(
+                engine_result.value, timing, begin=True
+            ) as conn:
+                result = self._connection_execute_many(conn, text(sql), rows)
+                rowcount = max(result.rowcount, 0)
+                self._lap_statement(timing, c.DbOracle.StatementPhase.EXECUTE, conn)
+        except c.DbOracle.EXC_DB_BROAD as e:
+            if timing is not None:
+                self._finish_statement(timing, error=e)
+            return r[int].fail_op("Batch execution", e)
+        if timing is not None:
+            timing.commit_seconds = timing.lap()
+            self._finish_statement(timing, rows=rowcount)
+        return r[int].ok(rowcount)
+
+    def execute_insert_all(
+        self,
+        table_name: str,
+        rows: t.DbOracle.BindBatch,
+        *,
+        columns: t.StrSequence | None = None,
+        schema: str | None = None,
+        rows_per_statement: int = c.DbOracle.DEFAULT_INSERT_ALL_ROWS,
+    ) -> p.Result[int]:
+        """Insert rows with multi-row ``INSERT ALL`` statements in one transaction.
+
+        Each statement carries up to ``rows_per_statement`` rows as scalar
+        binds, capped so the rows fit Oracle's 999 target columns per
+        multitable insert, so every chunk costs one round-trip even where
+        array binding is unavailable. Columns default to the keys of the
+        first row. The whole call is timed as one statement under the
+        fingerprint of its first template. Inserted rows count towards the
+        table's changes for ``gather_stats_if_stale``.
+        """
+        if rows_per_statement < 1:
+            return r[int].fail("Rows per statement must be positive")
+        if not rows:
+            return r[int].ok(0)
+        if not self.connected():
+            return r[int].fail("Not connected to database")
+        column_names = list(columns or rows[0])
+        if not column_names:
+            return r[int].fail("INSERT ALL requires at least one column")
+        step = min(
+            rows_per_statement, c.DbOracle.MAX_INSERT_ALL_COLUMNS // len(column_names)
+        )
+        if step < 1:
+            return r[int].fail("Too many columns for a single INSERT ALL row")
+        templates = {
+            size: self.build_insert_all_statement(
+                table_name, column_names, size, schema
+            )
+            for size in {min(step, len(rows)), len(rows) % step} - {0}
+        }
+        failed = next((res for res in templates.values() if res.failure), None)
+        if failed is not None:
+            return r[int].fail(failed.error or "Failed to build INSERT ALL statement")
+        engine_result = self._get_engine()
+        if engine_result.failure:
+            return r[int].fail(engine_result.error or "Failed to get database engine")
+        with self.trace(
+            "execute_insert_all",
+            {"db.collection.name": table_name, "db.operation.batch.size": len(rows)},
+        ) as span:
+            timing = self._begin_statement(templates[min(step, len(rows))].value)
+            try:
+                with self._timed_connection(
+                    engine_result.value, timing, begin=True
+                ) as conn:
+                    for start in range(0, len(rows), step):
+                        batch = rows[start : start + step]
+                        _ = self._connection_execute_many(
+                            conn,
+                            text(templates[len(batch)].value),
+                            [self.insert_all_binds(batch, column_names)],
+                        )
+                    self._lap_statement(timing, c.DbOracle.StatementPhase.EXECUTE, conn)
+            except c.DbOracle.EXC_DB_BROAD as e:
+                if span is not None:
+                    span.record_error(e)
+                if timing is not None:
+                    self._finish_statement(timing, error=e)
+                return r[int].fail_op("INSERT ALL execution", e)
+            if timing is not None:
+                timing.commit_seconds = timing.lap()
+                self._finish_statement(timing, rows=len(rows))
+        self._track_row_changes(table_name, schema, len(rows))
+        return r[int].ok(len(rows))
+
     def execute_many(
         self, sql: str, params_list: t.SequenceOf[t.JsonMapping | m.ConfigMap]
     ) -> p.Result[int]:
-        """Execute SQL statement multiple times."""
+        """Execute SQL statement multiple times in one transaction.
+
+        Rows sharing one key set go in a single array-bound round-trip;
+        rows with differing key sets are executed one by one, as before.
+        Rows written by an INSERT, UPDATE, DELETE or MERGE count towards the
+        target table's changes for ``gather_stats_if_stale``.
+        """
+        typed_params = [
+            params
+            if isinstance(params, m.ConfigMap)
+            else m.ConfigMap.model_validate(params)
+            for params in params_list
+        ]
+        rows = [params.root for params in typed_params]
+        result = (
+            self._execute_each(sql, typed_params)
+            if len({frozenset(row) for row in rows}) > 1
+            else self.execute_batch(sql, rows)
+        )
+        if result.success:
+            self._track_statement_changes(sql, result.value)
+        return result
+
+    def _execute_each(
+        self, sql: str, params_list: t.SequenceOf[m.ConfigMap]
+    ) -> p.Result[int]:
+        """Execute a statement once per parameter set in one transaction."""
         if not self.connected():
             return r[int].fail("Not connected to database")
         engine_result = self._get_engine()
         if engine_result.failure:
             return r[int].fail(engine_result.error or "Failed to get database engine")
+        timing = self._begin_statement(sql)
+        total_affected = 0
         try:
-            with self._engine_begin(engine_result.value) as conn:
-                total_affected = 0
+            with self._timed_connection(
+                engine_result.value, timing, begin=True
+            ) as conn:
                 for params in params_list:
-                    typed_params = (
-                        params
-                        if isinstance(params, m.ConfigMap)
-                        else m.ConfigMap.model_validate(params)
-                    )
-                    result = self._connection_execute(conn, text(sql), typed_params)
+                    result = self._connection_execute(conn, text(sql), params)
                     total_affected += max(result.rowcount, 0)
-                return r[int].ok(total_affected)
+                self._lap_statement(timing, c.DbOracle.StatementPhase.EXECUTE, conn)
         except c.DbOracle.EXC_DB_BROAD as e:
+            if timing is not None:
+                self._finish_statement(timing, error=e)
             return r[int].fail_op("Bulk execution", e)
+        if timing is not None:
+            timing.commit_seconds = timing.lap()
+            self._finish_statement(timing, rows=total_affected)
+        return r[int].ok(total_affected)
 
     @override
     def execute_query(
         self, sql: str, params: m.ConfigMap | None = None
     ) -> p.Result[Sequence[m.Dict]]:
-        """Execute SQL query and return results."""
+        """Execute SQL query and return results.
+
+        Unless instrumentation is disabled in the settings, the checkout,
+        execute, fetch and normalization phases are timed and recorded with
+        the row count and payload size. With ``session_stats`` enabled the
+        call's ``v$mystat`` deltas are recorded too, and with ``bind_literals``
+        the safe literals of ``sql`` are sent as bind variables.
+        """
         if not self.connected():
             return r[Sequence[m.Dict]].fail("Not connected to database")
         engine_result = self._get_engine()
@@ -63,30 +206,106 @@ class FlextDbOracleServiceQuery(FlextDbOracleServiceBase):
             return r[Sequence[m.Dict]].fail(
                 engine_result.error or "Failed to get database engine"
             )
+        sql, params = self._bind_literals(sql, params)
+        timing = self._begin_statement(sql)
         try:
-            with self._engine_connect(engine_result.value) as conn:
+            with self._timed_connection(engine_result.value, timing) as conn:
                 result = self._connection_execute(conn, text(sql), params)
-                rows: t.SequenceOf[m.Dict] = self._normalize_query_rows(result)
-                return r[Sequence[m.Dict]].ok(rows)
+                self._lap_statement(timing, c.DbOracle.StatementPhase.EXECUTE)
+                fetched = result.mappings().all()
+                self._lap_statement(timing, c.DbOracle.StatementPhase.FETCH, conn)
         except c.DbOracle.EXC_DB_BROAD as e:
+            if timing is not None:
+                self._finish_statement(timing, error=e)
             return r[Sequence[m.Dict]].fail_op("Query execution", e)
+        if timing is not None:
+            _ = timing.lap()
+        rows: t.SequenceOf[m.Dict] = self._normalize_query_rows(fetched)
+        if timing is not None:
+            timing.normalize_seconds = timing.lap()
+            self._finish_statement(
+                timing,
+                rows=len(rows),
+                payload_bytes=sum(
+                    len(value) for row in rows for value in row.root.values()
+                ),
+            )
+        return r[Sequence[m.Dict]].ok(rows)
+
+    def execute_query_json(
+        self,
+        sql: str,
+        params: m.ConfigMap | None = None,
+        *,
+        backend: c.DbOracle.JsonBackend = c.DbOracle.JsonBackend.AUTO,
+    ) -> p.Result[bytes]:
+        """Execute a query and encode its rows as a JSON array of objects.
+
+        Raw driver tuples are encoded straight to bytes with their column
+        names, skipping the string normalization of ``execute_query``;
+        NUMBERs become JSON numbers, dates RFC 3339 strings and raw bytes
+        base64 strings.
+        """
+        if not self.connected():
+            return r[bytes].fail("Not connected to database")
+        engine_result = self._get_engine()
+        if engine_result.failure:
+            return r[bytes].fail(engine_result.error or "Failed to get database engine")
+        sql, params = self._bind_literals(sql, params)
+        timing = self._begin_statement(sql)
+        try:
+            with self._timed_connection(engine_result.value, timing) as conn:
+                result = self._connection_execute(conn, text(sql), params)
+                self._lap_statement(timing, c.DbOracle.StatementPhase.EXECUTE)
+                rows = result.all()
+                self._lap_statement(timing, c.DbOracle.StatementPhase.FETCH, conn)
+        except c.DbOracle.EXC_DB_BROAD as e:
+            if timing is not None:
+                self._finish_statement(timing, error=e)
+            return r[bytes].fail_op("Query execution", e)
+        column_names = list(result.keys())
+        if timing is None:
+            return self.encode_json_rows(column_names, rows, backend=backend)
+        _ = timing.lap()
+        encoded = self.encode_json_rows(column_names, rows, backend=backend)
+        timing.normalize_seconds = timing.lap()
+        self._finish_statement(
+            timing,
+            rows=len(rows),
+            payload_bytes=len(encoded.value) if encoded.success else 0,
+            success=encoded.success,
+        )
+        return encoded
 
     def execute_statement(
         self, sql: str, params: m.ConfigMap | None = None
     ) -> p.Result[int]:
-        """Execute SQL statement and return affected rows."""
+        """Execute SQL statement and return affected rows.
+
+        With ``bind_literals`` enabled, safe literals are sent as binds.
+        """
         if not self.connected():
             return r[int].fail("Not connected to database")
         engine_result = self._get_engine()
         if engine_result.failure:
             return r[int].fail(engine_result.error or "Failed to get database engine")
+        sql, params = self._bind_literals(sql, params)
+        timing = self._begin_statement(sql)
         try:
-            with self._engine_begin(engine_result.value) as conn:
+            with self._timed_connection(
+                engine_result.value, timing, begin=True
+            ) as conn:
                 result = self._connection_execute(conn, text(sql), params)
                 rowcount = max(result.rowcount, 0)
-                return r[int].ok(rowcount)
+                self._lap_statement(timing, c.DbOracle.StatementPhase.EXECUTE, conn)
         except c.DbOracle.EXC_DB_BROAD as e:
+            if timing is not None:
+                self._finish_statement(timing, error=e)
             return r[int].fail_op("Statement execution", e)
+        if timing is not None:
+            timing.commit_seconds = timing.lap()
+            self._finish_statement(timing, rows=rowcount)
+        return r[int].ok(rowcount)
 
     def fetch_one(
         self, sql: str, params: m.ConfigMap | None = None
@@ -96,12 +315,8 @@ class FlextDbOracleServiceQuery(FlextDbOracleServiceBase):
             lambda rows: rows[0] if rows else None
         )
 
-    def _normalize_query_rows(
-        self, query_result: CursorResult[tuple[t.JsonValue, ...]]
-    ) -> t.SequenceOf[m.Dict]:
-        """Normalize SQLAlchemy query result rows into typed mapping models."""
-        mapping_result = query_result.mappings()
-        rows = mapping_result.all()
+    def _normalize_query_rows(self, rows: Sequence[RowMapping]) -> t.SequenceOf[m.Dict]:
+        """Normalize fetched SQLAlchemy mapping rows into typed mapping models."""
         result: t.SequenceOf[m.Dict] = [
             m.Dict(root={str(key): str(val) for key, val in dict(row).items()})
             for row in rows
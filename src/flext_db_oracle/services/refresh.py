@@ -0,0 +1,710 @@
+"""Full-refresh service mixin for flext-db-oracle.
+
+Reloads a table into a NOLOGGING shadow table with direct-path inserts,
+rebuilds its indexes and swaps it into place by partition exchange or
+rename, so readers never see a half-loaded table.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+from sqlalchemy import bindparam, text
+
+from flext_db_oracle import FlextDbOracleServiceBase, c, m, p, r, t
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, MutableMapping, MutableSequence
+
+    from sqlalchemy import Connection as SAConnection, Engine as SAEngine
+
+
+class FlextDbOracleServiceRefresh(FlextDbOracleServiceBase):
+    """Mixin providing shadow-table full refreshes for FlextDbOracleServices.
+
+    Handles: full_refresh, shadow table lifecycle, index rebuild, swap.
+    """
+
+    def full_refresh(
+        self,
+        table_name: str,
+        *,
+        rows: Iterable[t.DbOracle.BindRow] | None = None,
+        source_query: str | None = None,
+        schema: str | None = None,
+        swap: c.DbOracle.RefreshSwap = c.DbOracle.RefreshSwap.RENAME,
+        partition_name: str | None = None,
+        batch_size: int = c.DbOracle.DEFAULT_LOAD_BATCH_SIZE,
+        index_workers: int = c.DbOracle.DEFAULT_DDL_WORKERS,
+        gather_stats: m.DbOracle.StatsOptions | None = None,
+    ) -> p.Result[m.DbOracle.RefreshResult]:
+        """Replace the contents of a table without blocking its readers.
+
+        ``rows`` (array binds) or ``source_query`` (``INSERT /*+ APPEND */
+        ... SELECT``) are direct-path loaded into a NOLOGGING shadow table
+        shaped like the target. Its indexes and primary key are rebuilt in
+        parallel and, with ``gather_stats``, its statistics are gathered
+        before the swap:
+
+        * ``EXCHANGE`` swaps the shadow with ``partition_name`` of the
+          partitioned target in one dictionary operation; only LOCAL indexes
+          are rebuilt and global indexes are maintained. The exchange runs
+          WITH VALIDATION, so rows outside the partition bounds fail it.
+          This is the recommended swap: the table stays in place with its
+          grants throughout.
+        * ``RENAME`` retires the target and renames the shadow into its
+          place, then restores the original index and constraint names and
+          re-applies the table's grants. This is not zero-downtime: between
+          the two table renames the name does not resolve (ORA-00942), and
+          until the final grants other users lack their privileges. The
+          retired table is dropped only after every step succeeded; a
+          failure renames everything back. The shadow is built from column
+          types, NOT NULL, the primary key and plain B-tree indexes only, so
+          tables with column defaults, CHECK, UNIQUE or foreign key
+          constraints, other index types or partitioning are refused.
+          Synonyms resolve by name and keep working; triggers of the old
+          table are not carried over.
+
+        The shadow table and its indexes are switched back to LOGGING before
+        the swap so later changes generate redo again; the direct-path load
+        itself is unlogged, so take a backup where media recovery matters.
+        Readers keep querying the old data until the swap. The refresh is
+        refused when a shadow or retired name it needs is already taken, so
+        it never drops a table it did not create. A failed load or index
+        build drops the shadow table and leaves the target untouched.
+        Dropped tables go to the recycle bin.
+        """
+        if (rows is None) == (source_query is None):
+            return r[m.DbOracle.RefreshResult].fail(
+                "Full refresh requires exactly one of rows or source_query"
+            )
+        if swap == c.DbOracle.RefreshSwap.EXCHANGE and not partition_name:
+            return r[m.DbOracle.RefreshResult].fail(
+                "Partition exchange requires a partition name"
+            )
+        if batch_size < 1 or index_workers < 1:
+            return r[m.DbOracle.RefreshResult].fail(
+                "Batch size and index workers must be positive"
+            )
+        if not self.connected():
+            return r[m.DbOracle.RefreshResult].fail("Not connected to database")
+        started = time.perf_counter()
+        shadow = self._shadow_name(self._dictionary_name(table_name))
+        metadata_result = self.fetch_table_metadata(table_name, schema)
+        indexes_result = self._fetch_index_definitions(table_name, schema)
+        grants_result = (
+            self._fetch_table_grants(table_name, schema)
+            if swap == c.DbOracle.RefreshSwap.RENAME
+            else r[t.SequenceOf[m.DbOracle.TableGrant]].ok([])
+        )
+        engine_result = self._get_engine()
+        if (
+            metadata_result.failure
+            or indexes_result.failure
+            or grants_result.failure
+            or engine_result.failure
+        ):
+            return r[m.DbOracle.RefreshResult].fail(
+                metadata_result.error
+                or indexes_result.error
+                or grants_result.error
+                or engine_result.error
+                or f"Failed to describe table {table_name}"
+            )
+        if not metadata_result.value.columns:
+            return r[m.DbOracle.RefreshResult].fail(
+                f"Table {table_name} has no columns"
+            )
+        engine = engine_result.value
+        indexes = [
+            index
+            for index in indexes_result.value
+            if index.local or swap == c.DbOracle.RefreshSwap.RENAME
+        ]
+        prepared = self._check_refresh_preflight(
+            engine, table_name, shadow, schema, swap, indexes
+        ).flat_map(
+            lambda _: self._create_shadow_table(
+                engine, shadow, schema, metadata_result.value
+            )
+        )
+        if prepared.failure:
+            return r[m.DbOracle.RefreshResult].fail(
+                prepared.error or f"Failed to create shadow table {shadow}"
+            )
+        result = m.DbOracle.RefreshResult(
+            table_name=table_name,
+            shadow_table=shadow,
+            swap=swap,
+            prepare_seconds=time.perf_counter() - started,
+        )
+        phase_started = time.perf_counter()
+        column_names = [column.name for column in metadata_result.value.columns]
+        loaded = self._load_shadow_table(
+            engine, shadow, schema, column_names, rows, source_query, batch_size
+        )
+        if loaded.failure:
+            return self._abandon_shadow(engine, shadow, schema, loaded.error)
+        result = result.model_copy(
+            update={
+                "rows_loaded": loaded.value,
+                "load_seconds": time.perf_counter() - phase_started,
+            }
+        )
+        phase_started = time.perf_counter()
+        built = self._build_shadow_indexes(shadow, schema, indexes, index_workers)
+        if built.failure:
+            return self._abandon_shadow(engine, shadow, schema, built.error)
+        stats_gathered = False
+        if gather_stats is not None:
+            stats_result = self.gather_table_stats(
+                shadow, schema=schema, options=gather_stats
+            )
+            if stats_result.failure:
+                return self._abandon_shadow(engine, shadow, schema, stats_result.error)
+            stats_gathered = stats_result.value.gathered
+        logged = self._enable_shadow_logging(engine, shadow, schema, indexes)
+        if logged.failure:
+            return self._abandon_shadow(engine, shadow, schema, logged.error)
+        result = result.model_copy(
+            update={
+                "indexes_built": built.value,
+                "stats_gathered": stats_gathered,
+                "index_seconds": time.perf_counter() - phase_started,
+            }
+        )
+        phase_started = time.perf_counter()
+        try:
+            if swap == c.DbOracle.RefreshSwap.EXCHANGE:
+                self._exchange_shadow_table(
+                    engine, table_name, shadow, schema, partition_name or ""
+                )
+            else:
+                self._rename_shadow_table(
+                    engine, table_name, shadow, schema, indexes, grants_result.value
+                )
+        except c.DbOracle.EXC_DB_BROAD as e:
+            self._drop_table_quietly(engine, shadow, schema)
+            return r[m.DbOracle.RefreshResult].fail_op("Full refresh swap", e)
+        result = result.model_copy(
+            update={
+                "grants_restored": len(grants_result.value),
+                "swap_seconds": time.perf_counter() - phase_started,
+            }
+        )
+        self.logger.info(
+            "Full refresh finished",
+            table=table_name,
+            swap=swap.value,
+            rows_loaded=result.rows_loaded,
+            indexes_built=result.indexes_built,
+            elapsed_seconds=round(result.elapsed_seconds, 3),
+        )
+        return r[m.DbOracle.RefreshResult].ok(result)
+
+    def _fetch_index_definitions(
+        self, table_name: str, schema: str | None
+    ) -> p.Result[t.SequenceOf[m.DbOracle.IndexDefinition]]:
+        """Read the plain B-tree indexes of a table from the data dictionary."""
+        engine_result = self._get_engine()
+        if engine_result.failure:
+            return r[t.SequenceOf[m.DbOracle.IndexDefinition]].fail(
+                engine_result.error or "Failed to get database engine"
+            )
+        params = m.ConfigMap(
+            root={
+                "owner": self._dictionary_name(schema) if schema else None,
+                "table_name": self._dictionary_name(table_name),
+            }
+        )
+        sql = (
+            "SELECT i.index_name, i.uniqueness, ic.column_name, "
+            "(SELECT pi.locality FROM all_part_indexes pi "
+            "WHERE pi.owner = i.owner AND pi.index_name = i.index_name), "
+            "(SELECT con.constraint_name FROM all_constraints con "
+            "WHERE con.owner = i.table_owner AND con.table_name = i.table_name "
+            "AND con.constraint_type = 'P' AND con.index_name = i.index_name) "
+            "FROM all_indexes i JOIN all_ind_columns ic "
+            "ON ic.index_owner = i.owner AND ic.index_name = i.index_name "
+            "WHERE i.table_owner = NVL(:owner, USER) "
+            "AND i.table_name = :table_name AND i.index_type = 'NORMAL' "
+            "ORDER BY i.index_name, ic.column_position"
+        )
+        try:
+            with self._engine_connect(engine_result.value) as conn:
+                rows = self._connection_execute(conn, text(sql), params).all()
+        except c.DbOracle.EXC_DB_BROAD as e:
+            return r[t.SequenceOf[m.DbOracle.IndexDefinition]].fail_op(
+                "Index lookup", e
+            )
+        columns: MutableMapping[str, MutableSequence[str]] = {}
+        indexes: MutableMapping[str, m.DbOracle.IndexDefinition] = {}
+        for index_name, uniqueness, column_name, locality, constraint in rows:
+            name = str(index_name)
+            columns.setdefault(name, []).append(str(column_name))
+            indexes[name] = m.DbOracle.IndexDefinition(
+                name=name,
+                unique=uniqueness == "UNIQUE",
+                local=locality == "LOCAL",
+                constraint_name=str(constraint) if constraint else None,
+            )
+        return r[t.SequenceOf[m.DbOracle.IndexDefinition]].ok([
+            index.model_copy(update={"columns": tuple(columns[name])})
+            for name, index in indexes.items()
+        ])
+
+    def _check_refresh_preflight(
+        self,
+        engine: SAEngine,
+        table_name: str,
+        shadow: str,
+        schema: str | None,
+        swap: c.DbOracle.RefreshSwap,
+        indexes: t.SequenceOf[m.DbOracle.IndexDefinition],
+    ) -> p.Result[bool]:
+        """Refuse a refresh that would lose table features or reuse taken names.
+
+        Every shadow and, for ``RENAME``, retired name of the table, its
+        indexes and constraints must be free, since the refresh creates
+        them and drops what it created.
+        """
+        renames: MutableSequence[Callable[[str], str]] = [self._shadow_name]
+        blockers = r[t.StrSequence].ok([])
+        if swap == c.DbOracle.RefreshSwap.RENAME:
+            renames.append(self._retired_name)
+            blockers = self._fetch_rename_blockers(engine, table_name, schema)
+        if blockers.failure:
+            return r[bool].fail(blockers.error or "Failed to inspect table")
+        if blockers.value:
+            return r[bool].fail(
+                f"Full refresh of {table_name} by RENAME would lose "
+                f"{', '.join(blockers.value)}; use EXCHANGE or reload it in place"
+            )
+        names = {shadow}
+        for rename in renames:
+            names.add(rename(self._dictionary_name(table_name)))
+            for index in indexes:
+                names.add(rename(index.name))
+                if index.constraint_name is not None:
+                    names.add(rename(index.constraint_name))
+        sql = (
+            "SELECT object_name FROM all_objects "
+            "WHERE owner = NVL(:owner, USER) AND object_name IN :names "
+            "UNION SELECT constraint_name FROM all_constraints "
+            "WHERE owner = NVL(:owner, USER) AND constraint_name IN :names"
+        )
+        params = m.ConfigMap(
+            root={
+                "owner": self._dictionary_name(schema) if schema else None,
+                "names": sorted(names),
+            }
+        )
+        try:
+            with self._engine_connect(engine) as conn:
+                taken = self._connection_execute(
+                    conn,
+                    text(sql).bindparams(bindparam("names", expanding=True)),
+                    params,
+                ).all()
+        except c.DbOracle.EXC_DB_BROAD as e:
+            return r[bool].fail_op("Refresh name lookup", e)
+        if taken:
+            return r[bool].fail(
+                f"Full refresh of {table_name} refused: "
+                f"{', '.join(sorted(str(row[0]) for row in taken))} already "
+                "exist; drop or rename them first"
+            )
+        return r[bool].ok(True)
+
+    def _fetch_rename_blockers(
+        self, engine: SAEngine, table_name: str, schema: str | None
+    ) -> p.Result[t.StrSequence]:
+        """Describe the table features a RENAME swap would not carry over."""
+        params = m.ConfigMap(
+            root={
+                "owner": self._dictionary_name(schema) if schema else None,
+                "table_name": self._dictionary_name(table_name),
+            }
+        )
+        sql = (
+            "SELECT 'default of ' || column_name FROM all_tab_columns "
+            "WHERE owner = NVL(:owner, USER) AND table_name = :table_name "
+            "AND default_length > 0 "
+            "UNION ALL SELECT 'constraint ' || constraint_name FROM all_constraints "
+            "WHERE owner = NVL(:owner, USER) AND table_name = :table_name "
+            "AND (constraint_type IN ('U', 'R') OR (constraint_type = 'C' "
+            "AND search_condition_vc NOT LIKE '\"%\" IS NOT NULL')) "
+            "UNION ALL SELECT 'foreign key ' || owner || '.' || constraint_name "
+            "FROM all_constraints WHERE constraint_type = 'R' "
+            "AND (r_owner, r_constraint_name) IN (SELECT owner, constraint_name "
+            "FROM all_constraints WHERE owner = NVL(:owner, USER) "
+            "AND table_name = :table_name AND constraint_type IN ('P', 'U')) "
+            "UNION ALL SELECT index_type || ' index ' || index_name FROM all_indexes "
+            "WHERE table_owner = NVL(:owner, USER) AND table_name = :table_name "
+            "AND index_type NOT IN ('NORMAL', 'LOB') "
+            "UNION ALL SELECT 'partitioning' FROM all_tables "
+            "WHERE owner = NVL(:owner, USER) AND table_name = :table_name "
+            "AND partitioned = 'YES'"
+        )
+        try:
+            with self._engine_connect(engine) as conn:
+                rows = self._connection_execute(conn, text(sql), params).all()
+        except c.DbOracle.EXC_DB_BROAD as e:
+            return r[t.StrSequence].fail_op("Table feature lookup", e)
+        return r[t.StrSequence].ok([str(row[0]) for row in rows])
+
+    def _fetch_table_grants(
+        self, table_name: str, schema: str | None
+    ) -> p.Result[t.SequenceOf[m.DbOracle.TableGrant]]:
+        """Read the object privileges granted on a table."""
+        engine_result = self._get_engine()
+        if engine_result.failure:
+            return r[t.SequenceOf[m.DbOracle.TableGrant]].fail(
+                engine_result.error or "Failed to get database engine"
+            )
+        params = m.ConfigMap(
+            root={
+                "owner": self._dictionary_name(schema) if schema else None,
+                "table_name": self._dictionary_name(table_name),
+            }
+        )
+        sql = (
+            "SELECT grantee, privilege, grantable FROM all_tab_privs "
+            "WHERE table_schema = NVL(:owner, USER) AND table_name = :table_name "
+            "ORDER BY grantee, privilege"
+        )
+        try:
+            with self._engine_connect(engine_result.value) as conn:
+                rows = self._connection_execute(conn, text(sql), params).all()
+        except c.DbOracle.EXC_DB_BROAD as e:
+            return r[t.SequenceOf[m.DbOracle.TableGrant]].fail_op("Grant lookup", e)
+        return r[t.SequenceOf[m.DbOracle.TableGrant]].ok([
+            m.DbOracle.TableGrant(
+                grantee=str(grantee),
+                privilege=str(privilege),
+                grantable=grantable == "YES",
+            )
+            for grantee, privilege, grantable in rows
+        ])
+
+    def _create_shadow_table(
+        self,
+        engine: SAEngine,
+        shadow: str,
+        schema: str | None,
+        metadata: m.DbOracle.TableMetadata,
+    ) -> p.Result[bool]:
+        """Create an empty NOLOGGING shadow table."""
+        columns = [
+            m.DbOracle.Column(
+                name=column.name, data_type=column.type_spec, nullable=column.nullable
+            )
+            for column in metadata.columns
+        ]
+        ddl_result = self.create_table_ddl(
+            shadow,
+            columns,
+            schema,
+            options=m.DbOracle.TableStorageOptions(nologging=True),
+        )
+        if ddl_result.failure:
+            return r[bool].fail(ddl_result.error or "Failed to build shadow DDL")
+        try:
+            with self._engine_begin(engine) as conn:
+                _ = self._connection_execute(conn, text(ddl_result.value))
+        except c.DbOracle.EXC_DB_BROAD as e:
+            return r[bool].fail_op("Shadow table creation", e)
+        return r[bool].ok(True)
+
+    def _load_shadow_table(
+        self,
+        engine: SAEngine,
+        shadow: str,
+        schema: str | None,
+        column_names: t.StrSequence,
+        rows: Iterable[t.DbOracle.BindRow] | None,
+        source_query: str | None,
+        batch_size: int,
+    ) -> p.Result[int]:
+        """Direct-path load the shadow table from binds or a source query."""
+        if source_query is not None:
+            column_list = ", ".join(
+                self._quote_identifier(name) for name in column_names
+            )
+            sql = (
+                f"INSERT {c.DbOracle.DIRECT_PATH_SELECT_HINT} INTO "
+                f"{self._dictionary_qualified_name(shadow, schema)} "
+                f"({column_list}) {source_query}"
+            )
+            try:
+                with self._engine_begin(engine) as conn:
+                    inserted = self._connection_execute(conn, text(sql))
+            except c.DbOracle.EXC_DB_BROAD as e:
+                return r[int].fail_op("Shadow table load", e)
+            return r[int].ok(max(inserted.rowcount, 0))
+        insert_result = self.build_insert_statement(shadow, column_names, schema)
+        if insert_result.failure:
+            return r[int].fail(insert_result.error or "Failed to build shadow INSERT")
+        load_sql = insert_result.value.replace(
+            "INSERT INTO", f"INSERT {c.DbOracle.DIRECT_PATH_INSERT_HINT} INTO", 1
+        )
+        try:
+            with self._engine_connect(engine) as conn:
+                loaded, _ = self._direct_path_load(
+                    conn, text(load_sql), rows or (), column_names, batch_size
+                )
+        except c.DbOracle.EXC_DB_BROAD as e:
+            return r[int].fail_op("Shadow table load", e)
+        return r[int].ok(loaded)
+
+    def _build_shadow_indexes(
+        self,
+        shadow: str,
+        schema: str | None,
+        indexes: t.SequenceOf[m.DbOracle.IndexDefinition],
+        index_workers: int,
+    ) -> p.Result[int]:
+        """Rebuild indexes and the primary key on the shadow table in parallel."""
+        jobs: MutableSequence[m.DbOracle.DdlJob] = []
+        for index in indexes:
+            shadow_index = self._shadow_name(index.name)
+            index_result = self.build_create_index_statement({
+                "table_name": shadow,
+                "index_name": shadow_index,
+                "columns": list(index.columns),
+                "unique": index.unique,
+                "schema_name": schema or "",
+                "nologging": True,
+            })
+            if index_result.failure:
+                return r[int].fail(
+                    index_result.error or f"Failed to build index {index.name}"
+                )
+            jobs.append(m.DbOracle.DdlJob(name=index.name, sql=index_result.value))
+            if index.constraint_name is not None:
+                key = ", ".join(self._quote_identifier(name) for name in index.columns)
+                constraint = self._shadow_name(index.constraint_name)
+                jobs.append(
+                    m.DbOracle.DdlJob(
+                        name=f"constraint {index.constraint_name}",
+                        sql=(
+                            f"ALTER TABLE "
+                            f"{self._dictionary_qualified_name(shadow, schema)} "
+                            f"ADD CONSTRAINT {self._quote_identifier(constraint)} "
+                            f"PRIMARY KEY ({key}) USING INDEX "
+                            f"{self._dictionary_qualified_name(shadow_index, schema)}"
+                        ),
+                        depends_on=[index.name],
+                    )
+                )
+        if not jobs:
+            return r[int].ok(0)
+        return self.run_ddl_jobs(jobs, max_workers=index_workers).flat_map(
+            lambda run: (
+                r[int].ok(len(indexes))
+                if run.succeeded
+                else r[int].fail(
+                    "Shadow index build failed: "
+                    + "; ".join(
+                        f"{job.name}: {job.error}" for job in run.jobs if job.error
+                    )
+                )
+            )
+        )
+
+    def _enable_shadow_logging(
+        self,
+        engine: SAEngine,
+        shadow: str,
+        schema: str | None,
+        indexes: t.SequenceOf[m.DbOracle.IndexDefinition],
+    ) -> p.Result[bool]:
+        """Switch the loaded shadow table and its indexes back to LOGGING."""
+        statements = [
+            f"ALTER TABLE {self._dictionary_qualified_name(shadow, schema)} LOGGING",
+            *(
+                "ALTER INDEX "
+                f"{self._dictionary_qualified_name(self._shadow_name(index.name), schema)} "
+                "LOGGING"
+                for index in indexes
+            ),
+        ]
+        try:
+            with self._engine_connect(engine) as conn:
+                for statement in statements:
+                    _ = self._connection_execute(conn, text(statement))
+        except c.DbOracle.EXC_DB_BROAD as e:
+            return r[bool].fail_op("Shadow logging switch", e)
+        return r[bool].ok(True)
+
+    def _exchange_shadow_table(
+        self,
+        engine: SAEngine,
+        table_name: str,
+        shadow: str,
+        schema: str | None,
+        partition_name: str,
+    ) -> None:
+        """Exchange the shadow table with a partition and drop the old data."""
+        partition = self._quote_identifier(self._dictionary_name(partition_name))
+        qualified_target = self._dictionary_qualified_name(table_name, schema)
+        qualified_shadow = self._dictionary_qualified_name(shadow, schema)
+        with self._engine_connect(engine) as conn:
+            _ = self._connection_execute(
+                conn,
+                text(
+                    f"ALTER TABLE {qualified_target} "
+                    f"EXCHANGE PARTITION {partition} WITH TABLE {qualified_shadow} "
+                    "INCLUDING INDEXES WITH VALIDATION UPDATE GLOBAL INDEXES"
+                ),
+            )
+            _ = self._connection_execute(conn, text(f"DROP TABLE {qualified_shadow}"))
+
+    def _rename_shadow_table(
+        self,
+        engine: SAEngine,
+        table_name: str,
+        shadow: str,
+        schema: str | None,
+        indexes: t.SequenceOf[m.DbOracle.IndexDefinition],
+        grants: t.SequenceOf[m.DbOracle.TableGrant],
+    ) -> None:
+        """Rename the shadow table into place and restore names and grants.
+
+        The retired table keeps its data until every rename and grant has
+        succeeded; a failing step undoes the completed ones in reverse.
+        """
+        target = self._dictionary_name(table_name)
+        retired = self._retired_name(target)
+        qualified_target = self._dictionary_qualified_name(target, schema)
+        qualified_retired = self._dictionary_qualified_name(retired, schema)
+        steps: MutableSequence[tuple[str, str | None]] = [
+            (
+                self._rename_object_sql("TABLE", target, retired, schema),
+                self._rename_object_sql("TABLE", retired, target, schema),
+            )
+        ]
+        steps.extend(
+            self._rename_steps(qualified_retired, schema, indexes, self._retired_name)
+        )
+        steps.append((
+            self._rename_object_sql("TABLE", shadow, target, schema),
+            self._rename_object_sql("TABLE", target, shadow, schema),
+        ))
+        steps.extend(
+            (undo, statement)
+            for statement, undo in self._rename_steps(
+                qualified_target, schema, indexes, self._shadow_name
+            )
+        )
+        steps.extend(
+            (
+                f"GRANT {grant.privilege} ON {qualified_target} "
+                f"TO {self._quote_identifier(grant.grantee)}"
+                + (" WITH GRANT OPTION" if grant.grantable else ""),
+                None,
+            )
+            for grant in grants
+        )
+        with self._engine_connect(engine) as conn:
+            self._run_reversible(conn, steps)
+        self._drop_table_quietly(engine, retired, schema)
+
+    def _rename_steps(
+        self,
+        qualified_table: str,
+        schema: str | None,
+        indexes: t.SequenceOf[m.DbOracle.IndexDefinition],
+        rename: Callable[[str], str],
+    ) -> t.SequenceOf[tuple[str, str]]:
+        """Rename steps, with their undo, moving indexes and keys to new names."""
+        steps: MutableSequence[tuple[str, str]] = []
+        for index in indexes:
+            index_name, renamed_index = index.name, rename(index.name)
+            steps.append((
+                self._rename_object_sql("INDEX", index_name, renamed_index, schema),
+                self._rename_object_sql("INDEX", renamed_index, index_name, schema),
+            ))
+            if index.constraint_name is not None:
+                key = self._quote_identifier(index.constraint_name)
+                renamed_key = self._quote_identifier(rename(index.constraint_name))
+                alter = f"ALTER TABLE {qualified_table} RENAME CONSTRAINT"
+                steps.append((
+                    f"{alter} {key} TO {renamed_key}",
+                    f"{alter} {renamed_key} TO {key}",
+                ))
+        return steps
+
+    def _rename_object_sql(
+        self, kind: str, name: str, new_name: str, schema: str | None
+    ) -> str:
+        """Render ``ALTER <kind> name RENAME TO new_name``."""
+        qualified = self._dictionary_qualified_name(name, schema)
+        return f"ALTER {kind} {qualified} RENAME TO {self._quote_identifier(new_name)}"
+
+    def _run_reversible(
+        self, conn: SAConnection, steps: t.SequenceOf[tuple[str, str | None]]
+    ) -> None:
+        """Run DDL steps in order, undoing completed ones if any step fails."""
+        undo: MutableSequence[str] = []
+        try:
+            for statement, reverse in steps:
+                _ = self._connection_execute(conn, text(statement))
+                if reverse is not None:
+                    undo.append(reverse)
+        except c.DbOracle.EXC_DB_BROAD:
+            for statement in reversed(undo):
+                self._execute_quietly(conn, statement)
+            raise
+
+    def _execute_quietly(self, conn: SAConnection, statement: str) -> None:
+        """Run a best-effort recovery statement, logging a driver error."""
+        try:
+            _ = self._connection_execute(conn, text(statement))
+        except c.DbOracle.EXC_DB_BROAD as e:
+            self.logger.warning(
+                "Full refresh undo step failed", statement=statement, error=str(e)
+            )
+
+    def _abandon_shadow(
+        self, engine: SAEngine, shadow: str, schema: str | None, error: str | None
+    ) -> p.Result[m.DbOracle.RefreshResult]:
+        """Drop a partially built shadow table and report the failure."""
+        self._drop_table_quietly(engine, shadow, schema)
+        return r[m.DbOracle.RefreshResult].fail(
+            f"Full refresh of {shadow} abandoned: {error or 'unknown error'}"
+        )
+
+    def _drop_table_quietly(
+        self, engine: SAEngine, table_name: str, schema: str | None
+    ) -> None:
+        """Drop a table this refresh created, logging a driver error."""
+        qualified = self._dictionary_qualified_name(table_name, schema)
+        try:
+            with self._engine_begin(engine) as conn:
+                _ = self._connection_execute(conn, text(f"DROP TABLE {qualified}"))
+        except c.DbOracle.EXC_DB_BROAD as e:
+            self.logger.debug(
+                "Scratch table not dropped", table=table_name, error=str(e)
+            )
+
+    @staticmethod
+    def _retired_name(name: str) -> str:
+        """Derive the name a replaced table, index or constraint is parked under."""
+        return f"{c.DbOracle.RETIRED_TABLE_PREFIX}{name}"[
+            : c.DbOracle.MAX_IDENTIFIER_LENGTH
+        ]
+
+    @staticmethod
+    def _shadow_name(name: str) -> str:
+        """Derive the shadow name of a table, index or constraint."""
+        return f"{c.DbOracle.SHADOW_TABLE_PREFIX}{name}"[
+            : c.DbOracle.MAX_IDENTIFIER_LENGTH
+        ]
+
+
+__all__: list[str] = ["FlextDbOracleServiceRefresh"]
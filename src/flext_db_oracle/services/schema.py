@@ -9,7 +9,7 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, override
 
 from sqlalchemy import func, select, table
 from sqlalchemy.dialects.oracle import dialect as oracle_dialect
@@ -33,6 +33,7 @@ class FlextDbOracleServiceSchema(FlextDbOracleServiceBase):
     get_schemas, get_tables, get_table_metadata, get_table_row_count.
     """
 
+    @override
     def fetch_columns(
         self, table_name: str, schema_name: str | None = None
     ) -> p.Result[Sequence[m.DbOracle.Column]]:
@@ -62,11 +63,21 @@ class FlextDbOracleServiceSchema(FlextDbOracleServiceBase):
                     default_value=str(
                         row.root.get("DATA_DEFAULT") or row.root.get("data_default", "")
                     ),
+                    data_length=self._column_int(row, "data_length"),
+                    data_precision=self._column_int(row, "data_precision"),
+                    data_scale=self._column_int(row, "data_scale"),
                 )
                 for row in rows
             ]
         )
 
+    @staticmethod
+    def _column_int(row: m.Dict, key: str) -> int | None:
+        """Read an optional integer dictionary attribute from a normalized row."""
+        raw_value = row.root.get(key.upper()) or row.root.get(key)
+        text_value = str(raw_value) if raw_value is not None else ""
+        return int(text_value) if text_value.isdigit() else None
+
     def fetch_primary_key_columns(
         self, table_name: str, schema_name: str | None = None
     ) -> p.Result[t.StrSequence]:
@@ -114,6 +125,7 @@ class FlextDbOracleServiceSchema(FlextDbOracleServiceBase):
             ]
         )
 
+    @override
     def fetch_table_metadata(
         self, table_name: str, schema: str | None = None
     ) -> p.Result[m.DbOracle.TableMetadata]:
@@ -136,23 +148,32 @@ class FlextDbOracleServiceSchema(FlextDbOracleServiceBase):
                         name=column.name,
                         data_type=column.data_type,
                         nullable=column.nullable,
+                        data_length=column.data_length,
+                        data_precision=column.data_precision,
+                        data_scale=column.data_scale,
                     )
                     for column in columns_result.value
                 ],
                 primary_keys=pk_result.value,
             )
 
-        return u.try_(
-            _fetch_metadata,
-            catch=(
-                t.DbOracle.OracleDatabaseError,
-                t.DbOracle.OracleInterfaceError,
-                ConnectionError,
-                SQLAlchemyOperationalError,
-                OSError,
-                RuntimeError,
-            ),
-        ).map_error(lambda e: f"Failed to get table metadata: {e}")
+        with self.trace(
+            "fetch_table_metadata", {"db.collection.name": table_name}
+        ) as span:
+            result = u.try_(
+                _fetch_metadata,
+                catch=(
+                    t.DbOracle.OracleDatabaseError,
+                    t.DbOracle.OracleInterfaceError,
+                    ConnectionError,
+                    SQLAlchemyOperationalError,
+                    OSError,
+                    RuntimeError,
+                ),
+            ).map_error(lambda e: f"Failed to get table metadata: {e}")
+            if span is not None and result.failure:
+                span.record_error(RuntimeError(result.error))
+            return result
 
     def fetch_table_row_count(
         self, table_name: str, schema_name: str | None = None
@@ -195,6 +216,7 @@ class FlextDbOracleServiceSchema(FlextDbOracleServiceBase):
             ),
         ).map_error(lambda e: f"Failed to get row count: {e}")
 
+    @override
     def fetch_tables(self, schema: str | None = None) -> p.Result[t.StrSequence]:
         """Get list of tables in Oracle schema."""
         if schema:
@@ -8,15 +8,21 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
-from collections.abc import Mapping, MutableMapping
+import hashlib
+import json
+from collections.abc import Mapping
+from typing import TYPE_CHECKING
 
-from flext_db_oracle import FlextDbOracleServiceBase, m, p, r, t
+from flext_db_oracle import FlextDbOracleServiceBase, c, m, p, r, t
+
+if TYPE_CHECKING:
+    from collections.abc import MutableSequence
 
 
 class FlextDbOracleServiceSinger(FlextDbOracleServiceBase):
     """Mixin providing Singer type mapping for s.
 
-    Handles: convert_singer_type, map_singer_schema.
+    Handles: convert_singer_type, map_singer_schema, compile_singer_coercer.
     """
 
     def convert_singer_type(
@@ -24,7 +30,10 @@ class FlextDbOracleServiceSinger(FlextDbOracleServiceBase):
         singer_type: str | t.StrSequence = "string",
         _format_hint: str | None = None,
     ) -> p.Result[str]:
-        """Convert Singer type to Oracle type - simplified."""
+        """Convert Singer type to Oracle type - simplified.
+
+        Objects and arrays are bound as JSON text, so they map to ``CLOB``.
+        """
         singer_type = self._normalize_singer_type(singer_type)
         if _format_hint == "date-time":
             return r[str].ok("TIMESTAMP")
@@ -34,6 +43,8 @@ class FlextDbOracleServiceSinger(FlextDbOracleServiceBase):
             "number": "NUMBER",
             "boolean": "NUMBER(1)",
             "date-time": "TIMESTAMP",
+            "object": "CLOB",
+            "array": "CLOB",
         }
         oracle_type = type_map.get(singer_type, "VARCHAR2(255)")
         return r[str].ok(oracle_type)
@@ -41,51 +52,87 @@ class FlextDbOracleServiceSinger(FlextDbOracleServiceBase):
     def map_singer_schema(
         self, singer_schema: m.DbOracle.SingerSchema | t.JsonMapping
     ) -> p.Result[m.DbOracle.TypeMapping]:
-        """Map Singer schema to Oracle types - simplified."""
-        raw_properties: t.JsonDict = {}
-        if isinstance(singer_schema, m.DbOracle.SingerSchema):
-            schema_model = singer_schema
-        else:
-            raw_props_value = singer_schema.get("properties", {})
-            if not isinstance(raw_props_value, dict):
-                return r[m.DbOracle.TypeMapping].fail(
-                    "Singer schema properties must be a mapping"
-                )
-            raw_properties = raw_props_value
-            normalized_properties: MutableMapping[str, m.DbOracle.SingerField] = {}
-            for field_name, field_def in raw_properties.items():
-                if isinstance(field_def, Mapping):
-                    field_type = field_def.get("type", "string")
-                    if isinstance(field_type, str):
-                        normalized_properties[field_name] = m.DbOracle.SingerField(
-                            type=field_type
-                        )
-                    else:
-                        normalized_properties[field_name] = m.DbOracle.SingerField(
-                            type="string"
-                        )
-                else:
-                    normalized_properties[field_name] = m.DbOracle.SingerField(
-                        type="string"
-                    )
-            schema_model = m.DbOracle.SingerSchema.model_validate({
-                "properties": normalized_properties
-            })
-        mapping = m.ConfigMap(root={})
-        for field_name, field_def in schema_model.properties.items():
-            raw_field = raw_properties.get(field_name)
-            format_value = (
-                raw_field.get("format") if isinstance(raw_field, Mapping) else None
+        """Map Singer schema properties to Oracle column types.
+
+        The mapping is read from the compiled coercer of the schema, so a
+        schema seen before is not re-validated field by field.
+        """
+        raw_schema: t.JsonMapping = (
+            {
+                "properties": {
+                    name: {
+                        "type": field.type
+                        if isinstance(field.type, str)
+                        else list(field.type)
+                    }
+                    for name, field in singer_schema.properties.items()
+                }
+            }
+            if isinstance(singer_schema, m.DbOracle.SingerSchema)
+            else singer_schema
+        )
+        return self.compile_singer_coercer(raw_schema).map(
+            lambda coercer: m.DbOracle.TypeMapping(mapping=coercer.column_types)
+        )
+
+    def compile_singer_coercer(
+        self, singer_schema: t.JsonMapping
+    ) -> p.Result[m.DbOracle.SingerCoercer]:
+        """Compile the record coercion plan of a Singer schema.
+
+        The plan holds, per property in schema order, the Oracle type and a
+        bind converter: ISO-8601 parsing for ``date-time``, 1/0 for booleans,
+        integers, decimals, and JSON text for nested objects and arrays.
+        Plans are cached by the hash of the schema's ``properties``.
+        """
+        properties = singer_schema.get("properties", {})
+        if not isinstance(properties, Mapping):
+            return r[m.DbOracle.SingerCoercer].fail(
+                "Singer schema properties must be a mapping"
+            )
+        try:
+            canonical = json.dumps(properties, separators=(",", ":"))
+        except (TypeError, ValueError) as e:
+            return r[m.DbOracle.SingerCoercer].fail(
+                f"Singer schema is not JSON serializable: {e}"
             )
-            format_hint = format_value if isinstance(format_value, str) else None
-            conversion = self.convert_singer_type(field_def.type, format_hint)
-            if conversion.success:
-                mapping.root[field_name] = conversion.value
-        normalized_mapping = {key: str(value) for key, value in mapping.root.items()}
-        type_mapping = m.DbOracle.TypeMapping.model_validate({
-            "mapping": normalized_mapping
-        })
-        return r[m.DbOracle.TypeMapping].ok(type_mapping)
+        schema_hash = hashlib.sha256(canonical.encode()).hexdigest()[:16]
+        cached = self._singer_coercers.get(schema_hash)
+        if cached is not None:
+            return r[m.DbOracle.SingerCoercer].ok(cached)
+        oracle_types: MutableSequence[str] = []
+        converters: MutableSequence[t.DbOracle.BindConverter] = []
+        for field_def in properties.values():
+            singer_type, format_hint = self._singer_field_type(field_def)
+            oracle_type = self.convert_singer_type(singer_type, format_hint)
+            oracle_types.append(oracle_type.value)
+            converters.append(self._singer_converter(singer_type, format_hint))
+        coercer = m.DbOracle.SingerCoercer(
+            schema_hash=schema_hash,
+            column_names=list(properties),
+            oracle_types=oracle_types,
+            converters=converters,
+        )
+        if len(self._singer_coercers) >= c.DbOracle.SINGER_COERCER_CACHE_SIZE:
+            del self._singer_coercers[next(iter(self._singer_coercers))]
+        self._singer_coercers[schema_hash] = coercer
+        return r[m.DbOracle.SingerCoercer].ok(coercer)
+
+    @classmethod
+    def _singer_field_type(cls, field_def: t.JsonValue) -> tuple[str, str | None]:
+        """Read the non-null Singer type and format hint of one property."""
+        if not isinstance(field_def, Mapping):
+            return "string", None
+        field_type = field_def.get("type", "string")
+        if isinstance(field_type, list):
+            field_type = [name for name in field_type if isinstance(name, str)]
+        format_value = field_def.get("format")
+        return (
+            cls._normalize_singer_type(field_type)
+            if isinstance(field_type, (str, list))
+            else "string",
+            format_value if isinstance(format_value, str) else None,
+        )
 
 
 __all__: list[str] = ["FlextDbOracleServiceSinger"]
@@ -0,0 +1,233 @@
+"""Singer tap service mixin for flext-db-oracle.
+
+Streams an Oracle table as Singer SCHEMA, RECORD and STATE messages:
+server-side cursor batches are serialized into one buffered write each.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from collections.abc import Mapping
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, BinaryIO
+
+from flext_db_oracle import FlextDbOracleServiceBase, c, m, p, r, t
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class FlextDbOracleServiceSingerTap(FlextDbOracleServiceBase):
+    """Mixin providing Singer tap streaming for FlextDbOracleServices.
+
+    Handles: run_singer_tap, Singer schema discovery, batched message writes.
+    """
+
+    def run_singer_tap(
+        self,
+        table_name: str,
+        *,
+        schema: str | None = None,
+        replication_key: str | None = None,
+        state: t.JsonMapping | None = None,
+        columns: t.StrSequence | None = None,
+        output: BinaryIO | None = None,
+        batch_size: int = c.DbOracle.DEFAULT_ARRAY_SIZE,
+        backend: c.DbOracle.JsonBackend = c.DbOracle.JsonBackend.AUTO,
+    ) -> p.Result[m.DbOracle.TapResult]:
+        """Write a table to ``output`` (default stdout) as Singer messages.
+
+        A SCHEMA message is discovered from the table metadata, then rows
+        stream through a server-side cursor. Each batch is serialized into
+        one payload and written with a single call, so memory stays bounded
+        by ``batch_size``. With ``replication_key`` or a bookmark in
+        ``state`` the sync is incremental and a STATE message, merged into
+        ``state``, follows every batch; otherwise the full table is emitted.
+        Messages are encoded with the ``backend`` JSON serializer.
+        """
+        if batch_size < 1:
+            return r[m.DbOracle.TapResult].fail("Batch size must be positive")
+        encoder_result = self.json_encoder(backend)
+        if encoder_result.failure:
+            return r[m.DbOracle.TapResult].fail(
+                encoder_result.error or f"JSON backend {backend} is unavailable"
+            )
+        encode = encoder_result.value
+        if not self.connected():
+            return r[m.DbOracle.TapResult].fail("Not connected to database")
+        stream = self._stream_name(table_name, schema)
+        bookmark_result = (
+            self.bookmark_from_state(state, table_name, schema=schema)
+            if state is not None
+            else r[m.DbOracle.Bookmark | None].ok(None)
+        )
+        metadata_result = self.fetch_table_metadata(table_name, schema)
+        if bookmark_result.failure or metadata_result.failure:
+            return r[m.DbOracle.TapResult].fail(
+                bookmark_result.error
+                or metadata_result.error
+                or f"Failed to describe table {table_name}"
+            )
+        bookmark = bookmark_result.value
+        metadata = metadata_result.value
+        selected = {name.upper() for name in columns} if columns else None
+        properties = {
+            column.name: self._singer_property(column)
+            for column in metadata.columns
+            if selected is None or column.name.upper() in selected
+        }
+        incremental = replication_key is not None or bookmark is not None
+        batches_result: p.Result[
+            Iterator[tuple[t.DbOracle.BindBatch, m.DbOracle.Bookmark | None]]
+        ]
+        if incremental:
+            batches_result = self.extract_incremental(
+                table_name,
+                replication_key=replication_key,
+                bookmark=bookmark,
+                schema=schema,
+                columns=list(properties),
+                batch_size=batch_size,
+            )
+            if replication_key is None and bookmark is not None:
+                replication_key = bookmark.replication_key
+        else:
+            batches_result = self.build_select(
+                table_name, list(properties), schema_name=schema
+            ).map(
+                lambda sql: (
+                    (batch, None)
+                    for batch in self._stream_row_batches(
+                        sql, None, batch_size, list(properties)
+                    )
+                )
+            )
+        if batches_result.failure:
+            return r[m.DbOracle.TapResult].fail(
+                batches_result.error or f"Failed to read table {table_name}"
+            )
+        key = self._dictionary_name(replication_key) if replication_key else None
+        if key == c.DbOracle.ROWSCN_REPLICATION_KEY:
+            properties = {key: {"type": ["null", "integer"]}, **properties}
+        elif key is not None and key not in properties:
+            properties.update({
+                column.name: self._singer_property(column)
+                for column in metadata.columns
+                if column.name.upper() == key.upper()
+            })
+        schema_message: t.JsonDict = {
+            "type": c.DbOracle.SingerMessageType.SCHEMA.value,
+            "stream": stream,
+            "schema": {"type": "object", "properties": properties},
+            "key_properties": list(metadata.primary_keys),
+        }
+        if key is not None:
+            schema_message["bookmark_properties"] = [key]
+        sink = output if output is not None else sys.stdout.buffer
+        started = time.perf_counter()
+        result = m.DbOracle.TapResult(stream=stream)
+        try:
+            sink.write(encode(schema_message) + b"\n")
+            result = self._write_singer_batches(
+                sink, encode, stream, batches_result.value, state, result
+            )
+            sink.flush()
+        except (*c.DbOracle.EXC_DB_BROAD, TypeError, ValueError) as e:
+            return r[m.DbOracle.TapResult].fail_op("Singer tap", e)
+        result = result.model_copy(
+            update={"elapsed_seconds": time.perf_counter() - started}
+        )
+        self.logger.info(
+            "Singer tap finished",
+            stream=stream,
+            rows_emitted=result.rows_emitted,
+            rows_per_second=round(result.rows_per_second, 1),
+        )
+        return r[m.DbOracle.TapResult].ok(result)
+
+    def _write_singer_batches(
+        self,
+        sink: BinaryIO,
+        encode: t.DbOracle.JsonEncoder,
+        stream: str,
+        batches: Iterator[tuple[t.DbOracle.BindBatch, m.DbOracle.Bookmark | None]],
+        state: t.JsonMapping | None,
+        result: m.DbOracle.TapResult,
+    ) -> m.DbOracle.TapResult:
+        """Serialize every batch (and its STATE) into one write per batch."""
+        rows_emitted = 0
+        batch_count = 0
+        bookmark: m.DbOracle.Bookmark | None = None
+        record_type = c.DbOracle.SingerMessageType.RECORD.value
+        for batch, bookmark in batches:
+            extracted = datetime.now(UTC).isoformat()
+            lines = [
+                encode({
+                    "type": record_type,
+                    "stream": stream,
+                    "record": dict(row),
+                    "time_extracted": extracted,
+                })
+                for row in batch
+            ]
+            if bookmark is not None:
+                lines.append(
+                    encode({
+                        "type": c.DbOracle.SingerMessageType.STATE.value,
+                        "value": self._merge_singer_state(state, bookmark),
+                    })
+                )
+            sink.write(b"\n".join(lines) + b"\n")
+            rows_emitted += len(batch)
+            batch_count += 1
+        return result.model_copy(
+            update={
+                "rows_emitted": rows_emitted,
+                "batches": batch_count,
+                "bookmark": bookmark,
+            }
+        )
+
+    @staticmethod
+    def _merge_singer_state(
+        state: t.JsonMapping | None, bookmark: m.DbOracle.Bookmark
+    ) -> t.JsonDict:
+        """Replace one stream's bookmark inside a Singer STATE value."""
+        value = state or {}
+        if value.get("type") == c.DbOracle.SingerMessageType.STATE.value:
+            inner = value.get("value")
+            value = inner if isinstance(inner, Mapping) else {}
+        merged: t.JsonDict = dict(value)
+        bookmarks = merged.get("bookmarks")
+        merged["bookmarks"] = {
+            **(bookmarks if isinstance(bookmarks, Mapping) else {}),
+            bookmark.stream: {
+                "replication_key": bookmark.replication_key,
+                "replication_key_value": bookmark.replication_key_value,
+            },
+        }
+        return merged
+
+    @classmethod
+    def _singer_property(cls, column: m.DbOracle.ColumnMetadata) -> t.JsonDict:
+        """Map an Oracle column to a Singer JSON Schema property."""
+        upper_type = column.data_type.upper()
+        if upper_type.startswith(tuple(c.DbOracle.TEMPORAL_TYPE_PREFIXES)):
+            prop: t.JsonDict = {"type": ["string"], "format": "date-time"}
+        elif upper_type.startswith(tuple(c.DbOracle.NUMERIC_TYPE_PREFIXES)):
+            integral = upper_type == "INTEGER" or (
+                upper_type == "NUMBER" and column.data_scale == 0
+            )
+            prop = {"type": ["integer" if integral else "number"]}
+        else:
+            prop = {"type": ["string"]}
+        if column.nullable:
+            prop["type"] = ["null", *prop["type"]]
+        return prop
+
+
+__all__: list[str] = ["FlextDbOracleServiceSingerTap"]
@@ -0,0 +1,469 @@
+"""Singer target service mixin for flext-db-oracle.
+
+Ingests Singer SCHEMA, RECORD and STATE messages into Oracle tables:
+records are buffered per stream and flushed as array-bound batches.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import time
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, BinaryIO
+
+from sqlalchemy import text
+
+from flext_db_oracle import c, m, p, r, t
+from flext_db_oracle.services.singer import FlextDbOracleServiceSinger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, MutableMapping, MutableSequence, MutableSet
+
+
+class FlextDbOracleServiceSingerTarget(FlextDbOracleServiceSinger):
+    """Mixin providing Singer target ingestion for FlextDbOracleServices.
+
+    Handles: run_singer_target, table auto-creation, batched stream flushes.
+    """
+
+    def run_singer_target(
+        self,
+        messages: Iterable[str | bytes] | None = None,
+        *,
+        schema: str | None = None,
+        state_output: BinaryIO | None = None,
+        batch_size: int = c.DbOracle.DEFAULT_LOAD_BATCH_SIZE,
+        max_batch_seconds: float = c.DbOracle.DEFAULT_TARGET_BATCH_SECONDS,
+    ) -> p.Result[m.DbOracle.TargetResult]:
+        """Load Singer messages (default: stdin lines) into tables of ``schema``.
+
+        A SCHEMA message maps its stream (``SCHEMA-TABLE`` ids keep the
+        table part) to a table, created from the compiled schema coercer
+        through ``create_table_ddl`` when missing; an existing table gains
+        new properties and wider VARCHAR2 columns in batched ALTER TABLEs.
+        RECORDs are buffered per stream and flushed once ``batch_size``
+        records are pending, or for every stream once the oldest pending
+        record is ``max_batch_seconds`` old; streams with ``key_properties``
+        are merged, others array-inserted.
+        A STATE value is written to ``state_output`` (default stdout) only
+        after every record received before it has been committed.
+        """
+        if batch_size < 1:
+            return r[m.DbOracle.TargetResult].fail("Batch size must be positive")
+        if max_batch_seconds <= 0:
+            return r[m.DbOracle.TargetResult].fail("Maximum batch age must be positive")
+        if not self.connected():
+            return r[m.DbOracle.TargetResult].fail("Not connected to database")
+        tables_result = self.fetch_tables(schema)
+        if tables_result.failure:
+            return r[m.DbOracle.TargetResult].fail(
+                tables_result.error or "Failed to list target tables"
+            )
+        existing = set(tables_result.value)
+        sink = state_output if state_output is not None else sys.stdout.buffer
+        plans: MutableMapping[str, m.DbOracle.SingerTargetStream] = {}
+        buffers: MutableMapping[str, MutableSequence[t.JsonMapping]] = {}
+        buffered_since: MutableMapping[str, float] = {}
+        table_columns: MutableMapping[str, t.SequenceOf[m.DbOracle.Column]] = {}
+        pending_state: t.JsonValue = None
+        records_received = 0
+        result = m.DbOracle.TargetResult()
+        started = time.perf_counter()
+        source = messages if messages is not None else sys.stdin.buffer
+        for line_number, line in enumerate(source, start=1):
+            message_result = self._decode_singer_message(line, line_number)
+            if message_result.failure:
+                return r[m.DbOracle.TargetResult].fail(
+                    message_result.error or f"Invalid Singer message {line_number}"
+                )
+            message = message_result.value
+            if not message:
+                continue
+            message_type = message.get("type")
+            stream = message.get("stream")
+            due: t.StrSequence = ()
+            if message_type == c.DbOracle.SingerMessageType.SCHEMA.value:
+                if not isinstance(stream, str):
+                    return r[m.DbOracle.TargetResult].fail(
+                        f"SCHEMA message {line_number} has no stream"
+                    )
+                schema_result = self._apply_singer_schema(
+                    message,
+                    stream,
+                    schema,
+                    result,
+                    plans,
+                    buffers,
+                    buffered_since,
+                    existing,
+                    table_columns,
+                )
+                if schema_result.failure:
+                    return schema_result
+                result = schema_result.value
+            elif message_type == c.DbOracle.SingerMessageType.RECORD.value:
+                record = message.get("record")
+                if not isinstance(stream, str) or stream not in plans:
+                    return r[m.DbOracle.TargetResult].fail(
+                        f"RECORD message {line_number} precedes the SCHEMA "
+                        f"of stream {stream}"
+                    )
+                if not isinstance(record, Mapping):
+                    return r[m.DbOracle.TargetResult].fail(
+                        f"RECORD message {line_number} has no record object"
+                    )
+                buffers.setdefault(stream, []).append(record)
+                buffered_since.setdefault(stream, time.monotonic())
+                records_received += 1
+                if len(buffers[stream]) >= batch_size:
+                    due = [stream]
+            elif message_type == c.DbOracle.SingerMessageType.STATE.value:
+                pending_state = message.get("value")
+            else:
+                self.logger.debug(
+                    "Skipping Singer message", type=message_type, line=line_number
+                )
+            if buffered_since and (
+                time.monotonic() - min(buffered_since.values()) >= max_batch_seconds
+            ):
+                due = list(buffered_since)
+            if due:
+                flush_result = self._flush_singer_streams(
+                    result, plans, buffers, buffered_since, due, schema
+                )
+                if flush_result.failure:
+                    return flush_result
+                result = flush_result.value
+            if pending_state is not None and not buffered_since:
+                emit_result = self._emit_singer_state(sink, pending_state, result)
+                if emit_result.failure:
+                    return emit_result
+                result = emit_result.value
+                pending_state = None
+        flush_result = self._flush_singer_streams(
+            result, plans, buffers, buffered_since, list(buffered_since), schema
+        )
+        if flush_result.failure:
+            return flush_result
+        result = flush_result.value
+        if pending_state is not None:
+            emit_result = self._emit_singer_state(sink, pending_state, result)
+            if emit_result.failure:
+                return emit_result
+            result = emit_result.value
+        result = result.model_copy(
+            update={
+                "streams": tuple(plans),
+                "records_received": records_received,
+                "elapsed_seconds": time.perf_counter() - started,
+            }
+        )
+        self.logger.info(
+            "Singer target finished",
+            streams=len(result.streams),
+            rows_written=result.rows_written,
+            rows_per_second=round(result.rows_per_second, 1),
+        )
+        return r[m.DbOracle.TargetResult].ok(result)
+
+    @staticmethod
+    def _decode_singer_message(
+        line: str | bytes, line_number: int
+    ) -> p.Result[t.JsonMapping]:
+        """Parse one message line; blank lines decode to an empty mapping."""
+        if not line.strip():
+            return r[t.JsonMapping].ok({})
+        try:
+            message = json.loads(line)
+        except ValueError as e:
+            return r[t.JsonMapping].fail(f"Invalid JSON on line {line_number}: {e}")
+        if not isinstance(message, Mapping):
+            return r[t.JsonMapping].fail(
+                f"Singer message on line {line_number} is not an object"
+            )
+        return r[t.JsonMapping].ok(message)
+
+    def _apply_singer_schema(
+        self,
+        message: t.JsonMapping,
+        stream: str,
+        schema: str | None,
+        result: m.DbOracle.TargetResult,
+        plans: MutableMapping[str, m.DbOracle.SingerTargetStream],
+        buffers: MutableMapping[str, MutableSequence[t.JsonMapping]],
+        buffered_since: MutableMapping[str, float],
+        existing: MutableSet[str],
+        table_columns: MutableMapping[str, t.SequenceOf[m.DbOracle.Column]],
+    ) -> p.Result[m.DbOracle.TargetResult]:
+        """Switch a stream to a new SCHEMA, creating or evolving its table.
+
+        A repeated, unchanged SCHEMA is a no-op. Otherwise records buffered
+        under the previous schema are flushed first, then the table is
+        created, or extended with the new columns, before the plan is used.
+        """
+        plan_result = self._plan_singer_stream(message, stream, schema)
+        if plan_result.failure:
+            return r[m.DbOracle.TargetResult].fail(
+                plan_result.error or f"Invalid SCHEMA for stream {stream}"
+            )
+        plan = plan_result.value
+        current = plans.get(stream)
+        if (
+            current is not None
+            and current.coercer.schema_hash == plan.coercer.schema_hash
+            and list(current.key_properties) == list(plan.key_properties)
+        ):
+            return r[m.DbOracle.TargetResult].ok(result)
+        if buffers.get(stream):
+            flush_result = self._flush_singer_streams(
+                result, plans, buffers, buffered_since, [stream], schema
+            )
+            if flush_result.failure:
+                return flush_result
+            result = flush_result.value
+        table = self._dictionary_name(plan.table_name)
+        if table in existing:
+            evolve_result = self._evolve_singer_table(plan, schema, table_columns)
+            if evolve_result.failure:
+                return r[m.DbOracle.TargetResult].fail(
+                    evolve_result.error or f"Failed to evolve table {table}"
+                )
+            if evolve_result.value and table not in result.tables_altered:
+                result = result.model_copy(
+                    update={"tables_altered": (*result.tables_altered, table)}
+                )
+        else:
+            create_result = self._create_singer_table(plan, schema)
+            if create_result.failure:
+                return r[m.DbOracle.TargetResult].fail(
+                    create_result.error or f"Failed to create table {table}"
+                )
+            existing.add(table)
+            result = result.model_copy(
+                update={"tables_created": (*result.tables_created, table)}
+            )
+        plans[stream] = plan
+        return r[m.DbOracle.TargetResult].ok(result)
+
+    def _plan_singer_stream(
+        self, message: t.JsonMapping, stream: str, schema: str | None
+    ) -> p.Result[m.DbOracle.SingerTargetStream]:
+        """Resolve a SCHEMA message into the load plan of its stream."""
+        singer_schema = message.get("schema")
+        raw_keys = message.get("key_properties") or []
+        if not isinstance(singer_schema, Mapping) or not isinstance(raw_keys, list):
+            return r[m.DbOracle.SingerTargetStream].fail(
+                f"Invalid SCHEMA message for stream {stream}"
+            )
+        coercer_result = self.compile_singer_coercer(singer_schema)
+        if coercer_result.failure:
+            return r[m.DbOracle.SingerTargetStream].fail(
+                coercer_result.error or f"Failed to map stream {stream}"
+            )
+        coercer = coercer_result.value
+        column_types = coercer.column_types
+        key_properties = [str(name) for name in raw_keys]
+        unknown = [name for name in key_properties if name not in column_types]
+        if not column_types or unknown:
+            return r[m.DbOracle.SingerTargetStream].fail(
+                f"SCHEMA of stream {stream} lacks properties: "
+                f"{', '.join(unknown) or 'all'}"
+            )
+        table_name = stream.rsplit("-", 1)[-1]
+        insert_sql: str | None = None
+        if not key_properties:
+            insert_result = self.build_insert_statement(
+                table_name, list(column_types), schema
+            )
+            if insert_result.failure:
+                return r[m.DbOracle.SingerTargetStream].fail(
+                    insert_result.error or f"Failed to build INSERT for {stream}"
+                )
+            insert_sql = insert_result.value
+        return r[m.DbOracle.SingerTargetStream].ok(
+            m.DbOracle.SingerTargetStream(
+                stream=stream,
+                table_name=table_name,
+                coercer=coercer,
+                key_properties=key_properties,
+                insert_sql=insert_sql,
+            )
+        )
+
+    def _create_singer_table(
+        self, plan: m.DbOracle.SingerTargetStream, schema: str | None
+    ) -> p.Result[bool]:
+        """Create the table of a stream from its mapped Singer schema."""
+        columns = [
+            m.DbOracle.Column(
+                name=name,
+                data_type=oracle_type,
+                nullable=name not in plan.key_properties,
+                primary_key=name in plan.key_properties,
+            )
+            for name, oracle_type in plan.coercer.column_types.items()
+        ]
+        ddl_result = self.create_table_ddl(plan.table_name, columns, schema)
+        engine_result = self._get_engine()
+        if ddl_result.failure or engine_result.failure:
+            return r[bool].fail(
+                ddl_result.error
+                or engine_result.error
+                or f"Failed to create table {plan.table_name}"
+            )
+        try:
+            with self._engine_begin(engine_result.value) as conn:
+                _ = self._connection_execute(conn, text(ddl_result.value), None)
+        except c.DbOracle.EXC_DB_BROAD as e:
+            return r[bool].fail_op(f"Creating table {plan.table_name}", e)
+        self.logger.info(
+            "Created Singer target table", stream=plan.stream, table=plan.table_name
+        )
+        return r[bool].ok(True)
+
+    def _evolve_singer_table(
+        self,
+        plan: m.DbOracle.SingerTargetStream,
+        schema: str | None,
+        table_columns: MutableMapping[str, t.SequenceOf[m.DbOracle.Column]],
+    ) -> p.Result[t.StrSequence]:
+        """Add new stream properties and widen VARCHAR2 columns of a table.
+
+        The stream schema is compared with the cached ``fetch_columns`` output
+        of the table. Missing columns are added with one ``ALTER TABLE ...
+        ADD`` and narrower VARCHAR2 columns widened with one ``ALTER TABLE
+        ... MODIFY``; any change drops the cached columns of the table.
+        Returns the names of the added or widened columns.
+        """
+        key = self._dictionary_qualified_name(plan.table_name, schema)
+        columns = table_columns.get(key)
+        if columns is None:
+            columns_result = self.fetch_columns(plan.table_name, schema)
+            if columns_result.failure:
+                return r[t.StrSequence].fail(
+                    columns_result.error or f"Failed to describe {plan.table_name}"
+                )
+            columns = table_columns[key] = columns_result.value
+        current = {column.name: column for column in columns}
+        added: MutableSequence[str] = []
+        widened: MutableSequence[str] = []
+        changed: MutableSequence[str] = []
+        for name, oracle_type in plan.coercer.column_types.items():
+            column = current.get(self._dictionary_name(name))
+            length_match = c.DbOracle.VARCHAR2_TYPE_RE.fullmatch(oracle_type)
+            if column is None:
+                added.append(f"{self._quote_identifier(name)} {oracle_type}")
+            elif (
+                length_match is not None
+                and column.data_type.upper() == "VARCHAR2"
+                and (column.data_length or 0) < int(length_match.group(1))
+            ):
+                widened.append(f"{self._quote_identifier(name)} {oracle_type}")
+            else:
+                continue
+            changed.append(name)
+        table = self._qualified_name(plan.table_name, schema)
+        statements = [
+            f"ALTER TABLE {table} {clause} ({', '.join(items)})"
+            for clause, items in (("ADD", added), ("MODIFY", widened))
+            if items
+        ]
+        if not statements:
+            return r[t.StrSequence].ok(())
+        engine_result = self._get_engine()
+        if engine_result.failure:
+            return r[t.StrSequence].fail(
+                engine_result.error or "Failed to get database engine"
+            )
+        try:
+            with self._engine_begin(engine_result.value) as conn:
+                for statement in statements:
+                    _ = self._connection_execute(conn, text(statement), None)
+        except c.DbOracle.EXC_DB_BROAD as e:
+            return r[t.StrSequence].fail_op(f"Evolving table {plan.table_name}", e)
+        del table_columns[key]
+        self.logger.info(
+            "Evolved Singer target table",
+            stream=plan.stream,
+            table=plan.table_name,
+            columns_added=len(added),
+            columns_widened=len(widened),
+        )
+        return r[t.StrSequence].ok(tuple(changed))
+
+    def _flush_singer_streams(
+        self,
+        result: m.DbOracle.TargetResult,
+        plans: t.MappingKV[str, m.DbOracle.SingerTargetStream],
+        buffers: MutableMapping[str, MutableSequence[t.JsonMapping]],
+        buffered_since: MutableMapping[str, float],
+        streams: t.StrSequence,
+        schema: str | None,
+    ) -> p.Result[m.DbOracle.TargetResult]:
+        """Write and commit the buffered records of ``streams``.
+
+        A stream's buffer is only released once its batch has committed;
+        the written rows and batches are added to ``result``.
+        """
+        rows_written = 0
+        batches = 0
+        for stream in streams:
+            records = buffers.get(stream)
+            if not records:
+                continue
+            plan = plans[stream]
+            try:
+                rows = plan.coercer.coerce(records)
+            except (ValueError, TypeError) as e:
+                return r[m.DbOracle.TargetResult].fail(
+                    f"Invalid record for stream {stream}: {e}"
+                )
+            write_result = (
+                self.execute_batch(plan.insert_sql, rows)
+                if plan.insert_sql is not None
+                else self.upsert_rows(
+                    plan.table_name,
+                    rows,
+                    plan.key_properties,
+                    schema=schema,
+                    batch_size=len(rows),
+                )
+            )
+            if write_result.failure:
+                return r[m.DbOracle.TargetResult].fail(
+                    f"Flush of stream {stream} failed: {write_result.error}"
+                )
+            self.logger.debug("Flushed Singer stream", stream=stream, rows=len(rows))
+            rows_written += len(rows)
+            batches += 1
+            del buffers[stream]
+            buffered_since.pop(stream, None)
+        return r[m.DbOracle.TargetResult].ok(
+            result.model_copy(
+                update={
+                    "rows_written": result.rows_written + rows_written,
+                    "batches": result.batches + batches,
+                }
+            )
+        )
+
+    @staticmethod
+    def _emit_singer_state(
+        sink: BinaryIO, value: t.JsonValue, result: m.DbOracle.TargetResult
+    ) -> p.Result[m.DbOracle.TargetResult]:
+        """Write one committed STATE value as a JSON line."""
+        try:
+            sink.write(f"{json.dumps(value, separators=(',', ':'))}\n".encode())
+            sink.flush()
+        except (OSError, TypeError, ValueError) as e:
+            return r[m.DbOracle.TargetResult].fail_op("Singer state emission", e)
+        return r[m.DbOracle.TargetResult].ok(
+            result.model_copy(update={"states_emitted": result.states_emitted + 1})
+        )
+
+
+__all__: list[str] = ["FlextDbOracleServiceSingerTarget"]
@@ -0,0 +1,111 @@
+"""Slow-query log service mixin for flext-db-oracle.
+
+Keeps a bounded log of instrumented calls slower than the configured
+threshold and, with ``explain_slow_queries``, captures their EXPLAIN PLAN
+on a background connection.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import override
+
+from flext_db_oracle import FlextDbOracleServiceBase, c, m, p, r
+
+
+class FlextDbOracleServiceSlowQuery(FlextDbOracleServiceBase):
+    """Mixin providing the slow-query log for FlextDbOracleServices.
+
+    Handles: fetch_slow_queries, reset_slow_queries, background plan capture.
+    """
+
+    def fetch_slow_queries(
+        self, *, wait_for_plans: bool = False, timeout: float | None = None
+    ) -> p.Result[Sequence[m.DbOracle.SlowQuery]]:
+        """Return the slow-query log, oldest entry first.
+
+        With ``explain_slow_queries`` enabled, plans are captured in the
+        background, so fresh entries may still be ``pending``; ``wait_for_plans`` first waits up to ``timeout``
+        seconds for the outstanding captures.
+        """
+        if wait_for_plans:
+            _ = wait(list(self._plan_captures), timeout=timeout)
+        return r[Sequence[m.DbOracle.SlowQuery]].ok(list(self._slow_queries))
+
+    def reset_slow_queries(self) -> p.Result[bool]:
+        """Clear the slow-query log and the plan cache."""
+        self._slow_queries.clear()
+        self._plan_cache.clear()
+        return r[bool].ok(value=True)
+
+    @override
+    def _log_slow_query(self, timing: m.DbOracle.StatementTiming) -> None:
+        """Log a slow call and queue the capture of its execution plan.
+
+        Only the normalized, literal-free SQL is kept in the log; the
+        original text is used once, by the background EXPLAIN PLAN.
+        """
+        entry = m.DbOracle.SlowQuery(
+            fingerprint=timing.fingerprint,
+            normalized_sql=self.normalize_sql(timing.statement),
+            operation_type=timing.operation_type,
+            elapsed_seconds=timing.total_seconds,
+            phases={
+                "checkout": timing.checkout_seconds,
+                "execute": timing.execute_seconds,
+                "fetch": timing.fetch_seconds,
+                "normalize": timing.normalize_seconds,
+                "commit": timing.commit_seconds,
+            },
+            rows=timing.rows,
+            success=timing.success,
+            timestamp=self._get_current_timestamp(),
+        )
+        self._slow_queries.append(entry)
+        self.logger.warning(
+            "Slow query",
+            fingerprint=entry.fingerprint,
+            elapsed_seconds=round(entry.elapsed_seconds, 3),
+            rows=entry.rows,
+        )
+        if not self.db_config.DbOracle.explain_slow_queries:
+            entry.plan_status = c.DbOracle.PlanCaptureStatus.SKIPPED
+            entry.plan_error = "Plan capture is disabled"
+        elif timing.operation_type not in c.DbOracle.EXPLAINABLE_KEYWORDS:
+            entry.plan_status = c.DbOracle.PlanCaptureStatus.SKIPPED
+            entry.plan_error = f"{timing.operation_type} statements have no plan"
+        else:
+            executor = self._plan_executor
+            if executor is None:
+                executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="flext-db-oracle-explain"
+                )
+                self._plan_executor = executor
+            future: Future[None] = executor.submit(
+                self._capture_plan, entry, timing.statement
+            )
+            self._plan_captures.append(future)
+
+    def _capture_plan(self, entry: m.DbOracle.SlowQuery, sql: str) -> None:
+        """EXPLAIN ``sql`` and attach the plan to the slow-query entry.
+
+        The plan is also checked against the fingerprint's baseline, with
+        the slow call's duration as the observed latency.
+        """
+        explained = self._explain_statement(sql)
+        if explained.failure:
+            entry.plan_status = c.DbOracle.PlanCaptureStatus.FAILED
+            entry.plan_error = explained.error or "Explain plan failed"
+            return
+        plan = explained.value
+        entry.plan_hash = plan.plan_hash
+        entry.plan = plan.text
+        entry.plan_status = c.DbOracle.PlanCaptureStatus.CAPTURED
+        self._record_plan(plan, entry.elapsed_seconds)
+
+
+__all__: list[str] = ["FlextDbOracleServiceSlowQuery"]
@@ -1,7 +1,7 @@
 """SQL builder service mixin for flext-db-oracle.
 
-Provides DDL/DML statement generation: INSERT, UPDATE, DELETE,
-SELECT, CREATE TABLE, DROP TABLE, CREATE INDEX.
+Provides DDL/DML statement generation: INSERT, INSERT ALL, UPDATE,
+DELETE, MERGE, SELECT, CREATE TABLE, DROP TABLE, CREATE INDEX.
 
 Copyright (c) 2025 FLEXT Team. All rights reserved.
 SPDX-License-Identifier: MIT
@@ -9,7 +9,8 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
-from typing import override
+import functools
+from typing import TYPE_CHECKING, override
 
 from sqlalchemy import (
     ClauseElement,
@@ -34,15 +35,29 @@ from sqlalchemy.types import UserDefinedType
 
 from flext_db_oracle import FlextDbOracleServiceBase, c, m, p, r, t
 
+if TYPE_CHECKING:
+    from collections.abc import MutableSequence
+
 
 class FlextDbOracleServiceSqlBuilder(FlextDbOracleServiceBase):
     """Mixin providing SQL statement builders for FlextDbOracleServices.
 
     Handles: build_create_index_statement, build_delete_statement,
-    build_insert_statement, build_select, build_update_statement,
-    create_table_ddl, drop_table_ddl.
+    build_insert_all_statement, build_insert_statement, build_merge_statement,
+    build_select, build_update_statement, create_table_ddl, drop_table_ddl,
+    statement_cache_info.
     """
 
+    @override
+    def statement_cache_info(self) -> t.MappingKV[str, tuple[int, int]]:
+        """Hits and misses of the compiled INSERT ALL and MERGE statement caches."""
+        insert_all = self._compile_insert_all_statement.cache_info()
+        merge = self._compile_merge_statement.cache_info()
+        return {
+            "insert_all_statement": (insert_all.hits, insert_all.misses),
+            "merge_statement": (merge.hits, merge.misses),
+        }
+
     class OracleRawType(UserDefinedType[str]):
         """Preserve exact Oracle type strings in SQLAlchemy DDL."""
 
@@ -54,12 +69,6 @@ class FlextDbOracleServiceSqlBuilder(FlextDbOracleServiceBase):
         def get_col_spec(self, **_kw: p.AttributeProbe) -> str:
             return self.spec
 
-    @staticmethod
-    def _normalize_identifier(name: str) -> str | quoted_name:
-        if c.DbOracle.IDENTIFIER_RE.fullmatch(name):
-            return quoted_name(name.upper(), quote=False)
-        return quoted_name(name, quote=True)
-
     @staticmethod
     def _compile_statement(statement: ClauseElement) -> str:
         compiled: str = c.DbOracle.collapse_whitespace(
@@ -76,6 +85,7 @@ class FlextDbOracleServiceSqlBuilder(FlextDbOracleServiceBase):
             sql = sql.replace(f":{bind_name}", f":{column_name}")
         return sql
 
+    @override
     def build_create_index_statement(self, config: t.JsonMapping) -> p.Result[str]:
         """Build Oracle CREATE INDEX statement from configuration."""
         try:
@@ -100,8 +110,16 @@ class FlextDbOracleServiceSqlBuilder(FlextDbOracleServiceBase):
             unique=settings.unique,
         )
         sql = self._compile_statement(CreateIndex(index))
+        if settings.local:
+            sql = f"{sql} LOCAL"
         if settings.tablespace:
-            sql = f"{sql} TABLESPACE {settings.tablespace}"
+            sql = f"{sql} TABLESPACE {self._quote_identifier(settings.tablespace)}"
+        if settings.compress is not None:
+            sql = f"{sql} COMPRESS {settings.compress}"
+        if settings.nologging:
+            sql = f"{sql} NOLOGGING"
+        if settings.online:
+            sql = f"{sql} ONLINE"
         if settings.parallel > 1:
             sql = f"{sql} PARALLEL {settings.parallel}"
         return r[str].ok(sql)
@@ -168,6 +186,7 @@ class FlextDbOracleServiceSqlBuilder(FlextDbOracleServiceBase):
             sql = sql.replace(f":{bind_name}", f":{column_name}")
         return r[str].ok(sql)
 
+    @override
     def build_insert_statement(
         self,
         table_name: str,
@@ -216,23 +235,239 @@ class FlextDbOracleServiceSqlBuilder(FlextDbOracleServiceBase):
             sql = sql.replace(f":{bind_name}", f":{column_name}")
         return r[str].ok(sql)
 
+    @override
+    def build_insert_all_statement(
+        self,
+        table_name: str,
+        columns: t.StrSequence,
+        row_count: int,
+        schema: str | None = None,
+    ) -> p.Result[str]:
+        """Build a multi-row ``INSERT ALL ... SELECT 1 FROM DUAL`` statement.
+
+        Row ``i`` binds column ``j`` as ``:r{i}c{j}`` (see ``insert_all_binds``),
+        so a whole batch travels in one statement without array binding.
+        ``row_count * len(columns)`` must stay within the target columns
+        Oracle allows across the INTO clauses of one multitable insert.
+        Compiled templates are cached per table, columns and row count.
+        """
+        if not columns:
+            return r[str].fail("INSERT ALL requires at least one column")
+        if row_count < 1:
+            return r[str].fail("INSERT ALL requires at least one row")
+        if row_count * len(columns) > c.DbOracle.MAX_INSERT_ALL_COLUMNS:
+            return r[str].fail(
+                f"INSERT ALL of {row_count} rows x {len(columns)} columns exceeds "
+                f"{c.DbOracle.MAX_INSERT_ALL_COLUMNS} target columns"
+            )
+        return r[str].ok(
+            self._compile_insert_all_statement(
+                table_name, tuple(columns), row_count, schema
+            )
+        )
+
+    @classmethod
+    @functools.lru_cache(maxsize=c.DbOracle.STATEMENT_CACHE_SIZE)
+    def _compile_insert_all_statement(
+        cls,
+        table_name: str,
+        columns: tuple[str, ...],
+        row_count: int,
+        schema: str | None,
+    ) -> str:
+        """Render the INSERT ALL text for one table, column set and row count.
+
+        Each INTO clause is compiled as a single-row INSERT; SQLAlchemy has
+        no multitable insert, so only ``INSERT ALL`` and the closing
+        ``SELECT 1 FROM DUAL`` are joined around them.
+        """
+        target = table(
+            cls._normalize_identifier(table_name),
+            *(column(cls._normalize_identifier(name)) for name in columns),
+            schema=cls._normalize_identifier(schema) if schema else None,
+        )
+        into_clauses = (
+            cls._compile_statement(
+                insert(target).values({
+                    target_column: bindparam(f"r{row}c{index}")
+                    for index, target_column in enumerate(target.c)
+                })
+            ).removeprefix("INSERT ")
+            for row in range(row_count)
+        )
+        return " ".join(("INSERT ALL", *into_clauses, "SELECT 1 FROM DUAL"))
+
+    @override
+    def build_merge_statement(
+        self,
+        table_name: str,
+        key_columns: t.StrSequence,
+        update_columns: t.StrSequence,
+        schema: str | None = None,
+        source_table: str | None = None,
+        source_schema: str | None = None,
+    ) -> p.Result[str]:
+        """Build a MERGE upsert matching rows on ``key_columns``.
+
+        Without ``source_table`` the source is ``SELECT :c0 AS col ... FROM
+        DUAL``, binding key then update column ``j`` as ``:c{j}`` (see
+        ``merge_binds``), so one statement executed with ``executemany``
+        upserts a whole batch of bind rows; with it the MERGE is set-based
+        over that table. Matched rows get ``update_columns``; unmatched rows
+        are inserted with keys and update columns. Compiled statements are
+        cached.
+        """
+        if not key_columns:
+            return r[str].fail("MERGE requires at least one key column")
+        overlap = sorted(set(key_columns) & set(update_columns))
+        if overlap:
+            return r[str].fail(f"MERGE cannot update key columns: {', '.join(overlap)}")
+        return r[str].ok(
+            self._compile_merge_statement(
+                table_name,
+                tuple(key_columns),
+                tuple(update_columns),
+                schema,
+                source_table,
+                source_schema,
+            )
+        )
+
+    @classmethod
+    @functools.lru_cache(maxsize=c.DbOracle.STATEMENT_CACHE_SIZE)
+    def _compile_merge_statement(
+        cls,
+        table_name: str,
+        key_columns: tuple[str, ...],
+        update_columns: tuple[str, ...],
+        schema: str | None,
+        source_table: str | None = None,
+        source_schema: str | None = None,
+    ) -> str:
+        """Render the MERGE text for one table, key and update column set.
+
+        SQLAlchemy Core has no MERGE construct, so the clauses are compiled
+        with the Oracle dialect and joined with the MERGE keywords.
+        """
+        column_names = tuple(dict.fromkeys([*key_columns, *update_columns]))
+        normalized = {name: cls._normalize_identifier(name) for name in column_names}
+        target = table(
+            cls._normalize_identifier(table_name),
+            *(column(name) for name in normalized.values()),
+            schema=cls._normalize_identifier(schema) if schema else None,
+        ).alias("tgt")
+        if source_table:
+            staged = table(
+                cls._normalize_identifier(source_table),
+                *(column(name) for name in normalized.values()),
+                schema=cls._normalize_identifier(source_schema)
+                if source_schema
+                else None,
+            )
+            source = select(*staged.c).subquery("src")
+        else:
+            source = select(
+                *(
+                    bindparam(f"c{index}").label(normalized[name])
+                    for index, name in enumerate(column_names)
+                )
+            ).subquery("src")
+        dialect = oracle_dialect()
+        compiler = dialect.statement_compiler(dialect, None)
+        pairs = {
+            name: compiler.process(
+                target.c[normalized[name]] == source.c[normalized[name]]
+            )
+            for name in column_names
+        }
+        clauses = [
+            "MERGE INTO",
+            compiler.process(target, asfrom=True),
+            "USING",
+            compiler.process(source, asfrom=True),
+            f"ON ({' AND '.join(pairs[name] for name in key_columns)})",
+        ]
+        if update_columns:
+            clauses.extend((
+                "WHEN MATCHED THEN UPDATE SET",
+                ", ".join(pairs[name] for name in update_columns),
+            ))
+        insert_columns = ", ".join(
+            compiler.preparer.format_column(target.c[normalized[name]])
+            for name in column_names
+        )
+        insert_values = ", ".join(
+            compiler.process(source.c[normalized[name]]) for name in column_names
+        )
+        clauses.extend((
+            f"WHEN NOT MATCHED THEN INSERT ({insert_columns})",
+            f"VALUES ({insert_values})",
+        ))
+        return c.DbOracle.collapse_whitespace(" ".join(clauses)).strip()
+
+    @override
     def build_select(
         self,
         table_name: str,
         columns: t.StrSequence | None = None,
         conditions: m.ConfigMap | t.JsonMapping | None = None,
         schema_name: str | None = None,
+        *,
+        hints: m.DbOracle.QueryHints | None = None,
+        in_conditions: t.MappingKV[str, int] | None = None,
+        range_columns: t.StrSequence | None = None,
+        lower_bounds: t.MappingKV[str, bool] | None = None,
+        order_by: t.StrSequence | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
     ) -> p.Result[str]:
-        """Build SELECT query through SQLAlchemy Core Oracle compilation."""
+        """Build SELECT query through SQLAlchemy Core Oracle compilation.
+
+        ``conditions`` bind equality as ``:col``. ``in_conditions`` maps a
+        column to its value count and binds ``:col_0 .. :col_n`` padded to a
+        bucketed size (see ``in_list_binds``); ``range_columns`` bind the
+        half-open range ``:col_lower <= col < :col_upper``; ``lower_bounds``
+        map a column to whether its open-ended bound ``:col_lower`` is
+        inclusive (``>=``) or exclusive (``>``). ``order_by`` entries may end
+        in ``ASC``/``DESC``; ``limit``/``offset`` render as
+        ``OFFSET :row_offset ROWS FETCH FIRST :row_limit ROWS ONLY`` so every
+        page shares one cursor; bind the same values under those names.
+        """
         typed_conditions = (
             conditions
             if isinstance(conditions, m.ConfigMap) or conditions is None
             else m.ConfigMap.model_validate(conditions)
         )
+        in_counts = dict(in_conditions or {})
+        oversized = [
+            name
+            for name, count in in_counts.items()
+            if not 0 < count <= c.DbOracle.MAX_IN_LIST_SIZE
+        ]
+        if oversized:
+            return r[str].fail(
+                f"IN lists need 1 to {c.DbOracle.MAX_IN_LIST_SIZE} values: "
+                f"{', '.join(oversized)}"
+            )
+        if (limit is not None and limit < 1) or (offset is not None and offset < 0):
+            return r[str].fail("Row limit must be positive and offset non-negative")
+        ordering = [
+            (name, direction.strip().upper() == "DESC")
+            for name, _, direction in (
+                entry.strip().partition(" ") for entry in order_by or ()
+            )
+        ]
         selected_columns = list(columns) if columns else []
         condition_columns = tuple(typed_conditions.root) if typed_conditions else ()
         statement_columns = tuple(
-            dict.fromkeys([*selected_columns, *condition_columns])
+            dict.fromkeys([
+                *selected_columns,
+                *condition_columns,
+                *in_counts,
+                *(range_columns or ()),
+                *(lower_bounds or {}),
+                *(name for name, _ in ordering),
+            ])
         )
         bind_names = {
             column_name: f"bind_{index:04d}"
@@ -270,6 +505,50 @@ class FlextDbOracleServiceSqlBuilder(FlextDbOracleServiceBase):
             statement = statement.where(
                 table_clause.c[column_name] == bindparam(bind_names[column_name])
             )
+        for position, (column_name, count) in enumerate(in_counts.items()):
+            in_binds = {
+                f"bind_in_{position:04d}_{index:04d}": f"{column_name}_{index}"
+                for index in range(self.in_list_size(count))
+            }
+            bind_names.update({value: key for key, value in in_binds.items()})
+            statement = statement.where(
+                table_clause.c[column_name].in_([bindparam(key) for key in in_binds])
+            )
+        for position, column_name in enumerate(range_columns or ()):
+            lower, upper = f"bind_lo_{position:04d}", f"bind_hi_{position:04d}"
+            bind_names[f"{column_name}_lower"] = lower
+            bind_names[f"{column_name}_upper"] = upper
+            statement = statement.where(
+                table_clause.c[column_name] >= bindparam(lower),
+                table_clause.c[column_name] < bindparam(upper),
+            )
+        for position, (column_name, inclusive) in enumerate(
+            (lower_bounds or {}).items()
+        ):
+            lower = f"bind_from_{position:04d}"
+            bind_names[f"{column_name}_lower"] = lower
+            statement = statement.where(
+                table_clause.c[column_name] >= bindparam(lower)
+                if inclusive
+                else table_clause.c[column_name] > bindparam(lower)
+            )
+        if ordering:
+            statement = statement.order_by(
+                *(
+                    table_clause.c[name].desc() if descending else table_clause.c[name]
+                    for name, descending in ordering
+                )
+            )
+        if hints is not None:
+            hint_text = self._render_hints(hints, table_name)
+            if hint_text:
+                statement = statement.prefix_with(f"/*+ {hint_text} */")
+        if limit is not None:
+            bind_names["row_limit"] = "bind_row_limit"
+            statement = statement.limit(bindparam("bind_row_limit"))
+        if offset is not None:
+            bind_names["row_offset"] = "bind_row_offset"
+            statement = statement.offset(bindparam("bind_row_offset"))
         sql = c.DbOracle.collapse_whitespace(
             str(statement.compile(dialect=oracle_dialect()))
         ).strip()
@@ -277,6 +556,20 @@ class FlextDbOracleServiceSqlBuilder(FlextDbOracleServiceBase):
             sql = sql.replace(f":{bind_name}", f":{column_name}")
         return r[str].ok(sql)
 
+    @classmethod
+    def _render_hints(cls, hints: m.DbOracle.QueryHints, table_name: str) -> str:
+        """Render structured optimizer hints as the body of a ``/*+ */`` comment."""
+        table_ref = cls._quote_identifier(table_name)
+        rendered = [
+            f"PARALLEL({hints.parallel})" if hints.parallel else "",
+            f"INDEX({table_ref} {cls._quote_identifier(hints.index)})"
+            if hints.index
+            else "",
+            f"FULL({table_ref})" if hints.full else "",
+            f"FIRST_ROWS({hints.first_rows})" if hints.first_rows else "",
+        ]
+        return " ".join(hint for hint in rendered if hint)
+
     def build_update_statement(
         self,
         table_name: str,
@@ -325,20 +618,82 @@ class FlextDbOracleServiceSqlBuilder(FlextDbOracleServiceBase):
             sql = sql.replace(f":{bind_name}", f":{column_name}")
         return r[str].ok(sql)
 
+    @override
     def create_table_ddl(
         self,
         table_name: str,
         columns: t.SequenceOf[m.DbOracle.Column | t.JsonMapping],
         schema: str | None = None,
+        *,
+        options: m.DbOracle.TableStorageOptions | None = None,
     ) -> p.Result[str]:
-        """Generate CREATE TABLE DDL through SQLAlchemy Oracle DDL compilation."""
+        """Generate CREATE TABLE DDL through SQLAlchemy Oracle DDL compilation.
+
+        ``options`` appends physical attributes, compression, logging,
+        partitioning and parallel clauses in Oracle's grammar order.
+        """
         try:
             column_models = self._normalize_table_columns(columns)
             table_object = self._create_table_object(table_name, column_models, schema)
             ddl = self._compile_statement(CreateTable(table_object))
-            return r[str].ok(ddl)
         except c.ValidationError as e:
             return r[str].fail(f"Invalid CREATE TABLE settings: {e}")
+        if options is None:
+            return r[str].ok(ddl)
+        return self._table_storage_clause(options).map(
+            lambda clause: f"{ddl} {clause}" if clause else ddl
+        )
+
+    def _table_storage_clause(
+        self, options: m.DbOracle.TableStorageOptions
+    ) -> p.Result[str]:
+        """Render the storage and partitioning clauses of CREATE TABLE."""
+        clauses: MutableSequence[str] = []
+        if options.pctfree is not None:
+            clauses.append(f"PCTFREE {options.pctfree}")
+        if options.tablespace:
+            clauses.append(f"TABLESPACE {self._quote_identifier(options.tablespace)}")
+        if options.nologging:
+            clauses.append("NOLOGGING")
+        if options.compression is not None:
+            clauses.append(c.DbOracle.TABLE_COMPRESSION_CLAUSES[options.compression])
+        if options.partition_type is not None:
+            partition_result = self._partition_clause(options)
+            if partition_result.failure:
+                return partition_result
+            clauses.append(partition_result.value)
+        if options.parallel is not None:
+            clauses.append(f"PARALLEL {options.parallel}")
+        return r[str].ok(" ".join(clauses))
+
+    def _partition_clause(
+        self, options: m.DbOracle.TableStorageOptions
+    ) -> p.Result[str]:
+        """Render the PARTITION BY clause for range, interval or hash tables."""
+        if not options.partition_columns:
+            return r[str].fail("Partitioned tables require partition columns")
+        key = ", ".join(
+            self._quote_identifier(name) for name in options.partition_columns
+        )
+        if options.partition_type == c.DbOracle.PartitionType.HASH:
+            if options.hash_partitions is None:
+                return r[str].fail("Hash partitioning requires hash_partitions")
+            return r[str].ok(
+                f"PARTITION BY HASH ({key}) PARTITIONS {options.hash_partitions}"
+            )
+        if not options.range_partitions:
+            return r[str].fail("Range and interval partitioning require partitions")
+        clause = f"PARTITION BY RANGE ({key})"
+        if options.partition_type == c.DbOracle.PartitionType.INTERVAL:
+            if not options.interval:
+                return r[str].fail("Interval partitioning requires an interval")
+            clause = f"{clause} INTERVAL ({options.interval})"
+        bounds = ", ".join(
+            f"PARTITION {self._quote_identifier(partition.name)} "
+            f"VALUES LESS THAN ({partition.values_less_than})"
+            for partition in options.range_partitions
+        )
+        return r[str].ok(f"{clause} ({bounds})")
 
     def _normalize_table_columns(
         self, columns: t.SequenceOf[m.DbOracle.Column | t.JsonMapping]
@@ -0,0 +1,198 @@
+"""Optimizer statistics service mixin for flext-db-oracle.
+
+Gathers table statistics through DBMS_STATS, either on demand or once
+the rows changed through this library make the current statistics stale.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, override
+
+from sqlalchemy import text
+
+from flext_db_oracle import FlextDbOracleServiceBase, c, m, p, r, t
+
+if TYPE_CHECKING:
+    from collections.abc import MutableSequence
+
+
+class FlextDbOracleServiceStatistics(FlextDbOracleServiceBase):
+    """Mixin providing optimizer statistics gathering for FlextDbOracleServices.
+
+    Handles: gather_table_stats, gather_stats_if_stale, change tracking.
+    """
+
+    @override
+    def gather_table_stats(
+        self,
+        table_name: str,
+        *,
+        schema: str | None = None,
+        options: m.DbOracle.StatsOptions | None = None,
+    ) -> p.Result[m.DbOracle.StatsResult]:
+        """Gather table statistics with ``DBMS_STATS.GATHER_TABLE_STATS``.
+
+        ``options`` selects the parallel degree, sample percent, granularity
+        and partition; ``incremental`` sets the table's INCREMENTAL
+        preference first so partitioned tables only rescan changed
+        partitions. Gathering resets the tracked change count of the table.
+        """
+        settings = options or m.DbOracle.StatsOptions()
+        if not self.connected():
+            return r[m.DbOracle.StatsResult].fail("Not connected to database")
+        engine_result = self._get_engine()
+        if engine_result.failure:
+            return r[m.DbOracle.StatsResult].fail(
+                engine_result.error or "Failed to get database engine"
+            )
+        binds: t.MutableJsonMapping = {
+            "owner": self._dictionary_name(schema) if schema else None,
+            "table_name": self._dictionary_name(table_name),
+            "granularity": settings.granularity.value,
+        }
+        if settings.partition_name is not None:
+            binds["partition_name"] = self._dictionary_name(settings.partition_name)
+        if settings.estimate_percent is not None:
+            binds["estimate_percent"] = settings.estimate_percent
+        if settings.degree is not None:
+            binds["degree"] = settings.degree
+        started = time.perf_counter()
+        try:
+            with self._engine_begin(engine_result.value) as conn:
+                _ = self._connection_execute(
+                    conn,
+                    text(self._gather_stats_block(settings)),
+                    m.ConfigMap(root=binds),
+                )
+        except c.DbOracle.EXC_DB_BROAD as e:
+            return r[m.DbOracle.StatsResult].fail_op("Statistics gathering", e)
+        key = self._stats_key(table_name, schema)
+        rows_changed = self._stats_row_changes.pop(key, 0)
+        stats_result = m.DbOracle.StatsResult(
+            table_name=table_name,
+            gathered=True,
+            rows_changed=rows_changed,
+            elapsed_seconds=time.perf_counter() - started,
+        )
+        self.logger.info(
+            "Table statistics gathered",
+            table=table_name,
+            granularity=settings.granularity.value,
+            elapsed_seconds=round(stats_result.elapsed_seconds, 3),
+        )
+        return r[m.DbOracle.StatsResult].ok(stats_result)
+
+    @override
+    def gather_stats_if_stale(
+        self,
+        table_name: str,
+        rows_changed: int,
+        *,
+        schema: str | None = None,
+        options: m.DbOracle.StatsOptions | None = None,
+    ) -> p.Result[m.DbOracle.StatsResult]:
+        """Record changed rows and gather statistics once they are stale.
+
+        Changes accumulate per table until they reach ``stale_fraction`` of
+        the row count of the current statistics (``ALL_TABLES.NUM_ROWS``);
+        tables that were never analyzed are gathered immediately.
+        """
+        if rows_changed < 0:
+            return r[m.DbOracle.StatsResult].fail(
+                "Changed row count must not be negative"
+            )
+        settings = options or m.DbOracle.StatsOptions()
+        key = self._stats_key(table_name, schema)
+        pending = self._stats_row_changes.get(key, 0) + rows_changed
+        self._stats_row_changes[key] = pending
+        baseline_result = self._analyzed_row_count(table_name, schema)
+        if baseline_result.failure:
+            return r[m.DbOracle.StatsResult].fail(
+                baseline_result.error or "Failed to read table statistics"
+            )
+        analyzed_rows = baseline_result.value
+        if analyzed_rows is not None and pending < settings.stale_fraction * max(
+            analyzed_rows, 1
+        ):
+            return r[m.DbOracle.StatsResult].ok(
+                m.DbOracle.StatsResult(
+                    table_name=table_name,
+                    rows_changed=pending,
+                    analyzed_rows=analyzed_rows,
+                )
+            )
+        return self.gather_table_stats(table_name, schema=schema, options=settings).map(
+            lambda gathered: gathered.model_copy(
+                update={"analyzed_rows": analyzed_rows}
+            )
+        )
+
+    def _analyzed_row_count(
+        self, table_name: str, schema: str | None
+    ) -> p.Result[int | None]:
+        """Read NUM_ROWS of the table's current statistics (None if never analyzed)."""
+        engine_result = self._get_engine()
+        if engine_result.failure:
+            return r[int | None].fail(
+                engine_result.error or "Failed to get database engine"
+            )
+        params = m.ConfigMap(
+            root={
+                "owner": self._dictionary_name(schema) if schema else None,
+                "table_name": self._dictionary_name(table_name),
+            }
+        )
+        try:
+            with self._engine_connect(engine_result.value) as conn:
+                row = self._connection_execute(
+                    conn,
+                    text(
+                        "SELECT num_rows FROM all_tables "
+                        "WHERE owner = NVL(:owner, USER) AND table_name = :table_name"
+                    ),
+                    params,
+                ).first()
+        except c.DbOracle.EXC_DB_BROAD as e:
+            return r[int | None].fail_op("Statistics lookup", e)
+        if row is None:
+            return r[int | None].fail(f"Table {table_name} not found")
+        num_rows = row[0]
+        return r[int | None].ok(int(num_rows) if num_rows is not None else None)
+
+    @staticmethod
+    def _gather_stats_block(options: m.DbOracle.StatsOptions) -> str:
+        """Render the anonymous PL/SQL block that gathers the statistics."""
+        arguments = ["ownname => NVL(:owner, USER)", "tabname => :table_name"]
+        if options.partition_name is not None:
+            arguments.append("partname => :partition_name")
+        arguments.append(
+            "estimate_percent => :estimate_percent"
+            if options.estimate_percent is not None
+            else "estimate_percent => DBMS_STATS.AUTO_SAMPLE_SIZE"
+        )
+        if options.degree is not None:
+            arguments.append("degree => :degree")
+        arguments.extend((
+            "granularity => :granularity",
+            f"cascade => {'TRUE' if options.cascade else 'FALSE'}",
+        ))
+        statements: MutableSequence[str] = []
+        if options.incremental is not None:
+            statements.append(
+                "DBMS_STATS.SET_TABLE_PREFS(NVL(:owner, USER), :table_name, "
+                f"'INCREMENTAL', '{'TRUE' if options.incremental else 'FALSE'}');"
+            )
+        statements.append(f"DBMS_STATS.GATHER_TABLE_STATS({', '.join(arguments)});")
+        return f"BEGIN {' '.join(statements)} END;"
+
+    @classmethod
+    def _stats_key(cls, table_name: str, schema: str | None) -> str:
+        """Key tracked change counts by the dictionary name of the table."""
+        return cls._dictionary_qualified_name(table_name, schema)
+
+
+__all__: list[str] = ["FlextDbOracleServiceStatistics"]
@@ -0,0 +1,534 @@
+"""Table copy service mixin for flext-db-oracle.
+
+Copies tables between Oracle databases or schemas: chunk planning,
+parallel reader/writer pipelines, and resumable per-chunk checkpoints.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from decimal import Decimal
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from sqlalchemy import bindparam, column, func, select, table, text
+from sqlalchemy.dialects.oracle import dialect as oracle_dialect
+
+from flext_db_oracle import FlextDbOracleServiceBase, c, m, p, r, t
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, MutableSequence
+
+    from sqlalchemy import Connection as SAConnection, TextClause
+
+    from flext_db_oracle.services.facade import FlextDbOracleServices
+
+
+class FlextDbOracleServiceTableCopy(FlextDbOracleServiceBase):
+    """Mixin providing Oracle-to-Oracle table copies for FlextDbOracleServices.
+
+    Handles: copy_table, chunk planning, checkpoint persistence,
+    per-chunk reader/writer pipelines.
+    """
+
+    def copy_table(
+        self,
+        target: FlextDbOracleServices,
+        table_name: str,
+        *,
+        source_schema: str | None = None,
+        target_table: str | None = None,
+        target_schema: str | None = None,
+        parallelism: int = c.DbOracle.DEFAULT_COPY_PARALLELISM,
+        chunk_count: int = c.DbOracle.DEFAULT_COPY_CHUNKS,
+        batch_size: int = c.DbOracle.DEFAULT_LOAD_BATCH_SIZE,
+        max_in_flight: int = c.DbOracle.DEFAULT_PIPELINE_QUEUE_DEPTH,
+        create_target: bool = True,
+        checkpoint_path: str | Path | None = None,
+        restart: bool = False,
+        gather_stats: m.DbOracle.StatsOptions | None = None,
+    ) -> p.Result[m.DbOracle.CopyResult]:
+        """Copy a table into another Oracle database or schema in parallel.
+
+        The source is split into chunks: primary-key ranges for a single
+        numeric key, ``ORA_HASH`` buckets otherwise. Up to ``parallelism``
+        chunks copy concurrently; each streams from the source through a
+        server-side cursor into a queue of at most ``max_in_flight`` batches
+        and is array-inserted into the target inside one transaction. Every
+        committed chunk is recorded in ``checkpoint_path`` so a failed copy
+        resumes with the chunks that are still missing; ``restart`` discards
+        that checkpoint and copies every chunk again (rows already in the
+        target are left in place). With ``gather_stats`` the copied rows
+        count towards the target table's staleness threshold and its
+        statistics are gathered once reached.
+        """
+        if min(parallelism, chunk_count, batch_size, max_in_flight) < 1:
+            return r[m.DbOracle.CopyResult].fail(
+                "Parallelism, chunk count, batch size and in-flight batches must be positive"
+            )
+        if not self.connected() or not target.connected():
+            return r[m.DbOracle.CopyResult].fail("Not connected to database")
+        destination = target_table or table_name
+        metadata_result = self.fetch_table_metadata(table_name, source_schema)
+        if metadata_result.failure:
+            return r[m.DbOracle.CopyResult].fail(
+                metadata_result.error or f"Failed to describe table {table_name}"
+            )
+        metadata = metadata_result.value
+        if not metadata.columns:
+            return r[m.DbOracle.CopyResult].fail(f"Table {table_name} has no columns")
+        if create_target:
+            created = self._ensure_copy_target(
+                target, destination, target_schema, metadata
+            )
+            if created.failure:
+                return r[m.DbOracle.CopyResult].fail(
+                    created.error or f"Failed to create target table {destination}"
+                )
+        path = Path(checkpoint_path) if checkpoint_path is not None else None
+        if restart and path is not None:
+            try:
+                path.unlink(missing_ok=True)
+            except OSError as exc:
+                return r[m.DbOracle.CopyResult].fail(
+                    f"Failed to discard copy checkpoint {path}: {exc}"
+                )
+        checkpoint_result = self._load_copy_checkpoint(path).flat_map(
+            lambda stored: (
+                r[m.DbOracle.CopyCheckpoint].ok(stored)
+                if stored is not None
+                else self._plan_copy_chunks(metadata, destination, chunk_count)
+            )
+        )
+        if checkpoint_result.failure:
+            return r[m.DbOracle.CopyResult].fail(
+                checkpoint_result.error or "Failed to plan copy chunks"
+            )
+        checkpoint = checkpoint_result.value
+        if (checkpoint.table_name, checkpoint.target_table) != (
+            table_name,
+            destination,
+        ):
+            return r[m.DbOracle.CopyResult].fail(
+                f"Checkpoint belongs to {checkpoint.table_name} -> {checkpoint.target_table}"
+            )
+        column_names = [column.name for column in metadata.columns]
+        select_result = self.build_select(
+            table_name, column_names, schema_name=source_schema
+        )
+        insert_result = target.build_insert_statement(
+            destination, column_names, target_schema
+        )
+        if select_result.failure or insert_result.failure:
+            return r[m.DbOracle.CopyResult].fail(
+                select_result.error
+                or insert_result.error
+                or "Failed to prepare copy statements"
+            )
+        copy_result = self._run_table_copy(
+            target,
+            checkpoint,
+            metadata,
+            select_result.value,
+            insert_result.value,
+            parallelism=parallelism,
+            batch_size=batch_size,
+            max_in_flight=max_in_flight,
+            checkpoint_path=path,
+        )
+        if gather_stats is None or copy_result.failure:
+            return copy_result
+        stats_result = target.gather_stats_if_stale(
+            destination,
+            copy_result.value.rows_copied,
+            schema=target_schema,
+            options=gather_stats,
+        )
+        if stats_result.failure:
+            self.logger.warning(
+                "Post-copy statistics gathering failed",
+                table=destination,
+                error=stats_result.error,
+            )
+            return copy_result
+        return r[m.DbOracle.CopyResult].ok(
+            copy_result.value.model_copy(
+                update={"stats_gathered": stats_result.value.gathered}
+            )
+        )
+
+    def _ensure_copy_target(
+        self,
+        target: FlextDbOracleServices,
+        destination: str,
+        target_schema: str | None,
+        metadata: m.DbOracle.TableMetadata,
+    ) -> p.Result[bool]:
+        """Create the target table from source metadata unless it exists."""
+        tables_result = target.fetch_tables(target_schema)
+        if tables_result.failure:
+            return r[bool].fail(tables_result.error or "Failed to list target tables")
+        if destination.upper() in {name.upper() for name in tables_result.value}:
+            return r[bool].ok(False)
+        columns = [
+            m.DbOracle.Column(
+                name=column.name,
+                data_type=column.type_spec,
+                nullable=column.nullable,
+                primary_key=column.name in metadata.primary_keys,
+            )
+            for column in metadata.columns
+        ]
+        return (
+            self
+            .create_table_ddl(destination, columns, target_schema)
+            .flat_map(target.execute_statement)
+            .map(lambda _: True)
+        )
+
+    def _plan_copy_chunks(
+        self, metadata: m.DbOracle.TableMetadata, destination: str, chunk_count: int
+    ) -> p.Result[m.DbOracle.CopyCheckpoint]:
+        """Split the source into key ranges or hash buckets."""
+        columns = {column.name: column for column in metadata.columns}
+        key_column = (
+            columns.get(metadata.primary_keys[0])
+            if len(metadata.primary_keys) == 1
+            else None
+        )
+        numeric_key = (
+            key_column is not None
+            and key_column.data_type.upper().startswith(
+                tuple(c.DbOracle.NUMERIC_TYPE_PREFIXES)
+            )
+        )
+        if key_column is None or not numeric_key or chunk_count == 1:
+            return r[m.DbOracle.CopyCheckpoint].ok(
+                m.DbOracle.CopyCheckpoint(
+                    table_name=metadata.table_name,
+                    target_table=destination,
+                    strategy=c.DbOracle.CopyChunkStrategy.HASH,
+                    chunk_count=chunk_count,
+                )
+            )
+        key = column(self._normalize_identifier(key_column.name))
+        source = table(
+            self._normalize_identifier(metadata.table_name),
+            key,
+            schema=self._normalize_identifier(metadata.schema_name)
+            if metadata.schema_name
+            else None,
+        )
+        buckets = (
+            select(
+                key,
+                func.ntile(bindparam("chunk_count")).over(order_by=key).label("bucket"),
+            )
+            .select_from(source)
+            .subquery()
+        )
+        bounds = (
+            select(func.max(buckets.c[key.name]).label("upper_bound"))
+            .group_by(buckets.c.bucket)
+            .order_by(buckets.c.bucket)
+        )
+        return self.execute_query(
+            str(bounds.compile(dialect=oracle_dialect())),
+            m.ConfigMap(root={"chunk_count": chunk_count}),
+        ).map(
+            lambda rows: m.DbOracle.CopyCheckpoint(
+                table_name=metadata.table_name,
+                target_table=destination,
+                strategy=c.DbOracle.CopyChunkStrategy.PK_RANGE,
+                chunk_count=max(len(rows), 1),
+                boundaries=tuple(
+                    str(row.root.get("upper_bound") or row.root.get("UPPER_BOUND"))
+                    for row in rows[:-1]
+                ),
+            )
+        )
+
+    def _chunk_predicate(
+        self,
+        checkpoint: m.DbOracle.CopyCheckpoint,
+        metadata: m.DbOracle.TableMetadata,
+        chunk_id: int,
+    ) -> tuple[str, t.DbOracle.BindRow]:
+        """Render the WHERE predicate and binds selecting one chunk."""
+        if checkpoint.chunk_count == 1:
+            return "", {}
+        if checkpoint.strategy == c.DbOracle.CopyChunkStrategy.PK_RANGE:
+            key = self._quote_identifier(metadata.primary_keys[0])
+            clauses: MutableSequence[str] = []
+            params: dict[str, t.DbOracle.BindValue] = {}
+            if chunk_id > 0:
+                clauses.append(f"{key} > :chunk_lower")
+                params["chunk_lower"] = Decimal(checkpoint.boundaries[chunk_id - 1])
+            if chunk_id < checkpoint.chunk_count - 1:
+                clauses.append(f"{key} <= :chunk_upper")
+                params["chunk_upper"] = Decimal(checkpoint.boundaries[chunk_id])
+            return " AND ".join(clauses), params
+        hash_input = (
+            " || '|' || ".join(
+                self._quote_identifier(name) for name in metadata.primary_keys
+            )
+            or "ROWID"
+        )
+        return (
+            f"ORA_HASH({hash_input}, :chunk_max_bucket) = :chunk_id",
+            {"chunk_max_bucket": checkpoint.chunk_count - 1, "chunk_id": chunk_id},
+        )
+
+    def _run_table_copy(
+        self,
+        target: FlextDbOracleServices,
+        checkpoint: m.DbOracle.CopyCheckpoint,
+        metadata: m.DbOracle.TableMetadata,
+        select_sql: str,
+        insert_sql: str,
+        *,
+        parallelism: int,
+        batch_size: int,
+        max_in_flight: int,
+        checkpoint_path: Path | None,
+    ) -> p.Result[m.DbOracle.CopyResult]:
+        """Copy every chunk missing from the checkpoint with a worker pool."""
+        started = time.perf_counter()
+        completed = set(checkpoint.completed_chunks)
+        pending = [
+            chunk_id
+            for chunk_id in range(checkpoint.chunk_count)
+            if chunk_id not in completed
+        ]
+        if not pending:
+            self.logger.warning(
+                "Table copy checkpoint already complete; nothing copied",
+                table=metadata.table_name,
+                chunks_skipped=len(completed),
+                hint="pass restart=True to copy the table again",
+            )
+        column_names = [column.name for column in metadata.columns]
+        stop = threading.Event()
+        errors: MutableSequence[str] = []
+        rows_copied = 0
+        chunks_copied = 0
+        with ThreadPoolExecutor(
+            max_workers=max(min(parallelism, len(pending)), 1),
+            thread_name_prefix="flext-db-oracle-copy",
+        ) as pool:
+            futures = {}
+            for chunk_id in pending:
+                predicate, params = self._chunk_predicate(
+                    checkpoint, metadata, chunk_id
+                )
+                chunk_sql = (
+                    f"{select_sql} WHERE {predicate}" if predicate else select_sql
+                )
+                futures[
+                    pool.submit(
+                        self._copy_chunk,
+                        target,
+                        chunk_sql,
+                        params,
+                        insert_sql,
+                        column_names,
+                        batch_size,
+                        max_in_flight,
+                        stop,
+                    )
+                ] = chunk_id
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+                chunk_id = futures[future]
+                try:
+                    chunk_result = future.result()
+                except Exception as exc:
+                    self.logger.exception("Table copy chunk failed", chunk=chunk_id)
+                    chunk_result = r[int].fail(f"{type(exc).__name__}: {exc}")
+                if chunk_result.failure:
+                    errors.append(f"chunk {chunk_id}: {chunk_result.error}")
+                    stop.set()
+                    for other in futures:
+                        _ = other.cancel()
+                    continue
+                rows_copied += chunk_result.value
+                chunks_copied += 1
+                checkpoint = checkpoint.model_copy(
+                    update={
+                        "completed_chunks": (*checkpoint.completed_chunks, chunk_id),
+                        "rows_copied": checkpoint.rows_copied + chunk_result.value,
+                    }
+                )
+                self._save_copy_checkpoint(checkpoint_path, checkpoint)
+        if errors:
+            return r[m.DbOracle.CopyResult].fail(
+                f"Copy of {metadata.table_name} stopped with "
+                f"{len(checkpoint.completed_chunks)}/{checkpoint.chunk_count} "
+                f"chunks committed: {'; '.join(errors)}"
+            )
+        copy_result = m.DbOracle.CopyResult(
+            table_name=metadata.table_name,
+            target_table=checkpoint.target_table,
+            strategy=checkpoint.strategy,
+            rows_copied=rows_copied,
+            chunks_copied=chunks_copied,
+            chunks_skipped=len(completed),
+            elapsed_seconds=time.perf_counter() - started,
+        )
+        self.logger.info(
+            "Table copy finished",
+            table=metadata.table_name,
+            rows_copied=copy_result.rows_copied,
+            chunks_copied=copy_result.chunks_copied,
+            rows_per_second=round(copy_result.rows_per_second, 1),
+        )
+        return r[m.DbOracle.CopyResult].ok(copy_result)
+
+    def _copy_chunk(
+        self,
+        target: FlextDbOracleServices,
+        chunk_sql: str,
+        params: t.DbOracle.BindRow,
+        insert_sql: str,
+        column_names: t.StrSequence,
+        batch_size: int,
+        max_in_flight: int,
+        stop: threading.Event,
+    ) -> p.Result[int]:
+        """Stream one chunk into the target and commit it as one transaction.
+
+        A reader that fails for any reason records its error before closing
+        the stream, so the writer rolls the chunk back instead of
+        committing a partial chunk.
+        """
+        if stop.is_set():
+            return r[int].fail("Copy cancelled")
+        batches: queue.Queue[t.DbOracle.BindBatch | None] = queue.Queue(
+            maxsize=max_in_flight
+        )
+        chunk_stop = threading.Event()
+        read_errors: MutableSequence[str] = []
+
+        def _halted() -> bool:
+            return stop.is_set() or chunk_stop.is_set()
+
+        def _put(item: t.DbOracle.BindBatch | None) -> bool:
+            while not _halted():
+                try:
+                    batches.put(item, timeout=0.1)
+                except queue.Full:
+                    continue
+                return True
+            return False
+
+        def _feed() -> None:
+            for batch in self._stream_row_batches(
+                chunk_sql, params, batch_size, column_names
+            ):
+                if not _put(batch):
+                    return
+
+        def _read() -> None:
+            drained = False
+            try:
+                _feed()
+                drained = True
+            except c.DbOracle.EXC_DB_BROAD as exc:
+                read_errors.append(str(exc))
+            finally:
+                if not drained and not read_errors:
+                    read_errors.append("reader stopped unexpectedly")
+                _put(None)
+
+        reader = threading.Thread(target=_read, daemon=True)
+        reader.start()
+        try:
+            with target.fetch_connection() as conn:
+                copied, finished = self._write_chunk(
+                    conn, text(insert_sql), batches, _halted, read_errors
+                )
+        except (RuntimeError, *c.DbOracle.EXC_DB_BROAD) as e:
+            return r[int].fail_op("Chunk copy", e)
+        finally:
+            chunk_stop.set()
+            reader.join()
+        if read_errors:
+            return r[int].fail(f"Chunk read failed: {read_errors[0]}")
+        if not finished:
+            return r[int].fail("Copy cancelled")
+        return r[int].ok(copied)
+
+    def _write_chunk(
+        self,
+        conn: SAConnection,
+        statement: TextClause,
+        batches: queue.Queue[t.DbOracle.BindBatch | None],
+        halted: Callable[[], bool],
+        read_errors: t.StrSequence,
+    ) -> tuple[int, bool]:
+        """Insert queued batches in one transaction until the stream ends.
+
+        The transaction commits only when the reader closed the stream
+        without an error; otherwise it rolls back. Returns the inserted row
+        count and whether the chunk was committed.
+        """
+        transaction = conn.begin()
+        copied = 0
+        ended = False
+        while not ended:
+            try:
+                batch = batches.get(timeout=0.1)
+            except queue.Empty:
+                if halted():
+                    break
+                continue
+            if batch is None:
+                ended = True
+                continue
+            _ = self._connection_execute_many(conn, statement, batch)
+            copied += len(batch)
+        if ended and not read_errors:
+            transaction.commit()
+            return copied, True
+        transaction.rollback()
+        return copied, False
+
+    @staticmethod
+    def _load_copy_checkpoint(
+        path: Path | None,
+    ) -> p.Result[m.DbOracle.CopyCheckpoint | None]:
+        """Load a persisted copy checkpoint when one exists."""
+        if path is None or not path.is_file():
+            return r[m.DbOracle.CopyCheckpoint | None].ok(None)
+        try:
+            stored = m.DbOracle.CopyCheckpoint.model_validate_json(
+                path.read_text(encoding="utf-8")
+            )
+        except (OSError, c.ValidationError) as exc:
+            return r[m.DbOracle.CopyCheckpoint | None].fail(
+                f"Invalid copy checkpoint {path}: {exc}"
+            )
+        return r[m.DbOracle.CopyCheckpoint | None].ok(stored)
+
+    def _save_copy_checkpoint(
+        self, path: Path | None, checkpoint: m.DbOracle.CopyCheckpoint
+    ) -> None:
+        """Atomically persist the copy checkpoint after a chunk commits."""
+        if path is None:
+            return
+        staging = path.with_name(f"{path.name}.tmp")
+        try:
+            _ = staging.write_text(checkpoint.model_dump_json(), encoding="utf-8")
+            _ = staging.replace(path)
+        except OSError as exc:
+            self.logger.warning("Failed to persist copy checkpoint", error=str(exc))
+
+
+__all__: list[str] = ["FlextDbOracleServiceTableCopy"]
@@ -0,0 +1,312 @@
+"""Bulk upsert service mixin for flext-db-oracle.
+
+Upserts rows into Oracle tables: array-bound MERGE statements for
+moderate batches and a staging-table pipeline for set-based bulk merges.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import hashlib
+import itertools
+import re
+import time
+from typing import TYPE_CHECKING, override
+
+from sqlalchemy import text
+
+from flext_db_oracle import FlextDbOracleServiceBase, c, m, p, r, t
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from sqlalchemy import Connection as SAConnection
+
+
+class FlextDbOracleServiceUpsert(FlextDbOracleServiceBase):
+    """Mixin providing bulk upserts for FlextDbOracleServices.
+
+    Handles: upsert_rows, upsert_via_staging, staging table lifecycle.
+    """
+
+    @override
+    def upsert_rows(
+        self,
+        table_name: str,
+        rows: t.DbOracle.BindBatch,
+        key_columns: t.StrSequence,
+        *,
+        update_columns: t.StrSequence | None = None,
+        schema: str | None = None,
+        batch_size: int = c.DbOracle.DEFAULT_LOAD_BATCH_SIZE,
+    ) -> p.Result[int]:
+        """Upsert rows with one array-bound MERGE per batch.
+
+        Update columns default to every column of the first row that is not
+        a key. Each batch commits atomically; the result is the number of
+        rows merged across all batches. Committed rows count towards the
+        table's changes for ``gather_stats_if_stale``.
+        """
+        if batch_size < 1:
+            return r[int].fail("Batch size must be positive")
+        if not rows:
+            return r[int].ok(0)
+        merged_columns = (
+            list(update_columns)
+            if update_columns is not None
+            else [name for name in rows[0] if name not in key_columns]
+        )
+        merge_result = self.build_merge_statement(
+            table_name, key_columns, merged_columns, schema
+        )
+        if merge_result.failure:
+            return r[int].fail(merge_result.error or "Failed to build MERGE statement")
+        bound_columns = (*key_columns, *merged_columns)
+        merged = 0
+        with self.trace(
+            "upsert_rows",
+            {"db.collection.name": table_name, "db.operation.batch.size": len(rows)},
+        ) as span:
+            for start in range(0, len(rows), batch_size):
+                batch = [
+                    self.merge_binds(row, bound_columns)
+                    for row in rows[start : start + batch_size]
+                ]
+                batch_result = self.execute_batch(merge_result.value, batch)
+                if batch_result.failure:
+                    error = (
+                        f"Upsert into {table_name} failed after {merged} rows: "
+                        f"{batch_result.error}"
+                    )
+                    if span is not None:
+                        span.record_error(RuntimeError(error))
+                    self._track_row_changes(table_name, schema, merged)
+                    return r[int].fail(error)
+                merged += batch_result.value
+        self._track_row_changes(table_name, schema, merged)
+        return r[int].ok(merged)
+
+    def upsert_via_staging(
+        self,
+        table_name: str,
+        rows: Iterable[t.DbOracle.BindRow],
+        key_columns: t.StrSequence,
+        *,
+        update_columns: t.StrSequence | None = None,
+        schema: str | None = None,
+        batch_size: int = c.DbOracle.DEFAULT_LOAD_BATCH_SIZE,
+    ) -> p.Result[m.DbOracle.StagedUpsertResult]:
+        """Upsert rows through a staging table and one set-based MERGE.
+
+        The rows are direct-path array-loaded into a session-private global
+        temporary table shaped like the target, merged into the target with a
+        single ``MERGE ... USING stage`` and the stage is truncated. Every
+        phase runs on one connection so the session-private rows stay
+        visible; per-phase timings are reported in the result. Keys must be
+        unique within ``rows``. The stage lives in the connected user's
+        schema and its name carries a digest of the target and its columns,
+        so a target whose columns changed gets a new stage instead of
+        dropping one other sessions may still hold rows in. Merged rows
+        count towards the target's changes for ``gather_stats_if_stale``.
+        """
+        if batch_size < 1:
+            return r[m.DbOracle.StagedUpsertResult].fail("Batch size must be positive")
+        if not self.connected():
+            return r[m.DbOracle.StagedUpsertResult].fail("Not connected to database")
+        columns_result = self.fetch_columns(table_name, schema)
+        if columns_result.failure:
+            return r[m.DbOracle.StagedUpsertResult].fail(
+                columns_result.error or f"Failed to describe table {table_name}"
+            )
+        target_shape = [
+            (column.name, column.type_spec) for column in columns_result.value
+        ]
+        if not target_shape:
+            return r[m.DbOracle.StagedUpsertResult].fail(
+                f"Table {table_name} has no columns"
+            )
+        stage_name = self._staging_table_name(table_name, schema, target_shape)
+        row_iter = iter(rows)
+        first = next(row_iter, None)
+        if first is None:
+            return r[m.DbOracle.StagedUpsertResult].ok(
+                m.DbOracle.StagedUpsertResult(
+                    table_name=table_name, staging_table=stage_name
+                )
+            )
+        merged_columns = (
+            list(update_columns)
+            if update_columns is not None
+            else [name for name in first if name not in key_columns]
+        )
+        bound_columns = [*key_columns, *merged_columns]
+        started = time.perf_counter()
+        prepared = self._ensure_staging_table(stage_name, target_shape)
+        merge_result = self.build_merge_statement(
+            table_name, key_columns, merged_columns, schema, source_table=stage_name
+        )
+        insert_result = self.build_insert_statement(stage_name, bound_columns)
+        engine_result = self._get_engine()
+        if (
+            prepared.failure
+            or merge_result.failure
+            or insert_result.failure
+            or engine_result.failure
+        ):
+            return r[m.DbOracle.StagedUpsertResult].fail(
+                prepared.error
+                or merge_result.error
+                or insert_result.error
+                or engine_result.error
+                or "Failed to prepare staged upsert"
+            )
+        load_sql = insert_result.value.replace(
+            "INSERT INTO", f"INSERT {c.DbOracle.DIRECT_PATH_INSERT_HINT} INTO", 1
+        )
+        truncate_sql = f"TRUNCATE TABLE {self._qualified_name(stage_name)}"
+        result = m.DbOracle.StagedUpsertResult(
+            table_name=table_name, staging_table=stage_name
+        )
+        try:
+            with self._engine_connect(engine_result.value) as conn:
+                _ = self._connection_execute(conn, text(truncate_sql))
+                result = self._load_staging_table(
+                    conn,
+                    load_sql,
+                    itertools.chain((first,), row_iter),
+                    bound_columns,
+                    batch_size,
+                    result.model_copy(
+                        update={"prepare_seconds": time.perf_counter() - started}
+                    ),
+                )
+                result = self._merge_staging_table(
+                    conn, merge_result.value, truncate_sql, result
+                )
+        except c.DbOracle.EXC_DB_BROAD as e:
+            return r[m.DbOracle.StagedUpsertResult].fail_op("Staged upsert", e)
+        self._track_row_changes(table_name, schema, result.rows_merged)
+        self.logger.info(
+            "Staged upsert finished",
+            table=table_name,
+            rows_staged=result.rows_staged,
+            rows_merged=result.rows_merged,
+            load_seconds=round(result.load_seconds, 3),
+            merge_seconds=round(result.merge_seconds, 3),
+        )
+        return r[m.DbOracle.StagedUpsertResult].ok(result)
+
+    def _load_staging_table(
+        self,
+        conn: SAConnection,
+        load_sql: str,
+        rows: Iterable[t.DbOracle.BindRow],
+        bound_columns: t.StrSequence,
+        batch_size: int,
+        result: m.DbOracle.StagedUpsertResult,
+    ) -> m.DbOracle.StagedUpsertResult:
+        """Array-load rows into the stage with committed direct-path batches."""
+        started = time.perf_counter()
+        rows_staged, batches = self._direct_path_load(
+            conn, text(load_sql), rows, bound_columns, batch_size
+        )
+        return result.model_copy(
+            update={
+                "rows_staged": rows_staged,
+                "batches": batches,
+                "load_seconds": time.perf_counter() - started,
+            }
+        )
+
+    def _merge_staging_table(
+        self,
+        conn: SAConnection,
+        merge_sql: str,
+        truncate_sql: str,
+        result: m.DbOracle.StagedUpsertResult,
+    ) -> m.DbOracle.StagedUpsertResult:
+        """Merge the stage into the target, commit, then empty the stage."""
+        started = time.perf_counter()
+        merged = self._connection_execute(conn, text(merge_sql))
+        conn.commit()
+        merge_seconds = time.perf_counter() - started
+        started = time.perf_counter()
+        _ = self._connection_execute(conn, text(truncate_sql))
+        return result.model_copy(
+            update={
+                "rows_merged": max(merged.rowcount, 0),
+                "merge_seconds": merge_seconds,
+                "cleanup_seconds": time.perf_counter() - started,
+            }
+        )
+
+    def _ensure_staging_table(
+        self, stage_name: str, target_shape: Sequence[tuple[str, str]]
+    ) -> p.Result[bool]:
+        """Create the global temporary staging table unless it already exists.
+
+        The stage name already encodes ``target_shape``, so an existing stage
+        is reused as is and never dropped. A stage created concurrently by
+        another session between the lookup and the DDL counts as existing.
+        """
+        tables_result = self.fetch_tables()
+        engine_result = self._get_engine()
+        if tables_result.failure or engine_result.failure:
+            return r[bool].fail(
+                tables_result.error
+                or engine_result.error
+                or "Failed to look up staging tables"
+            )
+        if stage_name in tables_result.value:
+            return r[bool].ok(False)
+        stage_columns = [
+            m.DbOracle.Column(name=name, data_type=type_spec, nullable=True)
+            for name, type_spec in target_shape
+        ]
+        ddl_result = self.create_table_ddl(stage_name, stage_columns)
+        if ddl_result.failure:
+            return r[bool].fail(ddl_result.error or "Failed to build staging DDL")
+        ddl = ddl_result.value.replace(
+            "CREATE TABLE", "CREATE GLOBAL TEMPORARY TABLE", 1
+        )
+        try:
+            with self._engine_begin(engine_result.value) as conn:
+                _ = self._connection_execute(
+                    conn, text(f"{ddl} ON COMMIT PRESERVE ROWS")
+                )
+        except c.DbOracle.EXC_DB_BROAD as e:
+            if stage_name in self.fetch_tables().unwrap_or([]):
+                return r[bool].ok(False)
+            return r[bool].fail_op("Staging table creation", e)
+        return r[bool].ok(True)
+
+    @classmethod
+    def _staging_table_name(
+        cls,
+        table_name: str,
+        schema: str | None,
+        target_shape: Sequence[tuple[str, str]],
+    ) -> str:
+        """Derive the staging table name for a schema-qualified target shape.
+
+        The name keeps a readable form of the table name and ends in a
+        digest of the schema, table and column names and types, so
+        same-named tables in different schemas, and the same table before
+        and after a column change, get separate stages.
+        """
+        qualified = cls._dictionary_qualified_name(table_name, schema)
+        shape = ",".join(f"{name} {type_spec}" for name, type_spec in target_shape)
+        digest = hashlib.sha256(f"{qualified}|{shape}".encode()).hexdigest()[:8]
+        stem = re.sub(r"\W", "_", table_name.upper())
+        room = (
+            c.DbOracle.MAX_IDENTIFIER_LENGTH
+            - len(c.DbOracle.STAGING_TABLE_PREFIX)
+            - len(digest)
+            - 1
+        )
+        return f"{c.DbOracle.STAGING_TABLE_PREFIX}{stem[:room]}_{digest.upper()}"
+
+
+__all__: list[str] = ["FlextDbOracleServiceUpsert"]
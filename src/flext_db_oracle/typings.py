@@ -7,6 +7,10 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
+from collections.abc import Callable, Mapping, Sequence
+from datetime import date, datetime
+from decimal import Decimal
+
 import oracledb
 
 from flext_cli import t
@@ -23,6 +27,19 @@ class FlextDbOracleTypes(t):
 
         type QueryParameters = t.JsonMapping
         type CliScalar = t.Scalar | None
+        type BindValue = (
+            str | int | float | bool | Decimal | datetime | date | bytes | None
+        )
+        type BindRow = Mapping[str, BindValue]
+        type BindBatch = Sequence[BindRow]
+        type BindConverter = Callable[[t.JsonValue], BindValue]
+        type LoadRecord = tuple[int, t.JsonMapping | None, str]
+        type StatementRunner = Callable[[str], None]
+        type OperationEntry = tuple[str, float, bool, str, t.JsonMapping | None]
+        type JsonEncodable = (
+            BindValue | Mapping[str, JsonEncodable] | Sequence[JsonEncodable]
+        )
+        type JsonEncoder = Callable[[JsonEncodable], bytes]
 
 
 t = FlextDbOracleTypes
@@ -15,6 +15,7 @@ _LAZY_IMPORTS = build_lazy_import_map({
     ".test_conftest_constants": ("TestsFlextDbOracleConftestConstants",),
     ".test_constants": ("TestsFlextDbOracleConstants",),
     ".test_coverage_baseline": ("TestsFlextDbOracleCoverageBaseline",),
+    ".test_ddl_executor": ("TestsFlextDbOracleDdlExecutor",),
     ".test_dispatcher": ("TestsFlextDbOracleDispatcher",),
     ".test_exceptions": ("TestsFlextDbOracleExceptions",),
     ".test_fields": ("TestsFlextDbOracleFields",),
@@ -26,6 +26,7 @@ class TestsFlextDbOracleSettings:
         tm.that(settings.DbOracle.name, eq=c.DbOracle.DEFAULT_DATABASE_NAME)
         tm.that(settings.DbOracle.sid, none=True)
         tm.that(settings.DbOracle.enable_dispatcher, eq=False)
+        tm.that(settings.DbOracle.explain_slow_queries, eq=False)
 
     def test_model_dump_exposes_every_public_field(self) -> None:
         """model_dump surfaces the full public field set inside the namespace."""
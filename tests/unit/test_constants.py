@@ -379,6 +379,40 @@ class TestsFlextDbOracleConstants:
         twice = c.DbOracle.collapse_whitespace(once)
         tm.that(twice, eq=once)
 
+    @pytest.mark.parametrize(
+        ("sql", "schema", "table"),
+        [
+            ("UPDATE emp SET sal = 1", None, "emp"),
+            ('DELETE FROM "Hr"."Emp"', '"Hr"', '"Emp"'),
+            ("INSERT /*+ APPEND */ INTO hr.emp (id) VALUES (1)", "hr", "emp"),
+            (
+                (
+                    "INSERT ALL INTO emp (id) VALUES (:a) "
+                    "INTO emp (id) VALUES (:b) SELECT 1 FROM DUAL"
+                ),
+                None,
+                "emp",
+            ),
+            (
+                (
+                    "INSERT FIRST WHEN id > 1 THEN INTO hr.big VALUES (id) "
+                    "ELSE INTO small VALUES (id) SELECT id FROM src"
+                ),
+                "hr",
+                "big",
+            ),
+        ],
+    )
+    def test_dml_target_re_finds_the_written_table(
+        self, sql: str, schema: str | None, table: str
+    ) -> None:
+        """The DML target is the first INTO table of a multitable insert."""
+        target = c.DbOracle.DML_TARGET_RE.match(sql)
+        tm.that(target, none=False)
+        if target is not None:
+            tm.that(target.group("schema"), eq=schema)
+            tm.that(target.group("table"), eq=table)
+
     # ---- feature flag surfaced through settings public API --------------
 
     @pytest.mark.parametrize("enabled", [True, False])
@@ -0,0 +1,171 @@
+"""Behavioral tests for the parallel DDL executor.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+Jobs run against a fake driver that sleeps per statement, so scheduling,
+dependency ordering and failure isolation are observable without Oracle.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from flext_db_oracle import FlextDbOracleSettings
+from flext_db_oracle.services.facade import FlextDbOracleServices
+from flext_tests import tm
+from tests import c, m
+
+
+class TestsFlextDbOracleDdlExecutor:
+    """Scheduling contract of ``run_ddl_jobs`` with a simulated driver."""
+
+    class FakeDriver:
+        """Statement runner that simulates per-statement latency."""
+
+        def __init__(
+            self,
+            latency: float,
+            failing: frozenset[str] = frozenset(),
+            rendezvous: int = 0,
+        ) -> None:
+            """Configure latency, failing statements and a start rendezvous.
+
+            With ``rendezvous`` set, each statement blocks until that many
+            statements are in flight at once, and fails if they never are.
+            """
+            self.latency = latency
+            self.failing = failing
+            self.barrier = (
+                threading.Barrier(rendezvous, timeout=5) if rendezvous else None
+            )
+            self.started: list[str] = []
+            self.finished: list[str] = []
+            self.active = 0
+            self.peak = 0
+            self._lock = threading.Lock()
+
+        def __call__(self, sql: str) -> None:
+            """Record, sleep and optionally fail one statement."""
+            with self._lock:
+                self.started.append(sql)
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+            try:
+                if self.barrier is not None:
+                    _ = self.barrier.wait()
+                time.sleep(self.latency)
+                if sql in self.failing:
+                    msg = f"ORA-01652: unable to extend temp segment for {sql}"
+                    raise RuntimeError(msg)
+            finally:
+                with self._lock:
+                    self.active -= 1
+            with self._lock:
+                self.finished.append(sql)
+
+    @pytest.fixture
+    def service(self) -> FlextDbOracleServices:
+        """Unconnected services; the fake driver replaces the database."""
+        settings = FlextDbOracleSettings.model_validate({
+            "DbOracle": {
+                "host": "test-host",
+                "username": "test-user",
+                "password": "test-password",
+            }
+        })
+        return FlextDbOracleServices(settings=settings)
+
+    def test_independent_jobs_run_concurrently(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """Three jobs on three workers are all in flight at the same time."""
+        driver = self.FakeDriver(latency=0.01, rendezvous=3)
+        jobs = [
+            m.DbOracle.DdlJob(name=f"idx{n}", sql=f"CREATE INDEX I{n}")
+            for n in range(3)
+        ]
+        result = service.run_ddl_jobs(jobs, max_workers=3, runner=driver)
+        tm.ok(result)
+        tm.that(result.value.succeeded, eq=True)
+        tm.that(len(result.value.jobs), eq=3)
+        tm.that(driver.peak, eq=3)
+
+    def test_worker_limit_caps_concurrency(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """No more than ``max_workers`` statements are ever in flight."""
+        driver = self.FakeDriver(latency=0.02)
+        jobs = [
+            m.DbOracle.DdlJob(name=f"idx{n}", sql=f"CREATE INDEX I{n}")
+            for n in range(6)
+        ]
+        result = service.run_ddl_jobs(jobs, max_workers=2, runner=driver)
+        tm.ok(result)
+        tm.that(result.value.succeeded, eq=True)
+        tm.that(driver.peak <= 2, eq=True)
+
+    def test_dependencies_run_after_their_prerequisites(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """A statistics job waits for both index builds it depends on."""
+        driver = self.FakeDriver(latency=0.05)
+        jobs = [
+            m.DbOracle.DdlJob(name="stats", sql="GATHER", depends_on=["a", "b"]),
+            m.DbOracle.DdlJob(name="a", sql="CREATE INDEX A"),
+            m.DbOracle.DdlJob(name="b", sql="CREATE INDEX B"),
+        ]
+        result = service.run_ddl_jobs(jobs, max_workers=4, runner=driver)
+        tm.ok(result)
+        tm.that(driver.started[-1], eq="GATHER")
+        tm.that(set(driver.finished[:2]), eq={"CREATE INDEX A", "CREATE INDEX B"})
+
+    def test_failure_skips_dependents_only(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """A failed job skips its dependents while unrelated jobs still succeed."""
+        driver = self.FakeDriver(latency=0.01, failing=frozenset({"CREATE INDEX A"}))
+        jobs = [
+            m.DbOracle.DdlJob(name="a", sql="CREATE INDEX A"),
+            m.DbOracle.DdlJob(name="a_stats", sql="GATHER A", depends_on=["a"]),
+            m.DbOracle.DdlJob(name="b", sql="CREATE INDEX B"),
+        ]
+        result = service.run_ddl_jobs(jobs, max_workers=2, runner=driver)
+        tm.ok(result)
+        statuses = {job.name: job.status for job in result.value.jobs}
+        tm.that(
+            statuses,
+            eq={
+                "a": c.DbOracle.DdlJobStatus.FAILED,
+                "a_stats": c.DbOracle.DdlJobStatus.SKIPPED,
+                "b": c.DbOracle.DdlJobStatus.SUCCEEDED,
+            },
+        )
+        tm.that(result.value.succeeded, eq=False)
+        tm.that("GATHER A" not in driver.started, eq=True)
+        failed = next(job for job in result.value.jobs if job.name == "a")
+        tm.that(failed.error, has="ORA-01652")
+
+    def test_invalid_job_graphs_are_rejected(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """Unknown dependencies and cycles fail before anything runs."""
+        driver = self.FakeDriver(latency=0.0)
+        unknown = [m.DbOracle.DdlJob(name="a", sql="X", depends_on=["missing"])]
+        cyclic = [
+            m.DbOracle.DdlJob(name="a", sql="X", depends_on=["b"]),
+            m.DbOracle.DdlJob(name="b", sql="Y", depends_on=["a"]),
+        ]
+        tm.fail(service.run_ddl_jobs(unknown, runner=driver), has="Unknown")
+        tm.fail(service.run_ddl_jobs(cyclic, runner=driver), has="Cyclic")
+        tm.that(driver.started, eq=[])
+
+    def test_database_runner_requires_connection(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """Without a fake driver the executor needs a connected service."""
+        jobs = [m.DbOracle.DdlJob(name="a", sql="CREATE INDEX A")]
+        tm.fail(service.run_ddl_jobs(jobs), has="Not connected")
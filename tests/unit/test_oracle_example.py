@@ -13,18 +13,26 @@ error-path cases do not require a ready database.
 from __future__ import annotations
 
 import contextlib
+import io
+import json
+import threading
+import time
+from collections.abc import Mapping
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import pytest
+from sqlalchemy import literal, select
+from sqlalchemy.dialects import oracle
 
 from flext_db_oracle import FlextDbOracleSettings
 from flext_db_oracle.api import FlextDbOracleApi
 from flext_db_oracle.services.facade import FlextDbOracleServices
 from flext_tests import tm
-from tests import u
+from tests import c, m, u
 
 if TYPE_CHECKING:
-    from tests import m, t
+    from tests import t
 
 # Live Oracle paths pull the session docker fixture via real_oracle_settings.
 pytestmark = pytest.mark.docker
@@ -71,6 +79,15 @@ class TestsFlextDbOracleOracleExample:
         tm.that(connection.connected(), eq=True)
         return connection
 
+    @staticmethod
+    def _literal_select(value: int) -> str:
+        """Render ``SELECT <value> FROM DUAL`` with the value inlined."""
+        return str(
+            select(literal(value)).compile(
+                dialect=oracle.dialect(), compile_kwargs={"literal_binds": True}
+            )
+        )
+
     # ------------------------------------------------------------------
     # Services facade: connection lifecycle
     # ------------------------------------------------------------------
@@ -121,7 +138,7 @@ class TestsFlextDbOracleOracleExample:
     def test_execute_many_returns_affected_row_count(
         self, real_oracle_config: FlextDbOracleSettings
     ) -> None:
-        """``execute_many`` reports the number of rows inserted."""
+        """``execute_many`` reports the rows inserted, whatever their key sets."""
         connection = self._connect_services(real_oracle_config)
         try:
             with contextlib.suppress(Exception):
@@ -135,21 +152,830 @@ class TestsFlextDbOracleOracleExample:
                 {"id": 2, "name": "Test 2"},
                 {"id": 3, "name": "Test 3"},
             ]
-            result = connection.execute_many(
-                "INSERT INTO temp_test_table (id, name) VALUES (:id, :name)",
-                params_list,
-            )
+            sql = "INSERT INTO temp_test_table (id, name) VALUES (:id, :name)"
+            result = connection.execute_many(sql, params_list)
             tm.ok(result)
             tm.that(result.value, eq=3)
+            mixed = connection.execute_many(
+                sql, [{"id": 4, "name": "Test 4"}, {"id": 5, "name": "x", "note": "y"}]
+            )
+            tm.that(tm.ok(mixed), eq=2)
         finally:
             with contextlib.suppress(Exception):
                 connection.execute_statement("DROP TABLE temp_test_table")
             connection.disconnect()
 
+    def test_load_file_inserts_rows_and_counts_rejects(
+        self, real_oracle_config: FlextDbOracleSettings, tmp_path: Path
+    ) -> None:
+        """``load_file`` array-inserts typed CSV rows and reports rejected lines."""
+        connection = self._connect_services(real_oracle_config)
+        source = tmp_path / "load.csv"
+        source.write_text(
+            "id,name\n1,alpha\n2,beta\nnot-a-number,gamma\n3,delta\n", encoding="utf-8"
+        )
+        try:
+            with contextlib.suppress(Exception):
+                connection.execute_statement("DROP TABLE temp_load_table")
+            tm.ok(
+                connection.execute_statement(
+                    "CREATE TABLE temp_load_table (id NUMBER, name VARCHAR2(100))"
+                )
+            )
+            result = connection.load_file("temp_load_table", source, batch_size=2)
+            tm.ok(result)
+            tm.that(result.value.rows_loaded, eq=3)
+            tm.that(result.value.rows_rejected, eq=1)
+            tm.that(result.value.batches, eq=2)
+        finally:
+            with contextlib.suppress(Exception):
+                connection.execute_statement("DROP TABLE temp_load_table")
+            connection.disconnect()
+
+    def test_upsert_rows_updates_matches_and_inserts_new_keys(
+        self, real_oracle_config: FlextDbOracleSettings
+    ) -> None:
+        """``upsert_rows`` merges a batch: existing keys update, new keys insert."""
+        connection = self._connect_services(real_oracle_config)
+        try:
+            with contextlib.suppress(Exception):
+                connection.execute_statement("DROP TABLE temp_upsert_table")
+            tm.ok(
+                connection.execute_statement(
+                    "CREATE TABLE temp_upsert_table "
+                    "(id NUMBER PRIMARY KEY, name VARCHAR2(40))"
+                )
+            )
+            tm.ok(
+                connection.upsert_rows(
+                    "temp_upsert_table", [{"id": 1, "name": "a"}], ["id"]
+                )
+            )
+            result = connection.upsert_rows(
+                "temp_upsert_table",
+                [{"id": 1, "name": "updated"}, {"id": 2, "name": "b"}],
+                ["id"],
+            )
+            tm.ok(result)
+            tm.that(result.value, eq=2)
+            row = connection.fetch_one(
+                "SELECT name FROM temp_upsert_table WHERE id = 1"
+            )
+            tm.ok(row)
+            tm.that(str(row.value), has="updated")
+        finally:
+            with contextlib.suppress(Exception):
+                connection.execute_statement("DROP TABLE temp_upsert_table")
+            connection.disconnect()
+
+    def test_upsert_via_staging_reports_phase_metrics(
+        self, real_oracle_config: FlextDbOracleSettings
+    ) -> None:
+        """``upsert_via_staging`` stages, merges and reports each phase."""
+        connection = self._connect_services(real_oracle_config)
+        stages: list[str] = []
+        try:
+            with contextlib.suppress(Exception):
+                connection.execute_statement("DROP TABLE temp_staged_table")
+            tm.ok(
+                connection.execute_statement(
+                    "CREATE TABLE temp_staged_table "
+                    "(id NUMBER PRIMARY KEY, name VARCHAR2(40))"
+                )
+            )
+            rows = ({"id": index, "name": f"row-{index}"} for index in range(50))
+            result = connection.upsert_via_staging(
+                "temp_staged_table", rows, ["id"], batch_size=20
+            )
+            tm.ok(result)
+            tm.that(result.value.rows_staged, eq=50)
+            tm.that(result.value.rows_merged, eq=50)
+            tm.that(result.value.batches, eq=3)
+            stages.append(result.value.staging_table)
+            tm.that(stages[0], has="STG_TEMP_STAGED_TABLE_")
+            tm.ok(
+                connection.execute_statement(
+                    "ALTER TABLE temp_staged_table ADD (note VARCHAR2(20))"
+                )
+            )
+            noted = connection.upsert_via_staging(
+                "temp_staged_table", [{"id": 1, "name": "one", "note": "x"}], ["id"]
+            )
+            tm.ok(noted)
+            tm.that(noted.value.rows_merged, eq=1)
+            stages.append(noted.value.staging_table)
+            tm.that(stages[1], ne=stages[0])
+        finally:
+            with contextlib.suppress(Exception):
+                connection.execute_statement("DROP TABLE temp_staged_table")
+            for stage in stages:
+                with contextlib.suppress(Exception):
+                    connection.execute_statement(f"TRUNCATE TABLE {stage}")
+                    connection.execute_statement(f"DROP TABLE {stage}")
+            connection.disconnect()
+
+    def test_copy_table_creates_target_and_resumes_from_checkpoint(
+        self, real_oracle_config: FlextDbOracleSettings, tmp_path: Path
+    ) -> None:
+        """``copy_table`` skips committed chunks on resume and recopies on restart."""
+        source = self._connect_services(real_oracle_config)
+        target = self._connect_services(real_oracle_config)
+        checkpoint = tmp_path / "copy.json"
+        try:
+            for table in ("temp_copy_source", "temp_copy_target"):
+                with contextlib.suppress(Exception):
+                    source.execute_statement(f"DROP TABLE {table}")
+            tm.ok(
+                source.execute_statement(
+                    "CREATE TABLE temp_copy_source "
+                    "(id NUMBER PRIMARY KEY, name VARCHAR2(40))"
+                )
+            )
+            tm.ok(
+                source.execute_batch(
+                    "INSERT INTO temp_copy_source (id, name) VALUES (:id, :name)",
+                    [{"id": index, "name": f"row-{index}"} for index in range(1, 101)],
+                )
+            )
+            result = source.copy_table(
+                target,
+                "TEMP_COPY_SOURCE",
+                target_table="TEMP_COPY_TARGET",
+                parallelism=2,
+                chunk_count=4,
+                batch_size=10,
+                checkpoint_path=checkpoint,
+            )
+            tm.ok(result)
+            tm.that(result.value.strategy, eq=c.DbOracle.CopyChunkStrategy.PK_RANGE)
+            tm.that(result.value.rows_copied, eq=100)
+            resumed = source.copy_table(
+                target,
+                "TEMP_COPY_SOURCE",
+                target_table="TEMP_COPY_TARGET",
+                checkpoint_path=checkpoint,
+            )
+            tm.ok(resumed)
+            tm.that(resumed.value.rows_copied, eq=0)
+            tm.that(resumed.value.chunks_skipped, eq=4)
+            tm.ok(source.execute_statement("TRUNCATE TABLE temp_copy_target"))
+            restarted = source.copy_table(
+                target,
+                "TEMP_COPY_SOURCE",
+                target_table="TEMP_COPY_TARGET",
+                chunk_count=2,
+                checkpoint_path=checkpoint,
+                restart=True,
+            )
+            tm.ok(restarted)
+            tm.that(restarted.value.rows_copied, eq=100)
+            tm.that(restarted.value.chunks_skipped, eq=0)
+        finally:
+            for table in ("temp_copy_source", "temp_copy_target"):
+                with contextlib.suppress(Exception):
+                    source.execute_statement(f"DROP TABLE {table}")
+            source.disconnect()
+            target.disconnect()
+
     # ------------------------------------------------------------------
     # API facade: context manager and metadata queries
     # ------------------------------------------------------------------
 
+    def test_gather_stats_if_stale_tracks_changed_rows(
+        self, real_oracle_config: FlextDbOracleSettings
+    ) -> None:
+        """Statistics are gathered first, then only once changes reach the threshold."""
+        connection = self._connect_services(real_oracle_config)
+        options = m.DbOracle.StatsOptions(stale_fraction=0.5)
+        try:
+            with contextlib.suppress(Exception):
+                connection.execute_statement("DROP TABLE temp_stats_table")
+            tm.ok(
+                connection.execute_statement(
+                    "CREATE TABLE temp_stats_table AS "
+                    "SELECT LEVEL AS id FROM DUAL CONNECT BY LEVEL <= 100"
+                )
+            )
+            first = connection.gather_stats_if_stale(
+                "temp_stats_table", 100, options=options
+            )
+            tm.ok(first)
+            tm.that(first.value.gathered, eq=True)
+            below = connection.gather_stats_if_stale(
+                "temp_stats_table", 20, options=options
+            )
+            tm.ok(below)
+            tm.that(below.value.gathered, eq=False)
+            tm.that(below.value.analyzed_rows, eq=100)
+            reached = connection.gather_stats_if_stale(
+                "temp_stats_table", 30, options=options
+            )
+            tm.ok(reached)
+            tm.that(reached.value.gathered, eq=True)
+            tm.that(reached.value.rows_changed, eq=50)
+        finally:
+            with contextlib.suppress(Exception):
+                connection.execute_statement("DROP TABLE temp_stats_table")
+            connection.disconnect()
+
+    def test_dml_helpers_count_rows_towards_stale_statistics(
+        self, real_oracle_config: FlextDbOracleSettings
+    ) -> None:
+        """execute_many, INSERT ALL and both upsert paths feed the change count."""
+        connection = self._connect_services(real_oracle_config)
+        options = m.DbOracle.StatsOptions(stale_fraction=0.5)
+        try:
+            with contextlib.suppress(Exception):
+                connection.execute_statement("DROP TABLE temp_stats_dml")
+            tm.ok(
+                connection.execute_statement(
+                    "CREATE TABLE temp_stats_dml (id NUMBER PRIMARY KEY, val NUMBER)"
+                )
+            )
+            tm.ok(
+                connection.execute_statement(
+                    "INSERT INTO temp_stats_dml "
+                    "SELECT LEVEL, 0 FROM DUAL CONNECT BY LEVEL <= 100"
+                )
+            )
+            tm.ok(connection.gather_table_stats("temp_stats_dml"))
+            tm.ok(
+                connection.execute_many(
+                    "INSERT INTO temp_stats_dml (id, val) VALUES (:id, :val)",
+                    [{"id": 100 + n, "val": 1} for n in range(1, 21)],
+                )
+            )
+            tm.ok(
+                connection.upsert_rows(
+                    "temp_stats_dml",
+                    [{"ID": n, "VAL": 2} for n in range(1, 11)],
+                    ["ID"],
+                )
+            )
+            tm.ok(
+                connection.execute_insert_all(
+                    "temp_stats_dml", [{"ID": 200 + n, "VAL": 4} for n in range(1, 6)]
+                )
+            )
+            below = tm.ok(
+                connection.gather_stats_if_stale("temp_stats_dml", 0, options=options)
+            )
+            tm.that(below.gathered, eq=False)
+            tm.that(below.rows_changed, eq=35)
+            tm.ok(
+                connection.upsert_via_staging(
+                    "temp_stats_dml",
+                    [{"ID": n, "VAL": 3} for n in range(11, 31)],
+                    ["ID"],
+                )
+            )
+            reached = tm.ok(
+                connection.gather_stats_if_stale("temp_stats_dml", 0, options=options)
+            )
+            tm.that(reached.gathered, eq=True)
+            tm.that(reached.rows_changed, eq=55)
+        finally:
+            with contextlib.suppress(Exception):
+                connection.execute_statement("DROP TABLE temp_stats_dml")
+            connection.disconnect()
+
+    def test_full_refresh_swaps_shadow_table_by_rename(
+        self, real_oracle_config: FlextDbOracleSettings
+    ) -> None:
+        """``full_refresh`` replaces the rows and restores names, grants and logging."""
+        connection = self._connect_services(real_oracle_config)
+        try:
+            with contextlib.suppress(Exception):
+                connection.execute_statement("DROP TABLE temp_refresh_table")
+            for statement in (
+                (
+                    "CREATE TABLE temp_refresh_table (id NUMBER, name VARCHAR2(40), "
+                    "CONSTRAINT temp_refresh_pk PRIMARY KEY (id))"
+                ),
+                "CREATE INDEX temp_refresh_name_ix ON temp_refresh_table (name)",
+                "INSERT INTO temp_refresh_table VALUES (1, 'stale')",
+                "GRANT SELECT ON temp_refresh_table TO PUBLIC",
+            ):
+                tm.ok(connection.execute_statement(statement))
+            rows = ({"ID": index, "NAME": f"row-{index}"} for index in range(30))
+            result = connection.full_refresh(
+                "temp_refresh_table", rows=rows, batch_size=10, index_workers=2
+            )
+            tm.ok(result)
+            tm.that(result.value.rows_loaded, eq=30)
+            tm.that(result.value.indexes_built, eq=2)
+            tm.that(result.value.shadow_table, eq="SHD_TEMP_REFRESH_TABLE")
+            stale = connection.execute_query(
+                "SELECT COUNT(*) FROM temp_refresh_table WHERE name = 'stale'"
+            )
+            tm.ok(stale)
+            tm.that(int(str(self._first_cell(stale.value[0]))), eq=0)
+            indexes = connection.execute_query(
+                "SELECT index_name FROM user_indexes "
+                "WHERE table_name = 'TEMP_REFRESH_TABLE' ORDER BY index_name"
+            )
+            tm.ok(indexes)
+            tm.that(
+                [str(self._first_cell(row)) for row in indexes.value],
+                eq=["TEMP_REFRESH_NAME_IX", "TEMP_REFRESH_PK"],
+            )
+            tm.that(result.value.grants_restored, eq=1)
+            grants = connection.execute_query(
+                "SELECT privilege FROM user_tab_privs "
+                "WHERE table_name = 'TEMP_REFRESH_TABLE' AND grantee = 'PUBLIC'"
+            )
+            tm.ok(grants)
+            tm.that([str(self._first_cell(row)) for row in grants.value], eq=["SELECT"])
+            logging = connection.execute_query(
+                "SELECT logging FROM user_tables "
+                "WHERE table_name = 'TEMP_REFRESH_TABLE' "
+                "UNION ALL SELECT logging FROM user_indexes "
+                "WHERE table_name = 'TEMP_REFRESH_TABLE'"
+            )
+            tm.ok(logging)
+            tm.that({str(self._first_cell(row)) for row in logging.value}, eq={"YES"})
+            retired = connection.execute_query(
+                "SELECT COUNT(*) FROM user_tables "
+                "WHERE table_name = 'OLD_TEMP_REFRESH_TABLE'"
+            )
+            tm.ok(retired)
+            tm.that(int(str(self._first_cell(retired.value[0]))), eq=0)
+        finally:
+            with contextlib.suppress(Exception):
+                connection.execute_statement("DROP TABLE temp_refresh_table PURGE")
+            connection.disconnect()
+
+    def test_full_refresh_refuses_taken_names_and_lossy_renames(
+        self, real_oracle_config: FlextDbOracleSettings
+    ) -> None:
+        """A taken shadow name or a column default stops the refresh untouched."""
+        connection = self._connect_services(real_oracle_config)
+        tables = ("temp_refresh_guard", "shd_temp_refresh_guard")
+        try:
+            for table in tables:
+                with contextlib.suppress(Exception):
+                    connection.execute_statement(f"DROP TABLE {table}")
+            for statement in (
+                "CREATE TABLE temp_refresh_guard (id NUMBER PRIMARY KEY)",
+                "CREATE TABLE shd_temp_refresh_guard (note VARCHAR2(10))",
+                "INSERT INTO shd_temp_refresh_guard VALUES ('keep')",
+            ):
+                tm.ok(connection.execute_statement(statement))
+            taken = connection.full_refresh("temp_refresh_guard", rows=[{"ID": 1}])
+            tm.fail(taken, has="SHD_TEMP_REFRESH_GUARD")
+            kept = connection.execute_query("SELECT note FROM shd_temp_refresh_guard")
+            tm.that(len(tm.ok(kept)), eq=1)
+            tm.ok(connection.execute_statement("DROP TABLE shd_temp_refresh_guard"))
+            tm.ok(
+                connection.execute_statement(
+                    "ALTER TABLE temp_refresh_guard ADD (flag NUMBER DEFAULT 0)"
+                )
+            )
+            lossy = connection.full_refresh("temp_refresh_guard", rows=[{"ID": 1}])
+            tm.fail(lossy, has="default of FLAG")
+        finally:
+            for table in tables:
+                with contextlib.suppress(Exception):
+                    connection.execute_statement(f"DROP TABLE {table}")
+            connection.disconnect()
+
+    def test_extract_incremental_resumes_from_bookmark(
+        self, real_oracle_config: FlextDbOracleSettings
+    ) -> None:
+        """A second extraction only returns rows at or past the bookmark."""
+        connection = self._connect_services(real_oracle_config)
+        try:
+            with contextlib.suppress(Exception):
+                connection.execute_statement("DROP TABLE temp_incremental_table")
+            tm.ok(
+                connection.execute_statement(
+                    "CREATE TABLE temp_incremental_table AS "
+                    "SELECT LEVEL AS id, 'row' AS name FROM DUAL CONNECT BY LEVEL <= 25"
+                )
+            )
+            first = connection.extract_incremental(
+                "temp_incremental_table", replication_key="id", batch_size=10
+            )
+            tm.ok(first)
+            batches = list(first.value)
+            tm.that([len(batch) for batch, _ in batches], eq=[10, 10, 5])
+            bookmark = batches[-1][1]
+            tm.that(bookmark.replication_key_value, eq=25)
+            tm.ok(
+                connection.execute_statement(
+                    "INSERT INTO temp_incremental_table VALUES (26, 'new')"
+                )
+            )
+            second = connection.extract_incremental(
+                "temp_incremental_table", bookmark=bookmark
+            )
+            tm.ok(second)
+            rows = [row for batch, _ in second.value for row in batch]
+            tm.that([row["ID"] for row in rows], eq=[25, 26])
+        finally:
+            with contextlib.suppress(Exception):
+                connection.execute_statement("DROP TABLE temp_incremental_table")
+            connection.disconnect()
+
+    def test_run_singer_tap_emits_schema_records_and_state(
+        self, real_oracle_config: FlextDbOracleSettings
+    ) -> None:
+        """The tap writes one SCHEMA, every row as RECORD and a STATE per batch."""
+        connection = self._connect_services(real_oracle_config)
+        output = io.BytesIO()
+        try:
+            with contextlib.suppress(Exception):
+                connection.execute_statement("DROP TABLE temp_tap_table")
+            tm.ok(
+                connection.execute_statement(
+                    "CREATE TABLE temp_tap_table AS SELECT LEVEL AS id, "
+                    "SYSDATE AS created_at FROM DUAL CONNECT BY LEVEL <= 12"
+                )
+            )
+            result = connection.run_singer_tap(
+                "temp_tap_table", replication_key="id", output=output, batch_size=5
+            )
+            tm.ok(result)
+            tm.that(result.value.rows_emitted, eq=12)
+            tm.that(result.value.batches, eq=3)
+            messages = [json.loads(line) for line in output.getvalue().splitlines()]
+            types = [message["type"] for message in messages]
+            tm.that(types[0], eq="SCHEMA")
+            tm.that(types.count("RECORD"), eq=12)
+            tm.that(types.count("STATE"), eq=3)
+            tm.that(
+                messages[-1]["value"]["bookmarks"]["TEMP_TAP_TABLE"][
+                    "replication_key_value"
+                ],
+                eq=12,
+            )
+        finally:
+            with contextlib.suppress(Exception):
+                connection.execute_statement("DROP TABLE temp_tap_table")
+            connection.disconnect()
+
+    def test_run_singer_target_merges_records_and_emits_state(
+        self, real_oracle_config: FlextDbOracleSettings
+    ) -> None:
+        """The target creates the table, merges keyed records, then emits STATE."""
+        connection = self._connect_services(real_oracle_config)
+        state_output = io.BytesIO()
+        schema_message = {
+            "type": "SCHEMA",
+            "stream": "SRC-TEMP_TARGET_TABLE",
+            "schema": {
+                "properties": {
+                    "id": {"type": "integer"},
+                    "name": {"type": ["null", "string"]},
+                    "updated_at": {"type": "string", "format": "date-time"},
+                }
+            },
+            "key_properties": ["id"],
+        }
+        records = [
+            {
+                "type": "RECORD",
+                "stream": "SRC-TEMP_TARGET_TABLE",
+                "record": {
+                    "id": index % 5,
+                    "name": f"name-{index}",
+                    "updated_at": "2025-01-01T00:00:00",
+                },
+            }
+            for index in range(8)
+        ]
+        state = {"type": "STATE", "value": {"bookmarks": {"SRC-TEMP": {"id": 7}}}}
+        lines = [json.dumps(message) for message in (schema_message, *records, state)]
+        try:
+            with contextlib.suppress(Exception):
+                connection.execute_statement("DROP TABLE temp_target_table")
+            result = connection.run_singer_target(
+                lines, state_output=state_output, batch_size=3
+            )
+            tm.ok(result)
+            tm.that(list(result.value.tables_created), eq=["TEMP_TARGET_TABLE"])
+            tm.that(result.value.records_received, eq=8)
+            tm.that(result.value.rows_written, eq=8)
+            tm.that(result.value.batches, eq=3)
+            tm.that(result.value.states_emitted, eq=1)
+            tm.that(json.loads(state_output.getvalue()), eq=state["value"])
+            count_result = connection.execute_query(
+                "SELECT COUNT(*) FROM temp_target_table"
+            )
+            tm.ok(count_result)
+            tm.that(self._first_cell(count_result.value[0]), eq=5)
+        finally:
+            with contextlib.suppress(Exception):
+                connection.execute_statement("DROP TABLE temp_target_table")
+            connection.disconnect()
+
+    def test_run_singer_target_evolves_existing_table(
+        self, real_oracle_config: FlextDbOracleSettings
+    ) -> None:
+        """A SCHEMA with new or wider properties alters the table in place."""
+        connection = self._connect_services(real_oracle_config)
+        schema_message = {
+            "type": "SCHEMA",
+            "stream": "TEMP_EVOLVE_TABLE",
+            "schema": {
+                "properties": {
+                    "id": {"type": "integer"},
+                    "name": {"type": "string"},
+                    "score": {"type": "number"},
+                }
+            },
+            "key_properties": [],
+        }
+        record = {
+            "type": "RECORD",
+            "stream": "TEMP_EVOLVE_TABLE",
+            "record": {"id": 1, "name": "x" * 50, "score": 1.5},
+        }
+        try:
+            with contextlib.suppress(Exception):
+                connection.execute_statement("DROP TABLE temp_evolve_table")
+            tm.ok(
+                connection.execute_statement(
+                    "CREATE TABLE temp_evolve_table (id NUMBER(38), name VARCHAR2(10))"
+                )
+            )
+            result = connection.run_singer_target(
+                [json.dumps(schema_message), json.dumps(record)],
+                state_output=io.BytesIO(),
+            )
+            tm.ok(result)
+            tm.that(list(result.value.tables_altered), eq=["TEMP_EVOLVE_TABLE"])
+            tm.that(result.value.rows_written, eq=1)
+            columns_result = connection.fetch_columns("TEMP_EVOLVE_TABLE")
+            tm.ok(columns_result)
+            lengths = {
+                column.name: column.data_length for column in columns_result.value
+            }
+            tm.that(lengths["NAME"], eq=4000)
+            tm.that("SCORE" in lengths, eq=True)
+        finally:
+            with contextlib.suppress(Exception):
+                connection.execute_statement("DROP TABLE temp_evolve_table")
+            connection.disconnect()
+
+    def test_queries_and_dml_are_instrumented(
+        self, real_oracle_config: FlextDbOracleSettings
+    ) -> None:
+        """Every query and DML call feeds the operation log and metrics."""
+        connection = self._connect_services(real_oracle_config)
+        try:
+            tm.ok(connection.execute_query("SELECT 'abc' AS v FROM DUAL"))
+            tm.ok(connection.execute_statement("BEGIN NULL; END;"))
+            tm.that(connection.execute_query("SELECT * FROM no_such").failure, eq=True)
+            metrics = tm.ok(connection.fetch_metrics())
+            select = metrics.operations["SELECT"]
+            assert isinstance(select, Mapping)
+            tm.that(select["count"], eq=2)
+            tm.that(select["error_rate"], eq=0.5)
+            tm.that(metrics.operations, has="BEGIN")
+            tm.that(metrics.metrics["db_oracle_statements_total"], eq="3")
+            tm.that(metrics.metrics["db_oracle_statement_errors_total"], eq="1")
+            tm.that(metrics.metrics["db_oracle_bytes_total"], eq="3")
+            operations = tm.ok(connection.fetch_operations())
+            tm.that(operations[-1].metadata_info, has="checkout_seconds")
+            tm.that(operations[-1].metadata_info, has="fingerprint")
+            tm.that(operations[-1].metadata_info, lacks="operation_type")
+        finally:
+            connection.disconnect()
+
+    def test_execute_insert_all_is_instrumented(
+        self, real_oracle_config: FlextDbOracleSettings
+    ) -> None:
+        """An INSERT ALL call is timed as one INSERT statement."""
+        connection = self._connect_services(real_oracle_config)
+        try:
+            with contextlib.suppress(Exception):
+                connection.execute_statement("DROP TABLE temp_insert_all_table")
+            tm.ok(
+                connection.execute_statement(
+                    "CREATE TABLE temp_insert_all_table (id NUMBER, name VARCHAR2(10))"
+                )
+            )
+            rows = [{"ID": index, "NAME": f"n{index}"} for index in range(5)]
+            tm.that(
+                tm.ok(
+                    connection.execute_insert_all(
+                        "temp_insert_all_table", rows, rows_per_statement=2
+                    )
+                ),
+                eq=5,
+            )
+            insert = tm.ok(connection.fetch_metrics()).operations["INSERT"]
+            assert isinstance(insert, Mapping)
+            tm.that(insert["count"], eq=1)
+            stats = tm.ok(
+                connection.fetch_statement_stats(
+                    order_by=c.DbOracle.StatementStatsOrder.ROWS, limit=1
+                )
+            )
+            tm.that(stats[0].rows, eq=5)
+        finally:
+            with contextlib.suppress(Exception):
+                connection.execute_statement("DROP TABLE temp_insert_all_table")
+            connection.disconnect()
+
+    def test_statement_stats_group_literal_variants(
+        self, real_oracle_config: FlextDbOracleSettings
+    ) -> None:
+        """Queries differing only in literals aggregate under one fingerprint."""
+        connection = self._connect_services(real_oracle_config)
+        try:
+            tm.ok(connection.execute_query("SELECT 1 FROM DUAL"))
+            tm.ok(connection.execute_query("select 2 from dual"))
+            stats = tm.ok(
+                connection.fetch_statement_stats(
+                    order_by=c.DbOracle.StatementStatsOrder.CALLS, limit=1
+                )
+            )
+            tm.that(stats[0].normalized_sql, eq="select ? from dual")
+            tm.that(stats[0].count, eq=2)
+            tm.that(stats[0].rows, eq=2)
+            tm.that(stats[0].mean_seconds > 0, eq=True)
+            tm.ok(connection.reset_statement_stats())
+            tm.that(tm.ok(connection.fetch_statement_stats()), eq=[])
+        finally:
+            connection.disconnect()
+
+    def test_bind_literals_share_one_statement(
+        self, real_oracle_config: FlextDbOracleSettings
+    ) -> None:
+        """With bind_literals on, literal variants run as one bound statement."""
+        settings = real_oracle_config.model_copy(
+            update={
+                "DbOracle": real_oracle_config.DbOracle.model_copy(
+                    update={"bind_literals": True}
+                )
+            }
+        )
+        connection = self._connect_services(settings)
+        try:
+            for sql in (
+                "SELECT COUNT(*) AS n FROM DUAL WHERE DUMMY = 'X'",
+                "SELECT COUNT(*) AS n FROM DUAL WHERE DUMMY = 'Y'",
+            ):
+                tm.ok(connection.execute_query(sql))
+            stats = tm.ok(connection.fetch_statement_stats())
+            tm.that(len(stats), eq=1)
+            tm.that(stats[0].normalized_sql, has=":flext_lit_0")
+            tm.that(stats[0].literal_variants, eq=1)
+        finally:
+            connection.disconnect()
+
+    def test_literal_heavy_statements_report_call_sites(
+        self, real_oracle_config: FlextDbOracleSettings
+    ) -> None:
+        """Enough literal variants flag a fingerprint with its calling lines."""
+        connection = self._connect_services(real_oracle_config)
+        try:
+            for value in range(c.DbOracle.LITERAL_VARIANT_THRESHOLD):
+                tm.ok(connection.execute_query(self._literal_select(value)))
+            stats = tm.ok(
+                connection.fetch_statement_stats(
+                    order_by=c.DbOracle.StatementStatsOrder.LITERAL_VARIANTS, limit=1
+                )
+            )
+            tm.that(stats[0].literal_heavy, eq=True)
+            tm.that(stats[0].call_sites[0], has="test_oracle_example")
+        finally:
+            connection.disconnect()
+
+    def test_session_stats_deltas_attach_to_operations(
+        self, real_oracle_config: FlextDbOracleSettings
+    ) -> None:
+        """With session_stats on, each call records its v$mystat deltas."""
+        settings = real_oracle_config.model_copy(
+            update={
+                "DbOracle": real_oracle_config.DbOracle.model_copy(
+                    update={"session_stats": True}
+                )
+            }
+        )
+        connection = self._connect_services(settings)
+        try:
+            tm.ok(connection.execute_query(self._literal_select(time.time_ns())))
+            operations = tm.ok(connection.fetch_operations())
+            for counter in ("consistent_gets", "hard_parses", "round_trips"):
+                tm.that(operations[-1].metadata_info, has=counter)
+            metrics = tm.ok(connection.fetch_metrics()).metrics
+            tm.that(int(str(metrics["db_oracle_session_hard_parses_total"])), gt=0)
+        finally:
+            connection.disconnect()
+
+    def test_instrumentation_can_be_disabled(
+        self, real_oracle_config: FlextDbOracleSettings
+    ) -> None:
+        """With instrumentation off, DB calls record nothing."""
+        settings = real_oracle_config.model_copy(
+            update={
+                "DbOracle": real_oracle_config.DbOracle.model_copy(
+                    update={"instrumentation": False}
+                )
+            }
+        )
+        connection = self._connect_services(settings)
+        try:
+            tm.ok(connection.execute_query("SELECT 1 FROM DUAL"))
+            tm.that(len(tm.ok(connection.fetch_operations())), eq=0)
+            tm.that(tm.ok(connection.fetch_metrics()).operations, eq={})
+        finally:
+            connection.disconnect()
+
+    def test_slow_query_log_captures_plan(
+        self, real_oracle_config: FlextDbOracleSettings
+    ) -> None:
+        """Calls over the threshold are logged and explained in background."""
+        settings = real_oracle_config.model_copy(
+            update={
+                "DbOracle": real_oracle_config.DbOracle.model_copy(
+                    update={"slow_query_seconds": 1e-9, "explain_slow_queries": True}
+                )
+            }
+        )
+        connection = self._connect_services(settings)
+        try:
+            tm.ok(
+                connection.execute_query(
+                    "SELECT 'secret' FROM DUAL WHERE 1 = :one",
+                    m.ConfigMap(root={"one": 1}),
+                )
+            )
+            entries = tm.ok(connection.fetch_slow_queries(wait_for_plans=True))
+            entry = entries[-1]
+            tm.that(entry.normalized_sql, eq="select ? from dual where ? = :one")
+            tm.that(entry.plan_status, eq=c.DbOracle.PlanCaptureStatus.CAPTURED)
+            tm.that(entry.plan_hash is not None, eq=True)
+            tm.that(entry.plan, has="DUAL")
+            tm.ok(connection.reset_slow_queries())
+            tm.that(tm.ok(connection.fetch_slow_queries()), eq=[])
+        finally:
+            connection.disconnect()
+        tm.that(
+            [
+                thread.name
+                for thread in threading.enumerate()
+                if thread.name.startswith("flext-db-oracle-explain")
+            ],
+            eq=[],
+        )
+
+    def test_explain_returns_plan_tree_and_baseline(
+        self, real_oracle_config: FlextDbOracleSettings
+    ) -> None:
+        """Explain builds a plan tree and records the fingerprint's baseline."""
+        connection = self._connect_services(real_oracle_config)
+        sql = "SELECT * FROM DUAL WHERE DUMMY = :dummy"
+        try:
+            plan = tm.ok(connection.explain(sql, m.ConfigMap(root={"dummy": "X"})))
+            tm.that(plan.plan_hash is not None, eq=True)
+            tm.that(plan.root is not None, eq=True)
+            steps = list(plan.root.walk()) if plan.root is not None else []
+            tm.that(steps[0].operation, eq="SELECT STATEMENT")
+            tm.that(
+                [step.object_name for step in steps if step.filter_predicates],
+                eq=["DUAL"],
+            )
+            tm.that(plan.text, has="Plan hash value")
+            tm.ok(connection.explain(sql))
+            baselines = tm.ok(connection.fetch_plan_baselines(sql))
+            tm.that(len(baselines), eq=1)
+            tm.that(baselines[0].plan_hash, eq=plan.plan_hash)
+            tm.that(tm.ok(connection.fetch_plan_regressions()), eq=[])
+            tm.ok(connection.reset_plan_baselines())
+            tm.that(tm.ok(connection.fetch_plan_baselines()), eq=[])
+        finally:
+            connection.disconnect()
+
+    def test_fetch_table_metadata_is_traced_per_query(
+        self, real_oracle_config: FlextDbOracleSettings
+    ) -> None:
+        """Every query inside fetch_table_metadata is a child span with phases."""
+        connection = self._connect_services(real_oracle_config)
+        try:
+            tm.ok(connection.set_span_exporter(m.DbOracle.InMemorySpanExporter()))
+            tm.ok(connection.fetch_table_metadata("EMPLOYEES"))
+            spans = tm.ok(connection.fetch_spans())
+            root = spans[-1]
+            tm.that(root.name, eq="fetch_table_metadata")
+            queries = [span for span in spans if span.parent_span_id == root.span_id]
+            tm.that(len(queries), eq=2)
+            for query in queries:
+                tm.that(query.name, eq="SELECT")
+                tm.that(query.trace_id, eq=root.trace_id)
+                tm.that(query.attributes, has="db.query.fingerprint")
+            phases = {
+                span.name
+                for span in spans
+                if span.parent_span_id in {query.span_id for query in queries}
+            }
+            tm.that(phases >= {"checkout", "execute", "fetch"}, eq=True)
+        finally:
+            connection.disconnect()
+
     def test_api_context_manager_executes_query(
         self, real_oracle_config: FlextDbOracleSettings
     ) -> None:
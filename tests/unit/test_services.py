@@ -10,16 +10,25 @@ patching of internal collaborators, no private-attribute access.
 """
 
 from __future__ import annotations
-from typing import TYPE_CHECKING
+
+import http.client
+import io
+import json
+from collections.abc import Iterator, Mapping
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, override
+
 import pytest
-from flext_db_oracle import FlextDbOracleSettings
+
+from flext_db_oracle import FlextDbOracleSettings, r
 from flext_db_oracle.api import FlextDbOracleApi
 from flext_db_oracle.services.facade import FlextDbOracleServices
 from flext_tests import tm
-from tests import m
+from tests import c, m, t
 
 if TYPE_CHECKING:
-    from tests import t
+    from tests import p
 
 
 class TestsFlextDbOracleServices:
@@ -199,6 +208,159 @@ class TestsFlextDbOracleServices:
         tm.that(result.value, has="id = :id")
         tm.that(result.value, has="status = :status")
 
+    def test_build_select_renders_hints_filters_and_row_limits(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """build_select renders hints, IN/range binds, ORDER BY and FETCH FIRST."""
+        result = service.build_select(
+            "USERS",
+            ["id"],
+            hints=m.DbOracle.QueryHints(parallel=4, full=True),
+            in_conditions={"status": 3},
+            range_columns=["created"],
+            order_by=["created DESC"],
+            limit=100,
+            offset=200,
+        )
+        tm.ok(result)
+        tm.that(result.value, has="SELECT /*+ PARALLEL(4) FULL(USERS) */")
+        tm.that(result.value, has=":status_0, :status_1, :status_2, :status_3)")
+        tm.that(result.value, has=">= :created_lower")
+        tm.that(result.value, has="< :created_upper")
+        tm.that(
+            result.value,
+            has="DESC OFFSET :row_offset ROWS FETCH FIRST :row_limit ROWS ONLY",
+        )
+
+    def test_build_select_renders_open_ended_lower_bounds(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """lower_bounds bind ``:col_lower`` inclusively or exclusively."""
+        result = service.build_select(
+            "ORDERS",
+            ["id"],
+            lower_bounds={"updated": True, "ora_rowscn": False},
+            order_by=["updated"],
+        )
+        tm.ok(result)
+        tm.that(result.value, has=">= :updated_lower")
+        tm.that(result.value, has="ora_rowscn > :ora_rowscn_lower")
+        tm.that(result.value, lacks="_upper")
+
+    def test_in_list_binds_pad_to_bucket_size(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """IN list binds are padded with the last value to the bucket size."""
+        binds = service.in_list_binds("status", ["A", "B", "C"])
+        tm.that(
+            dict(binds),
+            eq={"status_0": "A", "status_1": "B", "status_2": "C", "status_3": "C"},
+        )
+
+    def test_build_select_rejects_oversized_in_list(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """IN lists beyond Oracle's 1000-expression limit are rejected."""
+        result = service.build_select("USERS", in_conditions={"id": 1001})
+        tm.fail(result, has="IN lists need")
+
+    def test_build_merge_statement_emits_dual_source_upsert(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """build_merge_statement renders a bind-row MERGE matched on the keys."""
+        result = service.build_merge_statement(
+            "USERS", ["id"], ["name", "email"], schema="APP"
+        )
+        tm.ok(result)
+        tm.that(result.value, has="MERGE INTO APP.USERS tgt")
+        tm.that(result.value, has=":c0 AS ID, :c1 AS NAME, :c2 AS EMAIL FROM DUAL")
+        tm.that(result.value, has="ON (tgt.ID = src.ID)")
+        tm.that(result.value, has="WHEN MATCHED THEN UPDATE SET tgt.NAME = src.NAME")
+        tm.that(result.value, has="WHEN NOT MATCHED THEN INSERT (ID, NAME, EMAIL)")
+
+    def test_build_merge_statement_rejects_key_updates(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """Key columns are matched, so MERGE refuses to update them."""
+        tm.fail(service.build_merge_statement("USERS", [], ["name"]), has="key column")
+        tm.fail(
+            service.build_merge_statement("USERS", ["id"], ["id", "name"]),
+            has="cannot update key columns: id",
+        )
+
+    def test_build_merge_statement_merges_from_source_table(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """A source table turns the MERGE into one set-based statement."""
+        result = service.build_merge_statement(
+            "USERS", ["id"], ["name"], source_table="STG_USERS"
+        )
+        tm.ok(result)
+        tm.that(result.value, has="FROM STG_USERS) src ON (tgt.ID = src.ID)")
+        tm.that(":c0" not in result.value, eq=True)
+
+    def test_build_merge_statement_quotes_identifiers_and_binds_by_position(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """Non-identifier column names are quoted and never used as bind names."""
+        result = service.build_merge_statement("USERS", ["Order Id"], ["e-mail"])
+        tm.ok(result)
+        tm.that(result.value, has=':c0 AS "Order Id", :c1 AS "e-mail"')
+        tm.that(
+            service.merge_binds(
+                {"Order Id": 7, "e-mail": "a@b"}, ["Order Id", "e-mail"]
+            ),
+            eq={"c0": 7, "c1": "a@b"},
+        )
+
+    def test_upsert_via_staging_fails_when_not_connected(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """The staging pipeline needs a connection before creating the stage."""
+        result = service.upsert_via_staging("USERS", [{"id": 1}], ["id"])
+        tm.fail(result, has="Not connected")
+
+    def test_build_insert_all_statement_numbers_binds_per_row(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """INSERT ALL renders one INTO clause per row with numbered binds."""
+        result = service.build_insert_all_statement("USERS", ["id", "name"], 2)
+        tm.ok(result)
+        tm.that(
+            result.value,
+            eq=(
+                "INSERT ALL INTO USERS (ID, NAME) VALUES (:r0c0, :r0c1) "
+                "INTO USERS (ID, NAME) VALUES (:r1c0, :r1c1) SELECT 1 FROM DUAL"
+            ),
+        )
+        binds = service.insert_all_binds(
+            [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}], ["id", "name"]
+        )
+        tm.that(dict(binds), eq={"r0c0": 1, "r0c1": "a", "r1c0": 2, "r1c1": "b"})
+
+    def test_build_insert_all_statement_enforces_target_column_limit(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """Rows times columns may not exceed Oracle's 999 INSERT ALL targets."""
+        columns = [f"c{index}" for index in range(10)]
+        tm.ok(service.build_insert_all_statement("USERS", columns, 99))
+        result = service.build_insert_all_statement("USERS", columns, 100)
+        tm.fail(result, has="999 target columns")
+
+    def test_execute_insert_all_fails_when_not_connected(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """Multi-row inserts require a connected service."""
+        result = service.execute_insert_all("USERS", [{"id": 1}])
+        tm.fail(result, has="Not connected")
+
+    def test_upsert_rows_fails_when_not_connected(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """Upserts build the MERGE but need a connection to execute it."""
+        result = service.upsert_rows("USERS", [{"id": 1, "name": "alice"}], ["id"])
+        tm.fail(result, has="Not connected")
+
     def test_create_table_ddl_emits_constraints(
         self, service: FlextDbOracleServices
     ) -> None:
@@ -238,6 +400,99 @@ class TestsFlextDbOracleServices:
             eq="CREATE UNIQUE INDEX APP.IDX_USERS_EMAIL ON APP.USERS (EMAIL) TABLESPACE USERS_TS PARALLEL 2",
         )
 
+    def test_build_create_index_statement_quotes_tablespace(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """Index tablespaces render like identifiers, never as raw text."""
+        result = service.build_create_index_statement({
+            "table_name": "USERS",
+            "index_name": "IDX_USERS_ID",
+            "columns": ["id"],
+            "tablespace": 'idx ts" PARALLEL 64 --',
+        })
+        tm.ok(result)
+        tm.that(result.value, has='TABLESPACE "idx ts"" PARALLEL 64 --"')
+
+    def test_create_table_ddl_renders_interval_partitioned_storage(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """Storage options render compression, logging and partitioning clauses."""
+        options = m.DbOracle.TableStorageOptions(
+            partition_type=c.DbOracle.PartitionType.INTERVAL,
+            partition_columns=["sale_date"],
+            range_partitions=[
+                m.DbOracle.RangePartition(
+                    name="p0", values_less_than="DATE '2025-01-01'"
+                )
+            ],
+            interval="NUMTOYMINTERVAL(1,'MONTH')",
+            compression=c.DbOracle.TableCompression.ADVANCED,
+            nologging=True,
+            pctfree=0,
+            parallel=8,
+        )
+        result = service.create_table_ddl(
+            "SALES",
+            [{"name": "sale_date", "data_type": "DATE", "nullable": False}],
+            options=options,
+        )
+        tm.ok(result)
+        tm.that(
+            result.value,
+            has=(
+                "PCTFREE 0 NOLOGGING ROW STORE COMPRESS ADVANCED "
+                "PARTITION BY RANGE (SALE_DATE) INTERVAL (NUMTOYMINTERVAL(1,'MONTH')) "
+                "(PARTITION P0 VALUES LESS THAN (DATE '2025-01-01')) PARALLEL 8"
+            ),
+        )
+
+    def test_create_table_ddl_rejects_incomplete_partitioning(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """Hash partitioning without a partition count is rejected."""
+        options = m.DbOracle.TableStorageOptions(
+            partition_type=c.DbOracle.PartitionType.HASH, partition_columns=["id"]
+        )
+        result = service.create_table_ddl(
+            "SALES", [{"name": "id", "data_type": "NUMBER"}], options=options
+        )
+        tm.fail(result, has="hash_partitions")
+
+    def test_build_create_index_statement_renders_local_online_compressed(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """LOCAL, COMPRESS, NOLOGGING and ONLINE follow the index columns."""
+        result = service.build_create_index_statement({
+            "table_name": "SALES",
+            "index_name": "IDX_SALES_DATE",
+            "columns": ["sale_date", "store_id"],
+            "local": True,
+            "compress": 1,
+            "nologging": True,
+            "online": True,
+            "parallel": 4,
+        })
+        tm.ok(result)
+        tm.that(
+            result.value,
+            eq=(
+                "CREATE INDEX IDX_SALES_DATE ON SALES (SALE_DATE, STORE_ID) "
+                "LOCAL COMPRESS 1 NOLOGGING ONLINE PARALLEL 4"
+            ),
+        )
+
+    def test_build_create_index_statement_rejects_zero_compress(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """A zero key-compression prefix is rejected instead of rendered."""
+        result = service.build_create_index_statement({
+            "table_name": "SALES",
+            "index_name": "IDX_SALES_DATE",
+            "columns": ["sale_date"],
+            "compress": 0,
+        })
+        tm.fail(result, has="compress")
+
     def test_build_create_index_statement_fails_for_empty_columns(
         self, service: FlextDbOracleServices
     ) -> None:
@@ -257,6 +512,8 @@ class TestsFlextDbOracleServices:
             ("integer", "NUMBER(38)"),
             ("number", "NUMBER"),
             ("boolean", "NUMBER(1)"),
+            ("object", "CLOB"),
+            ("array", "CLOB"),
         ],
     )
     def test_convert_singer_type_maps_scalar_types(
@@ -275,6 +532,14 @@ class TestsFlextDbOracleServices:
         tm.ok(result)
         tm.that(result.value, eq="VARCHAR2(4000)")
 
+    def test_convert_singer_type_skips_leading_null(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """A nullable array listing ``null`` first maps its non-null type."""
+        result = service.convert_singer_type(["null", "integer"])
+        tm.ok(result)
+        tm.that(result.value, eq="NUMBER(38)")
+
     def test_convert_singer_type_honors_datetime_format(
         self, service: FlextDbOracleServices
     ) -> None:
@@ -303,6 +568,76 @@ class TestsFlextDbOracleServices:
         tm.that(mapping["created_at"], eq="TIMESTAMP")
         tm.that(mapping["is_active"], eq="NUMBER(1)")
 
+    def test_map_singer_schema_maps_nullable_type_arrays(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """Type arrays in a raw schema keep their non-null Oracle mapping."""
+        result = service.map_singer_schema({
+            "properties": {"amount": {"type": ["null", "number"]}}
+        })
+        tm.ok(result)
+        tm.that(result.value["amount"], eq="NUMBER")
+
+    def test_compile_singer_coercer_is_cached_by_schema_hash(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """Compiling the same schema twice reuses the cached plan."""
+        schema: t.JsonMapping = {"properties": {"id": {"type": "integer"}}}
+        first = service.compile_singer_coercer(schema)
+        second = service.compile_singer_coercer({
+            "properties": {"id": {"type": "integer"}}
+        })
+        tm.ok(first)
+        tm.ok(second)
+        tm.that(second.value is first.value, eq=True)
+        tm.that(list(first.value.column_names), eq=["id"])
+
+    def test_singer_coercer_converts_records_to_bind_rows(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """The coercer types every property and binds NULL for missing ones."""
+        result = service.compile_singer_coercer({
+            "properties": {
+                "id": {"type": ["null", "integer"]},
+                "active": {"type": "boolean"},
+                "seen_at": {"type": "string", "format": "date-time"},
+                "tags": {"type": "object"},
+                "note": {"type": "string"},
+            }
+        })
+        tm.ok(result)
+        tm.that(list(result.value.oracle_types)[3], eq="CLOB")
+        rows = result.value.coerce([
+            {
+                "id": "7",
+                "active": True,
+                "seen_at": "2025-01-02T03:04:05",
+                "tags": {"a": 1},
+                "extra": "dropped",
+            }
+        ])
+        tm.that(
+            dict(rows[0]),
+            eq={
+                "id": 7,
+                "active": 1,
+                "seen_at": datetime.fromisoformat("2025-01-02T03:04:05"),
+                "tags": '{"a":1}',
+                "note": None,
+            },
+        )
+
+    def test_singer_coercer_rejects_invalid_boolean(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """Values a converter cannot type raise instead of binding garbage."""
+        result = service.compile_singer_coercer({
+            "properties": {"active": {"type": "boolean"}}
+        })
+        tm.ok(result)
+        with pytest.raises(ValueError, match="invalid boolean"):
+            result.value.coerce([{"active": "maybe"}])
+
     def test_map_singer_schema_rejects_non_mapping_properties(
         self, service: FlextDbOracleServices
     ) -> None:
@@ -357,6 +692,205 @@ class TestsFlextDbOracleServices:
         tm.ok(after)
         tm.that(len(after.value) > len(before.value), eq=True)
 
+    def test_operation_log_keeps_only_the_most_recent_entries(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """The operation log is a ring buffer bounded by its capacity."""
+        capacity = c.DbOracle.OPERATION_LOG_CAPACITY
+        for index in range(capacity + 5):
+            tm.ok(service.track_operation("INSERT", float(index)))
+        operations = service.fetch_operations()
+        tm.ok(operations)
+        tm.that(len(operations.value), eq=capacity)
+        tm.that(operations.value[0].duration, eq=5.0)
+        tm.that(operations.value[-1].duration, eq=float(capacity + 4))
+
+    def test_fetch_metrics_reports_operation_percentiles(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """Per-type aggregates expose count, error rate and latency percentiles."""
+        for index in range(1, 101):
+            tm.ok(service.track_operation("SELECT", index / 1000, success=index > 10))
+        result = service.fetch_metrics()
+        tm.ok(result)
+        summary = result.value.operations["SELECT"]
+        assert isinstance(summary, Mapping)
+        tm.that(summary["count"], eq=100)
+        tm.that(summary["error_rate"], eq=0.1)
+        for key, expected in (
+            ("p50_seconds", 0.05),
+            ("p95_seconds", 0.095),
+            ("p99_seconds", 0.099),
+        ):
+            estimate = summary[key]
+            assert isinstance(estimate, float)
+            tm.that(abs(estimate - expected) <= expected * 0.02, eq=True)
+
+    def test_reset_operation_stats_starts_a_new_window(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """Operation aggregates accumulate until they are reset."""
+        tm.ok(service.track_operation("SELECT", 0.01))
+        tm.ok(service.track_operation("SELECT", 0.02))
+        tm.that(tm.ok(service.fetch_metrics()).operations, has="SELECT")
+        tm.ok(service.reset_operation_stats())
+        tm.that(tm.ok(service.fetch_metrics()).operations, eq={})
+        tm.ok(service.track_operation("SELECT", 0.03))
+        summary = tm.ok(service.fetch_metrics()).operations["SELECT"]
+        assert isinstance(summary, Mapping)
+        tm.that(summary["count"], eq=1)
+
+    def test_export_openmetrics_renders_operation_histograms(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """Tracked operations render as cumulative OpenMetrics histograms."""
+        tm.ok(service.track_operation("SELECT", 0.02))
+        text = tm.ok(service.export_openmetrics())
+        family = "db_oracle_operation_duration_seconds"
+        tm.that(text, has=f"# TYPE {family} histogram")
+        tm.that(text, has=f'{family}_bucket{{operation="SELECT",le="0.01"}} 0')
+        tm.that(text, has=f'{family}_bucket{{operation="SELECT",le="0.025"}} 1')
+        tm.that(text, has=f'{family}_bucket{{operation="SELECT",le="+Inf"}} 1')
+        tm.that(text, has=f'{family}_count{{operation="SELECT"}} 1')
+        tm.that(text, has='db_oracle_cache_hits_total{cache="merge_statement"}')
+        tm.that(text.endswith("# EOF\n"), eq=True)
+
+    def test_serve_metrics_answers_scrapes(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """The local endpoint serves /metrics and 404s any other path."""
+        server = tm.ok(service.serve_metrics(port=0))
+        client = http.client.HTTPConnection("127.0.0.1", server.server_port, timeout=5)
+        try:
+            client.request("GET", "/metrics")
+            response = client.getresponse()
+            tm.that(response.status, eq=200)
+            tm.that(
+                response.getheader("Content-Type"), has="application/openmetrics-text"
+            )
+            tm.that(response.read().decode(), has="# EOF")
+            client.request("GET", "/other")
+            missing = client.getresponse()
+            tm.that(missing.status, eq=404)
+            _ = missing.read()
+        finally:
+            client.close()
+            server.shutdown()
+            server.server_close()
+
+    def test_trace_nests_spans_and_exports_them(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """Spans opened inside a span become its children in the same trace."""
+        exporter = m.DbOracle.InMemorySpanExporter()
+        tm.ok(service.set_span_exporter(exporter))
+        with service.trace("outer", {"db.collection.name": "EMP"}) as outer:
+            assert outer is not None
+            with service.trace("inner") as inner:
+                assert inner is not None
+        spans = tm.ok(service.fetch_spans())
+        tm.that([span.name for span in spans], eq=["inner", "outer"])
+        tm.that(spans[0].trace_id, eq=spans[1].trace_id)
+        tm.that(spans[0].parent_span_id, eq=spans[1].span_id)
+        tm.that(spans[1].parent_span_id, eq=None)
+        tm.that(spans[1].attributes["db.system"], eq="oracle")
+        tm.that(spans[1].attributes["db.collection.name"], eq="EMP")
+        tm.that(spans[1].end_time_unix_nano >= spans[1].start_time_unix_nano, eq=True)
+
+    def test_trace_continues_a_remote_traceparent(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """A W3C traceparent sets the trace and parent of the new span."""
+        tm.ok(service.set_span_exporter(m.DbOracle.InMemorySpanExporter()))
+        trace_id, parent_id = "a" * 32, "b" * 16
+        traceparent = f"00-{trace_id}-{parent_id}-01"
+        with service.trace("remote", traceparent=traceparent) as span:
+            assert span is not None
+            tm.that(span.traceparent, has=trace_id)
+        spans = tm.ok(service.fetch_spans())
+        tm.that(spans[0].trace_id, eq=trace_id)
+        tm.that(spans[0].parent_span_id, eq=parent_id)
+
+    def test_trace_records_ora_error_codes(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """An exception escaping a span marks it failed with its ORA code."""
+        tm.ok(service.set_span_exporter(m.DbOracle.InMemorySpanExporter()))
+        msg = "ORA-00942: table or view does not exist"
+        with pytest.raises(RuntimeError, match="ORA-00942"), service.trace("failing"):
+            raise RuntimeError(msg)
+        span = tm.ok(service.fetch_spans())[0]
+        tm.that(span.status, eq=c.DbOracle.SpanStatus.ERROR)
+        tm.that(span.attributes["error.type"], eq="ORA-00942")
+
+    def test_in_memory_span_exporter_keeps_the_latest_spans(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """The in-memory exporter is a bounded buffer of the newest spans."""
+        exporter = m.DbOracle.InMemorySpanExporter()
+        tm.that(exporter.spans.maxlen, eq=c.DbOracle.SPAN_BUFFER_CAPACITY)
+        tm.ok(service.set_span_exporter(exporter))
+        for index in range(c.DbOracle.SPAN_BUFFER_CAPACITY + 2):
+            with service.trace(f"span-{index}"):
+                pass
+        spans = tm.ok(service.fetch_spans())
+        tm.that(len(spans), eq=c.DbOracle.SPAN_BUFFER_CAPACITY)
+        tm.that(spans[0].name, eq="span-2")
+
+    def test_trace_survives_an_unwritable_trace_file(
+        self, service: FlextDbOracleServices, tmp_path: Path
+    ) -> None:
+        """A span export that cannot write is logged, not raised."""
+        tm.ok(
+            service.set_span_exporter(m.DbOracle.FileSpanExporter(path=str(tmp_path)))
+        )
+        with service.trace("unwritable") as span:
+            assert span is not None
+        tm.that(span.end_time_unix_nano >= span.start_time_unix_nano, eq=True)
+
+    def test_trace_is_a_no_op_when_tracing_is_off(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """Without an exporter no span is created or kept."""
+        with service.trace("ignored") as span:
+            tm.that(span, eq=None)
+        tm.that(service.fetch_spans().failure, eq=True)
+
+    def test_tracing_setting_writes_spans_to_a_file(self, tmp_path: Path) -> None:
+        """With tracing and a trace file configured, spans land as JSON lines."""
+        trace_file = tmp_path / "spans.jsonl"
+        service = FlextDbOracleServices(
+            settings=FlextDbOracleSettings.model_validate({
+                "DbOracle": {"tracing": True, "trace_file": str(trace_file)}
+            })
+        )
+        with service.trace("written"):
+            pass
+        lines = trace_file.read_text(encoding="utf-8").splitlines()
+        tm.that(len(lines), eq=1)
+        tm.that(lines[0], has='"name":"written"')
+
+    def test_fetch_statement_stats_validates_limit(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """Statement statistics start empty and reject non-positive limits."""
+        tm.that(tm.ok(service.fetch_statement_stats()), eq=[])
+        result = service.fetch_statement_stats(limit=0)
+        tm.fail(result, has="Limit must be positive")
+
+    def test_slow_query_log_starts_empty(self, service: FlextDbOracleServices) -> None:
+        """The slow-query log is empty until a call crosses the threshold."""
+        tm.that(tm.ok(service.fetch_slow_queries(wait_for_plans=True)), eq=[])
+        tm.that(tm.ok(service.reset_slow_queries()), eq=True)
+
+    def test_explain_rejects_statements_without_plan(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """Explain needs a query or DML statement and a connection."""
+        tm.fail(service.explain("BEGIN NULL; END;"), has="no execution plan")
+        tm.fail(service.explain("SELECT 1 FROM DUAL"), has="Not connected")
+        tm.that(tm.ok(service.fetch_plan_baselines()), eq=[])
+
     def test_plugin_register_fetch_list_unregister_lifecycle(
         self, service: FlextDbOracleServices
     ) -> None:
@@ -428,6 +962,275 @@ class TestsFlextDbOracleServices:
         tm.that(result.failure, eq=True)
         tm.that(result.error or "", has="row count")
 
+    def test_execute_batch_fails_when_not_connected(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """Array-bound batch execution requires an active connection."""
+        result = service.execute_batch(
+            "INSERT INTO t (id) VALUES (:id)", [{"id": 1}, {"id": 2}]
+        )
+        tm.fail(result, has="Not connected")
+
+    def test_load_file_fails_for_missing_file(
+        self, service: FlextDbOracleServices, tmp_path: Path
+    ) -> None:
+        """Loading a file that does not exist fails before touching Oracle."""
+        result = service.load_file("USERS", tmp_path / "missing.csv")
+        tm.fail(result, has="not found")
+
+    def test_load_file_rejects_unknown_format(
+        self, service: FlextDbOracleServices, tmp_path: Path
+    ) -> None:
+        """Only CSV and JSONL inputs are accepted by the bulk loader."""
+        source = tmp_path / "users.parquet"
+        source.write_bytes(b"PAR1")
+        result = service.load_file("USERS", source)
+        tm.fail(result, has="Unsupported load file format")
+
+    def test_load_file_fails_when_not_connected(
+        self, service: FlextDbOracleServices, tmp_path: Path
+    ) -> None:
+        """A well-formed file still requires a connected service."""
+        source = tmp_path / "users.csv"
+        source.write_text("id,name\n1,alice\n", encoding="utf-8")
+        result = service.load_file("USERS", source, batch_size=10)
+        tm.fail(result, has="Not connected")
+
+    def test_copy_table_rejects_non_positive_parallelism(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """Copy tuning arguments are validated before any connection check."""
+        result = service.copy_table(service, "USERS", parallelism=0)
+        tm.fail(result, has="must be positive")
+
+    def test_copy_table_fails_when_not_connected(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """Both source and target services must be connected to copy."""
+        result = service.copy_table(service, "USERS")
+        tm.fail(result, has="Not connected")
+
+    def test_gather_table_stats_fails_when_not_connected(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """DBMS_STATS gathering needs a connected service."""
+        result = service.gather_table_stats("USERS")
+        tm.fail(result, has="Not connected")
+
+    def test_gather_stats_if_stale_rejects_negative_changes(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """Changed row counts are validated before any statistics lookup."""
+        result = service.gather_stats_if_stale("USERS", -1)
+        tm.fail(result, has="must not be negative")
+
+    def test_stats_options_defaults_and_bounds(self) -> None:
+        """Stats options default to AUTO granularity and bound the sample size."""
+        options = m.DbOracle.StatsOptions()
+        tm.that(options.granularity, eq=c.DbOracle.StatsGranularity.AUTO)
+        tm.that(options.stale_fraction, eq=c.DbOracle.STATS_STALE_FRACTION)
+        tm.that(options.cascade, eq=True)
+        with pytest.raises(m.ValidationError):
+            m.DbOracle.StatsOptions(estimate_percent=150)
+
+    def test_full_refresh_requires_exactly_one_source(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """A full refresh loads either bound rows or a source query, not both."""
+        tm.fail(service.full_refresh("REPORT"), has="exactly one")
+        result = service.full_refresh(
+            "REPORT", rows=[{"ID": 1}], source_query="SELECT 1 FROM DUAL"
+        )
+        tm.fail(result, has="exactly one")
+
+    def test_full_refresh_exchange_requires_partition(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """Partition exchange needs the partition that receives the shadow."""
+        result = service.full_refresh(
+            "REPORT", rows=[], swap=c.DbOracle.RefreshSwap.EXCHANGE
+        )
+        tm.fail(result, has="partition name")
+
+    def test_full_refresh_fails_when_not_connected(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """Refreshing needs a connected service."""
+        result = service.full_refresh("REPORT", rows=[{"ID": 1}])
+        tm.fail(result, has="Not connected")
+
+    def test_singer_state_round_trips_bookmarks(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """Bookmarks render as Singer STATE and read back per stream."""
+        bookmark = m.DbOracle.Bookmark(
+            stream="HR-EMPLOYEES",
+            replication_key="UPDATED_AT",
+            replication_key_value="2025-01-31T12:00:00",
+        )
+        state = {"type": "STATE", "value": service.singer_state([bookmark])}
+        restored = service.bookmark_from_state(state, "employees", schema="hr")
+        tm.ok(restored)
+        tm.that(restored.value, eq=bookmark)
+        missing = service.bookmark_from_state(state, "DEPARTMENTS", schema="HR")
+        tm.ok(missing)
+        tm.that(missing.value, eq=None)
+
+    def test_extract_incremental_fails_when_not_connected(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """Incremental extraction needs a connected service."""
+        result = service.extract_incremental("EMPLOYEES", replication_key="ID")
+        tm.fail(result, has="Not connected")
+
+    def test_run_singer_tap_fails_when_not_connected(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """The Singer tap needs a connected service and writes nothing otherwise."""
+        output = io.BytesIO()
+        result = service.run_singer_tap("EMPLOYEES", output=output)
+        tm.fail(result, has="Not connected")
+        tm.that(output.getvalue(), eq=b"")
+
+    class CannedTapServices(FlextDbOracleServices):
+        """Services whose table reads are canned incremental batches."""
+
+        @override
+        def connected(self) -> bool:
+            return True
+
+        @override
+        def fetch_table_metadata(
+            self, table_name: str, schema: str | None = None
+        ) -> p.Result[m.DbOracle.TableMetadata]:
+            return r[m.DbOracle.TableMetadata].ok(
+                m.DbOracle.TableMetadata(
+                    table_name=table_name,
+                    columns=[
+                        m.DbOracle.ColumnMetadata(
+                            name="ID", data_type="NUMBER", nullable=False, data_scale=0
+                        ),
+                        m.DbOracle.ColumnMetadata(name="NAME", data_type="VARCHAR2"),
+                    ],
+                    primary_keys=["ID"],
+                )
+            )
+
+        @override
+        def extract_incremental(
+            self,
+            table_name: str,
+            *,
+            replication_key: str | None = None,
+            bookmark: m.DbOracle.Bookmark | None = None,
+            schema: str | None = None,
+            columns: t.StrSequence | None = None,
+            batch_size: int = c.DbOracle.DEFAULT_ARRAY_SIZE,
+        ) -> p.Result[Iterator[tuple[t.DbOracle.BindBatch, m.DbOracle.Bookmark]]]:
+            def mark(value: int) -> m.DbOracle.Bookmark:
+                return m.DbOracle.Bookmark(
+                    stream=table_name,
+                    replication_key=replication_key or "ID",
+                    replication_key_value=value,
+                )
+
+            batches: list[tuple[t.DbOracle.BindBatch, m.DbOracle.Bookmark]] = [
+                ([{"ID": 1, "NAME": "a"}, {"ID": 2, "NAME": None}], mark(2)),
+                ([{"ID": 3, "NAME": "c"}], mark(3)),
+            ]
+            return r[Iterator[tuple[t.DbOracle.BindBatch, m.DbOracle.Bookmark]]].ok(
+                iter(batches)
+            )
+
+    def test_run_singer_tap_frames_schema_records_and_state(
+        self, settings: FlextDbOracleSettings
+    ) -> None:
+        """SCHEMA comes first, then each batch's RECORDs followed by its STATE."""
+        service = self.CannedTapServices(settings=settings)
+        output = io.BytesIO()
+        result = service.run_singer_tap(
+            "USERS",
+            replication_key="ID",
+            state={"bookmarks": {"ORDERS": {"replication_key": "ID"}}},
+            output=output,
+            backend=c.DbOracle.JsonBackend.STDLIB,
+        )
+        tm.ok(result)
+        tm.that(result.value.rows_emitted, eq=3)
+        tm.that(result.value.batches, eq=2)
+        messages = [json.loads(line) for line in output.getvalue().splitlines()]
+        tm.that(
+            [message["type"] for message in messages],
+            eq=["SCHEMA", "RECORD", "RECORD", "STATE", "RECORD", "STATE"],
+        )
+        tm.that(
+            messages[0],
+            eq={
+                "type": "SCHEMA",
+                "stream": "USERS",
+                "schema": {
+                    "type": "object",
+                    "properties": {
+                        "ID": {"type": ["integer"]},
+                        "NAME": {"type": ["null", "string"]},
+                    },
+                },
+                "key_properties": ["ID"],
+                "bookmark_properties": ["ID"],
+            },
+        )
+        tm.that(messages[2]["record"], eq={"ID": 2, "NAME": None})
+        tm.that(
+            {message["stream"] for message in messages if message["type"] == "RECORD"},
+            eq={"USERS"},
+        )
+        tm.that(
+            messages[5]["value"]["bookmarks"],
+            eq={
+                "ORDERS": {"replication_key": "ID"},
+                "USERS": {"replication_key": "ID", "replication_key_value": 3},
+            },
+        )
+        tm.that(
+            result.value.bookmark,
+            eq=m.DbOracle.Bookmark(
+                stream="USERS", replication_key="ID", replication_key_value=3
+            ),
+        )
+
+    def test_run_singer_target_fails_when_not_connected(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """The Singer target needs a connected service and emits no state."""
+        state_output = io.BytesIO()
+        result = service.run_singer_target(
+            ['{"type": "STATE", "value": {}}'], state_output=state_output
+        )
+        tm.fail(result, has="Not connected")
+        tm.that(state_output.getvalue(), eq=b"")
+
+    def test_run_singer_target_rejects_non_positive_batch_age(
+        self, service: FlextDbOracleServices
+    ) -> None:
+        """A zero flush interval is rejected before any message is read."""
+        result = service.run_singer_target([], max_batch_seconds=0)
+        tm.fail(result, has="batch age")
+
+    def test_column_model_renders_type_spec(self) -> None:
+        """Column type specs carry Oracle length, precision and scale."""
+        text_column = m.DbOracle.Column(
+            name="NAME", data_type="VARCHAR2", nullable=True, data_length=80
+        )
+        amount_column = m.DbOracle.Column(
+            name="AMOUNT",
+            data_type="NUMBER",
+            nullable=True,
+            data_precision=12,
+            data_scale=2,
+        )
+        tm.that(text_column.type_spec, eq="VARCHAR2(80)")
+        tm.that(amount_column.type_spec, eq="NUMBER(12,2)")
+
     def test_column_model_exposes_public_fields(self) -> None:
         """A Column model reports its declared public field values."""
         column = m.DbOracle.Column(
@@ -12,7 +12,13 @@ implementation structures are exercised.
 
 from __future__ import annotations
 
+import csv
+import json
 from collections.abc import Mapping
+from datetime import UTC, datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pytest
 
@@ -20,6 +26,9 @@ from flext_db_oracle import FlextDbOracleSettings
 from flext_tests import tm
 from tests import c, m, t, u
 
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
 
 @pytest.mark.unit
 class TestsFlextDbOracleUtilitiesUnit:
@@ -51,6 +60,144 @@ class TestsFlextDbOracleUtilitiesUnit:
         tm.that(len(hash_value), eq=16)
         tm.that(hash_value.isalnum(), eq=True)
 
+    def test_statement_fingerprint_ignores_whitespace(self) -> None:
+        """Statements differing only in whitespace share a fingerprint."""
+        first = u.DbOracle.statement_fingerprint("SELECT id\n  FROM users")
+        tm.that(len(first), eq=16)
+        tm.that(u.DbOracle.statement_fingerprint(" SELECT id FROM users "), eq=first)
+        tm.that(
+            u.DbOracle.statement_fingerprint("SELECT name FROM users") != first, eq=True
+        )
+
+    @pytest.mark.parametrize(
+        ("sql", "expected"),
+        [
+            (
+                "SELECT * FROM Emp WHERE id IN (1, 2, 3) AND name = 'O''Brien'",
+                "select * from emp where id in (...) and name = ?",
+            ),
+            (
+                'select "Mixed" from t -- trailing\n where x = 1.5e3',
+                'select "Mixed" from t where x = ?',
+            ),
+            (
+                "/* note */ INSERT INTO t VALUES (:a, :b)",
+                "insert into t values ( :a , :b )",
+            ),
+        ],
+    )
+    def test_normalize_sql_strips_literals_and_collapses_in_lists(
+        self, sql: str, expected: str
+    ) -> None:
+        """Literals, IN lists, comments, case and layout are normalized away."""
+        tm.that(u.DbOracle.normalize_sql(sql), eq=expected)
+
+    def test_statement_fingerprint_groups_literal_variants(self) -> None:
+        """Statements differing only in literal values share a fingerprint."""
+        tm.that(
+            u.DbOracle.statement_fingerprint("SELECT * FROM t WHERE id IN (1, 2)"),
+            eq=u.DbOracle.statement_fingerprint("select * from T where ID in (7)"),
+        )
+
+    def test_statement_bind_names_skips_literals_and_comments(self) -> None:
+        """Bind names are distinct, case-insensitive and ignore quoted text."""
+        sql = "SELECT ':fake' FROM t /* :note */ WHERE a = :Id OR b = :id AND c = :x"
+        tm.that(u.DbOracle.statement_bind_names(sql), eq=["Id", "x"])
+
+    def test_iter_file_lines_keeps_lines_whole_across_chunks(
+        self, tmp_path: Path
+    ) -> None:
+        """Chunks shorter than a line still yield every line whole, in order."""
+        lines = [f"{n},name {n}\n" for n in range(50)]
+        source = tmp_path / "rows.csv"
+        source.write_text("".join(lines), encoding="utf-8")
+        tm.that(list(u.DbOracle.iter_file_lines(source, chunk_bytes=7)), eq=lines)
+
+    @pytest.mark.parametrize("header", [[], ["ID,NAME\n"]])
+    def test_iter_csv_records_numbers_file_lines(self, header: list[str]) -> None:
+        """Rows carry their file line; short rows are flagged, blank ones skipped."""
+        reader = csv.reader([*header, "1,a\n", "\n", "2\n", "3,c\n"])
+        if header:
+            _ = next(reader)
+        first_line = len(header) + 1
+        bad_line = first_line + 2
+        records = list(u.DbOracle.iter_csv_records(reader, ["ID", "NAME"]))
+        tm.that(
+            records,
+            eq=[
+                (first_line, {"ID": "1", "NAME": "a"}, ""),
+                (bad_line, None, "expected 2 fields, got 1"),
+                (bad_line + 1, {"ID": "3", "NAME": "c"}, ""),
+            ],
+        )
+
+    def test_iter_csv_records_counts_lines_of_multi_line_fields(self) -> None:
+        """A quoted field spanning lines pushes later rows to their real line."""
+        reader = csv.reader(['1,"a\n', 'b"\n', "2\n", "3,c\n"])
+        records = list(u.DbOracle.iter_csv_records(reader, ["ID", "NAME"]))
+        tm.that(
+            records,
+            eq=[
+                (1, {"ID": "1", "NAME": "a\nb"}, ""),
+                (3, None, "expected 2 fields, got 1"),
+                (4, {"ID": "3", "NAME": "c"}, ""),
+            ],
+        )
+
+    def test_iter_jsonl_records_matches_columns_and_flags_bad_lines(self) -> None:
+        """Keys match columns case-insensitively; non-objects are flagged."""
+        lines = iter(['{"id": 1, "NAME": "x"}\n', "[1]\n", "oops\n"])
+        records = list(u.DbOracle.iter_jsonl_records(lines, ["id", "name"]))
+        tm.that(records[0], eq=(1, {"id": 1, "name": "x"}, ""))
+        tm.that(records[1], eq=(2, None, "JSON line is not an object"))
+        tm.that(records[2][2], has="invalid JSON")
+
+    @pytest.mark.parametrize(
+        ("sql", "expected", "values"),
+        [
+            (
+                "SELECT name, 'x' FROM t WHERE id = 7 AND tag IN ('a', 'b''c')",
+                (
+                    "SELECT name, 'x' FROM t WHERE id = :flext_lit_0"
+                    " AND tag IN (:flext_lit_1, :flext_lit_2)"
+                ),
+                (7, "a", "b'c"),
+            ),
+            (
+                "DELETE FROM t WHERE d > DATE '2024-01-01' AND n BETWEEN 1 AND 9",
+                (
+                    "DELETE FROM t WHERE d > DATE '2024-01-01'"
+                    " AND n BETWEEN :flext_lit_0 AND :flext_lit_1"
+                ),
+                (1, 9),
+            ),
+            (
+                (
+                    "SELECT CASE WHEN a = 1 THEN 'x' END k, COUNT(*) FROM t"
+                    " WHERE b IN (SELECT b FROM u WHERE c = 2)"
+                    " GROUP BY CASE WHEN a = 1 THEN 'x' END"
+                    " HAVING COUNT(*) > 3 ORDER BY CASE WHEN a = 1 THEN 0 END"
+                ),
+                (
+                    "SELECT CASE WHEN a = 1 THEN 'x' END k, COUNT(*) FROM t"
+                    " WHERE b IN (SELECT b FROM u WHERE c = :flext_lit_0)"
+                    " GROUP BY CASE WHEN a = 1 THEN 'x' END"
+                    " HAVING COUNT(*) > :flext_lit_1"
+                    " ORDER BY CASE WHEN a = 1 THEN 0 END"
+                ),
+                (2, 3),
+            ),
+            ("CREATE TABLE t (id NUMBER DEFAULT 0)", None, ()),
+        ],
+    )
+    def test_parameterize_sql_binds_predicate_literals(
+        self, sql: str, expected: str | None, values: tuple[int | str, ...]
+    ) -> None:
+        """Predicate and value-list literals become binds; others stay put."""
+        template, binds = u.DbOracle.parameterize_sql(sql)
+        tm.that(template, eq=expected or sql)
+        tm.that(tuple(value for _, value in binds), eq=values)
+
     def test_generate_query_hash_is_deterministic_for_same_inputs(self) -> None:
         """Identical query and params always produce the identical hash."""
         query = "SELECT id, name FROM users WHERE active = :active"
@@ -269,6 +416,94 @@ class TestsFlextDbOracleUtilitiesUnit:
         data: list[t.JsonValue] = [{"id": 7}]
         tm.that(tm.ok(u.DbOracle.format_query_result(data)), eq=str(data))
 
+    # ------------------------------------------------------------------ #
+    # JSON serialization                                                 #
+    # ------------------------------------------------------------------ #
+
+    _JSON_COLUMNS: tuple[str, ...] = ("ID", "AMOUNT", "CREATED_AT", "RAW", "NOTE")
+    _JSON_ROWS: tuple[tuple[t.DbOracle.BindValue, ...], ...] = tuple(
+        (
+            index,
+            Decimal(f"{index}.25"),
+            datetime(2025, 1, 1, 12, 0, index % 60, tzinfo=UTC),
+            bytes([index % 256]),
+            None if index % 2 else f"row-{index}",
+        )
+        for index in range(1000)
+    )
+
+    @pytest.mark.parametrize(
+        "backend", [c.DbOracle.JsonBackend.AUTO, c.DbOracle.JsonBackend.STDLIB]
+    )
+    def test_encode_json_rows_encodes_driver_values(
+        self, backend: c.DbOracle.JsonBackend
+    ) -> None:
+        """NUMBERs encode as JSON numbers and naive datetimes as UTC."""
+        row = (
+            Decimal(7),
+            Decimal("12345.678"),
+            datetime(2025, 1, 2, 3, 4, 5, tzinfo=UTC).replace(tzinfo=None),
+            b"\x0f",
+            None,
+        )
+        payload: bytes = tm.ok(
+            u.DbOracle.encode_json_rows(self._JSON_COLUMNS, [row], backend=backend)
+        )
+        tm.that(payload.decode(), has='"ID":7,"AMOUNT":12345.678,')
+        tm.that(
+            json.loads(payload),
+            eq=[
+                {
+                    "ID": 7,
+                    "AMOUNT": 12345.678,
+                    "CREATED_AT": "2025-01-02T03:04:05Z",
+                    "RAW": "Dw==",
+                    "NOTE": None,
+                }
+            ],
+        )
+
+    def test_encode_json_rows_is_identical_across_backends(self) -> None:
+        """AUTO yields the same bytes as the standard library encoder."""
+        rows = self._JSON_ROWS[:5]
+        tm.that(
+            tm.ok(u.DbOracle.encode_json_rows(self._JSON_COLUMNS, rows)),
+            eq=tm.ok(
+                u.DbOracle.encode_json_rows(
+                    self._JSON_COLUMNS, rows, backend=c.DbOracle.JsonBackend.STDLIB
+                )
+            ),
+        )
+
+    @pytest.mark.benchmark(group="json-rows")
+    def test_benchmark_format_query_result_json(
+        self, benchmark: BenchmarkFixture
+    ) -> None:
+        """Baseline: stringified row maps through ``format_query_result``."""
+
+        def format_rows() -> str:
+            rows = [
+                {
+                    name: str(value)
+                    for name, value in zip(self._JSON_COLUMNS, row, strict=True)
+                }
+                for row in self._JSON_ROWS
+            ]
+            return tm.ok(u.DbOracle.format_query_result(rows, "json"))
+
+        tm.that(len(json.loads(benchmark(format_rows))), eq=1000)
+
+    @pytest.mark.benchmark(group="json-rows")
+    def test_benchmark_encode_json_rows(self, benchmark: BenchmarkFixture) -> None:
+        """Fast path: raw tuples encoded straight to bytes."""
+
+        def encode_rows() -> bytes:
+            return tm.ok(
+                u.DbOracle.encode_json_rows(self._JSON_COLUMNS, self._JSON_ROWS)
+            )
+
+        tm.that(len(json.loads(benchmark(encode_rows))), eq=1000)
+
     # ------------------------------------------------------------------ #
     # Settings from environment                                          #
     # ------------------------------------------------------------------ #